@@ -52,6 +52,16 @@ if config.config_file_name is not None:
 # Target metadata for autogenerate
 target_metadata = Base.metadata
 
+# Indexes created at runtime rather than by migrations
+RUNTIME_INDEX_PREFIXES = ("ix_knowledge_embedding_hnsw_",)
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Keep autogenerate from dropping runtime-managed indexes."""
+    if type_ == "index" and reflected and name and name.startswith(RUNTIME_INDEX_PREFIXES):
+        return False
+    return True
+
 
 def get_url() -> str:
     """Get sync database URL from settings (for offline mode)."""
@@ -80,6 +90,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -90,7 +101,11 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations using provided connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
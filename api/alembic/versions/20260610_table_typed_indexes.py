@@ -0,0 +1,65 @@
+"""add table index declarations and jsonb timestamp helper
+
+Adds ``tables.indexes`` (declared per-table expression indexes on document
+fields) and the IMMUTABLE ``bifrost_jsonb_timestamptz`` helper used by
+timestamp-typed document filters and their indexes.
+
+Revision ID: 20260610_table_typed_indexes
+Revises: 20260604_brand_terms
+Create Date: 2026-06-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260610_table_typed_indexes"
+down_revision: Union[str, Sequence[str]] = "20260604_brand_terms"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tables",
+        sa.Column("indexes", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+    # Parses a JSONB string as timestamptz; NULL for anything else. TimeZone
+    # and DateStyle are pinned on the function so the result only depends on
+    # its input, which is what makes IMMUTABLE (and so indexing) valid.
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION bifrost_jsonb_timestamptz(value jsonb)
+        RETURNS timestamptz
+        LANGUAGE plpgsql
+        IMMUTABLE
+        PARALLEL SAFE
+        SET "TimeZone" TO 'UTC'
+        SET "DateStyle" TO 'ISO, YMD'
+        AS $$
+        BEGIN
+            IF value IS NULL OR jsonb_typeof(value) <> 'string' THEN
+                RETURN NULL;
+            END IF;
+            IF (value #>> '{}') !~ '^\d{4}-\d{2}-\d{2}' THEN
+                RETURN NULL;
+            END IF;
+            BEGIN
+                RETURN (value #>> '{}')::timestamptz;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+        END;
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    # CASCADE drops any timestamp document indexes built on the helper
+    op.execute("DROP FUNCTION IF EXISTS bifrost_jsonb_timestamptz(jsonb) CASCADE")
+    op.drop_column("tables", "indexes")
@@ -0,0 +1,24 @@
+"""add max_parallel_tool_calls to agents for concurrent tool dispatch
+
+Revision ID: 20260612_agent_parallel_tools
+Revises: 20260610_table_typed_indexes
+Create Date: 2026-06-12
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260612_agent_parallel_tools"
+down_revision = "20260610_table_typed_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agents",
+        sa.Column("max_parallel_tool_calls", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("agents", "max_parallel_tool_calls")
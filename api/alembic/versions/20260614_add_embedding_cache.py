@@ -0,0 +1,34 @@
+"""add embedding_cache for content-addressed embedding reuse
+
+Revision ID: 20260614_embedding_cache
+Revises: 20260612_agent_parallel_tools
+Create Date: 2026-06-14
+
+Embeddings keyed by (model, dimensions, sha256(text)). Knowledge store
+writes and embedding reindexes look chunks up here in bulk and only send
+text that has never been embedded with the current model to the provider.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260614_embedding_cache"
+down_revision = "20260612_agent_parallel_tools"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache",
+        sa.Column("model", sa.String(255), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("model", "dimensions", "content_hash"),
+    )
+    # Unconstrained vector, like knowledge_store.embedding
+    op.execute("ALTER TABLE embedding_cache ADD COLUMN embedding vector NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_cache")
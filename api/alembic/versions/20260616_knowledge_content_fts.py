@@ -0,0 +1,32 @@
+"""knowledge_store: full-text index over content for hybrid search
+
+Revision ID: 20260616_knowledge_fts
+Revises: 20260614_embedding_cache
+Create Date: 2026-06-16
+
+GIN expression index on to_tsvector('english', content). Hybrid knowledge
+search fuses its matches with vector results (reciprocal rank fusion) so
+exact identifiers — ticket numbers, SKUs — rank even when their embedding
+is a poor match. Built CONCURRENTLY so large knowledge stores stay
+writable during the upgrade.
+"""
+from alembic import op
+
+
+revision = "20260616_knowledge_fts"
+down_revision = "20260614_embedding_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_knowledge_content_fts "
+            "ON knowledge_store USING gin (to_tsvector('english'::regconfig, content))"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_knowledge_content_fts")
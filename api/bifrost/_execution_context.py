@@ -137,6 +137,7 @@ class ExecutionContext:
 
     # ==================== WORKFLOW STATE (private) ====================
     _integration_cache: dict = field(default_factory=dict)
+    _config_cache: dict = field(default_factory=dict, repr=False)
     _integration_calls: list = field(default_factory=list)
     _dynamic_secrets: set[str] = field(default_factory=set, repr=False)
     _scope_override: str | None = field(default=None, repr=False)
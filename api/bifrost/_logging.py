@@ -15,6 +15,7 @@ from __future__ import annotations
 import json
 import logging
 import threading
+from collections import deque
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -37,6 +38,17 @@ _local = threading.local()
 # Thread-local counters for sync callers, dict for async callers.
 _async_sequence_counters: dict[str, int] = {}
 
+# Log shipping: records are coalesced and written every interval, or as soon
+# as a full batch is waiting. MAX_PENDING bounds memory — once reached, the
+# logging thread ships a batch itself before queueing more.
+LOG_FLUSH_INTERVAL_SECONDS = 0.05
+LOG_FLUSH_MAX_BATCH = 200
+LOG_MAX_PENDING = 10_000
+
+# Active shippers by execution ID (see start_log_shipper)
+_shippers: dict[str, "LogShipper"] = {}
+_shippers_lock = threading.Lock()
+
 
 def clear_sequence_counter(execution_id: str) -> None:
     """Remove sequence counter for a completed execution.
@@ -69,6 +81,45 @@ def _serialize_metadata(metadata: dict[str, Any] | None) -> dict[str, Any] | Non
     return convert(metadata)
 
 
+def _build_stream_entry(
+    exec_id: str,
+    level: str,
+    message: str,
+    safe_metadata: dict[str, Any] | None,
+    ts: datetime,
+) -> dict[str, str]:
+    """Build the Redis Stream fields for one log entry."""
+    return {
+        "execution_id": exec_id,
+        "level": level.upper(),
+        "message": message,
+        "metadata": json.dumps(safe_metadata) if safe_metadata else "{}",
+        "timestamp": ts.isoformat(),
+    }
+
+
+def _build_pubsub_entry(
+    exec_id: str,
+    level: str,
+    message: str,
+    safe_metadata: dict[str, Any] | None,
+    ts: datetime,
+    sequence: int | None,
+) -> dict[str, Any]:
+    """Build the WebSocket payload for one log entry."""
+    log_entry: dict[str, Any] = {
+        "type": "execution_log",
+        "executionId": exec_id,
+        "level": level.upper(),
+        "message": message,
+        "metadata": safe_metadata,
+        "timestamp": ts.isoformat(),
+    }
+    if sequence is not None:
+        log_entry["sequence"] = sequence
+    return log_entry
+
+
 def _get_sync_redis() -> redis_sync.Redis:
     """Get thread-local sync Redis connection."""
     if not hasattr(_local, "redis") or _local.redis is None:
@@ -109,14 +160,7 @@ def append_log_to_stream(
     ts = timestamp or datetime.now(timezone.utc)
     stream_key = execution_logs_stream_key(exec_id)
 
-    safe_metadata = _serialize_metadata(metadata)
-    entry = {
-        "execution_id": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": json.dumps(safe_metadata) if safe_metadata else "{}",
-        "timestamp": ts.isoformat(),
-    }
+    entry = _build_stream_entry(exec_id, level, message, _serialize_metadata(metadata), ts)
 
     try:
         r = _get_sync_redis()
@@ -156,17 +200,9 @@ def publish_log_to_pubsub(
     exec_id = str(execution_id)
     ts = timestamp or datetime.now(timezone.utc)
 
-    safe_metadata = _serialize_metadata(metadata)
-    log_entry: dict[str, Any] = {
-        "type": "execution_log",
-        "executionId": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": safe_metadata,
-        "timestamp": ts.isoformat(),
-    }
-    if sequence is not None:
-        log_entry["sequence"] = sequence
+    log_entry = _build_pubsub_entry(
+        exec_id, level, message, _serialize_metadata(metadata), ts, sequence,
+    )
 
     try:
         r = _get_sync_redis()
@@ -176,6 +212,172 @@ def publish_log_to_pubsub(
         _local.redis = None
 
 
+class LogShipper:
+    """
+    Background shipper for one execution's logs.
+
+    Workflow threads only append to an in-memory queue; a daemon thread
+    drains it every LOG_FLUSH_INTERVAL_SECONDS (or as soon as
+    LOG_FLUSH_MAX_BATCH records are waiting) with one pipelined round trip:
+    an XADD per record plus a single PUBLISH carrying the whole batch as an
+    ``execution_log_batch`` message.
+
+    Sequence numbers are assigned under the same lock that appends to the
+    queue, and batches are shipped one at a time, so stream order, pubsub
+    order and sequence order always agree.
+    """
+
+    def __init__(
+        self,
+        execution_id: str,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+        max_batch: int = LOG_FLUSH_MAX_BATCH,
+        max_pending: int = LOG_MAX_PENDING,
+    ) -> None:
+        self.execution_id = execution_id
+        self._stream_key = execution_logs_stream_key(execution_id)
+        self._channel = f"bifrost:execution:{execution_id}"
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+
+        self._pending: deque[tuple[dict[str, str], dict[str, Any]]] = deque()
+        self._sequence = 0
+        self._lock = threading.Lock()
+        # Held while a batch is taken and shipped — keeps batches in order
+        # when the shipper thread and a caller flush at the same time
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"log-shipper-{execution_id[:8]}", daemon=True,
+        )
+
+        self.shipped = 0
+        self.batches = 0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(
+        self,
+        level: str,
+        message: str,
+        metadata: dict[str, Any] | None,
+        timestamp: datetime,
+    ) -> int:
+        """
+        Queue a log record for shipping.
+
+        Returns:
+            The sequence number assigned to the record
+        """
+        safe_metadata = _serialize_metadata(metadata)
+        with self._lock:
+            sequence = self._sequence
+            self._sequence += 1
+            self._pending.append((
+                _build_stream_entry(self.execution_id, level, message, safe_metadata, timestamp),
+                _build_pubsub_entry(self.execution_id, level, message, safe_metadata, timestamp, sequence),
+            ))
+            pending = len(self._pending)
+
+        if pending >= self._max_pending:
+            # Redis is falling behind — ship from this thread rather than
+            # let the queue grow without bound
+            self._flush_batch()
+        elif pending >= self._max_batch:
+            self._wake.set()
+        return sequence
+
+    def flush(self) -> int:
+        """Ship everything queued so far. Returns the number of records shipped."""
+        shipped = 0
+        while True:
+            count = self._flush_batch()
+            if not count:
+                return shipped
+            shipped += count
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and synchronously flush what is left."""
+        self._closed = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self) -> None:
+        try:
+            while not self._closed:
+                self._wake.wait(self._flush_interval)
+                self._wake.clear()
+                self.flush()
+        finally:
+            close_thread_redis()
+
+    def _flush_batch(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                count = min(len(self._pending), self._max_batch)
+                batch = [self._pending.popleft() for _ in range(count)]
+            if not batch:
+                return 0
+
+            try:
+                r = _get_sync_redis()
+                pipe = r.pipeline(transaction=False)
+                for stream_entry, _ in batch:
+                    # MAXLEN ~ 10000 keeps stream bounded (approximate trimming)
+                    pipe.xadd(self._stream_key, stream_entry, maxlen=10000)  # type: ignore[arg-type]
+                pipe.publish(self._channel, json.dumps({
+                    "type": "execution_log_batch",
+                    "executionId": self.execution_id,
+                    "logs": [pubsub_entry for _, pubsub_entry in batch],
+                }))
+                pipe.execute()
+            except Exception as e:
+                # Same contract as the unbatched path: log shipping is
+                # best-effort and never fails the workflow
+                logger.warning(f"Failed to ship {len(batch)} logs: {e}")
+                _local.redis = None
+                return len(batch)
+
+            self.shipped += len(batch)
+            self.batches += 1
+            return len(batch)
+
+
+def start_log_shipper(execution_id: str | UUID) -> LogShipper:
+    """
+    Start batching log_and_broadcast calls for an execution.
+
+    Must be paired with stop_log_shipper, which performs the final flush.
+    """
+    exec_id = str(execution_id)
+    shipper = LogShipper(exec_id)
+    with _shippers_lock:
+        previous = _shippers.pop(exec_id, None)
+        _shippers[exec_id] = shipper
+    if previous is not None:
+        previous.close()
+    shipper.start()
+    return shipper
+
+
+def stop_log_shipper(execution_id: str | UUID) -> None:
+    """
+    Flush and stop an execution's shipper.
+
+    Blocks until every queued record is written, so call it before the
+    execution result is reported.
+    """
+    with _shippers_lock:
+        shipper = _shippers.pop(str(execution_id), None)
+    if shipper is not None:
+        shipper.close()
+
+
 def log_and_broadcast(
     execution_id: str | UUID,
     level: str,
@@ -189,6 +391,9 @@ def log_and_broadcast(
     This is the main entry point for logging from workflow threads.
     Replaces the old pattern of calling append_log_sync + broadcaster separately.
 
+    When a shipper is running for the execution (start_log_shipper), the
+    record is queued for a batched write instead and None is returned.
+
     Args:
         execution_id: Execution UUID
         level: Log level
@@ -197,12 +402,17 @@ def log_and_broadcast(
         timestamp: Optional timestamp
 
     Returns:
-        Stream entry ID if successful, None on error
+        Stream entry ID if successful, None on error or when batched
     """
     ts = timestamp or datetime.now(timezone.utc)
 
-    # Increment thread-local sequence counter for this execution
     exec_id = str(execution_id)
+    shipper = _shippers.get(exec_id)
+    if shipper is not None:
+        shipper.submit(level, message, metadata, ts)
+        return None
+
+    # Increment thread-local sequence counter for this execution
     if not hasattr(_local, "sequence_counters"):
         _local.sequence_counters = {}
     seq = _local.sequence_counters.get(exec_id, 0)
@@ -253,14 +463,7 @@ async def append_log_to_stream_async(
     ts = timestamp or datetime.now(timezone.utc)
     stream_key = execution_logs_stream_key(exec_id)
 
-    safe_metadata = _serialize_metadata(metadata)
-    entry = {
-        "execution_id": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": json.dumps(safe_metadata) if safe_metadata else "{}",
-        "timestamp": ts.isoformat(),
-    }
+    entry = _build_stream_entry(exec_id, level, message, _serialize_metadata(metadata), ts)
 
     try:
         async with get_redis() as r:
@@ -341,17 +544,9 @@ async def publish_log_to_pubsub_async(
     exec_id = str(execution_id)
     ts = timestamp or datetime.now(timezone.utc)
 
-    safe_metadata = _serialize_metadata(metadata)
-    log_entry: dict[str, Any] = {
-        "type": "execution_log",
-        "executionId": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": safe_metadata,
-        "timestamp": ts.isoformat(),
-    }
-    if sequence is not None:
-        log_entry["sequence"] = sequence
+    log_entry = _build_pubsub_entry(
+        exec_id, level, message, _serialize_metadata(metadata), ts, sequence,
+    )
 
     try:
         async with get_redis() as r:
@@ -430,6 +625,79 @@ def close_thread_redis() -> None:
 # =============================================================================
 
 
+# Stream entries read per XRANGE page and rows per multi-row INSERT during
+# persistence. Six columns per row keeps each INSERT far below asyncpg's
+# 32767 bind-parameter limit.
+LOG_PERSIST_PAGE_SIZE = 1000
+
+
+def _stream_entry_to_row(
+    exec_uuid: UUID, data: dict[str, str], sequence: int,
+) -> dict[str, Any]:
+    """Convert a Redis Stream entry into an execution_logs row."""
+    # Parse timestamp and strip timezone (DB uses TIMESTAMP WITHOUT TIME ZONE)
+    ts_str = data.get("timestamp", datetime.now(timezone.utc).isoformat())
+    ts = datetime.fromisoformat(ts_str)
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None)
+
+    return {
+        "execution_id": exec_uuid,
+        "level": data.get("level", "INFO"),
+        "message": data.get("message", ""),
+        "log_metadata": json.loads(data.get("metadata", "{}")),
+        "timestamp": ts,
+        "sequence": sequence,
+    }
+
+
+async def _persist_stream_pages(
+    r: Any,
+    stream_key: str,
+    exec_uuid: UUID,
+    db: "AsyncSession",
+) -> int:
+    """
+    Copy an execution's stream into execution_logs one page at a time.
+
+    Only one page of entries is held in memory, and each page is written
+    with a single multi-row INSERT instead of one ORM object per log.
+    """
+    from sqlalchemy import insert
+
+    from src.models.orm import ExecutionLog
+
+    persisted = 0
+    sequence = 0
+    start = "-"
+    while True:
+        entries = await r.xrange(  # type: ignore[misc]
+            stream_key, min=start, max="+", count=LOG_PERSIST_PAGE_SIZE,
+        )
+        if not entries:
+            break
+
+        rows = []
+        for entry_id, data in entries:
+            try:
+                rows.append(_stream_entry_to_row(exec_uuid, data, sequence))
+            except Exception as e:
+                logger.warning(f"Failed to parse log entry {entry_id}: {e}")
+            # Sequence follows stream position, including unparseable entries
+            sequence += 1
+
+        if rows:
+            await db.execute(insert(ExecutionLog).values(rows))
+            persisted += len(rows)
+
+        if len(entries) < LOG_PERSIST_PAGE_SIZE:
+            break
+        # Exclusive start: resume after the last entry of this page
+        start = f"({entries[-1][0]}"
+
+    return persisted
+
+
 async def flush_logs_to_postgres(
     execution_id: str | UUID,
     session: "AsyncSession | None" = None,
@@ -438,7 +706,8 @@ async def flush_logs_to_postgres(
     Flush all logs from Redis Stream to Postgres.
 
     Called at the end of execution to persist logs from the stream
-    to the database. Uses batch inserts for efficiency.
+    to the database. Pages through the stream with XRANGE COUNT and
+    writes each page with one multi-row INSERT.
 
     Args:
         execution_id: Execution UUID
@@ -448,8 +717,6 @@ async def flush_logs_to_postgres(
     Returns:
         Number of logs persisted
     """
-    from src.models.orm import ExecutionLog
-
     exec_id = str(execution_id)
     exec_uuid = UUID(exec_id)
     stream_key = execution_logs_stream_key(exec_id)
@@ -458,56 +725,26 @@ async def flush_logs_to_postgres(
         from src.core.cache import get_redis
 
         async with get_redis() as r:
-            # Read all entries from stream
-            entries = await r.xrange(stream_key, min="-", max="+")  # type: ignore[misc]
-
-            if not entries:
-                return 0
-
-            # Parse entries - enumerate to preserve insertion order
-            logs_to_insert = []
-            for seq, (entry_id, data) in enumerate(entries):
-                try:
-                    # Parse timestamp and strip timezone (DB uses TIMESTAMP WITHOUT TIME ZONE)
-                    ts_str = data.get("timestamp", datetime.now(timezone.utc).isoformat())
-                    ts = datetime.fromisoformat(ts_str)
-                    if ts.tzinfo is not None:
-                        ts = ts.replace(tzinfo=None)
-
-                    log_entry = ExecutionLog(
-                        execution_id=exec_uuid,
-                        level=data.get("level", "INFO"),
-                        message=data.get("message", ""),
-                        log_metadata=json.loads(data.get("metadata", "{}")),
-                        timestamp=ts,
-                        sequence=seq,
-                    )
-                    logs_to_insert.append(log_entry)
-                except Exception as e:
-                    logger.warning(f"Failed to parse log entry {entry_id}: {e}")
-                    continue
-
-            if not logs_to_insert:
-                return 0
-
-            # Batch insert to Postgres
             if session is not None:
                 # Use provided session (caller manages commit)
-                session.add_all(logs_to_insert)
+                persisted = await _persist_stream_pages(r, stream_key, exec_uuid, session)
             else:
                 # Create own session
                 from src.core.database import get_session_factory
 
                 session_factory = get_session_factory()
                 async with session_factory() as db:
-                    db.add_all(logs_to_insert)
+                    persisted = await _persist_stream_pages(r, stream_key, exec_uuid, db)
                     await db.commit()
 
+            if not persisted:
+                return 0
+
             # Clear the stream after successful persistence
             await r.delete(stream_key)
 
-            logger.debug(f"Flushed {len(logs_to_insert)} logs to Postgres for {log_safe(exec_id)}")
-            return len(logs_to_insert)
+            logger.debug(f"Flushed {persisted} logs to Postgres for {log_safe(exec_id)}")
+            return persisted
 
     except Exception as e:
         logger.error(f"Failed to flush logs to Postgres: {e}")
@@ -304,6 +304,13 @@ async def execute_workflow(
     sys.exit(0 if final_status == "Success" else 1)
 
 
+def _echo_log(msg: dict) -> None:
+    """Print one execution_log payload as ``[LEVEL] message``."""
+    level = (msg.get("level") or "info").upper()
+    message = msg.get("message") or ""
+    click.echo(f"[{level}] {message}")
+
+
 async def _stream_execution_logs(
     client: BifrostClient, execution_id: str
 ) -> str:
@@ -337,9 +344,10 @@ async def _stream_execution_logs(
                     msg_type = msg.get("type")
 
                     if msg_type == "execution_log":
-                        level = (msg.get("level") or "info").upper()
-                        message = msg.get("message") or ""
-                        click.echo(f"[{level}] {message}")
+                        _echo_log(msg)
+                    elif msg_type == "execution_log_batch":
+                        for log in msg.get("logs") or []:
+                            _echo_log(log)
                     elif msg_type == "execution_update":
                         status_val = msg.get("status")
                         if status_val in _TERMINAL_STATUSES:
@@ -4,6 +4,10 @@ Configuration SDK for Bifrost - API-only implementation.
 Provides Python API for configuration management (get, set, list, delete).
 All operations go through HTTP API endpoints.
 All methods are async and must be awaited.
+
+Reads are memoized on the active ExecutionContext, so repeat reads of a key
+within one run cost no API call. Writes through this module invalidate the
+memo; writes made elsewhere during the run are not observed.
 """
 
 from __future__ import annotations
@@ -12,7 +16,45 @@ from typing import Any
 
 from .client import get_client, raise_for_status_with_detail
 from .models import ConfigData
-from ._context import resolve_scope
+from ._context import _execution_context, resolve_scope
+
+
+def _config_memo() -> dict[tuple[str | None, str], dict[str, Any] | None] | None:
+    """Per-execution memo of config/get results, or None outside a workflow."""
+    ctx = _execution_context.get()
+    if ctx is None:
+        return None
+    return ctx._config_cache
+
+
+def _forget_config(key: str) -> None:
+    """Drop a key from the memo under every scope (writes cascade)."""
+    memo = _config_memo()
+    if memo is None:
+        return
+    for memo_key in [k for k in memo if k[1] == key]:
+        del memo[memo_key]
+
+
+def _config_result_value(result: dict[str, Any] | None, default: Any) -> Any:
+    if result is None:
+        return default
+    return result.get("value", default)
+
+
+def _remember_config(
+    memo: dict[tuple[str | None, str], dict[str, Any] | None] | None,
+    scope: str | None,
+    key: str,
+    result: dict[str, Any] | None,
+) -> None:
+    if result is not None and result.get("config_type") == "secret":
+        value = result.get("value")
+        if isinstance(value, str):
+            from ._context import register_secret
+            register_secret(value)
+    if memo is not None:
+        memo[(scope, key)] = result
 
 
 class config:
@@ -56,8 +98,12 @@ class config:
             >>> timeout = await config.get("timeout", default=30)
             >>> org_setting = await config.get("key", scope="org-uuid-here")
         """
-        client = get_client()
         effective_scope = resolve_scope(scope)
+        memo = _config_memo()
+        if memo is not None and (effective_scope, key) in memo:
+            return _config_result_value(memo[(effective_scope, key)], default)
+
+        client = get_client()
         response = await client.post(
             "/api/sdk/config/get",
             json={"key": key, "scope": effective_scope}
@@ -65,16 +111,67 @@ class config:
 
         if response.status_code == 200:
             result = response.json()
-            if result is None:
-                return default
-            value = result.get("value", default)
-            if result.get("config_type") == "secret" and isinstance(value, str):
-                from ._context import register_secret
-                register_secret(value)
-            return value
+            _remember_config(memo, effective_scope, key, result)
+            return _config_result_value(result, default)
         else:
             return default
 
+    @staticmethod
+    async def get_many(
+        keys: list[str],
+        default: Any = None,
+        scope: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get several configuration values in one API call.
+
+        Keys already read during this execution are served from memory; the
+        rest are fetched together.
+
+        Args:
+            keys: Configuration keys
+            default: Value for keys that are not found (optional)
+            scope: Organization scope override (same rules as ``get``)
+
+        Returns:
+            dict[str, Any]: Every requested key mapped to its value or default
+
+        Raises:
+            RuntimeError: If not authenticated
+
+        Example:
+            >>> from bifrost import config
+            >>> cfg = await config.get_many(["api_url", "api_key", "timeout"])
+            >>> cfg["timeout"]
+        """
+        effective_scope = resolve_scope(scope)
+        memo = _config_memo()
+        results: dict[str, dict[str, Any] | None] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            if memo is not None and (effective_scope, key) in memo:
+                results[key] = memo[(effective_scope, key)]
+            else:
+                missing.append(key)
+
+        if missing:
+            client = get_client()
+            response = await client.post(
+                "/api/sdk/config/get_many",
+                json={"keys": missing, "scope": effective_scope}
+            )
+            if response.status_code == 200:
+                fetched = response.json()
+                for key in missing:
+                    result = fetched.get(key)
+                    _remember_config(memo, effective_scope, key, result)
+                    results[key] = result
+
+        return {
+            key: _config_result_value(results.get(key), default)
+            for key in keys
+        }
+
     @staticmethod
     async def set(
         key: str,
@@ -117,6 +214,7 @@ class config:
             }
         )
         raise_for_status_with_detail(response)
+        _forget_config(key)
 
     @staticmethod
     async def list(scope: str | None = None) -> ConfigData:
@@ -190,4 +288,5 @@ class config:
             json={"key": key, "scope": effective_scope}
         )
         raise_for_status_with_detail(response)
+        _forget_config(key)
         return response.json()
@@ -4,18 +4,52 @@ Integrations SDK for Bifrost.
 Provides Python API for integration management and OAuth configuration.
 
 All methods are async and must be awaited.
+
+``integrations.get`` results are memoized on the active ExecutionContext and
+reused until shortly before their access token expires.
 """
 
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 
 from .client import get_client
 from .models import IntegrationData, IntegrationMappingResponse
-from ._context import resolve_scope
+from ._context import _execution_context, resolve_scope
 
 logger = logging.getLogger(__name__)
 
+# Memoized tokens are refetched this long before they expire (seconds)
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+
+def _is_fresh(data: IntegrationData) -> bool:
+    """True unless the integration's access token is at or near expiry."""
+    if data.oauth is None or not data.oauth.expires_at:
+        return True
+    try:
+        expiry = datetime.fromisoformat(data.oauth.expires_at)
+    except ValueError:
+        return False
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+    return remaining > _TOKEN_EXPIRY_MARGIN_SECONDS
+
+
+def _forget_connection(connection_name: str) -> None:
+    """Drop memoized integrations using an OAuth connection (after a refresh)."""
+    ctx = _execution_context.get()
+    if ctx is None:
+        return
+    memo = ctx._integration_cache
+    for key in [
+        k for k, v in memo.items()
+        if v.oauth is not None and v.oauth.connection_name == connection_name
+    ]:
+        del memo[key]
+
 
 class integrations:
     """
@@ -84,8 +118,16 @@ class integrations:
             ...     oauth_scope="https://outlook.office365.com/.default"
             ... )
         """
-        client = get_client()
         effective_scope = resolve_scope(scope)
+        ctx = _execution_context.get()
+        memo_key = (name, effective_scope, oauth_scope)
+        if ctx is not None:
+            memoized = ctx._integration_cache.get(memo_key)
+            if memoized is not None and _is_fresh(memoized):
+                # Copy so caller mutations don't leak into later calls
+                return memoized.model_copy(deep=True)
+
+        client = get_client()
         request_data = {"name": name, "scope": effective_scope}
         if oauth_scope:
             request_data["oauth_scope"] = oauth_scope
@@ -109,6 +151,8 @@ class integrations:
                     val = data.config.get(key)
                     if val:
                         register_secret(str(val))
+            if ctx is not None:
+                ctx._integration_cache[memo_key] = data.model_copy(deep=True)
             return data
         else:
             logger.warning(f"Integrations API call failed: {response.status_code}")
@@ -33,7 +33,7 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from .client import get_client, raise_for_status_with_detail
 from .models import KnowledgeDocument, NamespaceInfo
@@ -161,11 +161,15 @@ class knowledge:
         metadata_filter: dict[str, Any] | None = None,
         scope: str | None = None,
         fallback: bool = True,
+        mode: Literal["vector", "hybrid", "keyword"] = "vector",
     ) -> list[KnowledgeDocument]:
         """
         Search for similar documents.
 
         Uses semantic similarity (vector search) to find relevant documents.
+        Set ``mode`` to also (``"hybrid"``) or only (``"keyword"``) match the
+        query's words in the document text, which finds exact identifiers
+        such as ticket numbers that embeddings tend to miss.
 
         Args:
             query: Search query (will be embedded)
@@ -178,9 +182,15 @@ class knowledge:
                 - org UUID string: Target specific organization
                 - "global": Search only global scope
             fallback: If True, also search global scope (default True)
+            mode: "vector" (default), "hybrid" (vector and full-text results
+                fused by rank), or "keyword" (full-text only, no embedding).
+                Full-text matching requires every query term. Results are
+                ordered by fused rank, but ``score`` stays the 0-1 vector
+                similarity (None for full-text-only matches), and min_score
+                only filters vector matches.
 
         Returns:
-            List of KnowledgeDocument sorted by similarity
+            List of KnowledgeDocument sorted by relevance
 
         Example:
             >>> results = await knowledge.search(
@@ -204,6 +214,7 @@ class knowledge:
                 "metadata_filter": metadata_filter,
                 "scope": effective_scope,
                 "fallback": fallback,
+                "mode": mode,
             }
         )
         raise_for_status_with_detail(response)
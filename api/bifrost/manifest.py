@@ -160,6 +160,7 @@ class ManifestAgent(BaseModel):
     llm_max_tokens: int | None = Field(default=None, description="Override LLM max tokens (null = global default)")
     max_iterations: int | None = Field(default=None, description="Max LLM iterations for autonomous runs")
     max_token_budget: int | None = Field(default=None, description="Max token budget for autonomous runs")
+    max_parallel_tool_calls: int | None = Field(default=None, description="Max tool calls run concurrently in one turn (null = default)")
 
 
 class ManifestApp(BaseModel):
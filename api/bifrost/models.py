@@ -188,6 +188,10 @@ class OAuthCredentials(BaseModel):
         self.access_token = data["access_token"]
         self.expires_at = data.get("expires_at")
         register_secret(self.access_token)
+
+        # Later integrations.get() calls must not return the replaced token
+        from .integrations import _forget_connection
+        _forget_connection(self.connection_name)
         return self
 
 
@@ -299,6 +303,7 @@ class DocumentList(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class BatchResult(BaseModel):
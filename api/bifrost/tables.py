@@ -8,7 +8,7 @@ All methods are async and must be awaited.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator
 from urllib.parse import urlencode
 
 from .client import get_client, raise_for_status_with_detail
@@ -583,6 +583,7 @@ class tables:
         limit: int = 100,
         offset: int = 0,
         scope: str | None = None,
+        cursor: str | None = None,
     ) -> DocumentList:
         """
         Query documents with filtering and pagination.
@@ -590,6 +591,8 @@ class tables:
         Supports advanced filter operators:
         - Simple equality: {"status": "active"}
         - Comparison: {"amount": {"gt": 100, "lte": 1000}}
+          (numbers compare numerically, ISO date strings as timestamps;
+          the table's schema column types take precedence)
         - LIKE patterns: {"name": {"contains": "acme"}}
         - IN lists: {"category": {"in_": ["a", "b"]}}
         - NULL checks: {"deleted_at": {"is_null": True}}
@@ -602,10 +605,15 @@ class tables:
             limit: Maximum documents to return (default 100).
             offset: Number of documents to skip.
             scope: Organization scope.
+            cursor: ``next_cursor`` from a previous page. Continues after that
+                page without OFFSET or a total count (``total`` is -1); pass
+                the same where/order_by/order_dir. To walk a whole table,
+                prefer ``tables.iter``.
 
         Returns:
             DocumentList: Query results with documents, total count, and
-            pagination info. Returns an empty list if the table doesn't exist.
+            pagination info (``next_cursor`` is None on the last page).
+            Returns an empty list if the table doesn't exist.
 
         Example:
             >>> results = await tables.query("customers", where={"status": "active"})
@@ -620,6 +628,7 @@ class tables:
                 "order_dir": order_dir,
                 "limit": limit,
                 "offset": offset,
+                "cursor": cursor,
             },
         )
         if response.status_code == 404:
@@ -627,6 +636,62 @@ class tables:
         raise_for_status_with_detail(response)
         return DocumentList.model_validate(response.json())
 
+    @staticmethod
+    async def iter(
+        table: str,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        order_dir: str = "asc",
+        page_size: int = 1000,
+        scope: str | None = None,
+    ) -> AsyncIterator[DocumentData]:
+        """
+        Iterate over every matching document, paging transparently.
+
+        Uses cursor (keyset) pagination, so each page costs the same no
+        matter how deep into the table it is, and no total is counted.
+
+        Args:
+            table: Table name or UUID.
+            where: Filter conditions (same operators as ``query``).
+            order_by: Field name to order by (JSONB field).
+            order_dir: "asc" or "desc".
+            page_size: Documents fetched per request (max 1000).
+            scope: Organization scope.
+
+        Yields:
+            DocumentData: Each matching document. Yields nothing if the table
+            doesn't exist.
+
+        Example:
+            >>> async for doc in tables.iter("customers", where={"status": "active"}):
+            ...     print(doc.id)
+        """
+        client = get_client()
+        effective_scope = resolve_scope(scope)
+        cursor: str | None = None
+        while True:
+            response = await client.post(
+                f"/api/tables/{table}/documents/query{_scope_query(effective_scope)}",
+                json={
+                    "where": where,
+                    "order_by": order_by,
+                    "order_dir": order_dir,
+                    "limit": page_size,
+                    "skip_count": True,
+                    "cursor": cursor,
+                },
+            )
+            if response.status_code == 404:
+                return
+            raise_for_status_with_detail(response)
+            page = DocumentList.model_validate(response.json())
+            for doc in page.documents:
+                yield doc
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
+
     @staticmethod
     async def count(
         table: str,
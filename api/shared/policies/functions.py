@@ -41,6 +41,10 @@ class FunctionDef:
     arg_types: list[type]
     """Expected types of args for the validator at table create/update."""
 
+    user_fields: frozenset[str]
+    """User attributes the evaluator reads. Two users that agree on them get
+    the same result for every row (websocket fanout groups on this)."""
+
 
 def _has_role_evaluate(args: list, user: _PolicyUser, row: dict) -> bool:
     target = args[0]
@@ -60,5 +64,6 @@ FUNCTIONS: Final[dict[str, FunctionDef]] = {
         evaluate=_has_role_evaluate,
         compile=_has_role_compile,
         arg_types=[str],
+        user_fields=frozenset({"role_names", "role_ids"}),
     ),
 }
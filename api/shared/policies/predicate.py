@@ -0,0 +1,398 @@
+"""Closure compiler for policy expressions.
+
+`evaluate` walks the expression tree node by node for every row it checks:
+dotted row paths are split, user fields looked up and function calls
+dispatched again each time. Hot paths that check many rows compile instead,
+in two stages with the same semantics as `evaluate`:
+
+- `compile_predicate` walks the tree once, splitting row paths and binding
+  each operator to its operands.
+- `CompiledExpr.bind(user)` resolves every user field, claim and
+  row-independent function call to a constant and folds what it can,
+  leaving a closure over the row alone. A user-only expression (e.g.
+  `{"user": "is_platform_admin"}`) binds to a constant answer.
+
+`compiled_policies` does the same for a table's `TablePolicies`, per action,
+and caches the result by table id and policy version so REST handlers and
+the websocket fanout share one compilation per table.
+
+`user_inputs` lists what an expression reads off the user, so callers can
+tell when two users are guaranteed the same answer for every row.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+from shared.policies.evaluate import (
+    _resolve_claims_field,
+    _resolve_user_field,
+    _scalar_eq,
+)
+from shared.policies.functions import FUNCTIONS
+from src.models.contracts.policies import Expr, TablePolicies
+
+RowPredicate = Callable[[dict | None], bool]
+"""row -> bool, for a user bound in advance."""
+
+UserInput = tuple[str, str]
+"""("user", field) or ("claims", name)."""
+
+
+class _Const:
+    """A node whose value doesn't depend on the row."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+_RowValue = Callable[[dict | None], Any]
+_Bound = Union[_Const, _RowValue]
+_Binder = Callable[[Any], _Bound]
+
+_TRUE = _Const(True)
+_FALSE = _Const(False)
+
+
+def _always(row: dict | None) -> bool:
+    return True
+
+
+def _never(row: dict | None) -> bool:
+    return False
+
+
+class CompiledExpr:
+    """An expression compiled once; `bind` specializes it to a user."""
+
+    __slots__ = ("_binder",)
+
+    def __init__(self, expr: Expr) -> None:
+        self._binder = _compile_node(expr.root)
+
+    def bind(self, user: Any) -> RowPredicate:
+        """Resolve the user's side of the expression; returns a row check."""
+        bound = self._binder(user)
+        if isinstance(bound, _Const):
+            return _always if bound.value else _never
+        return lambda row: bool(bound(row))
+
+    def __call__(self, row: dict | None, user: Any) -> bool:
+        """One-off check, as `evaluate(expr, row, user)`."""
+        return self.bind(user)(row)
+
+
+def compile_predicate(expr: Expr) -> CompiledExpr:
+    """Compile an expression to a closure equivalent to `evaluate`."""
+    return CompiledExpr(expr)
+
+
+def user_inputs(expr: Expr) -> frozenset[UserInput]:
+    """Every user field and claim the expression can read."""
+    found: set[UserInput] = set()
+    _collect_user_inputs(expr.root, found)
+    return frozenset(found)
+
+
+# --- Table policies -----------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CompiledPolicies:
+    """A table's policies compiled per action (see `compiled_policies`)."""
+
+    version: str
+    # action -> OR'd rule expressions; None when a rule allows unconditionally
+    _rules: dict[str, tuple[CompiledExpr, ...] | None]
+    _user_inputs: dict[str, frozenset[UserInput]]
+
+    def bind(self, action: str, user: Any) -> RowPredicate:
+        """`evaluate_action` for one action and user, as a row check."""
+        rules = self._rules.get(action, ())
+        if rules is None:
+            return _always
+        checks = []
+        for rule in rules:
+            check = rule.bind(user)
+            if check is _always:
+                return _always
+            if check is not _never:
+                checks.append(check)
+        if not checks:
+            return _never
+        if len(checks) == 1:
+            return checks[0]
+        return lambda row: any(check(row) for check in checks)
+
+    def allows(self, action: str, row: dict | None, user: Any) -> bool:
+        """One-off check, as `evaluate_action(action, policies, row, user)`."""
+        return self.bind(action, user)(row)
+
+    def user_inputs(self, action: str) -> frozenset[UserInput]:
+        """Every user field and claim the action's rules can read."""
+        return self._user_inputs.get(action, frozenset())
+
+
+def compile_policies(policies: TablePolicies) -> CompiledPolicies:
+    """Compile every action's rules (uncached; see `compiled_policies`)."""
+    rules: dict[str, list[CompiledExpr] | None] = {}
+    inputs: dict[str, frozenset[UserInput]] = {}
+    for policy in policies.policies:
+        compiled = compile_predicate(policy.when) if policy.when is not None else None
+        reads = user_inputs(policy.when) if policy.when is not None else frozenset()
+        for action in policy.actions:
+            inputs[action] = inputs.get(action, frozenset()) | reads
+            if compiled is None:
+                rules[action] = None
+                continue
+            existing = rules.setdefault(action, [])
+            if existing is not None:
+                existing.append(compiled)
+    return CompiledPolicies(
+        version=policy_version(policies),
+        _rules={a: tuple(r) if r is not None else None for a, r in rules.items()},
+        _user_inputs=inputs,
+    )
+
+
+def policy_version(policies: TablePolicies) -> str:
+    """Content hash of a policies document; changes with every edit."""
+    canonical = json.dumps(policies.model_dump(mode="json"), sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+# Compiled policies per (table id, version); LRU-bounded
+COMPILED_POLICY_CACHE_SIZE = 256
+
+_compiled_cache: OrderedDict[tuple[str, str], CompiledPolicies] = OrderedDict()
+
+
+def compiled_policies(table_id: str, policies: TablePolicies) -> CompiledPolicies:
+    """Compiled form of a table's policies, compiled once per policy version."""
+    key = (str(table_id), policy_version(policies))
+    compiled = _compiled_cache.get(key)
+    if compiled is not None:
+        _compiled_cache.move_to_end(key)
+        return compiled
+    compiled = compile_policies(policies)
+    _compiled_cache[key] = compiled
+    if len(_compiled_cache) > COMPILED_POLICY_CACHE_SIZE:
+        _compiled_cache.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_policies() -> None:
+    """Drop every cached compilation (tests)."""
+    _compiled_cache.clear()
+
+
+# --- Compiler -----------------------------------------------------------------
+
+
+def _as_row_value(bound: _Bound) -> _RowValue:
+    if isinstance(bound, _Const):
+        value = bound.value
+        return lambda row: value
+    return bound
+
+
+def _compile_node(node: Any) -> _Binder:
+    # Literals
+    if isinstance(node, (str, int, float, bool)) or node is None:
+        const = _Const(node)
+        return lambda user: const
+    if isinstance(node, list):
+        return _compile_list([_compile_node(item) for item in node])
+
+    # References
+    if isinstance(node, dict):
+        keys = set(node.keys())
+        if keys == {"row"}:
+            resolve = _compile_row_path(node["row"])
+            return lambda user: resolve
+        if keys == {"user"}:
+            field = node["user"]
+            return lambda user: _Const(_resolve_user_field(user, field))
+        if keys == {"claims"}:
+            name = node["claims"]
+            return lambda user: _Const(_resolve_claims_field(user, name))
+        if "call" in keys:
+            return _compile_call(node)
+        # Operators: single-key dict
+        if len(keys) == 1:
+            op = next(iter(keys))
+            return _compile_op(op, node[op])
+
+    raise ValueError(f"unevaluatable node: {node!r}")
+
+
+def _compile_list(items: list[_Binder]) -> _Binder:
+    def bind(user: Any) -> _Bound:
+        bound = [item(user) for item in items]
+        if all(isinstance(b, _Const) for b in bound):
+            return _Const([b.value for b in bound])  # type: ignore[union-attr]
+        values = [_as_row_value(b) for b in bound]
+        return lambda row: [value(row) for value in values]
+
+    return bind
+
+
+def _compile_row_path(path: str) -> _RowValue:
+    """Dot-path lookup against the row dict; missing keys return None."""
+    parts = tuple(path.split("."))
+    if len(parts) == 1:
+        key = parts[0]
+        return lambda row: row.get(key) if isinstance(row, dict) else None
+
+    def resolve(row: dict | None) -> Any:
+        cur: Any = row
+        for part in parts:
+            if not isinstance(cur, dict):
+                return None
+            cur = cur.get(part)
+            if cur is None:
+                return None
+        return cur
+
+    return resolve
+
+
+def _compile_call(node: dict) -> _Binder:
+    fn = FUNCTIONS[node["call"]]
+    args = [_compile_node(a) for a in node.get("args", [])]
+
+    def bind(user: Any) -> _Bound:
+        bound = [a(user) for a in args]
+        if all(isinstance(b, _Const) for b in bound):
+            # Registered functions are row-independent (their `compile`
+            # form resolves them without a row), so constant args fold
+            return _Const(fn.evaluate([b.value for b in bound], user, {}))  # type: ignore[union-attr]
+        values = [_as_row_value(b) for b in bound]
+        return lambda row: fn.evaluate([v(row) for v in values], user, row or {})
+
+    return bind
+
+
+def _compile_op(op: str, value: Any) -> _Binder:
+    if op in ("and", "or"):
+        return _compile_logic(op, [_compile_node(item) for item in value])
+    if op == "not":
+        inner = _compile_node(value)
+
+        def bind_not(user: Any) -> _Bound:
+            b = inner(user)
+            if isinstance(b, _Const):
+                return _Const(not b.value)
+            return lambda row: not b(row)
+
+        return bind_not
+    if op == "is_null":
+        inner = _compile_node(value)
+
+        def bind_is_null(user: Any) -> _Bound:
+            b = inner(user)
+            if isinstance(b, _Const):
+                return _Const(b.value is None)
+            return lambda row: b(row) is None
+
+        return bind_is_null
+
+    test = _BINARY.get(op)
+    if test is None:
+        raise ValueError(f"unknown operator {op!r}")
+    left, right = _compile_node(value[0]), _compile_node(value[1])
+
+    def bind_binary(user: Any) -> _Bound:
+        a, b = left(user), right(user)
+        if isinstance(a, _Const) and isinstance(b, _Const):
+            return _Const(test(a.value, b.value))
+        if isinstance(b, _Const):
+            constant = b.value
+            return lambda row: test(a(row), constant)  # type: ignore[operator]
+        fa, fb = _as_row_value(a), b
+        return lambda row: test(fa(row), fb(row))
+
+    return bind_binary
+
+
+def _compile_logic(op: str, items: list[_Binder]) -> _Binder:
+    # `and` stops at the first false operand, `or` at the first true one
+    stop_at = op == "or"
+
+    def bind(user: Any) -> _Bound:
+        checks: list[_RowValue] = []
+        for item in items:
+            b = item(user)
+            if isinstance(b, _Const):
+                if bool(b.value) is stop_at:
+                    return _TRUE if stop_at else _FALSE
+                continue
+            checks.append(b)
+        if not checks:
+            return _FALSE if stop_at else _TRUE
+        if len(checks) == 1:
+            only = checks[0]
+            return lambda row: bool(only(row))
+        if stop_at:
+            return lambda row: any(check(row) for check in checks)
+        return lambda row: all(check(row) for check in checks)
+
+    return bind
+
+
+def _ordered(compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def test(a: Any, b: Any) -> bool:
+        if a is None or b is None:
+            return False
+        try:
+            return compare(a, b)
+        except TypeError:
+            return False
+
+    return test
+
+
+def _contains(a: Any, b: Any) -> bool:
+    if a is None or not isinstance(b, list):
+        return False
+    return a in b
+
+
+_BINARY: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": _scalar_eq,
+    "neq": lambda a, b: not _scalar_eq(a, b),
+    "lt": _ordered(operator.lt),
+    "lte": _ordered(operator.le),
+    "gt": _ordered(operator.gt),
+    "gte": _ordered(operator.ge),
+    "in": _contains,
+}
+
+
+def _collect_user_inputs(node: Any, found: set[UserInput]) -> None:
+    if isinstance(node, list):
+        for item in node:
+            _collect_user_inputs(item, found)
+        return
+    if not isinstance(node, dict):
+        return
+    keys = set(node.keys())
+    if keys == {"user"}:
+        found.add(("user", node["user"]))
+    elif keys == {"claims"}:
+        found.add(("claims", node["claims"]))
+    elif keys == {"row"}:
+        return
+    elif "call" in keys:
+        found.update(("user", f) for f in FUNCTIONS[node["call"]].user_fields)
+        _collect_user_inputs(node.get("args", []), found)
+    else:
+        for value in node.values():
+            _collect_user_inputs(value, found)
@@ -13,21 +13,94 @@ filter) determines which event — if any — to deliver:
     True        | True        | "update" (row stays in view, content changed)
 
 This module centralizes that logic so it can be unit-tested without standing
-up a websocket connection. The websocket router calls `decide_visibility_change`
-once per message per subscriber.
+up a websocket connection. `decide_visibility_change` answers for one
+subscriber. The websocket fanout instead uses the table's compiled policies
+(`shared.policies.predicate.compiled_policies`) and groups subscribers by
+`visibility_class`: subscribers whose user-side inputs and filter agree get
+the same decision for every row, so each message is decided once per class.
 """
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import json
+from dataclasses import dataclass
+from typing import Any, Hashable, Literal
+from uuid import UUID
 
-from shared.policies.evaluate import evaluate
+from shared.policies.evaluate import (
+    _resolve_claims_field,
+    _resolve_user_field,
+    evaluate,
+)
+from shared.policies.predicate import (
+    CompiledExpr,
+    CompiledPolicies,
+    RowPredicate,
+    UserInput,
+    compile_predicate,
+    user_inputs,
+)
 from shared.policies.probe import evaluate_action
 from src.models.contracts.policies import Expr, TablePolicies
 
 Action = Literal["insert", "update", "delete"]
 
 
+@dataclass(frozen=True)
+class CompiledFilter:
+    """A subscriber's filter expression, compiled at subscribe time."""
+
+    matches: CompiledExpr
+    key: str
+    """Canonical JSON of the expression; equal filters share a key."""
+    user_inputs: frozenset[UserInput]
+
+
+def compile_filter(user_filter: Expr) -> CompiledFilter:
+    return CompiledFilter(
+        matches=compile_predicate(user_filter),
+        key=json.dumps(user_filter.root, sort_keys=True),
+        user_inputs=user_inputs(user_filter),
+    )
+
+
+def visibility_class(
+    policies: CompiledPolicies,
+    user: Any,
+    user_filter: CompiledFilter | None = None,
+) -> Hashable:
+    """Key under which subscribers always get the same visibility decision.
+
+    Built from the filter and the value of every user field and claim the
+    policies or filter read, so it is only as fine-grained as they are: a
+    policy on `organization_id` groups a table's subscribers by org, one on
+    `user_id` groups a user's connections.
+    """
+    inputs = policies.user_inputs("read")
+    filter_key = None
+    if user_filter is not None:
+        inputs = inputs | user_filter.user_inputs
+        filter_key = user_filter.key
+    values = []
+    for namespace, name in sorted(inputs):
+        if namespace == "user":
+            value = _resolve_user_field(user, name)
+        else:
+            value = _resolve_claims_field(user, name)
+        values.append(_freeze(value))
+    return (filter_key, tuple(values))
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
 def is_row_visible(
     row: dict | None,
     policies: TablePolicies,
@@ -64,7 +137,35 @@ def decide_visibility_change(
     """
     old_visible = is_row_visible(old_row, policies, user, user_filter)
     new_visible = is_row_visible(new_row, policies, user, user_filter)
+    return _four_way(old_row, new_row, old_visible, new_visible)
+
 
+def decide_compiled_visibility_change(
+    old_row: dict | None,
+    new_row: dict | None,
+    can_read: RowPredicate,
+    matches: RowPredicate | None = None,
+) -> tuple[Action, dict | str | None] | None:
+    """`decide_visibility_change` over read policies and filter bound to a user.
+
+    `can_read` is `CompiledPolicies.bind("read", user)`; `matches` the bound
+    filter, if any.
+    """
+
+    def visible(row: dict | None) -> bool:
+        if row is None or not can_read(row):
+            return False
+        return matches is None or matches(row)
+
+    return _four_way(old_row, new_row, visible(old_row), visible(new_row))
+
+
+def _four_way(
+    old_row: dict | None,
+    new_row: dict | None,
+    old_visible: bool,
+    new_visible: bool,
+) -> tuple[Action, dict | str | None] | None:
     if not old_visible and not new_visible:
         return None
     if not old_visible and new_visible:
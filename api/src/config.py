@@ -80,6 +80,20 @@ class Settings(BaseSettings):
         default=10,
         description="Max concurrent workflow executions (controls RabbitMQ prefetch)"
     )
+    execution_lookahead: int = Field(
+        default=10,
+        ge=0,
+        le=50,
+        description="Extra execution messages each worker prefetches and holds for "
+        "fair-share dispatch across organizations"
+    )
+    execution_lookahead_max_age_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a prefetched execution may wait for a free slot before "
+        "it is requeued to the broker (for another worker, and well inside "
+        "RabbitMQ's consumer_timeout)"
+    )
 
     # Process Pool Configuration (on-demand only — every execution forks
     # a fresh one-shot worker, capped at `max_workers` concurrent forks).
@@ -107,6 +121,11 @@ class Settings(BaseSettings):
         default=0.85,
         description="Reject new forks when container memory usage exceeds this ratio (0.0-1.0)"
     )
+    template_preload_modules: int = Field(
+        default=0,
+        description="Warm-import this many of the most-used workspace modules into the "
+        "fork template so children inherit them initialised (0 = disabled)"
+    )
 
     # ==========================================================================
     # Redis
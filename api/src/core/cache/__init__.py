@@ -71,13 +71,17 @@ from .invalidation import (
 # Data provider cache
 from .data_provider_cache import (
     TTL_DATA_PROVIDER,
+    TTL_STALE as TTL_DATA_PROVIDER_STALE,
+    LOCK_EXTEND_INTERVAL as DATA_PROVIDER_LOCK_EXTEND_INTERVAL,
     cache_result as cache_data_provider_result,
     compute_param_hash,
     data_provider_cache_key,
     get_cached_result as get_cached_data_provider,
     invalidate_data_provider,
     acquire_compute_lock,
+    extend_compute_lock,
     release_compute_lock,
+    wait_for_cached_result as wait_for_cached_data_provider,
 )
 
 __all__ = [
@@ -123,11 +127,15 @@ __all__ = [
     "upsert_org",
     # Data provider cache
     "TTL_DATA_PROVIDER",
+    "TTL_DATA_PROVIDER_STALE",
+    "DATA_PROVIDER_LOCK_EXTEND_INTERVAL",
     "data_provider_cache_key",
     "compute_param_hash",
     "get_cached_data_provider",
     "cache_data_provider_result",
     "invalidate_data_provider",
     "acquire_compute_lock",
+    "extend_compute_lock",
     "release_compute_lock",
+    "wait_for_cached_data_provider",
 ]
@@ -4,7 +4,7 @@ Redis-backed cache for data provider results.
 Replaces the in-memory cache with Redis for:
 - Shared cache across multiple containers (horizontal scaling)
 - Durability across restarts
-- TTL-based expiration
+- TTL-based expiration, with a stale window for stale-while-revalidate
 - Stampede protection via SETNX locks
 
 Follows the same patterns as other cache modules in shared/cache/.
@@ -12,6 +12,7 @@ Follows the same patterns as other cache modules in shared/cache/.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -28,6 +29,17 @@ TTL_DATA_PROVIDER = 300
 # Lock TTL for stampede protection (10 seconds)
 TTL_LOCK = 10
 
+# How often a caller still computing pushes back its lock's expiry
+LOCK_EXTEND_INTERVAL = TTL_LOCK / 3
+
+# How long an expired entry is kept so it can be served while one caller
+# refreshes it (stale-while-revalidate). Freshness is still decided by
+# the entry's expires_at.
+TTL_STALE = 300
+
+# Poll interval while waiting for another caller's computation
+LOCK_POLL_INTERVAL = 0.1
+
 
 def _get_scope(org_id: str | None) -> str:
     """Get the scope prefix for a key."""
@@ -82,18 +94,31 @@ def compute_param_hash(parameters: dict[str, Any] | None) -> str:
     return hashlib.sha256(param_str.encode()).hexdigest()[:16]
 
 
+def _is_expired(cached_entry: dict[str, Any]) -> bool:
+    expires_at_str = cached_entry.get("expires_at")
+    if not expires_at_str:
+        return False
+    expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
+    return datetime.now(timezone.utc) >= expires_at
+
+
 async def get_cached_result(
     org_id: str | None,
     name: str,
-    parameters: dict[str, Any] | None
+    parameters: dict[str, Any] | None,
+    allow_stale: bool = False,
 ) -> dict[str, Any] | None:
     """
     Get cached data provider result from Redis.
 
+    Expired entries stay in Redis for ``TTL_STALE`` seconds. They are only
+    returned when ``allow_stale`` is set, marked with ``"stale": True``.
+
     Args:
         org_id: Organization ID
         name: Data provider function name
         parameters: Input parameters
+        allow_stale: Return expired entries still held for revalidation
 
     Returns:
         Cached entry with 'data' and 'expires_at' keys, or None if not cached
@@ -111,15 +136,13 @@ async def get_cached_result(
 
             cached_entry = json.loads(cached_json)
 
-            # Parse expires_at and check if still valid
-            expires_at_str = cached_entry.get("expires_at")
-            if expires_at_str:
-                expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
-                if datetime.now(timezone.utc) >= expires_at:
-                    # Expired - Redis TTL should have handled this, but be safe
+            if _is_expired(cached_entry):
+                if not allow_stale:
                     logger.debug(f"Cache expired for data provider: {name}")
-                    await r.delete(cache_key)
                     return None
+                logger.info(f"Stale cache hit for data provider: {name}")
+                cached_entry["stale"] = True
+                return cached_entry
 
             logger.info(f"Cache hit for data provider: {name}")
             return cached_entry
@@ -128,7 +151,7 @@ async def get_cached_result(
         # Log but don't fail - cache is optional
         logger.warning(f"Cache read failed for {name}: {e}")
         return None
-    except (json.JSONDecodeError, KeyError) as e:
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
         logger.warning(f"Cache data invalid for {name}: {e}")
         return None
 
@@ -143,6 +166,9 @@ async def cache_result(
     """
     Cache a data provider result in Redis.
 
+    The key lives for ``ttl_seconds + TTL_STALE`` so the entry can be served
+    stale while it is refreshed; ``expires_at`` marks the end of freshness.
+
     Args:
         org_id: Organization ID
         name: Data provider function name
@@ -167,7 +193,7 @@ async def cache_result(
             # Use SETEX for atomic set with TTL
             await r.setex(
                 cache_key,
-                ttl_seconds,
+                ttl_seconds + TTL_STALE,
                 json.dumps(cache_entry, default=str)
             )
             logger.info(f"Cached data provider result: {name} (TTL: {ttl_seconds}s)")
@@ -288,3 +314,85 @@ async def release_compute_lock(
     except CacheError as e:
         # Lock will expire on its own - log and continue
         logger.warning(f"Lock release failed for {name}: {e}")
+
+
+async def extend_compute_lock(
+    org_id: str | None,
+    name: str,
+    parameters: dict[str, Any] | None,
+    lock_ttl: int = TTL_LOCK
+) -> None:
+    """
+    Push back the compute lock's expiry while its holder is still computing.
+
+    Call every ``LOCK_EXTEND_INTERVAL`` seconds during a computation that
+    may outlast ``TTL_LOCK``, so waiters keep waiting instead of computing
+    the same result again.
+
+    Args:
+        org_id: Organization ID
+        name: Data provider function name
+        parameters: Input parameters
+        lock_ttl: Lock TTL in seconds
+    """
+    param_hash = compute_param_hash(parameters)
+    lock_key = data_provider_lock_key(org_id, name, param_hash)
+
+    try:
+        async with get_redis() as r:
+            await r.expire(lock_key, lock_ttl)
+
+    except CacheError as e:
+        # The lock may expire early; a waiter then computes too
+        logger.warning(f"Lock extension failed for {name}: {e}")
+
+
+async def wait_for_cached_result(
+    org_id: str | None,
+    name: str,
+    parameters: dict[str, Any] | None,
+    timeout: float = TTL_LOCK,
+) -> dict[str, Any] | None:
+    """
+    Wait for the caller holding the compute lock to cache a fresh result.
+
+    Returns as soon as a fresh entry appears. Returns None if the lock is
+    released (or expires) without one, or after ``timeout`` seconds; the
+    caller should then try to take the lock, and compute the result only if
+    it gets it (otherwise wait again).
+
+    Args:
+        org_id: Organization ID
+        name: Data provider function name
+        parameters: Input parameters
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Fresh cached entry, or None
+    """
+    param_hash = compute_param_hash(parameters)
+    cache_key = data_provider_cache_key(org_id, name, param_hash)
+    lock_key = data_provider_lock_key(org_id, name, param_hash)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    try:
+        async with get_redis() as r:
+            while True:
+                cached_json, locked = await (
+                    r.pipeline(transaction=False).get(cache_key).exists(lock_key).execute()
+                )
+                if cached_json is not None:
+                    cached_entry = json.loads(cached_json)
+                    if not _is_expired(cached_entry):
+                        return cached_entry
+                if not locked or loop.time() >= deadline:
+                    return None
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+    except CacheError as e:
+        logger.warning(f"Waiting for cached result failed for {name}: {e}")
+        return None
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.warning(f"Cache data invalid for {name}: {e}")
+        return None
@@ -0,0 +1,233 @@
+"""
+Per-process cache for resolved SDK integration data.
+
+``POST /api/sdk/integrations/get`` resolves a mapping, cascades to the right
+OAuth token, resolves URL templates and decrypts secrets — and integration
+modules call it from nearly every helper. This cache keeps the resolved
+response in process memory, keyed by (integration name, org, oauth_scope).
+
+Entries are held in memory only (they contain decrypted secrets) and expire
+after TTL_INTEGRATION_RESOLUTION seconds or shortly before the cached access
+token expires, whichever comes first.
+
+Cross-process invalidation uses a Redis version counter: every entry records
+the version current when its resolution started, and any committed write to
+an integration, mapping, integration config, OAuth provider or OAuth token
+bumps the counter (see ``register_integration_cache_hooks``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.cache.keys import INTEGRATIONS_VERSION_KEY
+from src.core.cache.redis_client import get_shared_redis
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a resolution is reused (seconds)
+TTL_INTEGRATION_RESOLUTION = 30
+
+# Cached access tokens are dropped this long before they expire (seconds)
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# Bound on cached resolutions per process
+MAX_CACHED_RESOLUTIONS = 1024
+
+CacheKey = tuple[str, str | None, str | None]
+
+# key -> (version, monotonic deadline, response)
+_cache: dict[CacheKey, tuple[int, float, Any]] = {}
+
+
+async def current_version() -> int | None:
+    """Return the integration cache version, or None if Redis is unavailable."""
+    try:
+        r = await get_shared_redis()
+        raw = await r.get(INTEGRATIONS_VERSION_KEY)
+    except Exception as e:
+        logger.debug(f"Integration cache version read failed: {e}")
+        return None
+    if isinstance(raw, bytes):
+        raw = raw.decode()
+    try:
+        return int(raw) if raw is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def get_cached_resolution(key: CacheKey, version: int | None) -> Any | None:
+    """Return a cached response for ``key`` if it is current, else None."""
+    if version is None:
+        return None
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    entry_version, deadline, response = entry
+    if entry_version != version or time.monotonic() >= deadline:
+        _cache.pop(key, None)
+        return None
+    return response
+
+
+def cache_resolution(
+    key: CacheKey,
+    version: int | None,
+    response: Any,
+    expires_at: str | None = None,
+) -> None:
+    """
+    Cache a resolved response.
+
+    Args:
+        key: (integration name, org_id, oauth_scope)
+        version: Version read before resolution started (None skips caching)
+        response: Response to reuse
+        expires_at: ISO expiry of the access token in ``response``, if any
+    """
+    if version is None:
+        return
+
+    ttl = float(TTL_INTEGRATION_RESOLUTION)
+    if expires_at:
+        try:
+            expiry = datetime.fromisoformat(expires_at)
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)
+            remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+            ttl = min(ttl, remaining - TOKEN_EXPIRY_MARGIN_SECONDS)
+        except ValueError:
+            # Unparseable expiry - fall back to the plain TTL
+            pass
+    if ttl <= 0:
+        return
+
+    if len(_cache) >= MAX_CACHED_RESOLUTIONS:
+        now = time.monotonic()
+        for stale in [k for k, (_, deadline, _) in _cache.items() if deadline <= now]:
+            del _cache[stale]
+        if len(_cache) >= MAX_CACHED_RESOLUTIONS:
+            # Still full: drop the oldest insertion
+            del _cache[next(iter(_cache))]
+
+    _cache[key] = (version, time.monotonic() + ttl, response)
+
+
+def clear_local_cache() -> None:
+    """Drop every cached resolution in this process."""
+    _cache.clear()
+
+
+async def invalidate_integration_resolutions() -> None:
+    """Invalidate cached resolutions in every process."""
+    clear_local_cache()
+    try:
+        r = await get_shared_redis()
+        await r.incr(INTEGRATIONS_VERSION_KEY)
+    except Exception as e:
+        # Best-effort: entries still expire within TTL_INTEGRATION_RESOLUTION
+        logger.warning(f"Failed to bump integration cache version: {e}")
+
+
+# =============================================================================
+# Invalidation hooks
+# =============================================================================
+
+# Attribute name used to flag a session that touched integration state
+_DIRTY_ATTR = "_bifrost_integration_cache_dirty"
+
+_WATCHED_MODELS: tuple[type, ...] = ()
+
+
+def _watched_models() -> tuple[type, ...]:
+    global _WATCHED_MODELS
+    if not _WATCHED_MODELS:
+        from src.models.orm.config import Config
+        from src.models.orm.integrations import (
+            Integration,
+            IntegrationConfigSchema,
+            IntegrationMapping,
+        )
+        from src.models.orm.oauth import OAuthProvider, OAuthToken
+
+        _WATCHED_MODELS = (
+            Config,
+            Integration,
+            IntegrationConfigSchema,
+            IntegrationMapping,
+            OAuthProvider,
+            OAuthToken,
+        )
+    return _WATCHED_MODELS
+
+
+def mark_integration_state_changed(session: Session | AsyncSession) -> None:
+    """Invalidate cached resolutions when this session next commits.
+
+    Bulk and Core ``insert``/``update``/``delete`` statements bypass the
+    flush hooks below; call this after executing one against integration or
+    OAuth tables.
+    """
+    setattr(getattr(session, "sync_session", session), _DIRTY_ATTR, True)
+
+
+def _affects_resolution(instance: Any) -> bool:
+    if not isinstance(instance, _watched_models()):
+        return False
+    from src.models.orm.config import Config
+
+    # Plain (non-integration) config rows don't feed integration resolution
+    if isinstance(instance, Config):
+        return instance.integration_id is not None
+    return True
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    """SQLAlchemy after_flush event — flag sessions that changed integration state."""
+    if getattr(session, _DIRTY_ATTR, False):
+        return
+    for instances in (session.new, session.dirty, session.deleted):
+        if any(_affects_resolution(instance) for instance in instances):
+            setattr(session, _DIRTY_ATTR, True)
+            return
+
+
+def _after_commit(session: Session) -> None:
+    """SQLAlchemy after_commit event — bump the version for flagged sessions."""
+    if not getattr(session, _DIRTY_ATTR, False):
+        return
+    setattr(session, _DIRTY_ATTR, False)
+
+    clear_local_cache()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # No event loop (e.g. test or CLI context)
+    loop.create_task(invalidate_integration_resolutions())
+
+
+def _after_rollback(session: Session) -> None:
+    """Clear the flag on rollback."""
+    setattr(session, _DIRTY_ATTR, False)
+
+
+def register_integration_cache_hooks() -> None:
+    """Register SQLAlchemy event listeners that invalidate cached resolutions.
+
+    Call this once during startup in every process that writes integration
+    or OAuth state (API, scheduler, worker).
+    """
+    if event.contains(Session, "after_commit", _after_commit):
+        return
+
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
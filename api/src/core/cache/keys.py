@@ -96,6 +96,14 @@ async def config_hash_key_versioned(
     return f"{base}:v{version}"
 
 
+# =============================================================================
+# Integration Keys
+# =============================================================================
+
+# Incremented on any integration/OAuth write; see cache.integration_cache
+INTEGRATIONS_VERSION_KEY = "bifrost:integrations:version"
+
+
 # =============================================================================
 # Form Keys
 # =============================================================================
@@ -272,6 +280,28 @@ def agent_run_steps_stream_key(run_id: str) -> str:
     return f"bifrost:agent_run_steps:{run_id}"
 
 
+def conversation_history_key(conversation_id: str) -> str:
+    """
+    Key for the cached LLM message history of a chat conversation.
+
+    Structure: STRING (JSON) with converted messages and conversion state
+    TTL: TTL_CONVERSATION_HISTORY, refreshed on every turn
+    Rebuilt from Postgres when missing or out of date.
+    """
+    return f"bifrost:conversation_history:{conversation_id}"
+
+
+def query_embedding_key(model: str, dimensions: int, query_hash: str) -> str:
+    """
+    Key for the cached embedding of a knowledge search query.
+
+    Structure: STRING (JSON array of floats)
+    TTL: TTL_QUERY_EMBEDDING
+    query_hash is the sha256 of the normalized query text.
+    """
+    return f"bifrost:query_embedding:{model}:{dimensions}:{query_hash}"
+
+
 # =============================================================================
 # Authentication Keys (Refresh Token JTI, OAuth State, Rate Limiting)
 # =============================================================================
@@ -349,6 +379,12 @@ TTL_ORGS = 3600  # 1 hour
 TTL_PENDING = 3600  # 1 hour (safety for orphaned changes)
 TTL_PENDING_EXECUTION = 3600  # 1 hour (safety for orphaned pending executions)
 
+# Chat TTLs
+TTL_CONVERSATION_HISTORY = 86400  # 24 hours (idle conversations are rebuilt from Postgres)
+
+# Knowledge TTLs
+TTL_QUERY_EMBEDDING = 86400  # 24 hours (embeddings don't change for a model)
+
 # Embed TTLs
 TTL_EMBED_EXECUTION = 86400  # 24 hours (embed session → execution link)
 
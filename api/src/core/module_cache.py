@@ -7,13 +7,19 @@ Workers read modules from this cache during virtual imports.
 Key patterns:
 - bifrost:module:{path} - JSON: {content, path, hash}
 - bifrost:module:index - SET of all module paths
+- bifrost:modcode:{magic}:{hash}:{path} - marshalled code object (bytes)
+- bifrost:module:usage - ZSET of module path -> executions that imported it
+- bifrost:module:changed - pub/sub channel, JSON: {path, hash} (hash null on delete)
 """
 
+import asyncio
 import hashlib
+import importlib.util
 import json
 import logging
+import marshal
 from pathlib import Path
-from typing import Awaitable, TypedDict, cast
+from typing import Any, Awaitable, TypedDict, cast
 
 from src.core.log_safety import log_safe
 from src.core.redis_client import get_redis_client
@@ -23,6 +29,16 @@ logger = logging.getLogger(__name__)
 
 MODULE_KEY_PREFIX = "bifrost:module:"
 MODULE_INDEX_KEY = "bifrost:module:index"
+MODULE_CODE_KEY_PREFIX = "bifrost:modcode:"
+MODULE_USAGE_KEY = "bifrost:module:usage"
+MODULE_CHANGED_CHANNEL = "bifrost:module:changed"
+
+# TTL for cached modules and their bytecode (24 hours)
+MODULE_CACHE_TTL = 86400
+
+# Bytecode is only valid for the interpreter that produced it, so the
+# magic number is part of every code cache key.
+BYTECODE_MAGIC = importlib.util.MAGIC_NUMBER.hex()
 
 
 class CachedModule(TypedDict):
@@ -33,6 +49,31 @@ class CachedModule(TypedDict):
     hash: str
 
 
+def module_code_key(path: str, content_hash: str) -> str:
+    """
+    Build the Redis key for a module's marshalled code object.
+
+    Keyed by content hash (not just path) so stale bytecode can never be
+    served for new source, and by path because the code object embeds
+    the filename used in tracebacks.
+    """
+    return f"{MODULE_CODE_KEY_PREFIX}{BYTECODE_MAGIC}:{content_hash}:{path}"
+
+
+def compile_module_code(path: str, content: str) -> bytes:
+    """
+    Compile module source and marshal the resulting code object.
+
+    Uses the same filename as VirtualModuleLoader so tracebacks are
+    identical whether the code came from the cache or a fresh compile.
+
+    Raises:
+        SyntaxError: If the source does not compile
+    """
+    code = compile(content, filename=path, mode="exec", dont_inherit=True)
+    return marshal.dumps(code)
+
+
 async def get_module(path: str) -> CachedModule | None:
     """
     Fetch a module from cache, falling back to S3.
@@ -77,7 +118,7 @@ async def get_module(path: str) -> CachedModule | None:
 
     # Re-cache to Redis (self-healing)
     try:
-        await redis.setex(key, 86400, json.dumps(module))
+        await redis.setex(key, MODULE_CACHE_TTL, json.dumps(module))
         redis_conn = await redis._get_redis()
         await cast(Awaitable[int], redis_conn.sadd(MODULE_INDEX_KEY, path))
     except Exception as e:
@@ -101,12 +142,30 @@ async def set_module(path: str, content: str, content_hash: str) -> None:
     key = f"{MODULE_KEY_PREFIX}{path}"
 
     cached = CachedModule(content=content, path=path, hash=content_hash)
-    await redis.setex(key, 86400, json.dumps(cached))  # 24hr TTL
+    await redis.setex(key, MODULE_CACHE_TTL, json.dumps(cached))
 
     # Add to index set
     redis_conn = await redis._get_redis()
     await cast(Awaitable[int], redis_conn.sadd(MODULE_INDEX_KEY, path))
 
+    # Pre-compile so workers can marshal.loads() instead of compiling on
+    # every import. Broken source is skipped - the worker will surface the
+    # SyntaxError itself when it falls back to compiling. Compiling a large
+    # module is CPU-bound, so it runs off the event loop.
+    if content_hash:
+        try:
+            code = await asyncio.to_thread(compile_module_code, path, content)
+            await cast(
+                Awaitable[bool],
+                redis_conn.setex(module_code_key(path, content_hash), MODULE_CACHE_TTL, code),
+            )
+        except SyntaxError:
+            logger.debug(f"Skipping bytecode cache for {path}: syntax error")
+        except Exception as e:
+            logger.warning(f"Failed to cache bytecode for {log_safe(path)}: {e}")
+
+    await _publish_module_change(redis_conn, path, content_hash)
+
     logger.debug(f"Cached module: {path}")
 
 
@@ -128,9 +187,31 @@ async def invalidate_module(path: str) -> None:
     redis_conn = await redis._get_redis()
     await cast(Awaitable[int], redis_conn.srem(MODULE_INDEX_KEY, path))
 
+    await _publish_module_change(redis_conn, path, None)
+
     logger.debug(f"Invalidated module cache: {path}")
 
 
+async def _publish_module_change(redis_conn: Any, path: str, content_hash: str | None) -> None:
+    """
+    Notify worker pools that a cached module changed.
+
+    Pools with hot-module preloading use this to refresh or restart their
+    template process. Best-effort: pools also re-verify preloaded hashes
+    periodically, so a lost notification only delays the refresh.
+    """
+    try:
+        await cast(
+            Awaitable[int],
+            redis_conn.publish(
+                MODULE_CHANGED_CHANNEL,
+                json.dumps({"path": path, "hash": content_hash}),
+            ),
+        )
+    except Exception as e:
+        logger.debug(f"Failed to publish module change for {path}: {e}")
+
+
 async def get_all_module_paths() -> set[str]:
     """
     Get all cached module paths.
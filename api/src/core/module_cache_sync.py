@@ -27,13 +27,16 @@ from typing import Any
 
 import redis
 
-from src.core.module_cache import MODULE_INDEX_KEY, MODULE_KEY_PREFIX, CachedModule
+from src.core.module_cache import (
+    MODULE_CACHE_TTL,
+    MODULE_INDEX_KEY,
+    MODULE_KEY_PREFIX,
+    CachedModule,
+    module_code_key,
+)
 
 logger = logging.getLogger(__name__)
 
-# TTL for cached modules (24 hours)
-MODULE_CACHE_TTL = 86400
-
 REPO_PREFIX = "_repo/"
 
 # Cached S3 client — reused across calls to avoid repeated setup
@@ -54,6 +57,20 @@ def _get_sync_redis() -> Any:
     )
 
 
+@lru_cache(maxsize=1)
+def _get_sync_redis_binary() -> Any:
+    """
+    Get synchronous Redis client that returns raw bytes.
+
+    Marshalled code objects are binary, so they can't go through the
+    decode_responses client used for JSON module payloads.
+    """
+    return redis.Redis.from_url(
+        os.environ.get("BIFROST_REDIS_URL", "redis://localhost:6379/0"),
+        decode_responses=False,
+    )
+
+
 def _get_engine_credentials() -> tuple[str, str] | None:
     """
     Read the engine bearer token and API URL from the credentials file.
@@ -332,6 +349,37 @@ def get_module_sync(path: str) -> CachedModule | None:
         return None
 
 
+def get_module_code_sync(path: str, content_hash: str) -> bytes | None:
+    """
+    Fetch a module's marshalled code object (synchronous).
+
+    Called by VirtualModuleLoader.exec_module() before compiling. Returns
+    None on a miss or any Redis error - the caller compiles from source.
+    """
+    try:
+        data = _get_sync_redis_binary().get(module_code_key(path, content_hash))
+        return data if data else None
+    except redis.RedisError as e:
+        logger.debug(f"Redis error fetching bytecode for {path}: {e}")
+        return None
+
+
+def set_module_code_sync(path: str, content_hash: str, code: bytes) -> None:
+    """
+    Store a module's marshalled code object (synchronous).
+
+    Populates the bytecode cache lazily when a worker had to compile
+    (e.g. modules cached before the bytecode cache existed, or after a
+    Python upgrade changed the magic number). Failures are non-fatal.
+    """
+    try:
+        _get_sync_redis_binary().setex(
+            module_code_key(path, content_hash), MODULE_CACHE_TTL, code
+        )
+    except redis.RedisError as e:
+        logger.debug(f"Failed to cache bytecode for {path}: {e}")
+
+
 def _list_s3_modules() -> set[str]:
     """
     List all Python module paths in S3 _repo/ (synchronous).
@@ -410,8 +458,9 @@ def get_module_index_sync() -> set[str]:
 
 
 def reset_sync_redis() -> None:
-    """Reset the sync Redis client."""
+    """Reset the sync Redis clients."""
     _get_sync_redis.cache_clear()
+    _get_sync_redis_binary.cache_clear()
 
 
 def reset_s3_client() -> None:
@@ -13,8 +13,10 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import UUID
 
@@ -30,6 +32,31 @@ from src.core.redis_reconnect import ResilientPubSubListener
 
 logger = logging.getLogger(__name__)
 
+# Prefix of every channel published to Redis
+REDIS_CHANNEL_PREFIX = "bifrost:"
+
+# How often traffic counters are logged while messages arrive
+STATS_LOG_INTERVAL_SECONDS = 300.0
+
+# Delivers one `table:` message to the channel's sockets; returns those
+# whose send failed
+TableFanout = Callable[[str, dict[str, Any], list["WebSocket"]], Awaitable[set["WebSocket"]]]
+
+
+@dataclass
+class PubSubStats:
+    """Counters for this replica's Redis pub/sub traffic (since process start)."""
+
+    # Messages read from Redis
+    received: int = 0
+    # Received messages with no local WebSocket left on the channel
+    unrouted: int = 0
+    # Per-socket sends (and table dispatcher calls)
+    delivered: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
 
 @dataclass
 class ConnectionManager:
@@ -40,12 +67,23 @@ class ConnectionManager:
     - execution:{execution_id} - Execution status updates and logs
     - user:{user_id} - User-specific notifications
     - system - System-wide broadcasts
+
+    Only channels with a local WebSocket are subscribed in Redis: the first
+    socket on a channel subscribes it and the last one to leave unsubscribes
+    it, so a replica only receives traffic it can deliver.
+
+    Traffic counters (`stats`) are logged at debug level every
+    ``STATS_LOG_INTERVAL_SECONDS`` while messages arrive, and on close.
     """
 
     # Active WebSocket connections per channel
     connections: dict[str, set[WebSocket]] = field(default_factory=dict)
     # Resilient pub/sub listener for receiving messages
     _pubsub_listener: ResilientPubSubListener | None = None
+    stats: PubSubStats = field(default_factory=PubSubStats)
+    _stats_logged_at: float = field(default_factory=time.monotonic)
+    # Policy-aware delivery for `table:` channels, set by the websocket router
+    table_fanout: TableFanout | None = None
 
     async def connect(self, websocket: WebSocket, channels: list[str]) -> None:
         """
@@ -63,20 +101,60 @@ class ConnectionManager:
         if not self._pubsub_listener or not self._pubsub_listener.is_healthy():
             await self._init_redis()
 
+        added = [channel for channel in channels if self._add(websocket, channel)]
+        await self._redis_subscribe(added)
         for channel in channels:
-            if channel not in self.connections:
-                self.connections[channel] = set()
-            self.connections[channel].add(websocket)
             logger.debug(f"WebSocket connected to channel: {log_safe(channel)}")
 
+    async def subscribe(self, websocket: WebSocket, channel: str) -> None:
+        """Add a connected WebSocket to another channel."""
+        if self._add(websocket, channel):
+            await self._redis_subscribe([channel])
+
+    def unsubscribe(self, websocket: WebSocket, channel: str) -> None:
+        """Remove a WebSocket from one channel."""
+        if self._remove(websocket, channel):
+            self._redis_unsubscribe([channel])
+
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove WebSocket from all channels."""
-        for channel, sockets in list(self.connections.items()):
-            sockets.discard(websocket)
-            if not sockets:
-                del self.connections[channel]
+        emptied = [
+            channel
+            for channel in list(self.connections)
+            if self._remove(websocket, channel)
+        ]
+        self._redis_unsubscribe(emptied)
         logger.debug("WebSocket disconnected")
 
+    def _add(self, websocket: WebSocket, channel: str) -> bool:
+        """Add a socket to a channel; True if it's the channel's first."""
+        sockets = self.connections.setdefault(channel, set())
+        sockets.add(websocket)
+        return len(sockets) == 1
+
+    def _remove(self, websocket: WebSocket, channel: str) -> bool:
+        """Remove a socket from a channel; True if that emptied it."""
+        sockets = self.connections.get(channel)
+        if sockets is None:
+            return False
+        sockets.discard(websocket)
+        if sockets:
+            return False
+        del self.connections[channel]
+        return True
+
+    async def _redis_subscribe(self, channels: list[str]) -> None:
+        if channels and self._pubsub_listener:
+            await self._pubsub_listener.subscribe(
+                REDIS_CHANNEL_PREFIX + channel for channel in channels
+            )
+
+    def _redis_unsubscribe(self, channels: list[str]) -> None:
+        if channels and self._pubsub_listener:
+            self._pubsub_listener.unsubscribe(
+                REDIS_CHANNEL_PREFIX + channel for channel in channels
+            )
+
     async def broadcast(self, channel: str, message: dict[str, Any]) -> None:
         """
         Broadcast message to all connections on a channel.
@@ -94,35 +172,59 @@ class ConnectionManager:
         if not published:
             await self._send_local(channel, message)
 
+    async def broadcast_many(self, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Broadcast several messages with a single pipelined Redis round trip.
+
+        Same delivery semantics as ``broadcast``: Redis when available,
+        local-only fallback otherwise.
+
+        Args:
+            messages: (channel, message) pairs, published in order
+        """
+        if not messages:
+            return
+        try:
+            async with get_redis() as r:
+                pipe = r.pipeline(transaction=False)
+                for channel, message in messages:
+                    pipe.publish(f"bifrost:{channel}", json.dumps(message))
+                await pipe.execute()
+            return
+        except Exception as e:
+            logger.warning(f"Failed to publish {len(messages)} messages to Redis: {e}")
+
+        for channel, message in messages:
+            await self._send_local(channel, message)
+
     async def _send_local(self, channel: str, message: dict[str, Any]) -> None:
         """Send message to local WebSocket connections.
 
-        For `table:` channels, the connection MUST have a per-message dispatcher
-        attached (via the websocket router for policy-driven filtering). The
-        dispatcher receives the raw message and decides what — if anything — to
-        deliver to the client. Without a dispatcher, the connection simply does
-        not receive table updates: subscribing to `table:` outside the
-        policy-aware router is not supported.
+        `table:` channels go through `table_fanout` (installed by the
+        websocket router for policy-driven filtering), which receives the raw
+        message and every socket on the channel and decides what — if
+        anything — each one gets. Sockets the router hasn't registered a
+        table subscription for receive nothing: subscribing to `table:`
+        outside the policy-aware router is not supported.
         """
         if channel not in self.connections:
             return
 
-        dead_connections = set()
-        is_table_channel = channel.startswith("table:")
-        message_json = json.dumps(message) if not is_table_channel else None
-
-        for websocket in self.connections[channel]:
-            try:
-                if is_table_channel:
-                    dispatcher = getattr(websocket, "_table_dispatcher", None)
-                    if dispatcher is None:
-                        continue
-                    await dispatcher(channel, message)
-                else:
-                    assert message_json is not None
+        dead_connections: set[WebSocket] = set()
+        sockets = list(self.connections[channel])
+
+        if channel.startswith("table:"):
+            if self.table_fanout is not None:
+                dead_connections = await self.table_fanout(channel, message, sockets)
+                self.stats.delivered += len(sockets) - len(dead_connections)
+        else:
+            message_json = json.dumps(message)
+            for websocket in sockets:
+                try:
                     await websocket.send_text(message_json)
-            except Exception:
-                dead_connections.add(websocket)
+                    self.stats.delivered += 1
+                except Exception:
+                    dead_connections.add(websocket)
 
         # Clean up dead connections
         for ws in dead_connections:
@@ -155,25 +257,39 @@ class ConnectionManager:
 
             # Create resilient listener for receiving messages
             async def on_message(channel: str, data: dict) -> None:
-                # Strip "bifrost:" prefix from channel
-                local_channel = channel.replace("bifrost:", "")
+                local_channel = channel.removeprefix(REDIS_CHANNEL_PREFIX)
+                self.stats.received += 1
+                if time.monotonic() - self._stats_logged_at >= STATS_LOG_INTERVAL_SECONDS:
+                    self._log_stats()
+                if local_channel not in self.connections:
+                    # Last socket left after the message was published
+                    self.stats.unrouted += 1
+                    return
                 await self._send_local(local_channel, data)
 
             self._pubsub_listener = ResilientPubSubListener(
                 redis_url=settings.redis_url,
-                patterns=["bifrost:*"],
                 on_message=on_message,
             )
             await self._pubsub_listener.start()
+            # Channels that gained sockets while Redis was unavailable
+            await self._redis_subscribe(list(self.connections))
             logger.info("Redis pub/sub initialized (with auto-reconnect)")
         except Exception as e:
             logger.warning(f"Failed to connect to Redis: {e}")
             self._pubsub_listener = None
 
+    def _log_stats(self) -> None:
+        self._stats_logged_at = time.monotonic()
+        logger.debug(
+            "Pub/sub: %d local channels, %s", len(self.connections), self.stats.as_dict()
+        )
+
     async def close(self) -> None:
         """Clean up connections."""
         if self._pubsub_listener:
             await self._pubsub_listener.stop()
+        self._log_stats()
 
 
 # Global connection manager instance
@@ -204,6 +320,30 @@ async def publish_execution_update(
     await manager.broadcast(f"execution:{execution_id}", message)
 
 
+async def publish_execution_updates(
+    updates: list[tuple[str | UUID, str, dict[str, Any] | None]],
+) -> None:
+    """
+    Publish several execution status updates in one Redis round trip.
+
+    Args:
+        updates: (execution_id, status, data) tuples, as for
+            ``publish_execution_update``
+    """
+    await manager.broadcast_many([
+        (
+            f"execution:{execution_id}",
+            {
+                "type": "execution_update",
+                "executionId": str(execution_id),
+                "status": status,
+                **(data or {}),
+            },
+        )
+        for execution_id, status, data in updates
+    ])
+
+
 async def publish_execution_log(
     execution_id: str | UUID,
     level: str,
@@ -961,6 +1101,33 @@ async def publish_document_change(
     await publisher.publish(channel, payload=payload)
 
 
+# Changes per `document_changes` message; bounds Redis payload size and the
+# work a subscriber's fanout does per message
+DOCUMENT_CHANGES_PER_MESSAGE = 500
+
+
+async def publish_document_changes(
+    table_id: str,
+    changes: list[dict[str, Any]],
+) -> None:
+    """Emit coalesced events for a batch of document changes.
+
+    Each entry carries the same ``action``/``old_row``/``new_row`` fields as
+    ``publish_document_change``; subscribers apply the per-row visibility
+    decision to every entry. Used by the batch endpoints so a 5,000-row
+    write is ten publishes of ``DOCUMENT_CHANGES_PER_MESSAGE`` changes
+    instead of 5,000 (or one unbounded message). No-op for an empty batch.
+    """
+    channel = f"table:{table_id}"
+    for start in range(0, len(changes), DOCUMENT_CHANGES_PER_MESSAGE):
+        payload = {
+            "type": "document_changes",
+            "table_id": table_id,
+            "changes": changes[start:start + DOCUMENT_CHANGES_PER_MESSAGE],
+        }
+        await publisher.publish(channel, payload=payload)
+
+
 async def publish_policy_changed(table_id: str) -> None:
     """Notify subscribers that the table's policies were edited.
 
@@ -3,7 +3,7 @@ Redis Client for Execution Management
 
 Provides:
 1. Pending execution storage (API writes, Worker reads)
-2. Sync execution results via BLPOP/RPUSH pattern
+2. Sync execution results via RPUSH + a per-process result dispatcher
 3. Cancellation flag management
 
 Execution Flow:
@@ -11,9 +11,11 @@ Execution Flow:
 2. API publishes to RabbitMQ
 3. Worker reads pending execution from Redis
 4. Worker writes to PostgreSQL and executes
-5. For sync: Worker pushes result, API's BLPOP returns
+5. For sync: Worker pushes result and publishes a notification; the API's
+   ResultDispatcher wakes the waiting request, which pops the result
 """
 
+import asyncio
 import json
 import logging
 from decimal import Decimal
@@ -24,11 +26,13 @@ import redis.asyncio as redis
 
 from src.config import get_settings
 from src.core.log_safety import log_safe
+from src.core.redis_reconnect import ResilientPubSubListener
 
 logger = logging.getLogger(__name__)
 
 # Redis key prefixes
 RESULT_KEY_PREFIX = "bifrost:result:"
+RESULT_NOTIFY_CHANNEL = "bifrost:results"
 PENDING_KEY_PREFIX = "bifrost:exec:"
 PENDING_KEY_SUFFIX = ":pending"
 ENDPOINT_WORKFLOW_CACHE_PREFIX = "bifrost:endpoint:workflow:"
@@ -44,6 +48,10 @@ DEFAULT_TIMEOUT_SECONDS = 300
 # Result TTL for auto-cleanup (60 seconds after push)
 RESULT_TTL_SECONDS = 60
 
+# Waiters re-check their result list at this interval, so a notification
+# missed during a pub/sub reconnect delays a result rather than losing it
+RESULT_RECHECK_SECONDS = 5.0
+
 # Pending execution TTL (1 hour safety for orphaned entries)
 PENDING_EXECUTION_TTL_SECONDS = 3600
 
@@ -68,18 +76,105 @@ class PendingExecution(TypedDict):
     cancelled: bool
 
 
+class ResultDispatcher:
+    """
+    Per-process fan-out of sync execution results to waiting callers.
+
+    One pub/sub subscription on RESULT_NOTIFY_CHANNEL serves every waiter in
+    the process. A waiter only touches the connection pool for a
+    non-blocking LPOP when woken (or on the periodic re-check), so the number
+    of concurrent sync waits is bounded by memory, not Redis connections.
+    """
+
+    def __init__(self, client: "RedisClient"):
+        self._client = client
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._listener: ResilientPubSubListener | None = None
+
+    async def start(self) -> None:
+        """Start the notification listener if it is not already running."""
+        if self._listener is not None:
+            return
+        settings = get_settings()
+        self._listener = ResilientPubSubListener(
+            redis_url=settings.redis_url,
+            channels=[RESULT_NOTIFY_CHANNEL],
+            on_message=self._on_message,
+        )
+        await self._listener.start()
+
+    async def stop(self) -> None:
+        """Stop the listener and wake every waiter so it re-checks once."""
+        if self._listener is not None:
+            await self._listener.stop()
+            self._listener = None
+        for events in self._waiters.values():
+            for event in events:
+                event.set()
+
+    async def _on_message(self, channel: str, data: dict) -> None:
+        execution_id = data.get("execution_id")
+        for event in self._waiters.get(execution_id, ()):
+            event.set()
+
+    async def wait(
+        self,
+        execution_id: str,
+        timeout_seconds: float,
+    ) -> dict[str, Any] | None:
+        """
+        Wait for an execution's result.
+
+        Registers before the first LPOP so a result pushed at any point is
+        either popped directly or signalled through the listener.
+
+        Returns:
+            Result dict or None if timeout
+        """
+        await self.start()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        event = asyncio.Event()
+        self._waiters.setdefault(execution_id, set()).add(event)
+        try:
+            while True:
+                event.clear()
+                value = await self._client._pop_result(execution_id)
+                if value is not None:
+                    return json.loads(value)
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(
+                        event.wait(), timeout=min(remaining, RESULT_RECHECK_SECONDS)
+                    )
+                except asyncio.TimeoutError:
+                    # Re-check (or give up) on the next iteration
+                    pass
+        finally:
+            events = self._waiters.get(execution_id)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del self._waiters[execution_id]
+
+
 class RedisClient:
     """
     Redis client wrapper for execution management.
 
     Provides:
     - Pending execution: set/get/delete/cancel pending executions
-    - Sync results: push_result/wait_for_result via BLPOP
+    - Sync results: push_result/wait_for_result via a shared ResultDispatcher
     - Cancellation: set_cancel_flag for running executions
     """
 
     def __init__(self):
         self._redis: redis.Redis | None = None
+        self._dispatcher = ResultDispatcher(self)
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create Redis connection."""
@@ -313,7 +408,7 @@ class RedisClient:
             raise
 
     # =========================================================================
-    # Sync Execution Results (BLPOP/RPUSH pattern)
+    # Sync Execution Results (RPUSH + notify, dispatched per process)
     # =========================================================================
 
     async def push_result(
@@ -356,6 +451,10 @@ class RedisClient:
             await cast(Awaitable[int], redis_client.rpush(key, json.dumps(payload, default=str)))
             # Set TTL for auto-cleanup
             await cast(Awaitable[bool], redis_client.expire(key, RESULT_TTL_SECONDS))
+            # Wake the waiting API process; the list above stays authoritative
+            await redis_client.publish(
+                RESULT_NOTIFY_CHANNEL, json.dumps({"execution_id": execution_id})
+            )
             logger.debug(f"Pushed result to Redis: {key}")
         except Exception as e:
             logger.error(f"Failed to push result to Redis: {e}")
@@ -364,12 +463,13 @@ class RedisClient:
     async def wait_for_result(
         self,
         execution_id: str,
-        timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
     ) -> dict[str, Any] | None:
         """
         Wait for execution result from Redis.
 
-        Called by API for sync execution requests.
+        Called by API for sync execution requests. The wait is an in-process
+        future on the shared ResultDispatcher; no connection is held open.
 
         Args:
             execution_id: Execution ID
@@ -378,29 +478,27 @@ class RedisClient:
         Returns:
             Result dict or None if timeout
         """
-        redis_client = await self._get_redis()
-        key = f"{RESULT_KEY_PREFIX}{execution_id}"
-
         try:
-            # BLPOP blocks until value available or timeout
-            # Cast needed: redis-py returns Union[Awaitable[list], list] but we're async
-            result = await cast(
-                Awaitable[list[str] | None],
-                redis_client.blpop([key], timeout=timeout_seconds)
-            )
-
-            if result is None:
-                logger.warning(f"Timeout waiting for result: {execution_id}")
-                return None
-
-            # result is tuple (key, value)
-            _, value = result
-            return json.loads(value)
-
+            result = await self._dispatcher.wait(execution_id, timeout_seconds)
         except Exception as e:
             logger.error(f"Error waiting for result: {e}")
             raise
 
+        if result is None:
+            logger.warning(f"Timeout waiting for result: {execution_id}")
+        return result
+
+    async def _pop_result(self, execution_id: str) -> str | None:
+        """Pop a pushed result without blocking."""
+        redis_client = await self._get_redis()
+        key = f"{RESULT_KEY_PREFIX}{execution_id}"
+        # Cast needed: redis-py returns Union[Awaitable[str], str] but we're async
+        return await cast(Awaitable[str | None], redis_client.lpop(key))
+
+    async def start_result_dispatcher(self) -> None:
+        """Subscribe to result notifications ahead of the first sync wait."""
+        await self._dispatcher.start()
+
     # =========================================================================
     # Agent Run Cancellation (mirrors execution cancel flags)
     # =========================================================================
@@ -490,6 +588,7 @@ class RedisClient:
 
     async def close(self) -> None:
         """Close Redis connection."""
+        await self._dispatcher.stop()
         if self._redis:
             await self._redis.close()
             self._redis = None
@@ -9,7 +9,7 @@ restarts or network issues occur.
 import asyncio
 import json
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 
 from redis.asyncio import Redis
@@ -43,6 +43,10 @@ class ResilientPubSubListener:
             patterns=["bifrost:*"],
             on_message=handle_message,
         )
+
+    Channels can also be added and removed while running with subscribe()
+    and unsubscribe(). Changes made close together are sent to Redis as one
+    SUBSCRIBE and one UNSUBSCRIBE, and survive reconnects.
     """
 
     redis_url: str
@@ -56,12 +60,20 @@ class ResilientPubSubListener:
     backoff_multiplier: float = 2.0  # Multiplier for each retry
     extended_failure_threshold: int = 5  # Log ERROR after this many failures
 
+    # How long subscription changes are collected before being sent
+    subscription_batch_window: float = 0.01
+
     # Internal state
     _redis: Redis | None = field(default=None, init=False)
     _pubsub: PubSub | None = field(default=None, init=False)
     _listener_task: asyncio.Task | None = field(default=None, init=False)
     _running: bool = field(default=False, init=False)
     _consecutive_failures: int = field(default=0, init=False)
+    # Channels added with subscribe(), and changes not yet sent to Redis
+    _subscribed: set[str] = field(default_factory=set, init=False)
+    _pending_subscribe: set[str] = field(default_factory=set, init=False)
+    _pending_unsubscribe: set[str] = field(default_factory=set, init=False)
+    _flush_task: asyncio.Task | None = field(default=None, init=False)
 
     async def start(self) -> asyncio.Task:
         """
@@ -90,6 +102,10 @@ class ResilientPubSubListener:
                 pass
             self._listener_task = None
 
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+
         await self._cleanup()
 
     async def _cleanup(self) -> None:
@@ -128,6 +144,8 @@ class ResilientPubSubListener:
             # Subscribe to channels
             for channel in self.channels:
                 await self._pubsub.subscribe(channel)
+            if self._subscribed:
+                await self._pubsub.subscribe(*self._subscribed)
 
             # Subscribe to patterns
             for pattern in self.patterns:
@@ -216,6 +234,11 @@ class ResilientPubSubListener:
             return
 
         while self._running:
+            if self._pubsub.connection is None:
+                # Nothing subscribed yet; the first subscribe() connects
+                await asyncio.sleep(0.5)
+                continue
+
             message = await self._pubsub.get_message(
                 ignore_subscribe_messages=True,
                 timeout=0.5,  # Check for cancellation every 500ms
@@ -253,6 +276,67 @@ class ResilientPubSubListener:
         except Exception as e:
             logger.error(f"Error handling pub/sub message: {e}")
 
+    async def subscribe(self, channels: Iterable[str]) -> None:
+        """
+        Subscribe to channels while running.
+
+        Returns once the SUBSCRIBE has been sent (or, while disconnected,
+        once recorded; reconnecting subscribes to it).
+        """
+        for channel in channels:
+            if channel in self._subscribed:
+                continue
+            self._subscribed.add(channel)
+            if channel in self._pending_unsubscribe:
+                self._pending_unsubscribe.discard(channel)
+            else:
+                self._pending_subscribe.add(channel)
+
+        flush = self._schedule_flush()
+        if flush is not None:
+            await asyncio.shield(flush)
+
+    def unsubscribe(self, channels: Iterable[str]) -> None:
+        """Unsubscribe from channels added with subscribe(), in the background."""
+        for channel in channels:
+            if channel not in self._subscribed:
+                continue
+            self._subscribed.discard(channel)
+            if channel in self._pending_subscribe:
+                self._pending_subscribe.discard(channel)
+            else:
+                self._pending_unsubscribe.add(channel)
+
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> asyncio.Task | None:
+        """Start the flush task if changes are waiting; return the running one."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return self._flush_task
+        if not (self._pending_subscribe or self._pending_unsubscribe):
+            return None
+        self._flush_task = asyncio.create_task(self._flush_subscriptions())
+        return self._flush_task
+
+    async def _flush_subscriptions(self) -> None:
+        """Send pending subscription changes, one command per direction."""
+        while self._pending_subscribe or self._pending_unsubscribe:
+            await asyncio.sleep(self.subscription_batch_window)
+            subscribe, self._pending_subscribe = self._pending_subscribe, set()
+            unsubscribe, self._pending_unsubscribe = self._pending_unsubscribe, set()
+
+            # While disconnected, _connect subscribes to _subscribed
+            if self._pubsub is None:
+                continue
+            try:
+                if subscribe:
+                    await self._pubsub.subscribe(*subscribe)
+                if unsubscribe:
+                    await self._pubsub.unsubscribe(*unsubscribe)
+            except Exception as e:
+                # The listener loop sees the broken connection and reconnects
+                logger.warning(f"Failed to update pub/sub subscriptions: {e}")
+
     def is_healthy(self) -> bool:
         """
         Check if the listener is healthy (running and connected).
@@ -13,27 +13,55 @@ Architecture (Redis-first):
 
 For sync execution requests (sync=True in message):
 - Pushes result to Redis after completion
-- API waits on Redis BLPOP for the result
+- API waits on its per-process result dispatcher for the result
 
 Execution Model:
 - All executions use ProcessPoolManager (process isolation)
 - Worker processes are pooled and reused for efficiency
 - Timeouts and crashes are handled by the pool manager
+
+Dispatch:
+- The consumer prefetches `execution_lookahead` messages beyond what the
+  pool can run and holds them in a FairQueue
+- Each time the pool has a free slot, the next message is picked by
+  priority (sync > interactive > bulk), then round-robin across orgs
+- The window is small (at most 50) and a message buffered longer than
+  `execution_lookahead_max_age_seconds` is requeued, so a busy worker
+  doesn't sit on work an idle one could run or trip the broker's
+  consumer_timeout
 """
 
 import asyncio
+import contextlib
+import json
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+from aio_pika import IncomingMessage
+
 from src.core.pubsub import publish_execution_update, publish_history_update
 from src.core.redis_client import get_redis_client
+from src.jobs.fair_queue import FairQueue
 from src.jobs.rabbitmq import BaseConsumer
 
 logger = logging.getLogger(__name__)
 
-# Queue name
-QUEUE_NAME = "workflow-executions"
+# Queue name. Renamed from LEGACY_QUEUE_NAME when the queue became
+# priority-capable (a queue's arguments can't change in place); the old
+# queue is still consumed so messages published before the upgrade run.
+QUEUE_NAME = "workflow-executions-prioritized"
+LEGACY_QUEUE_NAME = "workflow-executions"
+
+
+def _dispatch_key(message: IncomingMessage) -> tuple[int, str]:
+    """(priority, org) a buffered message is dispatched by."""
+    try:
+        org_id = json.loads(message.body).get("org_id") or ""
+    except (ValueError, AttributeError):
+        org_id = ""
+    return message.priority or 0, org_id
 
 
 class WorkflowExecutionConsumer(BaseConsumer):
@@ -59,9 +87,21 @@ class WorkflowExecutionConsumer(BaseConsumer):
         settings = get_settings()
         super().__init__(
             queue_name=QUEUE_NAME,
-            prefetch_count=settings.max_concurrency,
+            prefetch_count=settings.max_concurrency + settings.execution_lookahead,
+            legacy_queue_names=(LEGACY_QUEUE_NAME,),
         )
         self._redis_client = get_redis_client()
+        # (message, monotonic time it was buffered)
+        self._buffer: FairQueue[tuple[IncomingMessage, float]] = FairQueue()
+        self._buffer_max_age = settings.execution_lookahead_max_age_seconds
+        # Messages taken from the buffer whose execution isn't routed yet;
+        # they hold a pool slot in wait_for_capacity's accounting
+        self._dispatching = 0
+        # Fair-share dispatcher and stale-message requeuer, started by the
+        # first delivered message
+        self._dispatcher: asyncio.Task | None = None
+        self._requeuer: asyncio.Task | None = None
+        self._dispatch_closed = False
 
         # Get the global ProcessPoolManager instance
         # This ensures package_install consumer can also update it
@@ -87,6 +127,11 @@ class WorkflowExecutionConsumer(BaseConsumer):
 
     async def stop(self) -> None:
         """Stop the consumer and process pool."""
+        # Buffered messages are unacked; closing the channel requeues them
+        for task in (self._dispatcher, self._requeuer):
+            if task is not None:
+                task.cancel()
+
         # Stop process pool
         if self._pool_started:
             await self._pool.stop()
@@ -96,6 +141,73 @@ class WorkflowExecutionConsumer(BaseConsumer):
         # Call parent stop
         await super().stop()
 
+    async def drain(self, deadline: float = 300.0) -> None:
+        """Requeue buffered messages, then drain in-flight executions."""
+        self._dispatch_closed = True
+        for task in (self._dispatcher, self._requeuer):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        # Cancel first so requeued messages go to other workers, not back here
+        await self._cancel_consumers()
+        await self._requeue(self._buffer.take_all())
+        await super().drain(deadline)
+
+    async def _requeue(self, entries: list[tuple[IncomingMessage, float]]) -> None:
+        for message, _buffered_at in entries:
+            try:
+                await message.nack(requeue=True)
+            except Exception as e:
+                logger.warning(f"Failed to requeue buffered message {message.message_id}: {e}")
+
+    async def _on_message(self, message: IncomingMessage) -> None:
+        """Buffer the message for fair-share dispatch."""
+        if self._draining or self._dispatch_closed:
+            await message.nack(requeue=True)
+            return
+        priority, org_id = _dispatch_key(message)
+        self._buffer.put((message, time.monotonic()), priority=priority, tenant=org_id)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        if self._requeuer is None or self._requeuer.done():
+            self._requeuer = asyncio.create_task(self._requeue_stale_loop())
+
+    async def _dispatch_loop(self) -> None:
+        """Start the next buffered execution whenever the pool has a free slot."""
+        while True:
+            # Wait for the slot before choosing the message, so a
+            # higher-priority message arriving meanwhile still goes first
+            await self._pool.wait_for_capacity(lambda: self._dispatching)
+            message, _buffered_at = await self._buffer.get()
+            self._dispatching += 1
+            task = asyncio.create_task(self._dispatch(message))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _requeue_stale_loop(self) -> None:
+        """Hand messages that waited too long for a slot back to the broker."""
+        while True:
+            await asyncio.sleep(self._buffer_max_age / 2)
+            await self._requeue_stale()
+
+    async def _requeue_stale(self) -> None:
+        cutoff = time.monotonic() - self._buffer_max_age
+        stale = self._buffer.remove_where(lambda entry: entry[1] <= cutoff)
+        if stale:
+            logger.info(
+                f"Requeueing {len(stale)} execution(s) buffered longer than "
+                f"{self._buffer_max_age:.0f}s"
+            )
+            await self._requeue(stale)
+
+    async def _dispatch(self, message: IncomingMessage) -> None:
+        try:
+            await self._process_message_with_ack(message)
+        finally:
+            self._dispatching -= 1
+            await self._pool.release_capacity()
+
     async def _handle_result(self, result: dict[str, Any]) -> None:
         """
         Handle result from process pool.
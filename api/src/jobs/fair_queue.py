@@ -0,0 +1,100 @@
+"""
+Fair-share dispatch buffer for work queue consumers.
+
+RabbitMQ hands a consumer messages in priority order, FIFO within a
+priority. That's fair to no one when one organization enqueues thousands of
+scheduled executions: everything published after them waits behind the
+whole backlog. A consumer that prefetches a window of messages can instead
+hold them in a `FairQueue` and pick what runs next itself:
+
+- the highest priority present always goes first (a sync request with a
+  caller waiting never queues behind background work)
+- within a priority, each tenant has its own FIFO and tenants take turns
+  (round-robin), so a tenant's backlog gets one dispatch per round no
+  matter how deep it is
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class FairQueue(Generic[T]):
+    """Priority lanes of per-tenant FIFOs, served round-robin."""
+
+    def __init__(self) -> None:
+        # priority -> tenant -> items; tenant order is the round-robin order
+        self._lanes: dict[int, OrderedDict[str, deque[T]]] = {}
+        self._size = 0
+        self._not_empty = asyncio.Event()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, item: T, priority: int = 0, tenant: str = "") -> None:
+        """Add an item to the back of its tenant's FIFO."""
+        lane = self._lanes.setdefault(priority, OrderedDict())
+        lane.setdefault(tenant, deque()).append(item)
+        self._size += 1
+        self._not_empty.set()
+
+    def get_nowait(self) -> T:
+        """
+        Take the next item: from the highest priority lane, the tenant whose
+        turn it is. Raises IndexError when empty.
+        """
+        if not self._size:
+            raise IndexError("get from an empty FairQueue")
+
+        priority = max(self._lanes)
+        lane = self._lanes[priority]
+        tenant, items = next(iter(lane.items()))
+        item = items.popleft()
+        if items:
+            # Back of the rotation until every other tenant has had a turn
+            lane.move_to_end(tenant)
+        else:
+            del lane[tenant]
+            if not lane:
+                del self._lanes[priority]
+
+        self._size -= 1
+        if not self._size:
+            self._not_empty.clear()
+        return item
+
+    async def get(self) -> T:
+        """Wait for an item, then take the next one (see get_nowait)."""
+        while not self._size:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def remove_where(self, predicate: Callable[[T], bool]) -> list[T]:
+        """Remove and return every item matching ``predicate``, keeping the rest in order."""
+        removed: list[T] = []
+        for priority, lane in list(self._lanes.items()):
+            for tenant, items in list(lane.items()):
+                kept: deque[T] = deque()
+                for item in items:
+                    (removed if predicate(item) else kept).append(item)
+                if kept:
+                    lane[tenant] = kept
+                else:
+                    del lane[tenant]
+            if not lane:
+                del self._lanes[priority]
+        self._size -= len(removed)
+        if not self._size:
+            self._not_empty.clear()
+        return removed
+
+    def take_all(self) -> list[T]:
+        """Remove and return every buffered item, in dispatch order."""
+        items: list[T] = []
+        while self._size:
+            items.append(self.get_nowait())
+        return items
@@ -9,6 +9,9 @@ import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 import aio_pika
@@ -21,6 +24,32 @@ from src.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+#: Work queues declared with ``x-max-priority`` (0-N message priorities).
+#: RabbitMQ can't change a queue's arguments once it exists, so a queue
+#: becomes priority-capable by moving to a new name; consumers keep draining
+#: the old one through ``BaseConsumer(legacy_queue_names=...)``.
+QUEUE_MAX_PRIORITY: dict[str, int] = {
+    "workflow-executions-prioritized": 10,
+}
+
+
+def work_queue_arguments(queue_name: str) -> dict[str, Any]:
+    """
+    Declaration arguments for a work queue.
+
+    Publishers and consumers both declare the queue, and RabbitMQ rejects a
+    declaration whose arguments differ from the existing queue's, so they
+    must agree.
+    """
+    arguments: dict[str, Any] = {
+        "x-dead-letter-exchange": f"{queue_name}-dlx",
+        "x-dead-letter-routing-key": queue_name,
+    }
+    if queue_name in QUEUE_MAX_PRIORITY:
+        arguments["x-max-priority"] = QUEUE_MAX_PRIORITY[queue_name]
+    return arguments
+
+
 class RabbitMQConnection:
     """
     Manages RabbitMQ connection pool.
@@ -31,6 +60,10 @@ class RabbitMQConnection:
     _instance: "RabbitMQConnection | None" = None
     _connection_pool: Pool | None = None
     _channel_pool: Pool | None = None
+    # Work queues whose topology (DLX, poison queue, main queue) has been
+    # declared through the publisher's pooled channels. Forgotten whenever a
+    # connection reconnects, since the broker may have come back without them.
+    declared_queues: set[str] = set()
 
     def __new__(cls):
         if cls._instance is None:
@@ -60,7 +93,9 @@ class RabbitMQConnection:
         settings = get_settings()
 
         async def get_connection() -> AbstractRobustConnection:
-            return await aio_pika.connect_robust(settings.rabbitmq_url)
+            connection = await aio_pika.connect_robust(settings.rabbitmq_url)
+            connection.reconnect_callbacks.add(self._forget_topology)
+            return connection
 
         async def get_channel() -> AbstractRobustChannel:
             assert self._connection_pool is not None
@@ -74,12 +109,16 @@ class RabbitMQConnection:
 
         logger.info("RabbitMQ connection pools initialized")
 
+    def _forget_topology(self, *_: Any) -> None:
+        self.declared_queues.clear()
+
     async def close(self) -> None:
         """Close all connections."""
         if self._channel_pool:
             await self._channel_pool.close()
         if self._connection_pool:
             await self._connection_pool.close()
+        self.declared_queues.clear()
         logger.info("RabbitMQ connections closed")
 
     def reset_pools(self) -> None:
@@ -97,6 +136,7 @@ class RabbitMQConnection:
         """
         self._connection_pool = None
         self._channel_pool = None
+        self.declared_queues.clear()
 
 
 # Global connection manager
@@ -119,6 +159,7 @@ class BaseConsumer(ABC):
         queue_name: str,
         prefetch_count: int = 1,
         dead_letter_exchange: str | None = None,
+        legacy_queue_names: tuple[str, ...] = (),
     ):
         """
         Initialize consumer.
@@ -127,13 +168,17 @@ class BaseConsumer(ABC):
             queue_name: Name of the queue to consume from
             prefetch_count: Number of messages to prefetch (QoS)
             dead_letter_exchange: Exchange for failed messages (poison queue)
+            legacy_queue_names: Former names of the queue, still consumed
+                so messages published before a rename aren't stranded
         """
         self.queue_name = queue_name
         self.prefetch_count = prefetch_count
         self.dead_letter_exchange = dead_letter_exchange or f"{queue_name}-dlx"
+        self.legacy_queue_names = legacy_queue_names
 
         self._channel: AbstractRobustChannel | None = None
         self._queue: aio_pika.Queue | None = None
+        self._legacy_consumers: list[tuple[aio_pika.abc.AbstractQueue, str]] = []
         self._running = False
         self._inflight: set[asyncio.Task] = set()
         self._consumer_tag: str | None = None
@@ -152,35 +197,52 @@ class BaseConsumer(ABC):
         self._channel = channel
         await channel.set_qos(prefetch_count=self.prefetch_count)
 
+        queue = await self._declare_queue(channel, self.queue_name)
+        self._queue = queue
+
+        logger.info(f"Consumer started for queue: {self.queue_name}")
+
+        # Start consuming, capturing the consumer tag so drain() can cancel it.
+        self._consumer_tag = await queue.consume(self._on_message)
+
+        # Keep draining queues this one was renamed from (they share the
+        # channel's QoS window, so they don't add concurrency)
+        for legacy_name in self.legacy_queue_names:
+            legacy_queue = await self._declare_queue(channel, legacy_name)
+            tag = await legacy_queue.consume(self._on_message)
+            self._legacy_consumers.append((legacy_queue, tag))
+            logger.info(f"Consumer draining legacy queue: {legacy_name}")
+
+    async def _declare_queue(
+        self,
+        channel: AbstractRobustChannel,
+        queue_name: str,
+    ) -> aio_pika.abc.AbstractQueue:
+        """Declare a work queue with its dead letter exchange and poison queue."""
+        arguments = work_queue_arguments(queue_name)
+        if queue_name == self.queue_name:
+            arguments["x-dead-letter-exchange"] = self.dead_letter_exchange
+
         # Declare dead letter exchange
         dlx = await channel.declare_exchange(
-            self.dead_letter_exchange,
+            arguments["x-dead-letter-exchange"],
             aio_pika.ExchangeType.DIRECT,
             durable=True,
         )
 
         # Declare dead letter queue
         dlq = await channel.declare_queue(
-            f"{self.queue_name}-poison",
+            f"{queue_name}-poison",
             durable=True,
         )
-        await dlq.bind(dlx, routing_key=self.queue_name)
+        await dlq.bind(dlx, routing_key=queue_name)
 
         # Declare main queue with dead letter routing
-        queue = await channel.declare_queue(
-            self.queue_name,
+        return await channel.declare_queue(
+            queue_name,
             durable=True,
-            arguments={
-                "x-dead-letter-exchange": self.dead_letter_exchange,
-                "x-dead-letter-routing-key": self.queue_name,
-            },
+            arguments=arguments,
         )
-        self._queue = queue
-
-        logger.info(f"Consumer started for queue: {self.queue_name}")
-
-        # Start consuming, capturing the consumer tag so drain() can cancel it.
-        self._consumer_tag = await queue.consume(self._on_message)
 
     async def stop(self) -> None:
         """Stop consuming messages (hard close — does NOT wait for in-flight).
@@ -212,13 +274,7 @@ class BaseConsumer(ABC):
         self._draining = True
 
         try:
-            # Cancel the consumer: stops new deliveries, keeps channel open.
-            if self._queue is not None and self._consumer_tag is not None:
-                try:
-                    await self._queue.cancel(self._consumer_tag)
-                    logger.info(f"Cancelled consumer for {self.queue_name}")
-                except Exception as e:
-                    logger.warning(f"Error cancelling consumer for {self.queue_name}: {e}")
+            await self._cancel_consumers()
 
             # Snapshot is intentional: any message that races past the _draining
             # flag gets nacked + requeued in _on_message and never enters _inflight.
@@ -244,6 +300,22 @@ class BaseConsumer(ABC):
             # Always close channel + connection, even if cancelled mid-drain.
             await self.stop()
 
+    async def _cancel_consumers(self) -> None:
+        """Stop new deliveries, keeping the channel open. Safe to call twice."""
+        if self._queue is not None and self._consumer_tag is not None:
+            try:
+                await self._queue.cancel(self._consumer_tag)
+                logger.info(f"Cancelled consumer for {self.queue_name}")
+            except Exception as e:
+                logger.warning(f"Error cancelling consumer for {self.queue_name}: {e}")
+            self._consumer_tag = None
+        for legacy_queue, tag in self._legacy_consumers:
+            try:
+                await legacy_queue.cancel(tag)
+            except Exception as e:
+                logger.warning(f"Error cancelling consumer for {legacy_queue.name}: {e}")
+        self._legacy_consumers.clear()
+
     async def _on_message(self, message: IncomingMessage) -> None:
         """
         Handle incoming message.
@@ -655,6 +727,9 @@ async def consume_from_exchange(
 
 _PUBLISH_RETRY_DELAYS_S = (0.1, 0.3, 1.0)
 
+# Messages published before awaiting their confirms together (publish_many)
+PUBLISH_CONFIRM_BATCH = 500
+
 # Connection/channel drops worth retrying (rabbitmq pod briefly out of the
 # Service endpoints, broker restarting, etc.).
 _PUBLISH_TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
@@ -678,85 +753,90 @@ def _is_transient_publish_error(exc: BaseException) -> bool:
     return isinstance(exc, _PUBLISH_TRANSIENT_ERRORS)
 
 
-async def _publish_once(
+async def _declare_queue_topology(
+    channel: aio_pika.abc.AbstractChannel,
     queue_name: str,
-    message: dict[str, Any],
-    priority: int,
 ) -> None:
-    async with rabbitmq.get_connection() as connection:
-        channel = await connection.channel()
-        try:
-            dead_letter_exchange = f"{queue_name}-dlx"
+    """
+    Declare a work queue with its dead letter exchange and poison queue.
 
-            await channel.declare_exchange(
-                dead_letter_exchange,
-                aio_pika.ExchangeType.DIRECT,
-                durable=True,
-            )
+    Declarations are idempotent, but each is a broker round trip, so it's
+    done once per queue and remembered until a connection reconnects.
+    """
+    if queue_name in rabbitmq.declared_queues:
+        return
 
-            dlq = await channel.declare_queue(
-                f"{queue_name}-poison",
-                durable=True,
-            )
-            await dlq.bind(dead_letter_exchange, routing_key=queue_name)
+    dead_letter_exchange = f"{queue_name}-dlx"
 
-            await channel.declare_queue(
-                queue_name,
-                durable=True,
-                arguments={
-                    "x-dead-letter-exchange": dead_letter_exchange,
-                    "x-dead-letter-routing-key": queue_name,
-                },
-            )
+    await channel.declare_exchange(
+        dead_letter_exchange,
+        aio_pika.ExchangeType.DIRECT,
+        durable=True,
+    )
 
-            await channel.default_exchange.publish(
-                aio_pika.Message(
-                    body=json.dumps(message).encode(),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                    priority=priority,
-                ),
-                routing_key=queue_name,
-            )
+    dlq = await channel.declare_queue(
+        f"{queue_name}-poison",
+        durable=True,
+    )
+    await dlq.bind(dead_letter_exchange, routing_key=queue_name)
 
-            logger.debug(f"Published message to {queue_name}")
-        finally:
-            await channel.close()
+    await channel.declare_queue(
+        queue_name,
+        durable=True,
+        arguments=work_queue_arguments(queue_name),
+    )
 
+    rabbitmq.declared_queues.add(queue_name)
 
-async def publish_message(
+
+def _amqp_message(message: dict[str, Any], priority: int) -> aio_pika.Message:
+    return aio_pika.Message(
+        body=json.dumps(message).encode(),
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        priority=priority,
+    )
+
+
+async def _publish_once(
     queue_name: str,
     message: dict[str, Any],
-    priority: int = 0,
+    priority: int,
 ) -> None:
-    """
-    Publish a message to a queue.
+    # Pooled channels are opened with publisher confirms, so this returns
+    # once the broker has taken the message
+    async with rabbitmq.get_channel() as channel:
+        await _declare_queue_topology(channel, queue_name)
+        await channel.default_exchange.publish(
+            _amqp_message(message, priority),
+            routing_key=queue_name,
+        )
 
-    Retries on transient broker errors (connection drops, channel close) so a
-    brief readiness flap on the rabbitmq pod doesn't surface as a workflow
-    failure. Real failures (auth, malformed message, broker rejecting the
-    publish) are not retried and propagate immediately.
+    logger.debug(f"Published message to {queue_name}")
 
-    Args:
-        queue_name: Target queue name
-        message: Message body (will be JSON encoded)
-        priority: Message priority (0-9, higher = more important)
-    """
-    await rabbitmq.init_pools()
+
+async def _retry_transient(
+    queue_name: str,
+    attempt: Callable[[], Awaitable[None]],
+) -> None:
+    """Run a publish attempt, retrying transient broker errors with backoff."""
     last_exc: BaseException | None = None
-    for attempt, delay in enumerate((*_PUBLISH_RETRY_DELAYS_S, None)):
+    for attempt_number, delay in enumerate((*_PUBLISH_RETRY_DELAYS_S, None)):
         try:
-            await _publish_once(queue_name, message, priority)
+            await attempt()
             return
         except Exception as exc:
             if not _is_transient_publish_error(exc):
                 raise
             last_exc = exc
+            # The channel (or the broker behind it) may be new on the next
+            # attempt; declare the queue again rather than trust the cache
+            rabbitmq.declared_queues.discard(queue_name)
             if delay is None:
                 break
             logger.warning(
                 "Transient AMQP error publishing to %s (attempt %d/%d, sleeping %.2fs): %s",
                 queue_name,
-                attempt + 1,
+                attempt_number + 1,
                 len(_PUBLISH_RETRY_DELAYS_S) + 1,
                 delay,
                 type(exc).__name__,
@@ -764,3 +844,158 @@ async def publish_message(
             await asyncio.sleep(delay)
     assert last_exc is not None
     raise last_exc
+
+
+# Publishes collected by an enclosing deferred_publishes() block
+_deferred_publishes: ContextVar[list[tuple[str, dict[str, Any], int]] | None] = ContextVar(
+    "deferred_publishes", default=None
+)
+
+
+async def publish_message(
+    queue_name: str,
+    message: dict[str, Any],
+    priority: int = 0,
+) -> None:
+    """
+    Publish a message to a queue.
+
+    Retries on transient broker errors (connection drops, channel close) so a
+    brief readiness flap on the rabbitmq pod doesn't surface as a workflow
+    failure. Real failures (auth, malformed message, broker rejecting the
+    publish) are not retried and propagate immediately.
+
+    Inside a ``deferred_publishes()`` block the message is held and sent
+    with the rest of the block's messages when it exits.
+
+    Args:
+        queue_name: Target queue name
+        message: Message body (will be JSON encoded)
+        priority: Message priority (0-9, higher = more important)
+    """
+    deferred = _deferred_publishes.get()
+    if deferred is not None:
+        deferred.append((queue_name, message, priority))
+        return
+
+    await rabbitmq.init_pools()
+    await _retry_transient(
+        queue_name, lambda: _publish_once(queue_name, message, priority)
+    )
+
+
+class PublishError(Exception):
+    """
+    A multi-message publish gave up part-way.
+
+    ``unconfirmed`` holds the message bodies the broker never confirmed.
+    Every other message was confirmed and will be consumed, so callers
+    must treat only these as not sent. The broker error is ``__cause__``.
+    """
+
+    def __init__(self, message: str, unconfirmed: list[dict[str, Any]]):
+        super().__init__(message)
+        self.unconfirmed = unconfirmed
+
+
+async def publish_many(
+    queue_name: str,
+    messages: list[dict[str, Any]],
+    priority: int = 0,
+) -> None:
+    """
+    Publish several messages to one queue over a single pooled channel.
+
+    Messages are sent back to back in batches of ``PUBLISH_CONFIRM_BATCH``
+    and each batch's publisher confirms are awaited together, instead of a
+    round trip per message. Transient broker errors are retried like
+    ``publish_message``; a retry resends only the messages the broker
+    hasn't confirmed.
+
+    Args:
+        queue_name: Target queue name
+        messages: Message bodies (each JSON encoded), published in order
+        priority: Message priority for every message (0-9)
+
+    Raises:
+        PublishError: If some messages could not be published; lists them
+    """
+    if not messages:
+        return
+
+    await rabbitmq.init_pools()
+    unconfirmed = list(messages)
+
+    async def attempt() -> None:
+        nonlocal unconfirmed
+        async with rabbitmq.get_channel() as channel:
+            await _declare_queue_topology(channel, queue_name)
+            exchange = channel.default_exchange
+            while unconfirmed:
+                batch = unconfirmed[:PUBLISH_CONFIRM_BATCH]
+                results = await asyncio.gather(
+                    *(
+                        exchange.publish(_amqp_message(m, priority), routing_key=queue_name)
+                        for m in batch
+                    ),
+                    return_exceptions=True,
+                )
+                failed = [m for m, r in zip(batch, results) if isinstance(r, BaseException)]
+                unconfirmed = failed + unconfirmed[len(batch):]
+                if failed:
+                    raise next(r for r in results if isinstance(r, BaseException))
+
+    try:
+        await _retry_transient(queue_name, attempt)
+    except Exception as exc:
+        raise PublishError(
+            f"{len(unconfirmed)} of {len(messages)} messages to {queue_name} "
+            f"were not confirmed: {exc}",
+            unconfirmed,
+        ) from exc
+    logger.debug(f"Published {len(messages)} messages to {queue_name}")
+
+
+@asynccontextmanager
+async def deferred_publishes() -> AsyncIterator[None]:
+    """
+    Hold ``publish_message`` calls made in this block and send them on exit.
+
+    For fan-out paths that enqueue many jobs in a loop: the messages are
+    grouped by queue and priority (keeping their order) and sent with
+    ``publish_many``. They are sent even if the block raises, since the
+    callers have already recorded the jobs as queued. Nested blocks defer
+    to the outermost one. Don't wait on a job's result inside the block;
+    nothing is published until it exits.
+
+    Raises:
+        PublishError: On exit, listing the messages of every group that
+            could not be published (other groups are still sent)
+    """
+    if _deferred_publishes.get() is not None:
+        yield
+        return
+
+    collected: list[tuple[str, dict[str, Any], int]] = []
+    token = _deferred_publishes.set(collected)
+    try:
+        yield
+    finally:
+        _deferred_publishes.reset(token)
+        groups: dict[tuple[str, int], list[dict[str, Any]]] = {}
+        for queue_name, message, priority in collected:
+            groups.setdefault((queue_name, priority), []).append(message)
+        unconfirmed: list[dict[str, Any]] = []
+        last_error: PublishError | None = None
+        for (queue_name, priority), messages in groups.items():
+            try:
+                await publish_many(queue_name, messages, priority)
+            except PublishError as exc:
+                unconfirmed.extend(exc.unconfirmed)
+                last_error = exc
+        if last_error is not None:
+            raise PublishError(
+                f"{len(unconfirmed)} of {len(collected)} deferred messages "
+                f"were not published: {last_error}",
+                unconfirmed,
+            ) from last_error.__cause__
@@ -1,7 +1,7 @@
 """Deferred execution promoter.
 
 Every 60 seconds, moves SCHEDULED executions whose ``scheduled_at`` has
-matured onto the RabbitMQ workflow-executions queue by flipping them to
+matured onto the RabbitMQ workflow execution queue by flipping them to
 PENDING and calling the shared ``_publish_pending`` helper.
 
 Design notes:
@@ -29,7 +29,7 @@ from sqlalchemy import select, update
 from src.core.database import get_db_context
 from src.models.enums import ExecutionStatus
 from src.models.orm.executions import Execution
-from src.services.execution.async_executor import _publish_pending
+from src.services.execution.async_executor import PRIORITY_BULK, _publish_pending
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +85,7 @@ async def promote_due_executions() -> tuple[int, int]:
                         (row.execution_context or {}).get("is_platform_admin", False)
                     ),
                     file_path=None,
+                    priority=PRIORITY_BULK,
                 )
                 promoted += 1
             except Exception:
@@ -0,0 +1,49 @@
+"""
+Knowledge Vector Index Scheduler
+
+Keeps the knowledge store's per-dimension HNSW index in line with the
+configured embedding model (see services/knowledge/vector_index.py).
+Runs at scheduler startup and hourly, so a new embedding config gets its
+index without a manual step; the embedding reindex job also syncs as soon
+as it finishes.
+"""
+
+import logging
+from typing import Any
+
+from src.core.database import get_engine, get_session_factory
+from src.services.embeddings.factory import get_embedding_config
+from src.services.knowledge.vector_index import sync_ann_indexes
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_knowledge_vector_indexes() -> dict[str, Any]:
+    """
+    Create the HNSW index for the configured embedding dimension and drop
+    indexes for dimensions no rows use anymore.
+
+    Returns:
+        Summary of the sync operation
+    """
+    try:
+        session_factory = get_session_factory()
+        async with session_factory() as db:
+            config = await get_embedding_config(db)
+    except ValueError as e:
+        # No embedding config yet: nothing can be stored, nothing to index
+        logger.debug(f"Knowledge vector index sync skipped: {e}")
+        return {"skipped": True}
+
+    try:
+        result = await sync_ann_indexes(get_engine(), config.dimensions)
+    except Exception as e:
+        logger.error(f"Knowledge vector index sync failed: {e}", exc_info=True)
+        return {"error": str(e)}
+
+    if result["created"] or result["dropped"]:
+        logger.info(
+            f"Knowledge vector indexes synced for dim {config.dimensions}: "
+            f"created={result['created']} dropped={result['dropped']}"
+        )
+    return {"dimensions": config.dimensions, **result}
@@ -21,6 +21,8 @@ from src.core.csrf import CSRFMiddleware
 from src.core.embed_middleware import EmbedScopeMiddleware
 from src.core.database import close_db, init_db
 from src.core.pubsub import manager as pubsub_manager
+from src.services.mcp_client.session_pool import close_session_pool
+from src.core.redis_client import close_redis_client, get_redis_client
 from src.routers.health import close_health_check_clients
 from src.routers import (
     auth_router,
@@ -132,6 +134,10 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     from src.core.entity_change_hook import register_entity_change_hooks
     register_entity_change_hooks()
 
+    # Invalidate cached SDK integration resolutions on integration/OAuth writes
+    from src.core.cache.integration_cache import register_integration_cache_hooks
+    register_integration_cache_hooks()
+
     # Register dynamic workflow endpoints for OpenAPI documentation
     logger.info("Registering workflow endpoints...")
     await register_dynamic_workflow_endpoints(app)
@@ -156,6 +162,9 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     asyncio.create_task(_run_reconciler())
 
+    # Subscribe to sync execution result notifications before serving requests
+    await get_redis_client().start_result_dispatcher()
+
     logger.info(f"Bifrost API started in {settings.environment} mode")
 
     yield
@@ -164,6 +173,8 @@ async def app_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Shutting down Bifrost API...")
 
     await pubsub_manager.close()
+    await close_session_pool()
+    await close_redis_client()
     await close_health_check_clients()
     await close_db()
     logger.info("Bifrost API shutdown complete")
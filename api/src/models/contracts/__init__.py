@@ -390,6 +390,7 @@ from src.models.contracts.github import (
 # CLI Models
 from src.models.contracts.cli import (
     CLIConfigDeleteRequest,
+    CLIConfigGetManyRequest,
     CLIConfigGetRequest,
     CLIConfigListRequest,
     CLIConfigSetRequest,
@@ -859,6 +860,7 @@ __all__ = [
     "CLIFileListRequest",
     "CLIFileDeleteRequest",
     "CLIConfigGetRequest",
+    "CLIConfigGetManyRequest",
     "CLIConfigSetRequest",
     "CLIConfigListRequest",
     "CLIConfigDeleteRequest",
@@ -78,6 +78,7 @@ class AgentCreate(BaseModel):
     llm_max_tokens: int | None = Field(default=None, ge=1, le=200000, description="Override max tokens")
     max_iterations: int | None = Field(default=None, ge=1, le=200, description="Max LLM iterations for autonomous runs")
     max_token_budget: int | None = Field(default=None, ge=1000, le=1000000, description="Max token budget for autonomous runs")
+    max_parallel_tool_calls: int | None = Field(default=None, ge=1, le=32, description="Max tool calls run concurrently in one turn (null = default of 4, 1 = sequential)")
 
 
 class AgentUpdate(BaseModel):
@@ -109,6 +110,7 @@ class AgentUpdate(BaseModel):
     llm_max_tokens: int | None = Field(default=None, ge=1, le=200000, description="Override max tokens")
     max_iterations: int | None = Field(default=None, ge=1, le=200, description="Max LLM iterations for autonomous runs")
     max_token_budget: int | None = Field(default=None, ge=1000, le=1000000, description="Max token budget for autonomous runs")
+    max_parallel_tool_calls: int | None = Field(default=None, ge=1, le=32, description="Max tool calls run concurrently in one turn (null = default of 4, 1 = sequential)")
 
 
 class AgentPromoteRequest(BaseModel):
@@ -169,6 +171,7 @@ class AgentPublic(BaseModel):
     llm_max_tokens: int | None = None
     max_iterations: int | None = None
     max_token_budget: int | None = None
+    max_parallel_tool_calls: int | None = None
     logo: str | None = Field(
         default=None,
         description="Inline logo as a data URL, or null when no logo is set.",
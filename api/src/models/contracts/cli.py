@@ -3,7 +3,7 @@ CLI contract models for Bifrost (sessions, file operations, config, oauth).
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -166,6 +166,17 @@ class CLIConfigGetRequest(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CLIConfigGetManyRequest(BaseModel):
+    """Request to get several config values in one call via CLI."""
+    keys: list[str] = Field(..., description="Configuration keys")
+    scope: str | None = Field(
+        default=None,
+        description="Organization scope: None=context default, UUID=specific org, 'global'=global scope"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class CLIConfigSetRequest(BaseModel):
     """Request to set a config value via CLI."""
     key: str = Field(..., description="Configuration key")
@@ -424,6 +435,11 @@ class CLIKnowledgeSearchRequest(BaseModel):
         description="Organization scope: None=context default, UUID=specific org, 'global'=global scope"
     )
     fallback: bool = Field(default=True, description="If True, also search global scope")
+    mode: Literal["vector", "hybrid", "keyword"] = Field(
+        default="vector",
+        description="vector=semantic similarity, keyword=full-text match only (no embedding), "
+        "hybrid=both fused by rank",
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -86,6 +86,14 @@ class PoolSummary(BaseModel):
         default=None,
         description="Memory limit of the worker container in bytes (from cgroup, -1 if unlimited)"
     )
+    preloaded_modules: int | None = Field(
+        default=None,
+        description="Workspace modules warm-imported into the fork template"
+    )
+    preload_hit_rate: float | None = Field(
+        default=None,
+        description="Fraction of workspace module imports served by the template preload"
+    )
 
 
 class PoolDetail(BaseModel):
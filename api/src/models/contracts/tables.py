@@ -81,6 +81,37 @@ class TableUpdate(BaseModel):
     )
 
 
+class TableIndexCreate(BaseModel):
+    """Input for declaring an expression index on a document field."""
+
+    field: str = Field(
+        min_length=1,
+        max_length=255,
+        description="Top-level document field to index",
+    )
+    kind: Literal["numeric", "boolean", "timestamp", "text"] | None = Field(
+        default=None,
+        description=(
+            "How the field is compared. Defaults to the table's schema hint "
+            "for the field, or 'text' if there is none."
+        ),
+    )
+
+
+class TableIndexPublic(BaseModel):
+    """A declared document field index."""
+
+    field: str
+    kind: Literal["numeric", "boolean", "timestamp", "text"]
+    name: str = Field(description="Postgres index name")
+
+
+class TableIndexListResponse(BaseModel):
+    """Response for listing a table's document indexes."""
+
+    indexes: list[TableIndexPublic]
+
+
 class TablePublic(TableBase):
     """Table output for API responses."""
 
@@ -92,6 +123,10 @@ class TablePublic(TableBase):
         default=None,
         validation_alias=AliasChoices("policies", "access"),
     )
+    indexes: list[dict[str, Any]] | None = Field(
+        default=None,
+        description="Declared document field indexes ([{field, kind}])",
+    )
     created_at: datetime
     updated_at: datetime
     created_by: str | None
@@ -309,6 +344,14 @@ class QueryFilter(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+def _validate_order_by(v: str | None) -> str | None:
+    if v is not None:
+        # Allow nested paths like "data.amount" or simple fields like "created_at"
+        if not v.replace(".", "").replace("_", "").isalnum():
+            raise ValueError("order_by must be alphanumeric with dots and underscores")
+    return v
+
+
 class DocumentQuery(BaseModel):
     """Query parameters for document search."""
 
@@ -347,16 +390,21 @@ class DocumentQuery(BaseModel):
         default=False,
         description="Skip the total count query (returns total=-1). Use for faster paginated fetches after the first page.",
     )
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Opaque cursor from a previous response's next_cursor. Continues "
+            "after that page using keyset pagination; offset is ignored and "
+            "the total is not counted (total=-1). where/order_by/order_dir "
+            "must match the query that produced the cursor."
+        ),
+    )
 
     @field_validator("order_by")
     @classmethod
     def validate_order_by(cls, v: str | None) -> str | None:
         """Validate order_by field name."""
-        if v is not None:
-            # Allow nested paths like "data.amount" or simple fields like "created_at"
-            if not v.replace(".", "").replace("_", "").isalnum():
-                raise ValueError("order_by must be alphanumeric with dots and underscores")
-        return v
+        return _validate_order_by(v)
 
 
 class DocumentListResponse(BaseModel):
@@ -367,6 +415,33 @@ class DocumentListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; null when this page is the last.",
+    )
+
+
+class DocumentExportQuery(BaseModel):
+    """Filter and ordering for a streaming NDJSON export."""
+
+    where: dict[str, Any] | None = Field(
+        default=None,
+        description="Filter conditions (same operators as DocumentQuery.where)",
+    )
+    order_by: str | None = Field(
+        default=None,
+        description="Field to order by (data field name)",
+    )
+    order_dir: Literal["asc", "desc"] = Field(
+        default="asc",
+        description="Sort direction",
+    )
+
+    @field_validator("order_by")
+    @classmethod
+    def validate_order_by(cls, v: str | None) -> str | None:
+        """Validate order_by field name."""
+        return _validate_order_by(v)
 
 
 class DocumentCountResponse(BaseModel):
@@ -34,7 +34,7 @@ from src.models.orm.external_mcp import (
 )
 from src.models.orm.forms import Form, FormField, FormRole
 from src.models.orm.integrations import Integration, IntegrationConfigSchema, IntegrationMapping
-from src.models.orm.knowledge import KnowledgeStore
+from src.models.orm.knowledge import EmbeddingCache, KnowledgeStore
 from src.models.orm.knowledge_sources import KnowledgeNamespaceRole
 from src.models.orm.metrics import ExecutionMetricsDaily, KnowledgeStorageDaily, PlatformMetricsSnapshot, WorkflowROIDaily
 from src.models.orm.mfa import MFARecoveryCode, TrustedDevice, UserMFAMethod, UserOAuthAccount
@@ -105,6 +105,7 @@ __all__ = [
     "IntegrationMapping",
     # Knowledge Store
     "KnowledgeStore",
+    "EmbeddingCache",
     # Knowledge Namespace Roles
     "KnowledgeNamespaceRole",
     # Audit
@@ -66,6 +66,8 @@ class Agent(Base):
     max_iterations: Mapped[int | None] = mapped_column(Integer, default=50)
     max_token_budget: Mapped[int | None] = mapped_column(Integer, default=100000)
     max_run_timeout: Mapped[int | None] = mapped_column(Integer, default=None)
+    # Tool calls from one LLM turn run concurrently up to this many (null = default)
+    max_parallel_tool_calls: Mapped[int | None] = mapped_column(Integer, default=None)
     created_by: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=text("NOW()")
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UniqueConstraint, text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -69,8 +69,9 @@ class KnowledgeStore(Base):
     # Search relies on the *currently configured* embedder being the one used
     # at store time (otherwise stored vectors live in a different vector space
     # than the query, and similarity is meaningless even at matching dims).
-    # No fixed-dim ANN index because pgvector's HNSW/IVFFlat both require a
-    # known dimension; sequential scan is fine at our scale.
+    # pgvector's HNSW/IVFFlat both require a known dimension, so ANN indexes
+    # are partial expression indexes per dimension, managed outside the ORM
+    # by services/knowledge/vector_index.py.
     embedding: Mapped[list] = mapped_column(Vector(), nullable=False)
 
     # Audit
@@ -126,8 +127,16 @@ class KnowledgeStore(Base):
         ),
         # Metadata filtering (GIN index for JSONB) - uses column name "metadata" not attribute name
         Index("ix_knowledge_metadata", "metadata", postgresql_using="gin"),
-        # Note: Vector index (IVFFlat) is created in migration since it requires
-        # special syntax not easily expressed in SQLAlchemy
+        # Full-text matching for hybrid search. The expression must match
+        # repositories/knowledge.py's lexical query exactly to be used.
+        Index(
+            "ix_knowledge_content_fts",
+            text("to_tsvector('english'::regconfig, content)"),
+            postgresql_using="gin",
+        ),
+        # Note: per-dimension HNSW indexes (ix_knowledge_embedding_hnsw_<dim>)
+        # are created at runtime by services/knowledge/vector_index.py, since
+        # the dimension depends on the configured embedding model
     )
 
     def __repr__(self) -> str:
@@ -135,3 +144,31 @@ class KnowledgeStore(Base):
             f"<KnowledgeStore(namespace={self.namespace!r}, "
             f"key={self.key!r}, org_id={self.organization_id})>"
         )
+
+
+class EmbeddingCache(Base):
+    """
+    Content-addressed embedding cache.
+
+    Maps (model, dimensions, sha256(text)) to the embedding the provider
+    returned for that text, so re-storing or reindexing unchanged chunks
+    doesn't pay for another embedding call. Shared across organizations:
+    the key is derived from the text itself, and the text is never stored.
+    See services/embeddings/cache.py.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(String(255), primary_key=True)
+    dimensions: Mapped[int] = mapped_column(Integer, primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    embedding: Mapped[list] = mapped_column(Vector(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=text("NOW()")
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingCache(model={self.model!r}, dimensions={self.dimensions}, "
+            f"content_hash={self.content_hash[:12]!r})>"
+        )
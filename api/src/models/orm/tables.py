@@ -53,6 +53,9 @@ class Table(Base):
     # The API contract field is named `policies`; the column name stays `access`
     # to avoid a schema migration. See contracts/tables.py for the rename adapter.
     access: Mapped[dict | None] = mapped_column(JSONB, default=None)
+    # Declared expression indexes on document fields: [{"field", "kind"}].
+    # The indexes themselves are built/dropped by src/services/table_indexes.py.
+    indexes: Mapped[list | None] = mapped_column(JSONB, default=None)
     description: Mapped[str | None] = mapped_column(Text, default=None)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=text("NOW()")
@@ -15,9 +15,16 @@ from sqlalchemy.types import Float, UserDefinedType
 
 class Vector(UserDefinedType):
     cache_ok = True
+    type_name = "VECTOR"
+
+    def __init__(self, dim: int | None = None):
+        # Dimension is only used for casts; the column itself is unconstrained
+        self.dim = dim
 
     def get_col_spec(self, **kw) -> str:
-        return "VECTOR"
+        if self.dim is None:
+            return self.type_name
+        return f"{self.type_name}({self.dim})"
 
     def bind_processor(self, dialect):
         def process(value):
@@ -37,3 +44,10 @@ class Vector(UserDefinedType):
     class comparator_factory(UserDefinedType.Comparator):
         def cosine_distance(self, other):
             return self.op("<=>", return_type=Float)(other)
+
+
+class HalfVector(Vector):
+    """pgvector ``halfvec`` — same text wire format as ``vector``."""
+
+    cache_ok = True
+    type_name = "HALFVEC"
@@ -187,6 +187,46 @@ class ConfigRepository(OrgScopedRepository[ConfigModel]):  # type: ignore[type-v
         )
         return config_dict
 
+    async def values_for_sdk(self, keys: list[str]) -> dict[str, Any]:
+        """Return merged config entries for ``keys`` only.
+
+        Reads just the requested fields of the cached merged hash with one
+        HMGET instead of transferring the whole hash. When the hash is not
+        cached, falls back to ``merged_for_sdk`` (which repopulates it).
+        Keys with no config are omitted from the result.
+        """
+        from src.core.cache.keys import config_hash_key_versioned
+        from src.core.cache.redis_client import get_shared_redis
+
+        if not keys:
+            return {}
+
+        org_id_str = str(self.org_id) if self.org_id is not None else None
+
+        try:
+            redis = await get_shared_redis()
+            hash_key = await config_hash_key_versioned(redis, org_id_str)
+            pipe = redis.pipeline(transaction=False)
+            pipe.exists(hash_key)
+            pipe.hmget(hash_key, keys)
+            exists, values = await pipe.execute()
+            if exists:
+                out: dict[str, Any] = {}
+                for key, value in zip(keys, values):
+                    if value is None:
+                        continue
+                    value_str = value.decode() if isinstance(value, bytes) else value
+                    try:
+                        out[key] = json.loads(value_str)
+                    except json.JSONDecodeError:
+                        out[key] = {"value": value_str, "type": "string"}
+                return out
+        except Exception as e:
+            logger.warning(f"Config cache read failed: {e}")
+
+        merged = await self.merged_for_sdk()
+        return {key: merged[key] for key in keys if key in merged}
+
     async def get_config_strict(self, key: str) -> ConfigModel | None:
         """Get config strictly in current org scope."""
         query = select(self.model).where(
@@ -5,17 +5,51 @@ Data access layer for the knowledge store (RAG).
 Handles vector storage, semantic search, and namespace management.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Select, delete, func, literal_column, select, text
 
 from src.models.orm import KnowledgeStore
 from src.repositories.org_scoped import OrgScopedRepository
 from src.services.embeddings import BaseEmbeddingClient
+from src.services.embeddings.cache import EmbeddingCacheStats, embed_with_cache
 from src.services.knowledge.chunking import split_into_chunks
+from src.services.knowledge.vector_index import (
+    ann_dimension_filter,
+    ann_distance,
+    ef_search_for,
+)
+
+
+# Text search configuration of ix_knowledge_content_fts. Inlined rather than
+# bound: the planner only matches the index expression against a constant.
+FTS_CONFIG = literal_column("'english'::regconfig")
+
+# Reciprocal rank fusion constant (Cormack et al.); dampens the advantage
+# of the very top ranks so agreement between the two lists matters more
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: list[list[tuple[KnowledgeStore, float]]],
+    k: int = RRF_K,
+) -> list[tuple[KnowledgeStore, float]]:
+    """
+    Fuse ranked result lists: each row scores sum(1 / (k + rank)) over the
+    lists it appears in. Returns (row, fused score), best first.
+    """
+    scores: dict[Any, float] = {}
+    rows: dict[Any, KnowledgeStore] = {}
+    for ranked in ranked_lists:
+        for rank, (row, _) in enumerate(ranked, start=1):
+            scores[row.id] = scores.get(row.id, 0.0) + 1.0 / (k + rank)
+            rows[row.id] = row
+    fused = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [(rows[row_id], score) for row_id, score in fused]
 
 
 @dataclass
@@ -26,6 +60,8 @@ class KnowledgeDocument:
     namespace: str
     content: str
     metadata: dict[str, Any]
+    # Cosine similarity (0-1) to the query embedding; None when the chunk
+    # was only matched by full text
     score: float | None = None
     organization_id: str | None = None
     key: str | None = None
@@ -68,6 +104,7 @@ class KnowledgeRepository(OrgScopedRepository[KnowledgeStore]):
         organization_id: UUID | None = None,
         created_by: UUID | None = None,
         embedder: BaseEmbeddingClient | None = None,
+        cache_stats: EmbeddingCacheStats | None = None,
     ) -> list[str]:
         """
         Store a document as one or more embedded chunks.
@@ -82,7 +119,10 @@ class KnowledgeRepository(OrgScopedRepository[KnowledgeStore]):
             metadata: Optional metadata dict
             organization_id: Organization scope (None for global). Defaults to self.org_id.
             created_by: User who created the document
-            embedder: Embedding client used to embed every chunk
+            embedder: Embedding client used to embed every chunk. Chunks
+                embedded before with the same model come from the
+                embedding cache instead.
+            cache_stats: Optional embedding cache hit/miss counters
 
         Returns:
             Inserted document IDs (UUID strings), in chunk_index order.
@@ -92,7 +132,7 @@ class KnowledgeRepository(OrgScopedRepository[KnowledgeStore]):
 
         target_org_id = organization_id if organization_id is not None else self.org_id
         chunks = split_into_chunks(content)
-        embeddings = await embedder.embed(chunks)
+        embeddings = await embed_with_cache(self.session, embedder, chunks, cache_stats)
 
         if len(embeddings) != len(chunks):
             raise ValueError(
@@ -131,7 +171,7 @@ class KnowledgeRepository(OrgScopedRepository[KnowledgeStore]):
 
     async def search(
         self,
-        query_embedding: list[float],
+        query_embedding: list[float] | None,
         namespace: str | list[str],
         organization_id: UUID | None = None,
         limit: int = 5,
@@ -139,79 +179,162 @@ class KnowledgeRepository(OrgScopedRepository[KnowledgeStore]):
         metadata_filter: dict[str, Any] | None = None,
         fallback: bool = True,
         group_by_key: bool = True,
+        query_text: str | None = None,
     ) -> list[KnowledgeDocument]:
         """
-        Search for similar documents using vector similarity.
+        Search for similar documents.
+
+        With only ``query_embedding`` this is pure vector similarity. Passing
+        ``query_text`` as well runs a hybrid search: full-text matches over
+        content are fused with the vector results by reciprocal rank fusion,
+        so exact identifiers (ticket numbers, SKUs) rank even when their
+        embedding doesn't. With ``query_text`` and no embedding, only the
+        full-text match runs.
 
         Args:
-            query_embedding: Query vector
+            query_embedding: Query vector (None for a full-text-only search)
             namespace: Namespace(s) to search
             organization_id: Organization scope. Defaults to self.org_id.
             limit: Maximum results
-            min_score: Minimum similarity score (0-1)
+            min_score: Minimum similarity score (0-1). In hybrid search it
+                only drops vector candidates; full-text matches are kept.
             metadata_filter: Filter by metadata fields
             fallback: If True, also search global scope
             group_by_key: If True, return at most one chunk per keyed document
+            query_text: Query text for full-text matching
 
         Returns:
-            List of KnowledgeDocument sorted by similarity
+            List of KnowledgeDocument, most relevant first: by similarity,
+            or by fused rank when ``query_text`` is given. ``score`` is
+            always the cosine similarity, and None for chunks only the
+            full-text match found.
         """
+        if query_embedding is None and not query_text:
+            raise ValueError("search requires a query_embedding or query_text")
+
         # Use self.org_id as default if not explicitly provided
         target_org_id = organization_id if organization_id is not None else self.org_id
         namespaces = [namespace] if isinstance(namespace, str) else namespace
+        raw_limit = limit * 4 if group_by_key else limit
+
+        def scoped(stmt):
+            stmt = stmt.where(KnowledgeStore.namespace.in_(namespaces))
 
-        # Build the query
+            # Organization scoping with optional fallback
+            if target_org_id and fallback:
+                # Search both org and global
+                stmt = stmt.where(
+                    (KnowledgeStore.organization_id == target_org_id) |
+                    (KnowledgeStore.organization_id.is_(None))
+                )
+            elif target_org_id:
+                # Only org scope
+                stmt = stmt.where(KnowledgeStore.organization_id == target_org_id)
+            else:
+                # Only global scope
+                stmt = stmt.where(KnowledgeStore.organization_id.is_(None))
+
+            # Metadata filtering using JSONB containment
+            if metadata_filter:
+                for key, value in metadata_filter.items():
+                    # Use @> containment operator
+                    stmt = stmt.where(
+                        KnowledgeStore.doc_metadata.contains({key: value})
+                    )
+            return stmt
+
+        vector_rows: list[tuple[KnowledgeStore, float]] = []
+        if query_embedding is not None:
+            vector_rows = await self._vector_candidates(query_embedding, scoped, raw_limit)
+            if min_score is not None:
+                vector_rows = [row for row in vector_rows if row[1] >= min_score]
+
+        if not query_text:
+            return self._to_documents(vector_rows, limit, group_by_key)
+
+        lexical_rows = await self._lexical_candidates(query_text, scoped, raw_limit)
+        # Order by fused rank, but report each chunk's similarity, not its
+        # fusion score (which only means something relative to this query)
+        similarity = {row.id: score for row, score in vector_rows}
+        fused = reciprocal_rank_fusion([vector_rows, lexical_rows])
+        return self._to_documents(
+            [(row, similarity.get(row.id)) for row, _ in fused], limit, group_by_key
+        )
+
+    async def _vector_candidates(
+        self,
+        query_embedding: list[float],
+        scoped: Callable[[Select], Select],
+        raw_limit: int,
+    ) -> list[tuple[KnowledgeStore, float]]:
+        """Nearest chunks by cosine similarity, best first."""
         # We use cosine distance (1 - cosine_similarity), so lower is better
         # Convert to similarity score: 1 - distance
-        distance_expr = KnowledgeStore.embedding.cosine_distance(query_embedding)
+        # Distance and dimension filter match the per-dimension HNSW index
+        # (see services/knowledge/vector_index.py); rows embedded at another
+        # dimension can't be compared with this query and are skipped.
+        distance_expr = ann_distance(query_embedding)
         score_expr = (1 - distance_expr).label("score")
 
-        stmt = select(
-            KnowledgeStore,
-            score_expr,
-        ).where(
-            KnowledgeStore.namespace.in_(namespaces)
-        )
-
-        # Organization scoping with optional fallback
-        if target_org_id and fallback:
-            # Search both org and global
-            stmt = stmt.where(
-                (KnowledgeStore.organization_id == target_org_id) |
-                (KnowledgeStore.organization_id.is_(None))
+        stmt = scoped(
+            select(KnowledgeStore, score_expr).where(
+                ann_dimension_filter(len(query_embedding))
             )
-        elif target_org_id:
-            # Only org scope
-            stmt = stmt.where(KnowledgeStore.organization_id == target_org_id)
-        else:
-            # Only global scope
-            stmt = stmt.where(KnowledgeStore.organization_id.is_(None))
+        )
 
-        # Metadata filtering using JSONB containment
-        if metadata_filter:
-            for key, value in metadata_filter.items():
-                # Use @> containment operator
-                stmt = stmt.where(
-                    KnowledgeStore.doc_metadata.contains({key: value})
-                )
+        # Order by ascending distance (not descending score) so the HNSW
+        # index can serve the ORDER BY ... LIMIT
+        stmt = stmt.order_by(distance_expr).limit(raw_limit)
+
+        # Transaction-local HNSW settings: a candidate list large enough for
+        # raw_limit, and iterative scans so namespace/org/metadata filters
+        # don't starve the result. relaxed_order may return rows slightly
+        # out of order, so re-sort below.
+        await self.session.execute(
+            text(
+                "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                "set_config('hnsw.iterative_scan', 'relaxed_order', true)"
+            ).bindparams(ef_search=str(ef_search_for(raw_limit)))
+        )
+        result = await self.session.execute(stmt)
+        return sorted(
+            ((row[0], float(row[1])) for row in result.all()),
+            key=lambda row: row[1],
+            reverse=True,
+        )
 
-        stmt = stmt.order_by(score_expr.desc())
-        raw_limit = limit * 4 if group_by_key else limit
-        stmt = stmt.limit(raw_limit)
+    async def _lexical_candidates(
+        self,
+        query_text: str,
+        scoped: Callable[[Select], Select],
+        raw_limit: int,
+    ) -> list[tuple[KnowledgeStore, float]]:
+        """Chunks matching every query term, best full-text rank first."""
+        # Same expression as ix_knowledge_content_fts, or the index isn't used
+        document = func.to_tsvector(FTS_CONFIG, KnowledgeStore.content)
+        # Every term must match (stop words aside), so a common word can't
+        # pull unrelated chunks into the fusion; quoted phrases and an
+        # explicit "or" work as in a web search box
+        query = func.websearch_to_tsquery(FTS_CONFIG, query_text)
+        rank_expr = func.ts_rank_cd(document, query).label("rank")
+
+        stmt = scoped(
+            select(KnowledgeStore, rank_expr).where(document.bool_op("@@")(query))
+        )
+        stmt = stmt.order_by(rank_expr.desc()).limit(raw_limit)
 
         result = await self.session.execute(stmt)
-        rows = result.all()
+        return [(row[0], float(row[1])) for row in result.all()]
 
+    @staticmethod
+    def _to_documents(
+        rows: list[tuple[KnowledgeStore, float | None]],
+        limit: int,
+        group_by_key: bool,
+    ) -> list[KnowledgeDocument]:
         documents: list[KnowledgeDocument] = []
         seen_keys: set[tuple[str, str | None, str]] = set()
-        for row in rows:
-            doc = row[0]
-            score = row[1]
-
-            # Filter by min_score if specified
-            if min_score is not None and score < min_score:
-                continue
-
+        for doc, score in rows:
             if group_by_key and doc.key is not None:
                 dedup_key = (
                     doc.namespace,
@@ -228,7 +351,7 @@ class KnowledgeRepository(OrgScopedRepository[KnowledgeStore]):
                     namespace=doc.namespace,
                     content=doc.content,
                     metadata=doc.doc_metadata,
-                    score=float(score),
+                    score=score,
                     organization_id=str(doc.organization_id) if doc.organization_id else None,
                     key=doc.key,
                     created_at=doc.created_at,
@@ -230,6 +230,7 @@ def _agent_to_public(agent: Agent) -> AgentPublic:
         llm_max_tokens=agent.llm_max_tokens,
         max_iterations=agent.max_iterations,
         max_token_budget=agent.max_token_budget,
+        max_parallel_tool_calls=agent.max_parallel_tool_calls,
         logo=_logo_data_url(agent.logo_data, agent.logo_content_type),
     )
 
@@ -383,6 +384,7 @@ async def create_agent(
         llm_max_tokens=agent_data.llm_max_tokens,
         max_iterations=agent_data.max_iterations,
         max_token_budget=agent_data.max_token_budget,
+        max_parallel_tool_calls=agent_data.max_parallel_tool_calls,
         created_by=user.email,
         created_at=now,
         updated_at=now,
@@ -695,6 +697,8 @@ async def update_agent(
         agent.max_iterations = agent_data.max_iterations
     if "max_token_budget" in agent_data.model_fields_set:
         agent.max_token_budget = agent_data.max_token_budget
+    if "max_parallel_tool_calls" in agent_data.model_fields_set:
+        agent.max_parallel_tool_calls = agent_data.max_parallel_tool_calls
 
     agent.updated_at = datetime.now(timezone.utc)
 
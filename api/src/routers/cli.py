@@ -67,6 +67,7 @@ from src.models.contracts.cli import (
     CLIAICompleteResponse,
     CLIAIInfoResponse,
     CLIConfigDeleteRequest,
+    CLIConfigGetManyRequest,
     CLIConfigGetRequest,
     CLIConfigListRequest,
     CLIConfigSetRequest,
@@ -397,30 +398,8 @@ async def _resolve_sdk_org_id(
     return str(resolved) if resolved is not None else None
 
 
-@router.post(
-    "/config/get",
-    response_model=CLIConfigValue | None,
-    summary="Get config value",
-)
-async def cli_get_config(
-    request: CLIConfigGetRequest,
-    current_user: CurrentUser,
-    db: AsyncSession = Depends(get_db),
-) -> CLIConfigValue | None:
-    """Get a config value via CLI API."""
-    from src.repositories.config import ConfigRepository
-
-    org_id = await _resolve_sdk_org_id(current_user, request.scope, db)
-    org_uuid = UUID(org_id) if org_id else None
-
-    # Canonical SDK config load: cascade (global + org-specific) merged.
-    repo = ConfigRepository(db, org_id=org_uuid, is_superuser=True)
-    all_config = await repo.merged_for_sdk()
-
-    if request.key not in all_config:
-        return None
-
-    entry = all_config[request.key]
+def _sdk_config_value(key: str, entry: dict[str, Any]) -> CLIConfigValue:
+    """Decrypt/coerce a merged config entry into the SDK response shape."""
     raw_value = entry.get("value")
     config_type = entry.get("type", "string")
 
@@ -435,7 +414,7 @@ async def cli_get_config(
             raw_value = json.loads(raw_value)
         except json.JSONDecodeError as e:
             # Stored value is not valid JSON — return raw string as fallback
-            logger.debug(f"config {log_safe(request.key)} stored as json but failed to parse, returning raw: {log_safe(e)}")
+            logger.debug(f"config {log_safe(key)} stored as json but failed to parse, returning raw: {log_safe(e)}")
     elif config_type == "bool":
         raw_value = str(raw_value).lower() == "true" if isinstance(raw_value, str) else bool(raw_value)
     elif config_type == "int":
@@ -443,15 +422,67 @@ async def cli_get_config(
             raw_value = int(raw_value)
         except (ValueError, TypeError) as e:
             # Stored value isn't coercible to int — return raw value
-            logger.debug(f"config {log_safe(request.key)} stored as int but failed to coerce, returning raw: {log_safe(e)}")
+            logger.debug(f"config {log_safe(key)} stored as int but failed to coerce, returning raw: {log_safe(e)}")
 
     return CLIConfigValue(
-        key=request.key,
+        key=key,
         value=raw_value,
         config_type=config_type,
     )
 
 
+@router.post(
+    "/config/get",
+    response_model=CLIConfigValue | None,
+    summary="Get config value",
+)
+async def cli_get_config(
+    request: CLIConfigGetRequest,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+) -> CLIConfigValue | None:
+    """Get a config value via CLI API."""
+    from src.repositories.config import ConfigRepository
+
+    org_id = await _resolve_sdk_org_id(current_user, request.scope, db)
+    org_uuid = UUID(org_id) if org_id else None
+
+    # Canonical SDK config load: cascade (global + org-specific) merged,
+    # served from the cached merged hash when available.
+    repo = ConfigRepository(db, org_id=org_uuid, is_superuser=True)
+    entries = await repo.values_for_sdk([request.key])
+
+    if request.key not in entries:
+        return None
+
+    return _sdk_config_value(request.key, entries[request.key])
+
+
+@router.post(
+    "/config/get_many",
+    response_model=dict[str, CLIConfigValue],
+    summary="Get several config values",
+)
+async def cli_get_many_config(
+    request: CLIConfigGetManyRequest,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, CLIConfigValue]:
+    """Get several config values in one call via CLI API.
+
+    Keys with no config are omitted from the response.
+    """
+    from src.repositories.config import ConfigRepository
+
+    org_id = await _resolve_sdk_org_id(current_user, request.scope, db)
+    org_uuid = UUID(org_id) if org_id else None
+
+    repo = ConfigRepository(db, org_id=org_uuid, is_superuser=True)
+    entries = await repo.values_for_sdk(list(dict.fromkeys(request.keys)))
+
+    return {key: _sdk_config_value(key, entry) for key, entry in entries.items()}
+
+
 @router.post(
     "/config/set",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -634,6 +665,11 @@ async def sdk_integrations_get(
     3. Fallback to integration defaults: When no org mapping exists, returns
        integration.default_entity_id, integration-level config, and OAuth data
     """
+    from src.core.cache.integration_cache import (
+        cache_resolution,
+        current_version,
+        get_cached_resolution,
+    )
     from src.repositories.integrations import IntegrationsRepository
     from src.repositories.oauth import OAuthTokenRepository
     from src.services.oauth_provider import resolve_url_template
@@ -642,6 +678,23 @@ async def sdk_integrations_get(
     org_id = await _resolve_sdk_org_id(current_user, request.scope, db)
     org_uuid = UUID(org_id) if org_id else None
 
+    # Scope has been authorized above; reuse a recent resolution if current
+    cache_key = (request.name, org_id, request.oauth_scope)
+    cache_version = await current_version()
+    cached = get_cached_resolution(cache_key, cache_version)
+    if cached is not None:
+        return cached
+
+    def _remember(response: SDKIntegrationsGetResponse) -> SDKIntegrationsGetResponse:
+        oauth = response.oauth
+        # Don't pin a missing token (e.g. a failed auto-refresh) for the TTL
+        if oauth is None or oauth.access_token:
+            cache_resolution(
+                cache_key, cache_version, response,
+                expires_at=oauth.expires_at if oauth else None,
+            )
+        return response
+
     try:
         repo = IntegrationsRepository(db)
 
@@ -684,7 +737,7 @@ async def sdk_integrations_get(
                 )
 
             logger.info(f"SDK retrieved integration '{log_safe(request.name)}' (org mapping) for user {current_user.email}")
-            return SDKIntegrationsGetResponse(**response_data)
+            return _remember(SDKIntegrationsGetResponse(**response_data))
 
         # Fall back to integration defaults
         integration = await repo.get_integration_by_name(request.name)
@@ -721,7 +774,7 @@ async def sdk_integrations_get(
             )
 
         logger.info(f"SDK retrieved integration '{log_safe(request.name)}' (defaults) for user {current_user.email}")
-        return SDKIntegrationsGetResponse(**response_data)
+        return _remember(SDKIntegrationsGetResponse(**response_data))
 
     except HTTPException:
         # Auth/scope failures (e.g. 403 from _resolve_sdk_org_id) must surface.
@@ -2208,18 +2261,21 @@ async def cli_knowledge_search(
     current_user: CurrentUser,
     db: AsyncSession = Depends(get_db),
 ) -> list[CLIKnowledgeDocumentResponse]:
-    """Search for similar documents using vector similarity."""
+    """Search for similar documents by vector similarity, full text, or both."""
     from src.models.contracts.cli import CLIKnowledgeDocumentResponse
     from src.repositories.knowledge import KnowledgeRepository
     from src.services.embeddings import get_embedding_client
+    from src.services.embeddings.query_cache import embed_query
 
     try:
         org_id = await _resolve_sdk_org_id(current_user, request.scope, db)
         org_uuid = UUID(org_id) if org_id else None
 
-        # Generate query embedding
-        embedding_client = await get_embedding_client(db)
-        query_embedding = await embedding_client.embed_single(request.query)
+        # Generate query embedding (keyword search doesn't need one)
+        query_embedding = None
+        if request.mode != "keyword":
+            embedding_client = await get_embedding_client(db)
+            query_embedding = await embed_query(embedding_client, request.query)
 
         # Search
         repo = KnowledgeRepository(db, org_id=org_uuid, is_superuser=True)
@@ -2230,6 +2286,7 @@ async def cli_knowledge_search(
             min_score=request.min_score,
             metadata_filter=request.metadata_filter,
             fallback=request.fallback,
+            query_text=request.query if request.mode != "vector" else None,
         )
 
         logger.info(f"CLI knowledge search: query={log_safe(request.query[:50])}..., results={len(results)}")
@@ -33,6 +33,7 @@ from sqlalchemy.orm import joinedload
 
 from src.config import get_settings
 from src.core.auth import Context
+from src.core.cache.integration_cache import mark_integration_state_changed
 from src.core.log_safety import log_safe
 from src.core.security import decrypt_secret, encrypt_secret
 from src.models.contracts.external_mcp import (
@@ -888,6 +889,7 @@ async def disconnect_user_credential(connection_id: UUID, ctx: Context) -> None:
     # for the per-user case: drop the token explicitly so it doesn't linger
     # if some future schema change drops the cascade.
     await ctx.db.execute(delete(OAuthToken).where(OAuthToken.id == token_id))
+    mark_integration_state_changed(ctx.db)
     await ctx.db.commit()
     logger.info(
         "user mcp credential disconnected: user=%s connection=%s",
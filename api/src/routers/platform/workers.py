@@ -282,6 +282,8 @@ async def list_pools(
                 pool_info.requirements_total = hb.get("requirements_total")
                 pool_info.memory_current_bytes = hb.get("memory_current_bytes")
                 pool_info.memory_max_bytes = hb.get("memory_max_bytes")
+                pool_info.preloaded_modules = hb.get("preloaded_modules")
+                pool_info.preload_hit_rate = hb.get("preload_hit_rate")
             except json.JSONDecodeError:
                 logger.warning(f"Invalid heartbeat JSON for pool {log_safe(worker_id)}")
 
@@ -9,26 +9,40 @@ Tables follow the same scoping pattern as configs:
 - organization_id = UUID: Organization-scoped table
 """
 
+import base64
+import hashlib
+import json
 import logging
 from datetime import datetime, timezone
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
-from sqlalchemy import String, cast, func, select
+from sqlalchemy import (
+    String,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
 from shared.claims.preresolve import preresolve_for_policies
 from shared.claims.registry import referenced_claim_names
-from shared.policies.probe import (
-    compile_read_filter,
-    evaluate_action,
-)
+from shared.policies.predicate import compiled_policies
+from shared.policies.probe import compile_read_filter
 from src.core.auth import Context, CurrentSuperuser
 from src.core.principal import UserPrincipal
 from src.core.constants import SYSTEM_USER_UUID
+from src.core.database import get_db_context
 from src.core.log_safety import log_safe
 from src.core.org_filter import resolve_org_filter, resolve_target_org
 from src.models.contracts.policies import (
@@ -43,12 +57,16 @@ from src.models.contracts.tables import (
     DocumentBatchDeleteResponse,
     DocumentCountResponse,
     DocumentCreate,
+    DocumentExportQuery,
     DocumentListResponse,
     DocumentPublic,
     DocumentQuery,
     DocumentUpdate,
     DocumentUpsert,
     TableCreate,
+    TableIndexCreate,
+    TableIndexListResponse,
+    TableIndexPublic,
     TableListResponse,
     TablePublic,
     TableUpdate,
@@ -56,13 +74,35 @@ from src.models.contracts.tables import (
 from src.models.orm.custom_claims import CustomClaim as CustomClaimORM
 from src.models.orm.tables import Document, Table
 from src.repositories.tables import TableRepository
-from src.core.pubsub import publish_document_change, publish_policy_changed
+from src.services.table_indexes import (
+    FieldKind,
+    comparison_operand,
+    create_table_index,
+    declared_indexes,
+    drop_table_indexes,
+    index_name,
+    schema_field_kinds,
+    table_field_kinds,
+    typed_field_expr,
+)
+from src.core.pubsub import (
+    publish_document_change,
+    publish_document_changes,
+    publish_policy_changed,
+)
 from src.services.audit import emit_audit
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/tables", tags=["Tables"])
 
+# Rows per multi-row INSERT in batch writes (keeps bind params under
+# asyncpg's 32767 limit)
+BATCH_WRITE_CHUNK = 1000
+
+# Rows fetched per server-side cursor round trip in NDJSON exports
+EXPORT_FETCH_SIZE = 1000
+
 
 def _load_policies(table: Table) -> TablePolicies:
     """Load TablePolicies from the table's `access` JSONB column.
@@ -145,7 +185,7 @@ async def _check_action_or_403(
     *,
     db: AsyncSession,
 ) -> None:
-    """Run evaluate_action; raise 403 with a generic message on deny.
+    """Check the action against the table's compiled policies; 403 on deny.
 
     On denial, emits a `policy.deny` audit row before raising so policy
     authors can debug "why can't user X read row Y?" via the audit log.
@@ -165,7 +205,7 @@ async def _check_action_or_403(
         db,
         table.organization_id,
     )
-    if evaluate_action(action, policies, row, user):
+    if compiled_policies(str(table.id), policies).allows(action, row, user):
         return
 
     # Resolve the row id only when it's actually a UUID.
@@ -209,12 +249,19 @@ def _escape_like(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
-def _build_document_filters(base_query: Any, where: dict[str, Any]) -> Any:
+def _build_document_filters(
+    base_query: Any,
+    where: dict[str, Any],
+    field_kinds: dict[str, FieldKind] | None = None,
+) -> Any:
     """Build SQLAlchemy filters from where clause with JSON-native operators.
 
     Supports:
     - Simple equality: {"status": "active"}
     - Comparison operators: {"amount": {"gt": 100, "lte": 1000}}
+      Compared as numeric, boolean, timestamp or text depending on
+      ``field_kinds`` (the table's schema hints and declared indexes) or,
+      failing that, the operand type. See ``src/services/table_indexes.py``.
     - Contains: {"name": {"contains": "acme"}} (case-insensitive substring)
     - Starts/ends with: {"name": {"starts_with": "a"}}
     - IN lists: {"category": {"in": ["a", "b"]}}
@@ -247,22 +294,17 @@ def _build_document_filters(base_query: Any, where: dict[str, Any]) -> Any:
                 elif op == "ends_with":
                     escaped = _escape_like(str(op_value))
                     base_query = base_query.where(json_field.astext.ilike(f"%{escaped}"))
-                elif op == "gt":
-                    base_query = base_query.where(
-                        cast(json_field.astext, String) > str(op_value)
-                    )
-                elif op == "gte":
-                    base_query = base_query.where(
-                        cast(json_field.astext, String) >= str(op_value)
-                    )
-                elif op == "lt":
-                    base_query = base_query.where(
-                        cast(json_field.astext, String) < str(op_value)
-                    )
-                elif op == "lte":
-                    base_query = base_query.where(
-                        cast(json_field.astext, String) <= str(op_value)
-                    )
+                elif op in ("gt", "gte", "lt", "lte"):
+                    kind, operand = comparison_operand(field, op_value, field_kinds or {})
+                    typed_field = typed_field_expr(field, kind)
+                    if op == "gt":
+                        base_query = base_query.where(typed_field > operand)
+                    elif op == "gte":
+                        base_query = base_query.where(typed_field >= operand)
+                    elif op == "lt":
+                        base_query = base_query.where(typed_field < operand)
+                    else:
+                        base_query = base_query.where(typed_field <= operand)
                 elif op in ("in", "in_"):
                     if isinstance(op_value, list):
                         def _jsonb_text(v: Any) -> str:
@@ -293,6 +335,111 @@ def _build_document_filters(base_query: Any, where: dict[str, Any]) -> Any:
     return base_query
 
 
+def _order_expr(order_by: str) -> ColumnElement:
+    return Document.data[order_by].astext
+
+
+def _apply_document_order(base_query: Any, order_by: str | None, order_dir: str) -> Any:
+    """Apply the document sort order used by queries, cursors and exports.
+
+    Always append `Document.id` as a secondary sort key so pagination is
+    stable when the primary key has ties (e.g. rows inserted in the same
+    transaction share `created_at`). Without a tiebreaker, Postgres returns
+    tied rows in arbitrary order and the same id can appear on adjacent
+    pages — or be skipped entirely.
+    """
+    if order_by:
+        # Order by JSONB field
+        order_expr = _order_expr(order_by)
+        if order_dir == "desc":
+            order_expr = order_expr.desc()
+        return base_query.order_by(order_expr, Document.id)
+    # Default ordering by created_at
+    if order_dir == "desc":
+        return base_query.order_by(Document.created_at.desc(), Document.id)
+    return base_query.order_by(Document.created_at.asc(), Document.id)
+
+
+def _where_fingerprint(where: dict[str, Any] | None) -> str:
+    encoded = json.dumps(where or {}, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()[:12]
+
+
+def _encode_cursor(
+    query_params: DocumentQuery,
+    last_doc: Document,
+    last_sort_key: str | None,
+) -> str:
+    """Opaque cursor pointing just after ``last_doc`` in the query's order."""
+    payload: dict[str, Any] = {
+        "o": query_params.order_by,
+        "d": query_params.order_dir,
+        "w": _where_fingerprint(query_params.where),
+        "i": last_doc.id,
+    }
+    if query_params.order_by:
+        payload["k"] = last_sort_key
+    else:
+        payload["c"] = last_doc.created_at.isoformat()
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, query_params: DocumentQuery) -> dict[str, Any]:
+    """Decode a cursor and check it belongs to this query."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, dict) or not isinstance(payload.get("i"), str):
+            raise ValueError
+        if not query_params.order_by:
+            payload["c"] = datetime.fromisoformat(payload["c"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if (
+        payload.get("o") != query_params.order_by
+        or payload.get("d") != query_params.order_dir
+        or payload.get("w") != _where_fingerprint(query_params.where)
+    ):
+        raise ValueError("Cursor does not match this query's where/order_by/order_dir")
+    return payload
+
+
+def _keyset_after(
+    order_by: str | None,
+    order_dir: str,
+    position: dict[str, Any],
+) -> ColumnElement:
+    """Predicate for rows after ``position`` in ``_apply_document_order``'s order.
+
+    The tiebreaker ``id`` is ascending in both directions, so this is the
+    expanded form rather than a row comparison. JSONB sort keys follow
+    Postgres NULL ordering: NULLS LAST ascending, NULLS FIRST descending.
+    """
+    last_id = position["i"]
+    if not order_by:
+        created_at = position["c"]
+        if order_dir == "desc":
+            before = Document.created_at < created_at
+        else:
+            before = Document.created_at > created_at
+        return or_(before, and_(Document.created_at == created_at, Document.id > last_id))
+
+    sort_expr = _order_expr(order_by)
+    last_key = position.get("k")
+    if order_dir == "desc":
+        if last_key is None:
+            return or_(and_(sort_expr.is_(None), Document.id > last_id), sort_expr.isnot(None))
+        return or_(sort_expr < last_key, and_(sort_expr == last_key, Document.id > last_id))
+    if last_key is None:
+        return and_(sort_expr.is_(None), Document.id > last_id)
+    return or_(
+        sort_expr > last_key,
+        and_(sort_expr == last_key, Document.id > last_id),
+        sort_expr.is_(None),
+    )
+
+
 class DocumentRepository:
     """Repository for document operations within a table."""
 
@@ -300,6 +447,26 @@ class DocumentRepository:
         self.session = session
         self.table = table
 
+    def _field_kinds(self) -> dict[str, FieldKind]:
+        """Comparison kinds from the table's schema hints and declared indexes."""
+        return table_field_kinds(self.table.schema, self.table.indexes)
+
+    def _select_table_documents(self) -> Any:
+        """``SELECT`` scoped to this table's documents.
+
+        Declared field indexes are partial on ``table_id``; Postgres can
+        only match a partial index predicate against a constant, so when the
+        table has any, the table id is inlined instead of bound (it is a
+        UUID, so inlining is safe).
+        """
+        if declared_indexes(self.table.indexes):
+            table_predicate = Document.table_id == literal_column(
+                f"'{UUID(str(self.table.id))}'::uuid"
+            )
+        else:
+            table_predicate = Document.table_id == self.table.id
+        return select(Document).where(table_predicate)
+
     async def insert(
         self,
         data: dict[str, Any],
@@ -413,6 +580,90 @@ class DocumentRepository:
         assert doc is not None  # we just upserted it
         return doc, inserted
 
+    async def get_many(self, doc_ids: list[str]) -> dict[str, Document]:
+        """Load existing documents by ID with a single ``id = ANY(...)`` query."""
+        if not doc_ids:
+            return {}
+        query = select(Document).where(
+            Document.table_id == self.table.id,
+            Document.id == any_(bindparam("doc_ids", doc_ids, type_=ARRAY(String))),
+        )
+        result = await self.session.execute(query)
+        return {doc.id: doc for doc in result.scalars().all()}
+
+    async def write_many(
+        self,
+        rows: list[dict[str, Any]],
+        *,
+        update_ids: set[str],
+    ) -> list[Document]:
+        """Insert rows, merging into the existing documents in ``update_ids``.
+
+        Each chunk is one multi-row ``INSERT ... ON CONFLICT DO UPDATE
+        RETURNING``. Conflicts only update rows listed in ``update_ids`` (the
+        ones the caller policy-checked for ``update``), with the same merge
+        semantics as ``update``; any other conflicting row is left untouched
+        and is missing from the result.
+
+        ``rows`` carry ``id``, ``data``, ``created_by`` and ``updated_by``,
+        with unique ids.
+        """
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        now = datetime.now(timezone.utc)
+        written: list[Document] = []
+        for start in range(0, len(rows), BATCH_WRITE_CHUNK):
+            chunk = rows[start:start + BATCH_WRITE_CHUNK]
+            stmt = pg_insert(Document).values([
+                {
+                    "id": row["id"],
+                    "table_id": self.table.id,
+                    "data": row["data"],
+                    "created_by": row["created_by"],
+                    "updated_by": row["updated_by"],
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for row in chunk
+            ])
+            chunk_update_ids = [row["id"] for row in chunk if row["id"] in update_ids]
+            if chunk_update_ids:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["table_id", "id"],
+                    set_={
+                        "data": Document.data.op("||", return_type=JSONB)(stmt.excluded.data),
+                        "updated_by": stmt.excluded.updated_by,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                    where=Document.id == any_(
+                        bindparam("update_ids", chunk_update_ids, type_=ARRAY(String))
+                    ),
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=["table_id", "id"])
+
+            result = await self.session.execute(
+                stmt.returning(Document),
+                execution_options={"populate_existing": True},
+            )
+            written.extend(result.scalars().all())
+        return written
+
+    async def delete_many(self, doc_ids: list[str]) -> list[str]:
+        """Delete documents by ID in one statement; returns the deleted IDs."""
+        if not doc_ids:
+            return []
+        stmt = (
+            delete(Document)
+            .where(
+                Document.table_id == self.table.id,
+                Document.id == any_(bindparam("doc_ids", doc_ids, type_=ARRAY(String))),
+            )
+            .returning(Document.id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def delete(self, doc_id: str) -> bool:
         """Delete a document."""
         doc = await self.get(doc_id)
@@ -435,52 +686,81 @@ class DocumentRepository:
         used by the REST handlers to push a compiled policy read-filter
         down into the SQL query.
         """
-        base_query = select(Document).where(Document.table_id == self.table.id)
+        documents, total, _ = await self.query_page(query_params, extra_where=extra_where)
+        return documents, total
+
+    async def query_page(
+        self,
+        query_params: DocumentQuery,
+        *,
+        extra_where: ColumnElement | None = None,
+    ) -> tuple[list[Document], int, str | None]:
+        """``query`` plus the cursor for the page after this one.
+
+        With ``query_params.cursor`` set, the page starts after the cursor's
+        row via a keyset predicate on the sort key (no OFFSET, no COUNT),
+        so walking a large table costs the same per page. The returned
+        cursor is None when the page came back short.
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for a
+                different where/order_by/order_dir.
+        """
+        base_query = self._select_table_documents()
 
         # Apply where filters using JSON-native operators
         if query_params.where:
-            base_query = _build_document_filters(base_query, query_params.where)
+            base_query = _build_document_filters(
+                base_query, query_params.where, self._field_kinds()
+            )
 
         if extra_where is not None:
             base_query = base_query.where(extra_where)
 
-        # Get total count before pagination (skip if caller doesn't need it)
-        if not query_params.skip_count:
+        if query_params.cursor:
+            position = _decode_cursor(query_params.cursor, query_params)
+            base_query = base_query.where(
+                _keyset_after(query_params.order_by, query_params.order_dir, position)
+            )
+
+        # Get total count before pagination (skip if caller doesn't need it;
+        # cursor pages never count — that's the point of using one)
+        if not query_params.skip_count and not query_params.cursor:
             count_query = base_query.with_only_columns(func.count()).order_by(None)
             count_result = await self.session.execute(count_query)
             total = count_result.scalar() or 0
         else:
             total = -1
 
-        # Apply ordering. Always append `Document.id` as a secondary sort key
-        # so OFFSET/LIMIT pagination is stable when the primary key has ties
-        # (e.g. rows inserted in the same transaction share `created_at`).
-        # Without a tiebreaker, Postgres returns tied rows in arbitrary order
-        # and the same id can appear on adjacent pages — or be skipped entirely.
+        base_query = _apply_document_order(
+            base_query, query_params.order_by, query_params.order_dir
+        )
         if query_params.order_by:
-            # Order by JSONB field
-            order_expr = Document.data[query_params.order_by].astext
-            if query_params.order_dir == "desc":
-                order_expr = order_expr.desc()
-            base_query = base_query.order_by(order_expr, Document.id)
-        else:
-            # Default ordering by created_at
-            if query_params.order_dir == "desc":
-                base_query = base_query.order_by(
-                    Document.created_at.desc(), Document.id
-                )
-            else:
-                base_query = base_query.order_by(
-                    Document.created_at.asc(), Document.id
-                )
+            # Read the sort key back as Postgres renders it so the cursor
+            # compares exactly (JSON numbers keep their stored scale, etc.)
+            base_query = base_query.add_columns(
+                _order_expr(query_params.order_by).label("sort_key")
+            )
 
         # Apply pagination
-        base_query = base_query.offset(query_params.offset).limit(query_params.limit)
+        if not query_params.cursor:
+            base_query = base_query.offset(query_params.offset)
+        base_query = base_query.limit(query_params.limit)
 
         result = await self.session.execute(base_query)
-        documents = list(result.scalars().all())
+        if query_params.order_by:
+            rows = result.all()
+            documents = [row[0] for row in rows]
+            last_sort_key = rows[-1][1] if rows else None
+        else:
+            documents = list(result.scalars().all())
+            last_sort_key = None
 
-        return documents, total
+        next_cursor = None
+        if documents and len(documents) == query_params.limit:
+            next_cursor = _encode_cursor(query_params, documents[-1], last_sort_key)
+
+        return documents, total, next_cursor
 
     async def count(
         self,
@@ -492,10 +772,10 @@ class DocumentRepository:
 
         ``extra_where`` is ANDed in alongside the user-provided filters.
         """
-        base_query = select(Document).where(Document.table_id == self.table.id)
+        base_query = self._select_table_documents()
 
         if where:
-            base_query = _build_document_filters(base_query, where)
+            base_query = _build_document_filters(base_query, where, self._field_kinds())
 
         if extra_where is not None:
             base_query = base_query.where(extra_where)
@@ -899,6 +1179,10 @@ async def delete_table(
     user: CurrentSuperuser,
 ) -> None:
     """Delete a table and all its documents by ID (platform admin only)."""
+    indexes = (
+        await ctx.db.execute(select(Table.indexes).where(Table.id == table_id))
+    ).scalar_one_or_none()
+
     repo = TableRepository(ctx.db, ctx.org_id, is_superuser=True)
     success = await repo.delete_table(table_id)
 
@@ -908,6 +1192,127 @@ async def delete_table(
             detail=f"Table '{table_id}' not found",
         )
 
+    if declared_indexes(indexes):
+        # DROP INDEX CONCURRENTLY waits on our own row locks — commit first.
+        await ctx.db.commit()
+        await drop_table_indexes(table_id, indexes)
+
+
+# =============================================================================
+# Index Endpoints
+# =============================================================================
+
+
+async def _get_table_by_id_or_404(db: AsyncSession, table_id: UUID) -> Table:
+    table = (
+        await db.execute(select(Table).where(Table.id == table_id))
+    ).scalar_one_or_none()
+    if table is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Table '{table_id}' not found",
+        )
+    return table
+
+
+def _index_public(table_id: UUID, entry: dict[str, str]) -> TableIndexPublic:
+    return TableIndexPublic(
+        field=entry["field"],
+        kind=entry["kind"],  # type: ignore[arg-type]
+        name=index_name(table_id, entry["field"], entry["kind"]),  # type: ignore[arg-type]
+    )
+
+
+@router.get(
+    "/{table_id}/indexes",
+    response_model=TableIndexListResponse,
+    summary="List document field indexes",
+)
+async def list_table_indexes(
+    table_id: UUID,
+    ctx: Context,
+    user: CurrentSuperuser,
+) -> TableIndexListResponse:
+    """List the expression indexes declared on a table's document fields."""
+    table = await _get_table_by_id_or_404(ctx.db, table_id)
+    return TableIndexListResponse(
+        indexes=[_index_public(table.id, e) for e in declared_indexes(table.indexes)],
+    )
+
+
+@router.post(
+    "/{table_id}/indexes",
+    response_model=TableIndexPublic,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a document field index",
+)
+async def create_table_index_endpoint(
+    table_id: UUID,
+    data: TableIndexCreate,
+    ctx: Context,
+    user: CurrentSuperuser,
+) -> TableIndexPublic:
+    """Build an expression index on a document field (platform admin only).
+
+    Range filters (``gt``/``gte``/``lt``/``lte``) on the field are then
+    compared as the index's kind and can be answered with an index scan.
+    The index is built with ``CREATE INDEX CONCURRENTLY``, so the request
+    blocks until the build finishes but writes to the table are not.
+    """
+    table = await _get_table_by_id_or_404(ctx.db, table_id)
+    existing = declared_indexes(table.indexes)
+    if any(e["field"] == data.field for e in existing):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Field '{data.field}' is already indexed",
+        )
+
+    kind: FieldKind = data.kind or schema_field_kinds(table.schema).get(data.field, "text")
+    entry = {"field": data.field, "kind": kind}
+
+    # The concurrent build runs on its own connection and waits for
+    # transactions touching documents — don't hold one open meanwhile.
+    await ctx.db.commit()
+    try:
+        await create_table_index(table.id, data.field, kind)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build index on '{data.field}': {e}",
+        )
+
+    table = await _get_table_by_id_or_404(ctx.db, table_id)
+    table.indexes = [*declared_indexes(table.indexes), entry]
+    await ctx.db.commit()
+    return _index_public(table.id, entry)
+
+
+@router.delete(
+    "/{table_id}/indexes/{field}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Drop a document field index",
+)
+async def delete_table_index(
+    table_id: UUID,
+    field: str,
+    ctx: Context,
+    user: CurrentSuperuser,
+) -> None:
+    """Drop the expression index on a document field (platform admin only)."""
+    table = await _get_table_by_id_or_404(ctx.db, table_id)
+    existing = declared_indexes(table.indexes)
+    removed = [e for e in existing if e["field"] == field]
+    if not removed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Field '{field}' is not indexed",
+        )
+
+    # Stop routing filters at the index before it goes away
+    table.indexes = [e for e in existing if e["field"] != field]
+    await ctx.db.commit()
+    await drop_table_indexes(table.id, removed)
+
 
 # =============================================================================
 # Document Endpoints
@@ -1210,13 +1615,93 @@ async def query_documents(
         )
 
     repo = DocumentRepository(ctx.db, table)
-    documents, total = await repo.query(query_params, extra_where=read_filter)
+    try:
+        documents, total, next_cursor = await repo.query_page(
+            query_params, extra_where=read_filter
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
     return DocumentListResponse(
         table_id=table.id,
         documents=[DocumentPublic.model_validate(d) for d in documents],
         total=total,
         limit=query_params.limit,
         offset=query_params.offset,
+        next_cursor=next_cursor,
+    )
+
+
+@router.post(
+    "/{table_id}/documents/export",
+    summary="Export documents as NDJSON",
+    response_class=StreamingResponse,
+)
+async def export_documents(
+    table_id: str,
+    ctx: Context,
+    body: DocumentExportQuery | None = None,
+    scope: str | None = Query(
+        None,
+        description="Target organization scope: 'global' or org UUID. Defaults to caller's home org. Provider admins only for non-self orgs.",
+    ),
+) -> StreamingResponse:
+    """Stream every matching document as newline-delimited JSON.
+
+    Rows come from a server-side cursor (``EXPORT_FETCH_SIZE`` at a time)
+    on a session owned by the response stream, so memory stays flat
+    regardless of table size. Applies the same policy read-filter as
+    ``/documents/query``; an unreadable table streams nothing.
+    """
+    body = body or DocumentExportQuery()
+    table = await get_table_or_404(ctx, table_id, scope=scope)
+
+    policies = _load_policies(table)
+    await preresolve_for_policies(
+        ctx.user,
+        policies,
+        ctx.db,
+        table.organization_id,
+    )
+    read_filter = compile_read_filter(policies, ctx.user)
+
+    repo = DocumentRepository(ctx.db, table)
+    export_query = repo._select_table_documents().with_only_columns(
+        Document.id,
+        Document.table_id,
+        Document.data,
+        Document.created_at,
+        Document.updated_at,
+        Document.created_by,
+        Document.updated_by,
+    )
+    if body.where:
+        export_query = _build_document_filters(export_query, body.where, repo._field_kinds())
+    if read_filter is not None:
+        export_query = export_query.where(read_filter)
+    export_query = _apply_document_order(export_query, body.order_by, body.order_dir)
+
+    async def generate():
+        if read_filter is None:
+            return
+        # The request's session is closed before the body streams — use
+        # a session that lives as long as the stream.
+        async with get_db_context() as db:
+            rows = await db.stream(
+                export_query.execution_options(yield_per=EXPORT_FETCH_SIZE)
+            )
+            async for row in rows:
+                yield DocumentPublic.model_validate(row).model_dump_json() + "\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="{table.name}.ndjson"',
+            "X-Accel-Buffering": "no",
+        },
     )
 
 
@@ -1241,6 +1726,13 @@ async def batch_documents(
 
     All-or-nothing on policy denials: any denied row aborts the whole batch
     with a 403 listing every denied index.
+
+    Set-based: one ``id = ANY(...)`` lookup for existing rows, one multi-row
+    ``INSERT ... ON CONFLICT DO UPDATE RETURNING`` per ``BATCH_WRITE_CHUNK``
+    rows, and a single coalesced ``document_changes`` notification after
+    commit. Rows that conflict with an existing document without having
+    been policy-checked as updates (plain inserts, or rows created
+    concurrently) are reported in ``errors`` rather than overwritten.
     """
     table = await get_table_or_404(ctx, table_id, scope=scope)
     repo = DocumentRepository(ctx.db, table)
@@ -1260,28 +1752,35 @@ async def batch_documents(
         for item in body.documents
     ]
 
+    # One query for every row that might already exist (upsert only —
+    # plain inserts never update).
+    pre_existing: dict[str, Document] = {}
+    if body.upsert:
+        pre_existing = await repo.get_many(
+            list({item.id for item in body.documents if item.id})
+        )
+
     # Pre-flight: check every row up front. Collect ALL denials so the
-    # client sees the full denied set in one response.
+    # client sees the full denied set in one response. The caller's side of
+    # the policies is resolved once; each row only pays for its own fields.
+    compiled = compiled_policies(str(table.id), policies)
+    can_update = compiled.bind("update", ctx.user)
+    can_create = compiled.bind("create", ctx.user)
     denied: list[int] = []
-    pre_existing: dict[int, Document] = {}
     for i, item in enumerate(body.documents):
         item_created_by, item_updated_by = attribution[i]
-        if body.upsert and item.id:
-            existing = await repo.get(item.id)
-            if existing is not None:
-                pre_existing[i] = existing
-                if not evaluate_action(
-                    "update", policies, _row_from_doc(existing), ctx.user
-                ):
-                    denied.append(i)
-                continue
+        existing = pre_existing.get(item.id) if item.id else None
+        if existing is not None:
+            if not can_update(_row_from_doc(existing)):
+                denied.append(i)
+            continue
         candidate_row: dict[str, Any] = {
             **item.data,
             "id": item.id,
             "created_by": item_created_by,
             "updated_by": item_updated_by,
         }
-        if not evaluate_action("create", policies, candidate_row, ctx.user):
+        if not can_create(candidate_row):
             denied.append(i)
 
     if denied:
@@ -1290,46 +1789,52 @@ async def batch_documents(
             detail={"denied_row_indices": denied},
         )
 
-    inserted = 0
     errors: list[dict[str, Any]] = []
-    written: list[Document] = []
-
+    rows: list[dict[str, Any]] = []
+    seen_ids: set[str] = set()
     for i, item in enumerate(body.documents):
+        doc_id = item.id or str(uuid4())
+        if doc_id in seen_ids:
+            errors.append({"id": item.id, "error": "Duplicate document id in batch"})
+            continue
+        seen_ids.add(doc_id)
         item_created_by, item_updated_by = attribution[i]
-        try:
-            if i in pre_existing:
-                old_row = _row_from_doc(pre_existing[i])
-                doc = await repo.update(item.id, item.data, updated_by=item_updated_by)
-                if doc is not None:
-                    await publish_document_change(
-                        table_id=str(table.id),
-                        action="update",
-                        old_row=old_row,
-                        new_row=_row_from_doc(doc),
-                    )
-                    written.append(doc)
-                inserted += 1
-                continue
-            doc = await repo.insert(
-                item.data,
-                created_by=item_created_by,
-                doc_id=item.id,
-                updated_by=item_updated_by,
-            )
-            await publish_document_change(
-                table_id=str(table.id),
-                action="insert",
-                old_row=None,
-                new_row=_row_from_doc(doc),
-            )
+        rows.append({
+            "id": doc_id,
+            "data": item.data,
+            "created_by": item_created_by,
+            "updated_by": item_updated_by,
+        })
+
+    # Snapshot pre-images now — the write refreshes these same instances.
+    old_rows = {doc_id: _row_from_doc(doc) for doc_id, doc in pre_existing.items()}
+
+    written_by_id = {
+        doc.id: doc
+        for doc in await repo.write_many(rows, update_ids=set(pre_existing))
+    }
+    written: list[Document] = []
+    for row in rows:
+        doc = written_by_id.get(row["id"])
+        if doc is None:
+            errors.append({"id": row["id"], "error": f"Document '{row['id']}' already exists"})
+        else:
             written.append(doc)
-            inserted += 1
-        except Exception as exc:
-            errors.append({"id": item.id, "error": str(exc)})
 
     await ctx.db.commit()
+    await publish_document_changes(
+        table_id=str(table.id),
+        changes=[
+            {
+                "action": "update" if doc.id in old_rows else "insert",
+                "old_row": old_rows.get(doc.id),
+                "new_row": _row_from_doc(doc),
+            }
+            for doc in written
+        ],
+    )
     return DocumentBatchCreateResponse(
-        inserted=inserted,
+        inserted=len(written),
         errors=errors,
         documents=[DocumentPublic.model_validate(d) for d in written],
     )
@@ -1364,19 +1869,17 @@ async def batch_delete_documents(
         table.organization_id,
     )
 
-    # Pre-flight: load each existing row and check `delete` against policy.
+    # Pre-flight: load the existing rows and check `delete` against policy.
+    existing_by_id = await repo.get_many(list(set(body.ids)))
+    can_delete = compiled_policies(str(table.id), policies).bind("delete", ctx.user)
     denied: list[int] = []
-    existing_by_index: dict[int, Document] = {}
     for i, doc_id in enumerate(body.ids):
-        existing = await repo.get(doc_id)
+        existing = existing_by_id.get(doc_id)
         if existing is None:
             # Skipping non-existent rows is the documented behavior; not a
             # denial, just a no-op.
             continue
-        existing_by_index[i] = existing
-        if not evaluate_action(
-            "delete", policies, _row_from_doc(existing), ctx.user
-        ):
+        if not can_delete(_row_from_doc(existing)):
             denied.append(i)
 
     if denied:
@@ -1385,23 +1888,20 @@ async def batch_delete_documents(
             detail={"denied_row_indices": denied},
         )
 
-    deleted = 0
-    deleted_ids: list[str] = []
-    for i, doc_id in enumerate(body.ids):
-        existing = existing_by_index.get(i)
-        if existing is None:
-            continue
-        old_row = _row_from_doc(existing)
-        ok = await repo.delete(doc_id)
-        if ok:
-            await publish_document_change(
-                table_id=str(table.id),
-                action="delete",
-                old_row=old_row,
-                new_row=None,
-            )
-            deleted += 1
-            deleted_ids.append(doc_id)
+    removed = set(await repo.delete_many(list(existing_by_id)))
+    deleted_ids = [doc_id for doc_id in dict.fromkeys(body.ids) if doc_id in removed]
+    deleted = len(deleted_ids)
 
     await ctx.db.commit()
+    await publish_document_changes(
+        table_id=str(table.id),
+        changes=[
+            {
+                "action": "delete",
+                "old_row": _row_from_doc(existing_by_id[doc_id]),
+                "new_row": None,
+            }
+            for doc_id in deleted_ids
+        ],
+    )
     return DocumentBatchDeleteResponse(deleted=deleted, deleted_ids=deleted_ids)
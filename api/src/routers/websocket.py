@@ -6,9 +6,10 @@ Replaces Azure Web PubSub with native FastAPI WebSockets.
 """
 
 import asyncio
+import json
 import logging
 from dataclasses import dataclass
-from typing import Annotated, Any
+from typing import Annotated, Any, Hashable
 from uuid import UUID
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
@@ -16,8 +17,13 @@ from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+from shared.policies.predicate import RowPredicate, compiled_policies
 from shared.policies.probe import is_subscribe_authorized
-from shared.policies.subscription import decide_visibility_change
+from shared.policies.subscription import (
+    compile_filter,
+    decide_compiled_visibility_change,
+    visibility_class,
+)
 from shared.role_cache import get_user_roles
 from src.core.auth import get_current_user_ws
 from src.core.principal import UserPrincipal
@@ -114,9 +120,9 @@ async def _resolve_table_id(name_or_id: str, user: UserPrincipal) -> str | None:
 
 # In-process policy cache for the document_change fanout hot path.
 #
-# Each `document_change` event reaches every WS subscriber's local handler,
-# which previously did a fresh DB load + Pydantic validate per event per
-# subscriber. For high-fanout tables (many subscribers + frequent updates)
+# Each `document_change` event reaches the table fanout on every process
+# with a subscriber, which previously did a fresh DB load + Pydantic
+# validate per event per subscriber. For high-fanout tables (many subscribers + frequent updates)
 # that's O(subs × updates) DB queries. The cache collapses it to one load
 # per (table, generation) pair.
 #
@@ -134,6 +140,7 @@ _table_policy_cache: dict[str, TablePolicies | None] = {}
 _POLICY_CACHE_MAX = 256
 
 
+
 def _invalidate_table_policy_cache(table_id: str) -> None:
     """Drop the cached policies for a table; next read reloads from DB."""
     _table_policy_cache.pop(table_id, None)
@@ -203,38 +210,35 @@ async def _populate_user_roles(user: UserPrincipal) -> None:
         user.role_names = role_names
 
 
-def _make_table_dispatcher(websocket: WebSocket, user: UserPrincipal) -> Any:
-    """Return an async dispatcher that filters table-channel messages for this WS.
-
-    Attached to the WebSocket as `_table_dispatcher` and invoked by the pubsub
-    manager's `_send_local` for every `table:` message destined for this
-    connection. The dispatcher consults the per-connection
-    `table_subscriptions` state to decide what (if anything) to forward.
-    """
-
-    async def dispatcher(channel_name: str, payload: dict[str, Any]) -> None:
-        await _handle_table_message(websocket, user, channel_name, payload)
-
-    return dispatcher
-
-
-async def _handle_table_message(
-    websocket: WebSocket,
-    user: UserPrincipal,
+async def _fan_out_table_message(
     channel_name: str,
     payload: dict[str, Any],
-) -> None:
-    """Apply the four-way visibility decision and emit the right action.
+    sockets: list[WebSocket],
+) -> set[WebSocket]:
+    """Apply the four-way visibility decision for every socket on a table channel.
 
-    `policy_changed` triggers a re-evaluation; if the user no longer satisfies
+    Installed as the pubsub manager's `table_fanout`. Only sockets with a
+    registered `table_subscriptions` entry for the table receive anything.
+    Row changes are decided once per visibility class — subscribers whose
+    policy-relevant user fields and filter agree — rather than once per
+    socket, and each class's message is serialized once.
+
+    `policy_changed` triggers a re-evaluation; if a user no longer satisfies
     `is_subscribe_authorized`, a `subscription_revoked` notice is sent and the
     subscription state is cleared.
+
+    Returns the sockets whose send failed.
     """
     table_id = channel_name.split(":", 1)[1]
-    table_subs: dict[str, dict[str, Any]] = getattr(websocket.state, "table_subscriptions", {})
-    sub = table_subs.get(table_id)
-    if sub is None:
-        return  # no longer subscribed
+    subscribers: list[tuple[WebSocket, dict[str, Any]]] = []
+    for websocket in sockets:
+        table_subs: dict[str, dict[str, Any]] = getattr(websocket.state, "table_subscriptions", {})
+        sub = table_subs.get(table_id)
+        if sub is not None:
+            subscribers.append((websocket, sub))
+    failed: set[WebSocket] = set()
+    if not subscribers:
+        return failed
 
     msg_type = payload.get("type")
 
@@ -243,41 +247,94 @@ async def _handle_table_message(
         # re-evaluation (and every subsequent document_change for this
         # table on this process) sees the fresh policies.
         _invalidate_table_policy_cache(table_id)
-        await _re_evaluate_subscription(websocket, user, table_id)
-        return
-
-    if msg_type != "document_change":
-        return
+        for websocket, sub in subscribers:
+            try:
+                await _re_evaluate_subscription(websocket, sub["user"], table_id)
+            except Exception:
+                failed.add(websocket)
+        return failed
+
+    if msg_type == "document_change":
+        changes = [payload]
+    elif msg_type == "document_changes":
+        # Coalesced batch write — same per-row decision for each entry
+        changes = payload.get("changes") or []
+    else:
+        return failed
 
     policies = await _load_policies_for_table(table_id)
     if policies is None:
-        return
+        return failed
+    compiled = compiled_policies(table_id, policies)
+
+    # class key -> (read check, filter check, members), bound to the class's
+    # first subscriber
+    classes: dict[Hashable, tuple[RowPredicate, RowPredicate | None, list[WebSocket]]] = {}
+    for websocket, sub in subscribers:
+        # A connection's user and filter are fixed, so its class only
+        # changes when the policies are recompiled
+        cached = sub.get("visibility_class")
+        if cached is not None and cached[0] is compiled:
+            key = cached[1]
+        else:
+            key = visibility_class(compiled, sub["user"], sub["filter"])
+            sub["visibility_class"] = (compiled, key)
+        if key in classes:
+            classes[key][2].append(websocket)
+            continue
+        user, user_filter = sub["user"], sub["filter"]
+        classes[key] = (
+            compiled.bind("read", user),
+            user_filter.matches.bind(user) if user_filter is not None else None,
+            [websocket],
+        )
+
+    for change in changes:
+        for can_read, matches, members in classes.values():
+            message = _document_change_message(table_id, can_read, matches, change)
+            if message is None:
+                continue
+            text = json.dumps(message)
+            for websocket in members:
+                if websocket in failed:
+                    continue
+                try:
+                    await websocket.send_text(text)
+                except Exception:
+                    failed.add(websocket)
+    return failed
+
 
-    decision = decide_visibility_change(
-        old_row=payload.get("old_row"),
-        new_row=payload.get("new_row"),
-        policies=policies,
-        user=user,
-        user_filter=sub.get("filter"),
+def _document_change_message(
+    table_id: str,
+    can_read: RowPredicate,
+    matches: RowPredicate | None,
+    change: dict[str, Any],
+) -> dict[str, Any] | None:
+    """The message one row change produces for a visibility class, if any."""
+    decision = decide_compiled_visibility_change(
+        old_row=change.get("old_row"),
+        new_row=change.get("new_row"),
+        can_read=can_read,
+        matches=matches,
     )
     if decision is None:
-        return
+        return None
 
     action, body = decision
     if action == "delete":
-        await websocket.send_json({
+        return {
             "type": "document_change",
             "action": "delete",
             "table_id": table_id,
             "row_id": body,
-        })
-    else:
-        await websocket.send_json({
-            "type": "document_change",
-            "action": action,
-            "table_id": table_id,
-            "row": body,
-        })
+        }
+    return {
+        "type": "document_change",
+        "action": action,
+        "table_id": table_id,
+        "row": body,
+    }
 
 
 async def _re_evaluate_subscription(
@@ -296,8 +353,8 @@ async def _re_evaluate_subscription(
         table_subs.pop(table_id, None)
         # The pubsub manager unsubscribes on disconnect; for a partial revoke,
         # we just stop processing future messages on this table by clearing
-        # the per-connection subscription state. The dispatcher early-exits
-        # for unknown table_ids.
+        # the per-connection subscription state. The fanout skips sockets
+        # without an entry for the table.
 
 
 async def _authorize_table_subscribe(
@@ -349,11 +406,15 @@ async def _authorize_table_subscribe(
 
     canonical_channel = f"table:{canonical_id}"
     table_subs: dict[str, dict[str, Any]] = getattr(websocket.state, "table_subscriptions", None) or {}
-    table_subs[canonical_id] = {"filter": spec.filter, "channel_name": canonical_channel}
+    table_subs[canonical_id] = {
+        "filter": compile_filter(spec.filter) if spec.filter is not None else None,
+        "channel_name": canonical_channel,
+        "user": user,
+    }
     websocket.state.table_subscriptions = table_subs
 
-    if not hasattr(websocket, "_table_dispatcher"):
-        websocket._table_dispatcher = _make_table_dispatcher(websocket, user)  # type: ignore[attr-defined]
+    if manager.table_fanout is None:
+        manager.table_fanout = _fan_out_table_message
     return canonical_channel
 
 
@@ -507,7 +568,8 @@ async def websocket_connect(
 
     Messages are JSON with structure:
         {
-            "type": "execution_update" | "execution_log" | "notification" | "system_event",
+            "type": "execution_update" | "execution_log" | "execution_log_batch"
+                    | "notification" | "system_event",
             ...payload
         }
     """
@@ -677,26 +739,20 @@ async def websocket_connect(
                                 "message": "Access denied"
                             })
                             continue
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
                         })
                     elif channel.startswith("cli-session:"):
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
                         })
                     elif channel.startswith("event-source:"):
                         # Event source channels for real-time event updates
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
@@ -706,9 +762,7 @@ async def websocket_connect(
                         # history:user:{user_id} - Allow only for the user's own channel
                         # history:GLOBAL - Allow only for platform admins
                         if channel == f"history:user:{user.user_id}" or (channel == "history:GLOBAL" and user.is_superuser):
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -723,9 +777,7 @@ async def websocket_connect(
                         # App Builder channels - validate user has access to the app
                         app_id = channel.split(":", 2)[2]
                         if await can_access_app(user, app_id):
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -739,9 +791,7 @@ async def websocket_connect(
                     elif channel == "package:install":
                         # Package installation channel - shared, superusers only
                         if user.is_superuser:
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -755,18 +805,14 @@ async def websocket_connect(
                     elif channel.startswith("git:"):
                         # Git sync job channels - ephemeral, job-specific UUIDs
                         # Any authenticated user can subscribe (job ID is a secret token)
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
                         })
                     elif channel.startswith("agent-run:") or channel == "agent-runs":
                         # Agent run channels - any authenticated user can subscribe
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
@@ -778,9 +824,7 @@ async def websocket_connect(
                         # silently no-op and no broadcast ever reaches the client
                         # (that's why cancel didn't dismiss and counters didn't tick).
                         if user.is_superuser:
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -794,9 +838,7 @@ async def websocket_connect(
                     elif channel == "platform_workers":
                         # Platform workers channel - diagnostics, platform admins only
                         if user.is_superuser:
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -818,9 +860,7 @@ async def websocket_connect(
                         )
                         if canonical_channel is None:
                             continue
-                        if canonical_channel not in manager.connections:
-                            manager.connections[canonical_channel] = set()
-                        manager.connections[canonical_channel].add(websocket)
+                        await manager.subscribe(websocket, canonical_channel)
                         # Echo the canonical channel back so client + server
                         # agree on a single name for subsequent unsubscribe
                         # / revocation messages.
@@ -842,8 +882,7 @@ async def websocket_connect(
                             if canonical_id is not None
                             else channel
                         )
-                        if canonical_channel in manager.connections:
-                            manager.connections[canonical_channel].discard(websocket)
+                        manager.unsubscribe(websocket, canonical_channel)
                         if canonical_id is not None:
                             table_subs = getattr(websocket.state, "table_subscriptions", None)
                             if table_subs is not None:
@@ -853,7 +892,7 @@ async def websocket_connect(
                             "channel": canonical_channel,
                         })
                     elif channel in manager.connections:
-                        manager.connections[channel].discard(websocket)
+                        manager.unsubscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "unsubscribed",
                             "channel": channel
@@ -67,7 +67,6 @@ from src.core.auth import Context, CurrentActiveUser, CurrentSuperuser
 from src.core.db_deps import DbSession
 from src.core.log_safety import log_safe
 from src.core.pubsub import publish_execution_update, publish_history_update
-from src.core.cache import get_cached_data_provider
 
 logger = logging.getLogger(__name__)
 
@@ -716,6 +715,7 @@ async def execute_workflow(
     """
     from uuid import uuid4
     from src.sdk.context import ExecutionContext as SharedContext, Organization
+    from src.services.execution.data_provider_edge import execute_data_provider
     from src.services.execution.service import (
         run_workflow,
         run_code,
@@ -891,46 +891,47 @@ async def execute_workflow(
                 transient=request.transient,
             )
         elif workflow and workflow.type == "data_provider":
-            # Only short-circuit on the sync/transient hot path. A non-transient
-            # request (e.g. manual "Execute" from the workflows page) expects a
-            # tracked execution row to navigate to — returning a synthetic
-            # execution_id would 404 the history detail page.
-            if request.transient and workflow.cache_ttl_seconds > 0:
-                cached_result = await get_cached_data_provider(
-                    str(execution_org_id) if execution_org_id else None,
-                    workflow.name,
-                    request.input_data,
-                )
-                if cached_result:
-                    return WorkflowExecutionResponse(
-                        execution_id=shared_ctx.execution_id,
-                        workflow_id=str(workflow.id),
-                        workflow_name=workflow.name,
-                        status=ExecutionStatus.SUCCESS,
-                        result=cached_result.get("data"),
-                        duration_ms=0,
-                        is_transient=True,
-                    )
-
             # Data providers always run sync (small payloads, no UI poll flow),
             # but honor the caller's transient flag: dropdown-options pass
             # transient=True for the fast path, the manual Execute page passes
             # transient=False and expects a tracked execution row.
-            result = await run_workflow(
-                context=shared_ctx,
-                workflow_id=str(workflow.id),
-                input_data=request.input_data,
-                transient=request.transient,
-                sync=True,
-            )
-            return WorkflowExecutionResponse(
-                execution_id=result.execution_id,
-                workflow_id=str(workflow.id),
-                workflow_name=workflow.name,
-                status=result.status,
-                result=result.result,
-                is_transient=request.transient,
-            )
+            # run_provider may outlive the request (background cache
+            # refresh), so it only closes over plain values, not the ORM row.
+            provider_id = str(workflow.id)
+            provider_name = workflow.name
+
+            async def run_provider() -> WorkflowExecutionResponse:
+                result = await run_workflow(
+                    context=shared_ctx,
+                    workflow_id=provider_id,
+                    input_data=request.input_data,
+                    transient=request.transient,
+                    sync=True,
+                )
+                return WorkflowExecutionResponse(
+                    execution_id=result.execution_id,
+                    workflow_id=provider_id,
+                    workflow_name=provider_name,
+                    status=result.status,
+                    result=result.result,
+                    is_transient=request.transient,
+                )
+
+            # Only serve from cache on the sync/transient hot path. A
+            # non-transient request (e.g. manual "Execute" from the workflows
+            # page) expects a tracked execution row to navigate to — returning
+            # a synthetic execution_id would 404 the history detail page.
+            if request.transient and workflow.cache_ttl_seconds > 0:
+                return await execute_data_provider(
+                    org_id=str(execution_org_id) if execution_org_id else None,
+                    workflow_id=provider_id,
+                    workflow_name=provider_name,
+                    parameters=request.input_data,
+                    execution_id=shared_ctx.execution_id,
+                    run=run_provider,
+                )
+
+            return await run_provider()
         elif workflow:
             # Execute workflow by ID
             result = await run_workflow(
@@ -79,6 +79,10 @@ class Scheduler:
         await init_db()
         logger.info("Database connection established")
 
+        # Token refreshes here must invalidate API-side integration caches
+        from src.core.cache.integration_cache import register_integration_cache_hooks
+        register_integration_cache_hooks()
+
         # Start APScheduler
         logger.info("Starting APScheduler...")
         await self._start_scheduler()
@@ -190,6 +194,24 @@ class Scheduler:
         except ImportError:
             logger.warning("Knowledge storage refresh job not available")
 
+        # Knowledge vector index sync - hourly (run immediately at startup)
+        try:
+            from src.jobs.schedulers.knowledge_vector_index import (
+                sync_knowledge_vector_indexes,
+            )
+            scheduler.add_job(
+                sync_knowledge_vector_indexes,
+                IntervalTrigger(hours=1),
+                id="knowledge_vector_index_sync",
+                name="Sync knowledge store HNSW indexes",
+                replace_existing=True,
+                next_run_time=datetime.now(timezone.utc),  # Run immediately at startup
+                **misfire_options,
+            )
+            logger.info("Knowledge vector index sync job scheduled (every hour)")
+        except ImportError:
+            logger.warning("Knowledge vector index sync job not available")
+
         # Webhook subscription renewal - every 6 hours
         try:
             from src.jobs.schedulers.webhook_renewal import renew_expiring_webhooks
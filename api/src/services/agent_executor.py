@@ -16,7 +16,7 @@ import json
 import logging
 import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID, uuid4
@@ -45,9 +45,17 @@ from src.services.llm import (
 )
 from src.services.execution.agent_helpers import (
     find_delegated_agent,
+    iter_tool_calls,
+    max_parallel_tool_calls,
     parse_mcp_tool_name,
     resolve_agent_tools,
 )
+from src.services.conversation_history import (
+    ConversationHistory,
+    estimate_message_tokens,
+    load_conversation_history,
+    save_conversation_history,
+)
 from src.services.execution.autonomous_agent_executor import AutonomousAgentExecutor
 from src.services.mcp_client import dispatch as mcp_dispatch
 from src.services.mcp_client.errors import (
@@ -296,9 +304,10 @@ class AgentExecutor:
             # 4b. Delegation tools are now included by resolve_agent_tools
 
             # 5. Build message history and fix any corrupted ordering
-            messages = await self._build_message_history(agent, conversation)
+            messages, history = await self._build_message_history(agent, conversation)
             messages = self._fix_interleaved_messages(messages)
             messages = self._fix_dangling_tool_calls(messages)
+            history_fixed = len(messages) != len(history.messages) + 1
 
             # 5b. Enhance system prompt with tool-use instructions if tools available
             if tool_definitions and messages and messages[0].role == "system":
@@ -317,8 +326,12 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
             async with self._db() as session:
                 llm_client = await get_llm_client(session)
 
-            # 5a. Check context size and prune if needed
-            estimated_tokens = self._estimate_tokens(messages)
+            # 5a. Check context size and prune if needed (the history keeps a
+            # running estimate; only re-count if the fixes above added messages)
+            if history_fixed:
+                estimated_tokens = self._estimate_tokens(messages)
+            else:
+                estimated_tokens = self._estimate_tokens(messages[:1]) + history.tokens
 
             if estimated_tokens > CONTEXT_WARNING_TOKENS:
                 if estimated_tokens > CONTEXT_MAX_TOKENS:
@@ -326,6 +339,10 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
                     messages, original_tokens = await self._prune_context(
                         messages, llm_client
                     )
+                    # Keep the pruned context so later turns append to it
+                    # instead of pruning the whole conversation again
+                    history.replace_messages(messages[1:])
+                    await save_conversation_history(conversation.id, history)
                     new_tokens = self._estimate_tokens(messages)
                     yield ChatStreamChunk(
                         type="context_warning",
@@ -464,7 +481,10 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
                     )
                 )
 
-                # Execute tools and add results to history
+                # Record every tool call as running before dispatching any,
+                # so the timeline shows the whole batch in request order
+                # tool_call_id -> (execution_id, TOOL_CALL message)
+                pending_calls: dict[str, tuple[str, Message]] = {}
                 for tc in collected_tool_calls:
                     tool_call = ToolCall(
                         id=tc.id,
@@ -486,6 +506,7 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
                         tool_call_id=tc.id,
                         execution_id=execution_id,
                     )
+                    pending_calls[tc.id] = (execution_id, tool_call_msg)
 
                     # Emit tool_call event with message ID
                     if stream:
@@ -507,50 +528,73 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
                             ),
                         )
 
-                    # Execute the tool with pre-generated execution_id
-                    tool_result = await self._execute_tool(
+                # Execute the tools concurrently (with pre-generated execution_ids);
+                # results come back in request order
+                async def run_tool(tc: ToolCallRequest) -> ToolResult:
+                    return await self._execute_tool(
                         tc,
                         agent,
                         conversation,
-                        execution_id=execution_id,
+                        execution_id=pending_calls[tc.id][0],
                         caller_user_id=caller_user_id,
                     )
 
-                    # Update TOOL_CALL message with result and state
-                    await self._update_tool_call_message(
-                        message_id=tool_call_msg.id,
-                        tool_state="completed" if not tool_result.error else "error",
-                        tool_result=tool_result.result if not tool_result.error else {"error": tool_result.error},
-                        duration_ms=tool_result.duration_ms,
-                    )
+                outcomes = iter_tool_calls(
+                    collected_tool_calls,
+                    run_tool,
+                    max_concurrency=max_parallel_tool_calls(agent),
+                )
+                async with aclosing(outcomes):
+                    async for tc, outcome, call_duration_ms in outcomes:
+                        execution_id, tool_call_msg = pending_calls[tc.id]
+                        if isinstance(outcome, ToolResult):
+                            tool_result = outcome
+                        else:
+                            # Timed out or failed outside _execute_tool's own handling
+                            logger.error(f"Tool execution error for {tc.name}: {outcome}")
+                            tool_result = ToolResult(
+                                tool_call_id=tc.id,
+                                tool_name=tc.name,
+                                result=None,
+                                error=str(outcome) or type(outcome).__name__,
+                                duration_ms=call_duration_ms,
+                            )
 
-                    if stream:
-                        yield ChatStreamChunk(
-                            type="tool_result",
-                            tool_result=tool_result,
-                            message_id=str(tool_call_msg.id),
+                        # Update TOOL_CALL message with result and state
+                        await self._update_tool_call_message(
+                            message_id=tool_call_msg.id,
+                            tool_state="completed" if not tool_result.error else "error",
+                            tool_result=tool_result.result if not tool_result.error else {"error": tool_result.error},
+                            duration_ms=tool_result.duration_ms,
                         )
 
-                    # Still save TOOL message for Anthropic API compatibility (history reconstruction)
-                    await self._save_message(
-                        conversation_id=conversation.id,
-                        role=MessageRole.TOOL,
-                        content=_serialize_for_json(tool_result.result) if tool_result.result else tool_result.error,
-                        tool_call_id=tc.id,
-                        tool_name=tc.name,
-                        execution_id=execution_id,
-                        duration_ms=tool_result.duration_ms,
-                    )
+                        if stream:
+                            yield ChatStreamChunk(
+                                type="tool_result",
+                                tool_result=tool_result,
+                                message_id=str(tool_call_msg.id),
+                            )
 
-                    # Add tool result to message history for LLM
-                    messages.append(
-                        LLMMessage(
-                            role="tool",
+                        # Still save TOOL message for Anthropic API compatibility (history reconstruction)
+                        await self._save_message(
+                            conversation_id=conversation.id,
+                            role=MessageRole.TOOL,
                             content=_serialize_for_json(tool_result.result) if tool_result.result else tool_result.error,
                             tool_call_id=tc.id,
                             tool_name=tc.name,
+                            execution_id=execution_id,
+                            duration_ms=tool_result.duration_ms,
+                        )
+
+                        # Add tool result to message history for LLM
+                        messages.append(
+                            LLMMessage(
+                                role="tool",
+                                content=_serialize_for_json(tool_result.result) if tool_result.result else tool_result.error,
+                                tool_call_id=tc.id,
+                                tool_name=tc.name,
+                            )
                         )
-                    )
 
                 # Continue loop to get LLM response with tool results
 
@@ -678,132 +722,29 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
 
     async def _build_message_history(
         self, agent: Agent | None, conversation: Conversation
-    ) -> list[LLMMessage]:
-        """Build the message history for LLM completion."""
-        messages: list[LLMMessage] = []
+    ) -> tuple[list[LLMMessage], ConversationHistory]:
+        """Build the message history for LLM completion.
 
+        Conversation messages come from the incremental history cache, which
+        only converts rows added since the previous turn. Returns the LLM
+        messages (system prompt first) and the history they came from.
+        """
         # Add system prompt (use agent's prompt or configurable default for agentless chat)
         if agent:
             from src.services.execution.agent_helpers import build_agent_system_prompt
             system_prompt = build_agent_system_prompt(agent, execution_context={"mode": "chat"})
         else:
             system_prompt = await self._get_default_system_prompt()
-        messages.append(
+
+        history = await load_conversation_history(self._session_factory, conversation.id)
+        messages = [
             LLMMessage(
                 role="system",
                 content=system_prompt,
-            )
-        )
-
-        # Get conversation messages in order
-        async with self._db() as session:
-            result = await session.execute(
-                select(Message)
-                .where(Message.conversation_id == conversation.id)
-                .order_by(Message.sequence)
-            )
-            db_messages = result.scalars().all()
-
-        # Track seen tool_call IDs to handle providers (e.g. Minimax) that
-        # reuse the same IDs across turns. When a collision is detected, remap
-        # to a unique ID and apply the same remap to the corresponding tool result.
-        seen_tc_ids: dict[str, int] = {}  # tc_id -> count of times seen
-        tc_id_remap: dict[tuple[int, str], str] = {}  # (sequence, original_id) -> new_id
-
-        for msg in db_messages:
-            if msg.role == MessageRole.USER:
-                messages.append(
-                    LLMMessage(
-                        role="user",
-                        content=msg.content,
-                    )
-                )
-            elif msg.role == MessageRole.ASSISTANT:
-                tool_calls = None
-                if msg.tool_calls:
-                    tool_calls = []
-                    for tc in msg.tool_calls:
-                        tc_id = tc["id"]
-                        if tc_id in seen_tc_ids:
-                            seen_tc_ids[tc_id] += 1
-                            new_id = f"{tc_id}_t{seen_tc_ids[tc_id]}"
-                            tc_id_remap[(msg.sequence, tc["id"])] = new_id
-                            tc_id = new_id
-                        else:
-                            seen_tc_ids[tc_id] = 1
-                        tool_calls.append(
-                            ToolCallRequest(
-                                id=tc_id,
-                                name=tc["name"],
-                                arguments=tc.get("arguments", {}),
-                            )
-                        )
-                messages.append(
-                    LLMMessage(
-                        role="assistant",
-                        content=msg.content,
-                        tool_calls=tool_calls,
-                    )
-                )
-            elif msg.role == MessageRole.TOOL_CALL:
-                # TOOL_CALL rows are stored separately from the assistant message.
-                # Attach them as tool_calls on the preceding assistant LLMMessage
-                # so the LLM sees the correct assistant→tool_use→tool_result sequence.
-                tc_id = msg.tool_call_id or ""
-                if tc_id in seen_tc_ids:
-                    seen_tc_ids[tc_id] += 1
-                    new_id = f"{tc_id}_t{seen_tc_ids[tc_id]}"
-                    tc_id_remap[(msg.sequence, msg.tool_call_id or "")] = new_id
-                    tc_id = new_id
-                else:
-                    seen_tc_ids[tc_id] = 1
-                tc_request = ToolCallRequest(
-                    id=tc_id,
-                    name=msg.tool_name or "",
-                    arguments=msg.tool_input if isinstance(msg.tool_input, dict) else {},
-                )
-                # Find the last assistant message (may have tool results between)
-                last_assistant_idx = None
-                for idx in range(len(messages) - 1, -1, -1):
-                    if messages[idx].role == "assistant":
-                        last_assistant_idx = idx
-                        break
-                if last_assistant_idx is not None:
-                    assistant_msg = messages[last_assistant_idx]
-                    if assistant_msg.tool_calls is None:
-                        assistant_msg.tool_calls = []
-                    assistant_msg.tool_calls.append(tc_request)
-                else:
-                    # No preceding assistant message — create a minimal one
-                    messages.append(
-                        LLMMessage(
-                            role="assistant",
-                            content=None,
-                            tool_calls=[tc_request],
-                        )
-                    )
-            elif msg.role == MessageRole.TOOL:
-                # Apply remapping if the preceding tool_call had its ID changed
-                tc_id = msg.tool_call_id
-                if tc_id:
-                    best_seq = -1
-                    for (seq, orig_id), new_id in tc_id_remap.items():
-                        if orig_id == tc_id and seq < msg.sequence and seq > best_seq:
-                            best_seq = seq
-                            tc_id = new_id
-                messages.append(
-                    LLMMessage(
-                        role="tool",
-                        content=msg.content,
-                        tool_call_id=tc_id,
-                        tool_name=msg.tool_name,
-                    )
-                )
-            elif msg.role == MessageRole.SYSTEM:
-                # Skip additional system messages (we already have the prompt)
-                pass
-
-        return messages
+            ),
+            *history.messages,
+        ]
+        return messages, history
 
     def _estimate_tokens(self, messages: list[LLMMessage]) -> int:
         """
@@ -813,18 +754,7 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
         reasonably accurate for English text and provides a conservative
         estimate for context management purposes.
         """
-        total = 0
-        for msg in messages:
-            if msg.content:
-                total += len(msg.content) // 4
-            if msg.tool_calls:
-                # Estimate tokens for tool call JSON
-                tool_json = json.dumps([
-                    {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
-                    for tc in msg.tool_calls
-                ])
-                total += len(tool_json) // 4
-        return total
+        return sum(estimate_message_tokens(msg) for msg in messages)
 
     def _find_turn_boundaries(self, messages: list[LLMMessage]) -> list[int]:
         """Find indices where new conversation turns start.
@@ -1509,6 +1439,7 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
         try:
             from src.repositories.knowledge import KnowledgeRepository
             from src.services.embeddings import get_embedding_client
+            from src.services.embeddings.query_cache import embed_query
 
             # Get search parameters
             query = tool_call.arguments.get("query", "")
@@ -1537,9 +1468,9 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
             # Generate query embedding
             async with self._db() as session:
                 embedding_client = await get_embedding_client(session)
-            query_embedding = await embedding_client.embed_single(query)
+            query_embedding = await embed_query(embedding_client, query)
 
-            # Search knowledge store
+            # Hybrid search: agents often look up exact identifiers
             async with self._db() as session:
                 repo = KnowledgeRepository(
                     session, org_id=agent.organization_id, is_superuser=True
@@ -1549,6 +1480,7 @@ IMPORTANT: When the user's request can be fulfilled using one of your tools, you
                     namespace=namespaces,
                     limit=limit,
                     fallback=True,  # Search org + global
+                    query_text=query,
                 )
 
             duration_ms = int((time.time() - start_time) * 1000)
@@ -0,0 +1,261 @@
+"""
+Incremental conversation history for chat agents.
+
+Converting a conversation's ``Message`` rows into ``LLMMessage``s used to
+happen from scratch on every user turn, which gets slower as long-running
+conversations accumulate hundreds of tool results. ``ConversationHistory``
+holds the converted messages together with the conversion state (last
+sequence seen, tool_call ID remaps, per-message token estimates) and is
+cached in Redis per conversation, so each turn only loads and converts
+the rows added since the previous turn.
+
+When the executor prunes the context (tool output compaction and/or
+summarization), it stores the pruned messages back into the history;
+later turns append to the pruned context instead of pruning the full
+conversation again.
+
+The cache is always rebuildable from Postgres: it is dropped when the
+rows it was built from no longer match (e.g. messages were deleted),
+and any Redis failure falls back to a full rebuild.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import load_only
+
+from src.core.cache import get_shared_redis
+from src.core.cache.keys import TTL_CONVERSATION_HISTORY, conversation_history_key
+from src.models.enums import MessageRole
+from src.models.orm import Message
+from src.services.llm import LLMMessage, ToolCallRequest
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached layout (or the row -> LLMMessage conversion) changes
+HISTORY_FORMAT_VERSION = 1
+
+
+def estimate_message_tokens(message: LLMMessage) -> int:
+    """Estimate tokens for one message (~4 characters per token)."""
+    total = 0
+    if message.content:
+        total += len(message.content) // 4
+    if message.tool_calls:
+        tool_json = json.dumps([
+            {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+            for tc in message.tool_calls
+        ])
+        total += len(tool_json) // 4
+    return total
+
+
+@dataclass
+class ConversationHistory:
+    """LLM-ready messages for a conversation (without the system prompt)."""
+
+    messages: list[LLMMessage] = field(default_factory=list)
+    token_counts: list[int] = field(default_factory=list)
+    # Highest Message.sequence converted so far, and how many rows that covered
+    last_sequence: int = 0
+    row_count: int = 0
+    # Index of the last assistant message, which TOOL_CALL rows attach to
+    last_assistant_idx: int | None = None
+    # Providers (e.g. Minimax) reuse tool_call IDs across turns; track what
+    # has been seen and the latest remap so tool results follow their call
+    seen_tc_ids: dict[str, int] = field(default_factory=dict)
+    tc_id_remap: dict[str, str] = field(default_factory=dict)
+    # True once messages hold a pruned/summarized context
+    pruned: bool = False
+
+    @property
+    def tokens(self) -> int:
+        """Running token estimate for the messages."""
+        return sum(self.token_counts)
+
+    def append_rows(self, rows: list[Message]) -> None:
+        """Convert new Message rows (in sequence order) and append them."""
+        for msg in rows:
+            self._append_row(msg)
+            self.last_sequence = max(self.last_sequence, msg.sequence)
+            self.row_count += 1
+
+    def replace_messages(self, messages: list[LLMMessage]) -> None:
+        """Replace the messages with a pruned/summarized context."""
+        self.messages = list(messages)
+        self.token_counts = [estimate_message_tokens(m) for m in self.messages]
+        self.last_assistant_idx = next(
+            (i for i in range(len(self.messages) - 1, -1, -1) if self.messages[i].role == "assistant"),
+            None,
+        )
+        self.pruned = True
+
+    def _append(self, message: LLMMessage) -> None:
+        self.messages.append(message)
+        self.token_counts.append(estimate_message_tokens(message))
+        if message.role == "assistant":
+            self.last_assistant_idx = len(self.messages) - 1
+
+    def _remap_tool_call_id(self, tc_id: str) -> str:
+        if tc_id in self.seen_tc_ids:
+            self.seen_tc_ids[tc_id] += 1
+            new_id = f"{tc_id}_t{self.seen_tc_ids[tc_id]}"
+            self.tc_id_remap[tc_id] = new_id
+            return new_id
+        self.seen_tc_ids[tc_id] = 1
+        return tc_id
+
+    def _append_row(self, msg: Message) -> None:
+        if msg.role == MessageRole.USER:
+            self._append(LLMMessage(role="user", content=msg.content))
+        elif msg.role == MessageRole.ASSISTANT:
+            tool_calls = None
+            if msg.tool_calls:
+                tool_calls = [
+                    ToolCallRequest(
+                        id=self._remap_tool_call_id(tc["id"]),
+                        name=tc["name"],
+                        arguments=tc.get("arguments", {}),
+                    )
+                    for tc in msg.tool_calls
+                ]
+            self._append(LLMMessage(role="assistant", content=msg.content, tool_calls=tool_calls))
+        elif msg.role == MessageRole.TOOL_CALL:
+            # TOOL_CALL rows are stored separately from the assistant message.
+            # Attach them as tool_calls on the preceding assistant LLMMessage
+            # so the LLM sees the correct assistant→tool_use→tool_result sequence.
+            tc_request = ToolCallRequest(
+                id=self._remap_tool_call_id(msg.tool_call_id or ""),
+                name=msg.tool_name or "",
+                arguments=msg.tool_input if isinstance(msg.tool_input, dict) else {},
+            )
+            idx = self.last_assistant_idx
+            if idx is None:
+                # No preceding assistant message — create a minimal one
+                self._append(LLMMessage(role="assistant", content=None, tool_calls=[tc_request]))
+                return
+            assistant_msg = self.messages[idx]
+            if assistant_msg.tool_calls is None:
+                assistant_msg.tool_calls = []
+            assistant_msg.tool_calls.append(tc_request)
+            self.token_counts[idx] = estimate_message_tokens(assistant_msg)
+        elif msg.role == MessageRole.TOOL:
+            # Apply the latest remap if the preceding tool_call had its ID changed
+            tc_id = msg.tool_call_id
+            if tc_id:
+                tc_id = self.tc_id_remap.get(tc_id, tc_id)
+            self._append(
+                LLMMessage(
+                    role="tool",
+                    content=msg.content,
+                    tool_call_id=tc_id,
+                    tool_name=msg.tool_name,
+                )
+            )
+        # SYSTEM rows are skipped (the executor supplies the system prompt)
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["version"] = HISTORY_FORMAT_VERSION
+        return json.dumps(data, default=str)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ConversationHistory | None":
+        data: dict[str, Any] = json.loads(raw)
+        if data.pop("version", None) != HISTORY_FORMAT_VERSION:
+            return None
+        messages = []
+        for m in data.pop("messages"):
+            if m.get("tool_calls") is not None:
+                m["tool_calls"] = [ToolCallRequest(**tc) for tc in m["tool_calls"]]
+            messages.append(LLMMessage(**m))
+        return cls(messages=messages, **data)
+
+
+_HISTORY_COLUMNS = (
+    Message.role,
+    Message.content,
+    Message.tool_calls,
+    Message.tool_call_id,
+    Message.tool_name,
+    Message.tool_input,
+    Message.sequence,
+)
+
+
+async def _read_cached(conversation_id: UUID) -> ConversationHistory | None:
+    try:
+        redis = await get_shared_redis()
+        raw = await redis.get(conversation_history_key(str(conversation_id)))
+        return ConversationHistory.from_json(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"Conversation history cache read failed for {conversation_id}: {e}")
+        return None
+
+
+async def save_conversation_history(conversation_id: UUID, history: ConversationHistory) -> None:
+    """Store the history for the next turn (best effort)."""
+    try:
+        redis = await get_shared_redis()
+        await redis.set(
+            conversation_history_key(str(conversation_id)),
+            history.to_json(),
+            ex=TTL_CONVERSATION_HISTORY,
+        )
+    except Exception as e:
+        logger.warning(f"Conversation history cache write failed for {conversation_id}: {e}")
+
+
+async def load_conversation_history(
+    session_factory: async_sessionmaker[AsyncSession],
+    conversation_id: UUID,
+) -> ConversationHistory:
+    """
+    Load a conversation's history, converting only rows added since the
+    cached copy was built.
+
+    Args:
+        session_factory: Factory for a short-lived DB session
+        conversation_id: Conversation to load
+
+    Returns:
+        ConversationHistory covering every message row of the conversation
+    """
+    history = await _read_cached(conversation_id)
+
+    async with session_factory() as session:
+        if history is not None:
+            # The cached copy is only valid if the rows it covered are unchanged
+            covered = await session.execute(
+                select(func.count())
+                .select_from(Message)
+                .where(Message.conversation_id == conversation_id)
+                .where(Message.sequence <= history.last_sequence)
+            )
+            if covered.scalar() != history.row_count:
+                logger.info(f"Conversation history cache for {conversation_id} is out of date, rebuilding")
+                history = None
+
+        cached = history is not None
+        if history is None:
+            history = ConversationHistory()
+
+        result = await session.execute(
+            select(Message)
+            .options(load_only(*_HISTORY_COLUMNS))
+            .where(Message.conversation_id == conversation_id)
+            .where(Message.sequence > history.last_sequence)
+            .order_by(Message.sequence)
+        )
+        rows = list(result.scalars().all())
+
+    if rows or not cached:
+        history.append_rows(rows)
+        await save_conversation_history(conversation_id, history)
+
+    return history
@@ -0,0 +1,159 @@
+"""
+Content-addressed embedding cache.
+
+Embeddings are a pure function of (model, dimensions, text), so once a
+chunk has been embedded there's no reason to pay the provider for it again:
+re-storing a document with mostly unchanged text, reindexing the platform
+docs, or the same boilerplate stored by several tenants all hit text that
+was embedded before.
+
+`embed_with_cache` looks every text up in the `embedding_cache` table in
+one query, sends only the misses to the provider (deduplicated), and
+writes the new embeddings back. The cache is keyed by sha256 of the text,
+so no content is stored and entries can be shared across organizations.
+
+Entries for other models are pruned when an embedding reindex completes
+(`prune_embedding_cache`); within a model they're kept indefinitely — a
+row is the size of one embedding, which the knowledge store already holds
+for every cached chunk anyway.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.orm.knowledge import EmbeddingCache
+from src.services.embeddings.base import BaseEmbeddingClient
+
+logger = logging.getLogger(__name__)
+
+# Hashes per lookup query / rows per insert (well under bind-parameter limits)
+LOOKUP_BATCH_SIZE = 1000
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Texts served from the cache vs sent to the provider."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+async def embed_with_cache(
+    session: AsyncSession,
+    embedder: BaseEmbeddingClient,
+    texts: list[str],
+    stats: EmbeddingCacheStats | None = None,
+) -> list[list[float]]:
+    """
+    Embed `texts`, reusing cached embeddings for text seen before.
+
+    Args:
+        session: Session the cache is read and written through (the
+            caller commits)
+        embedder: Provider client; its config's model and dimensions
+            are part of the cache key
+        texts: Texts to embed
+        stats: Optional counters to accumulate hits/misses into
+
+    Returns:
+        One embedding per text, in order.
+    """
+    if not texts:
+        return []
+
+    model = embedder.config.model
+    dimensions = embedder.config.dimensions
+    hashes = [content_hash(t) for t in texts]
+    unique = list(dict.fromkeys(hashes))
+
+    cached: dict[str, list[float]] = {}
+    for start in range(0, len(unique), LOOKUP_BATCH_SIZE):
+        batch = unique[start:start + LOOKUP_BATCH_SIZE]
+        result = await session.execute(
+            select(EmbeddingCache.content_hash, EmbeddingCache.embedding).where(
+                EmbeddingCache.model == model,
+                EmbeddingCache.dimensions == dimensions,
+                EmbeddingCache.content_hash.in_(batch),
+            )
+        )
+        cached.update(result.tuples().all())
+
+    first_text = dict(zip(hashes, texts))
+    missing = [h for h in unique if h not in cached]
+    if missing:
+        vectors = await embedder.embed([first_text[h] for h in missing])
+        if len(vectors) != len(missing):
+            raise ValueError(
+                f"Embedder returned {len(vectors)} embeddings for {len(missing)} texts"
+            )
+        fresh = dict(zip(missing, vectors))
+        cached.update(fresh)
+        await _write(session, model, dimensions, fresh)
+
+    if stats is not None:
+        # Repeats of a missing text within the batch count as hits: they
+        # weren't sent to the provider either
+        stats.misses += len(missing)
+        stats.hits += len(hashes) - len(missing)
+
+    return [cached[h] for h in hashes]
+
+
+async def _write(
+    session: AsyncSession,
+    model: str,
+    dimensions: int,
+    embeddings: dict[str, list[float]],
+) -> None:
+    # A provider that ignores the configured dimensions would poison the
+    # key for every later lookup; only cache what matches it.
+    rows = [
+        {"model": model, "dimensions": dimensions, "content_hash": h, "embedding": e}
+        for h, e in embeddings.items()
+        if len(e) == dimensions
+    ]
+    if len(rows) != len(embeddings):
+        logger.warning(
+            f"Not caching {len(embeddings) - len(rows)} embedding(s) from {model!r}: "
+            f"dimension differs from configured {dimensions}"
+        )
+    for start in range(0, len(rows), LOOKUP_BATCH_SIZE):
+        await session.execute(
+            insert(EmbeddingCache)
+            .values(rows[start:start + LOOKUP_BATCH_SIZE])
+            .on_conflict_do_nothing()
+        )
+
+
+async def prune_embedding_cache(session: AsyncSession, model: str, dimensions: int) -> int:
+    """Delete cache entries for every (model, dimensions) except the given one."""
+    result = await session.execute(
+        delete(EmbeddingCache).where(
+            tuple_(EmbeddingCache.model, EmbeddingCache.dimensions) != (model, dimensions)
+        )
+    )
+    return result.rowcount or 0
+
+
+__all__ = [
+    "EmbeddingCacheStats",
+    "content_hash",
+    "embed_with_cache",
+    "prune_embedding_cache",
+]
@@ -0,0 +1,103 @@
+"""
+Query embedding cache.
+
+Every knowledge search embeds its query through the provider before it can
+touch the index, and agents in particular repeat the same few queries
+across turns and runs. `embed_query` caches query embeddings in two
+tiers: a small in-process LRU in front of Redis, keyed by model,
+dimensions and the sha256 of the normalized query, so a repeated query
+costs a dict lookup (or one Redis GET from another worker) instead of a
+provider round trip.
+
+Both tiers are best effort: a Redis failure only means the query is
+embedded again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+
+from src.core.cache import get_shared_redis
+from src.core.cache.keys import TTL_QUERY_EMBEDDING, query_embedding_key
+from src.services.embeddings.base import BaseEmbeddingClient
+
+logger = logging.getLogger(__name__)
+
+# In-process entries (a 3072-dim embedding is ~25KB as floats)
+LOCAL_CACHE_SIZE = 512
+
+_local: OrderedDict[str, list[float]] = OrderedDict()
+
+
+def normalize_query(query: str) -> str:
+    """Collapse runs of whitespace so trivially different queries share an entry."""
+    return " ".join(query.split())
+
+
+def _cache_key(embedder: BaseEmbeddingClient, query: str) -> str:
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    return query_embedding_key(embedder.config.model, embedder.config.dimensions, digest)
+
+
+async def embed_query(embedder: BaseEmbeddingClient, query: str) -> list[float]:
+    """
+    Embed a search query, reusing the embedding of an identical earlier query.
+
+    Args:
+        embedder: Provider client; its config's model and dimensions are
+            part of the cache key
+        query: Query text (whitespace is normalized before embedding)
+
+    Returns:
+        The query embedding.
+    """
+    query = normalize_query(query)
+    key = _cache_key(embedder, query)
+
+    embedding = _local.get(key)
+    if embedding is not None:
+        _local.move_to_end(key)
+        return embedding
+
+    embedding = await _read_redis(key)
+    if embedding is None:
+        embedding = await embedder.embed_single(query)
+        await _write_redis(key, embedding)
+
+    _local[key] = embedding
+    if len(_local) > LOCAL_CACHE_SIZE:
+        _local.popitem(last=False)
+    return embedding
+
+
+async def _read_redis(key: str) -> list[float] | None:
+    try:
+        redis = await get_shared_redis()
+        raw = await redis.get(key)
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"Query embedding cache read failed: {e}")
+        return None
+
+
+async def _write_redis(key: str, embedding: list[float]) -> None:
+    try:
+        redis = await get_shared_redis()
+        await redis.set(key, json.dumps(embedding), ex=TTL_QUERY_EMBEDDING)
+    except Exception as e:
+        logger.warning(f"Query embedding cache write failed: {e}")
+
+
+def clear_local_query_cache() -> None:
+    """Drop the in-process tier (tests, or after an embedding model change)."""
+    _local.clear()
+
+
+__all__ = [
+    "clear_local_query_cache",
+    "embed_query",
+    "normalize_query",
+]
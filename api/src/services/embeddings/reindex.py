@@ -22,7 +22,7 @@ from typing import cast
 
 from sqlalchemy import select, update
 
-from src.core.database import get_db_context
+from src.core.database import get_db_context, get_engine
 from src.core.redis_client import get_redis_client
 from src.models.contracts.notifications import (
     NotificationStatus,
@@ -30,7 +30,13 @@ from src.models.contracts.notifications import (
 )
 from src.models.orm.knowledge import KnowledgeStore
 from src.repositories.knowledge import KnowledgeRepository
+from src.services.embeddings.cache import (
+    EmbeddingCacheStats,
+    embed_with_cache,
+    prune_embedding_cache,
+)
 from src.services.embeddings.factory import get_embedding_client
+from src.services.knowledge.vector_index import sync_ann_indexes
 from src.services.notification_service import get_notification_service
 
 logger = logging.getLogger(__name__)
@@ -85,10 +91,14 @@ async def run_reindex_for_group(
     namespace: str,
     organization_id,
     key: str,
+    cache_stats: EmbeddingCacheStats | None = None,
 ) -> int:
     """
     Re-chunk and re-embed rows under (namespace, organization_id, key).
 
+    Chunks already in the embedding cache for the current model aren't
+    sent to the provider; hits/misses accumulate into ``cache_stats``.
+
     Returns the number of chunks written. Cancellation and progress reporting
     are handled by the caller.
     """
@@ -122,6 +132,7 @@ async def run_reindex_for_group(
         organization_id=organization_id,
         created_by=created_by,
         embedder=embedder,
+        cache_stats=cache_stats,
     )
     return len(new_ids)
 
@@ -144,6 +155,8 @@ async def run_reindex(notification_id: str) -> None:
     total = 0
     failed_batches = 0
     total_batches = 0
+    index_dim: int | None = None
+    cache_stats = EmbeddingCacheStats()
 
     try:
         async with get_db_context() as db:
@@ -206,6 +219,8 @@ async def run_reindex(notification_id: str) -> None:
                                 "processed": processed,
                                 "total": total,
                                 "failed_batches": failed_batches,
+                                "cache_hits": cache_stats.hits,
+                                "cache_misses": cache_stats.misses,
                                 "total_batches": total_batches,
                                 "cancelled": True,
                             },
@@ -220,6 +235,7 @@ async def run_reindex(notification_id: str) -> None:
                         namespace=namespace,
                         organization_id=org_id,
                         key=key,
+                        cache_stats=cache_stats,
                     )
                     await db.commit()
                 except Exception as e:
@@ -227,13 +243,13 @@ async def run_reindex(notification_id: str) -> None:
                     logger.error(f"Reindex group {namespace}/{org_id}/{key} failed: {e}")
                     await db.rollback()
                     await _push_progress(
-                        notif_service, notification_id, processed, total
+                        notif_service, notification_id, processed, total, cache_stats
                     )
                     continue
 
                 processed += 1
                 await _push_progress(
-                    notif_service, notification_id, processed, total
+                    notif_service, notification_id, processed, total, cache_stats
                 )
 
             for row in keyless_rows:
@@ -250,6 +266,8 @@ async def run_reindex(notification_id: str) -> None:
                                 "processed": processed,
                                 "total": total,
                                 "failed_batches": failed_batches,
+                                "cache_hits": cache_stats.hits,
+                                "cache_misses": cache_stats.misses,
                                 "total_batches": total_batches,
                                 "cancelled": True,
                             },
@@ -258,7 +276,9 @@ async def run_reindex(notification_id: str) -> None:
                     return
 
                 try:
-                    vector = await client.embed_single(row.content)
+                    [vector] = await embed_with_cache(
+                        db, client, [row.content], cache_stats
+                    )
                     await db.execute(
                         update(KnowledgeStore)
                         .where(KnowledgeStore.id == row.id)
@@ -270,13 +290,13 @@ async def run_reindex(notification_id: str) -> None:
                     logger.error(f"Reindex keyless row {row.id} failed: {e}")
                     await db.rollback()
                     await _push_progress(
-                        notif_service, notification_id, processed, total
+                        notif_service, notification_id, processed, total, cache_stats
                     )
                     continue
 
                 processed += 1
                 await _push_progress(
-                    notif_service, notification_id, processed, total
+                    notif_service, notification_id, processed, total, cache_stats
                 )
 
             # Terminal status reflects the real outcome:
@@ -298,17 +318,21 @@ async def run_reindex(notification_id: str) -> None:
                             "processed": processed,
                             "total": total,
                             "failed_batches": failed_batches,
+                            "cache_hits": cache_stats.hits,
+                            "cache_misses": cache_stats.misses,
                             "total_batches": total_batches,
                         },
                     ),
                 )
             else:
+                index_dim = client.config.dimensions
                 description = f"Reindexed {processed}/{total} knowledge document(s)."
                 if failed_batches:
                     description += (
                         f" ({failed_batches}/{total_batches} document(s) failed; "
                         f"{total - processed} kept their old embedding.)"
                     )
+                description += f" ({_cache_summary(cache_stats)})"
                 await notif_service.update_notification(
                     notification_id,
                     NotificationUpdate(
@@ -319,11 +343,33 @@ async def run_reindex(notification_id: str) -> None:
                             "processed": processed,
                             "total": total,
                             "failed_batches": failed_batches,
+                            "cache_hits": cache_stats.hits,
+                            "cache_misses": cache_stats.misses,
                             "total_batches": total_batches,
                         },
                     ),
                 )
 
+            if index_dim is not None:
+                # Stores and searches use the new model from here on;
+                # entries for older models would only be hit again if the
+                # config were switched back
+                try:
+                    pruned = await prune_embedding_cache(
+                        db, client.config.model, client.config.dimensions
+                    )
+                    await db.commit()
+                    if pruned:
+                        logger.info(f"Pruned {pruned} embedding cache entries for other models")
+                except Exception as e:
+                    logger.warning(f"Embedding cache prune failed: {e}")
+                    await db.rollback()
+
+        # Outside the session: CREATE INDEX CONCURRENTLY waits for open
+        # transactions on knowledge_store to finish
+        if index_dim is not None:
+            await _sync_vector_index(index_dim)
+
     except Exception as e:
         logger.exception("Reindex job failed")
         await notif_service.update_notification(
@@ -336,6 +382,8 @@ async def run_reindex(notification_id: str) -> None:
                     "processed": processed,
                     "total": total,
                     "failed_batches": failed_batches,
+                    "cache_hits": cache_stats.hits,
+                    "cache_misses": cache_stats.misses,
                 },
             ),
         )
@@ -343,16 +391,44 @@ async def run_reindex(notification_id: str) -> None:
         await clear_cancel_flag(notification_id)
 
 
+async def _sync_vector_index(dim: int) -> None:
+    """Build the HNSW index for the new dimension and drop the old one."""
+    try:
+        result = await sync_ann_indexes(get_engine(), dim)
+        logger.info(
+            f"Knowledge vector indexes synced after reindex (dim {dim}): "
+            f"created={result['created']} dropped={result['dropped']}"
+        )
+    except Exception as e:
+        # Search still works (exact scan); the scheduler job retries hourly
+        logger.error(f"Knowledge vector index sync after reindex failed: {e}")
+
+
+def _cache_summary(cache_stats: EmbeddingCacheStats) -> str:
+    return (
+        f"embedding cache hit ratio {cache_stats.hit_ratio:.0%}, "
+        f"{cache_stats.misses} chunk(s) embedded"
+    )
+
+
 async def _push_progress(
-    notif_service, notification_id: str, processed: int, total: int
+    notif_service,
+    notification_id: str,
+    processed: int,
+    total: int,
+    cache_stats: EmbeddingCacheStats,
 ) -> None:
     percent = (processed / total * 100.0) if total else 100.0
     await notif_service.update_notification(
         notification_id,
         NotificationUpdate(
             status=NotificationStatus.RUNNING,
-            description=f"Re-embedded {processed}/{total} knowledge document(s)...",
+            description=(
+                f"Re-embedded {processed}/{total} knowledge document(s) "
+                f"({_cache_summary(cache_stats)})..."
+            ),
             percent=percent,
+            result={"cache_hits": cache_stats.hits, "cache_misses": cache_stats.misses},
         ),
     )
 
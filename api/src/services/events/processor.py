@@ -24,6 +24,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from src.core.log_safety import log_safe
+from src.jobs.rabbitmq import PublishError, deferred_publishes
 from src.models.enums import EventDeliveryStatus, EventSourceType, EventStatus
 from src.models.orm.events import (
     Event,
@@ -562,26 +563,59 @@ class EventProcessor:
             logger.error(f"Event not found when queueing deliveries: {log_safe(event_id)}")
             return 0
 
-        queued = 0
-        for delivery in deliveries:
-            if delivery.status != EventDeliveryStatus.PENDING:
-                continue
-
-            try:
-                subscription = delivery.subscription
-                if subscription and subscription.target_type == "agent":
-                    await self._queue_agent_run(delivery, event_obj)
-                else:
-                    await self._queue_workflow_execution(delivery, event_obj)
-                delivery.status = EventDeliveryStatus.QUEUED
-                queued += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to queue delivery {delivery.id}: {e}",
-                    exc_info=True,
-                )
+        # Publish the whole fan-out in one batch once every delivery is
+        # prepared, rather than a broker round trip per delivery. Each
+        # delivery is tracked by its message's execution/run id so a
+        # partial publish failure only fails the messages never confirmed.
+        queued_deliveries: list[EventDelivery] = []
+        message_ids: dict[str, EventDelivery] = {}
+        try:
+            async with deferred_publishes():
+                for delivery in deliveries:
+                    if delivery.status != EventDeliveryStatus.PENDING:
+                        continue
+
+                    try:
+                        subscription = delivery.subscription
+                        if subscription and subscription.target_type == "agent":
+                            message_id = await self._queue_agent_run(delivery, event_obj)
+                        else:
+                            message_id = await self._queue_workflow_execution(
+                                delivery, event_obj
+                            )
+                        delivery.status = EventDeliveryStatus.QUEUED
+                        queued_deliveries.append(delivery)
+                        message_ids[message_id] = delivery
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to queue delivery {delivery.id}: {e}",
+                            exc_info=True,
+                        )
+                        delivery.status = EventDeliveryStatus.FAILED
+                        delivery.error_message = str(e)
+        except Exception as e:
+            if isinstance(e, PublishError):
+                # Confirmed messages will still run; fail only the rest
+                failed = [
+                    message_ids[message_id]
+                    for message in e.unconfirmed
+                    if (message_id := message.get("execution_id") or message.get("run_id"))
+                    in message_ids
+                ]
+            else:
+                failed = list(queued_deliveries)
+            logger.error(
+                f"Failed to publish {len(failed)} of {len(queued_deliveries)} "
+                f"deliveries for event {log_safe(event_id)}: {e}",
+                exc_info=True,
+            )
+            for delivery in failed:
                 delivery.status = EventDeliveryStatus.FAILED
                 delivery.error_message = str(e)
+            queued_deliveries = [
+                d for d in queued_deliveries if d.status == EventDeliveryStatus.QUEUED
+            ]
+        queued = len(queued_deliveries)
 
         await self.session.flush()
 
@@ -615,7 +649,7 @@ class EventProcessor:
         self,
         delivery: EventDelivery,
         event: Event,
-    ) -> None:
+    ) -> str:
         """
         Queue a workflow execution for an event delivery.
 
@@ -624,6 +658,9 @@ class EventProcessor:
         If the subscription has an input_mapping defined, it is processed to build
         workflow parameters using template substitution. Otherwise, the raw event
         data is used as parameters (legacy behavior).
+
+        Returns:
+            The execution ID
         """
         from src.services.execution.async_executor import enqueue_system_workflow_execution
 
@@ -701,13 +738,14 @@ class EventProcessor:
                 "event_id": str(event.id),
             },
         )
+        return execution_id
 
     async def _queue_agent_run(
         self,
         delivery: EventDelivery,
         event: Event,
-    ) -> None:
-        """Queue an agent run for an event delivery targeting an agent."""
+    ) -> str:
+        """Queue an agent run for an event delivery targeting an agent; returns the run ID."""
         from src.services.execution.agent_run_service import enqueue_agent_run
 
         subscription = delivery.subscription
@@ -760,6 +798,7 @@ class EventProcessor:
                 "event_id": str(event.id),
             },
         )
+        return run_id
 
 
 
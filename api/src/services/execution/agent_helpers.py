@@ -1,6 +1,10 @@
 """Shared helpers for agent execution (used by both chat and autonomous executors)."""
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 from uuid import UUID
 
 from sqlalchemy import select
@@ -13,7 +17,7 @@ from src.models.orm.external_mcp import (
     MCPConnection,
     MCPServer,
 )
-from src.services.llm import ToolDefinition
+from src.services.llm import ToolCallRequest, ToolDefinition
 from src.services.tool_registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
@@ -339,3 +343,100 @@ def parse_mcp_tool_name(qualified_name: str) -> tuple[UUID, str] | None:
     if not tool_name:
         return None
     return connection_id, tool_name
+
+
+# ==================== CONCURRENT TOOL CALLS ====================
+
+# Tool calls from one assistant message run concurrently, capped per agent
+# by ``Agent.max_parallel_tool_calls`` (null = this default; 1 = sequential).
+DEFAULT_MAX_PARALLEL_TOOL_CALLS = 4
+
+# Per-call ceiling. Longer than the autonomous delegation timeout so a
+# delegated run times out (and records its failure) before this fires.
+TOOL_CALL_TIMEOUT_SECONDS = 900
+
+# How often ``iter_tool_calls`` polls ``should_cancel`` while calls run
+CANCEL_POLL_INTERVAL_SECONDS = 1.0
+
+T = TypeVar("T")
+
+
+class ToolCallTimeoutError(Exception):
+    """Raised (as an outcome) when a tool call exceeds its timeout."""
+    pass
+
+
+def max_parallel_tool_calls(agent: Agent | None) -> int:
+    """Concurrency cap for an agent's tool calls within one turn."""
+    limit = agent.max_parallel_tool_calls if agent else None
+    return max(1, limit or DEFAULT_MAX_PARALLEL_TOOL_CALLS)
+
+
+async def iter_tool_calls(
+    tool_calls: Sequence[ToolCallRequest],
+    execute: Callable[[ToolCallRequest], Awaitable[T]],
+    *,
+    max_concurrency: int,
+    timeout: float | None = TOOL_CALL_TIMEOUT_SECONDS,
+    should_cancel: Callable[[], Awaitable[bool]] | None = None,
+) -> AsyncIterator[tuple[ToolCallRequest, T | BaseException, int]]:
+    """Run a turn's tool calls concurrently and yield outcomes in request order.
+
+    At most ``max_concurrency`` calls run at once. Outcomes are yielded as
+    ``(tool_call, result_or_exception, duration_ms)`` in the order the LLM
+    requested the calls, so history and step events stay deterministic
+    even though calls finish in any order. A failing call never cancels
+    its siblings; its exception is yielded as the outcome instead:
+
+    - ``ToolCallTimeoutError`` if the call ran longer than ``timeout``
+    - ``asyncio.CancelledError`` if ``should_cancel`` returned True
+      while the call was queued or running
+
+    Calls still running when the consumer stops iterating (or is itself
+    cancelled) are cancelled. Iterate inside ``contextlib.aclosing`` so
+    that happens promptly when the consumer is an async generator.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run_one(tool_call: ToolCallRequest) -> tuple[T | BaseException, int]:
+        async with semaphore:
+            start = time.monotonic()
+            outcome: T | BaseException
+            try:
+                outcome = await asyncio.wait_for(execute(tool_call), timeout)
+            except asyncio.TimeoutError:
+                outcome = ToolCallTimeoutError(
+                    f"Tool '{tool_call.name}' timed out after {timeout}s"
+                )
+            except Exception as e:
+                outcome = e
+            return outcome, int((time.monotonic() - start) * 1000)
+
+    tasks = [asyncio.create_task(run_one(tc)) for tc in tool_calls]
+
+    async def watch_cancel() -> None:
+        assert should_cancel is not None
+        while not all(t.done() for t in tasks):
+            await asyncio.sleep(CANCEL_POLL_INTERVAL_SECONDS)
+            if await should_cancel():
+                for t in tasks:
+                    t.cancel()
+                return
+
+    watcher = asyncio.create_task(watch_cancel()) if should_cancel else None
+    try:
+        for tool_call, task in zip(tool_calls, tasks):
+            # wait() rather than awaiting the task so a call cancelled by the
+            # watcher is reported as an outcome, not raised into the consumer
+            await asyncio.wait([task])
+            if task.cancelled():
+                yield tool_call, asyncio.CancelledError("Tool call cancelled"), 0
+            else:
+                outcome, duration_ms = task.result()
+                yield tool_call, outcome, duration_ms
+    finally:
+        for t in tasks:
+            t.cancel()
+        if watcher is not None:
+            watcher.cancel()
+        await asyncio.gather(*tasks, *([watcher] if watcher else []), return_exceptions=True)
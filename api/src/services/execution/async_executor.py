@@ -27,7 +27,14 @@ from src.services.execution.queue_tracker import add_to_queue
 
 logger = logging.getLogger(__name__)
 
-QUEUE_NAME = "workflow-executions"
+QUEUE_NAME = "workflow-executions-prioritized"
+
+# Message priorities (QUEUE_NAME is declared with x-max-priority 10). Workers
+# dispatch higher priorities first and share each priority fairly across
+# organizations, so bulk fan-out can't starve interactive runs.
+PRIORITY_BULK = 1  # schedules, events, deferred runs
+PRIORITY_INTERACTIVE = 5  # user-triggered: forms, API calls, the editor
+PRIORITY_SYNC = 9  # a caller is blocked waiting for the result
 
 
 async def _publish_pending(
@@ -45,6 +52,7 @@ async def _publish_pending(
     is_platform_admin: bool,
     file_path: str | None,
     event: dict[str, Any] | None = None,
+    priority: int = PRIORITY_INTERACTIVE,
 ) -> None:
     """
     Write a pending-execution blob to Redis, register with the queue tracker,
@@ -52,7 +60,8 @@ async def _publish_pending(
 
     Shared by the run-now path (enqueue_workflow_execution) and the deferred
     execution promoter. Callers are responsible for generating execution_id
-    before calling this helper.
+    before calling this helper. Sync executions are always published at
+    PRIORITY_SYNC.
     """
     redis_client = get_redis_client()
 
@@ -76,10 +85,12 @@ async def _publish_pending(
     # Add to queue tracking (publishes position updates to all queued executions)
     await add_to_queue(execution_id)
 
-    # Prepare queue message (minimal - worker reads full context from Redis)
+    # Prepare queue message (minimal - worker reads full context from Redis;
+    # org_id is the fair-share key the worker dispatches by)
     message: dict[str, Any] = {
         "execution_id": execution_id,
         "workflow_id": workflow_id,
+        "org_id": org_id,
         "sync": sync,
     }
 
@@ -88,7 +99,7 @@ async def _publish_pending(
         message["file_path"] = file_path
 
     # Enqueue message via RabbitMQ
-    await publish_message(QUEUE_NAME, message)
+    await publish_message(QUEUE_NAME, message, priority=PRIORITY_SYNC if sync else priority)
 
 
 async def enqueue_workflow_execution(
@@ -100,6 +111,7 @@ async def enqueue_workflow_execution(
     sync: bool = False,
     api_key_id: str | None = None,
     file_path: str | None = None,
+    priority: int = PRIORITY_INTERACTIVE,
 ) -> str:
     """
     Enqueue a workflow for async execution.
@@ -116,6 +128,7 @@ async def enqueue_workflow_execution(
         sync: If True, worker will push result to Redis for caller to BLPOP
         api_key_id: Optional workflow ID whose API key triggered this execution
         file_path: Optional file path (for fast direct loading, avoids filesystem scan)
+        priority: Queue priority (PRIORITY_BULK for system-triggered work)
 
     Returns:
         execution_id: UUID of the queued execution
@@ -147,6 +160,7 @@ async def enqueue_workflow_execution(
         is_platform_admin=context.is_platform_admin,
         file_path=file_path,
         event=event_payload,
+        priority=priority,
     )
 
     logger.info(
@@ -213,11 +227,12 @@ async def enqueue_code_execution(
         "execution_id": execution_id,
         "code": code_base64,
         "script_name": script_name,
+        "org_id": context.org_id,
         "sync": sync,
     }
 
     # Enqueue message via RabbitMQ
-    await publish_message(QUEUE_NAME, message)
+    await publish_message(QUEUE_NAME, message, priority=PRIORITY_SYNC if sync else PRIORITY_INTERACTIVE)
 
     logger.info(
         f"Enqueued async code execution: {log_safe(script_name)}",
@@ -243,7 +258,7 @@ async def enqueue_system_workflow_execution(
 
     Handles execution_id generation internally - callers don't need to pre-generate.
     Uses the system user for executions not triggered by a real user
-    (webhooks, schedules, topic events).
+    (webhooks, schedules, topic events), published at PRIORITY_BULK.
 
     Args:
         workflow_id: UUID of workflow to execute
@@ -279,4 +294,5 @@ async def enqueue_system_workflow_execution(
         workflow_id=workflow_id,
         parameters=parameters,
         execution_id=execution_id,  # Pass explicitly to avoid double generation
+        priority=PRIORITY_BULK,
     )
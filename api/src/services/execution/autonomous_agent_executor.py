@@ -13,6 +13,7 @@ import asyncio
 import json
 import logging
 import time
+from contextlib import aclosing
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID, uuid4
@@ -30,6 +31,8 @@ from src.core.pubsub import publish_agent_run_step
 from src.services.execution.agent_helpers import (
     build_agent_system_prompt,
     find_delegated_agent,
+    iter_tool_calls,
+    max_parallel_tool_calls,
     parse_mcp_tool_name,
     resolve_agent_tools,
 )
@@ -76,7 +79,8 @@ class AutonomousAgentExecutor:
         self._delegation_depth = _delegation_depth
         self._tool_workflow_id_map: dict[str, UUID] = {}
         self._current_run_id: str = ""
-        self._last_delegation_run_id: str | None = None
+        # tool_call_id -> child run ID, for the delegation's tool_result step
+        self._delegation_run_ids: dict[str, str] = {}
         # Caller_user_id for the active run, threaded into MCP dispatch.
         # ``None`` means the run is autonomous (scheduled / webhook /
         # event-trigger), in which case dispatch resolves to the
@@ -279,58 +283,63 @@ class AutonomousAgentExecutor:
                 tool_calls=response.tool_calls,
             ))
 
-            # Execute tools
-            cancelled_during_tools = False
-            for tc in response.tool_calls:
-                # Check for cancellation between tool calls
-                if await self._check_cancelled(run_id):
-                    cancelled_during_tools = True
-                    break
-
-                step_number += 1
-                await self._record_step(run_id, step_number, "tool_call", {
-                    "tool_name": tc.name,
-                    "arguments": tc.arguments,
-                })
-
-                tool_start = time.time()
-                try:
-                    result = await self._execute_tool(tc, agent)
-                    tool_duration = int((time.time() - tool_start) * 1000)
-
-                    step_content: dict = {
-                        "tool_name": tc.name,
-                        "result": str(result)[:20000],
-                        "is_error": False,
-                    }
-                    # Include child_run_id for delegation steps
-                    if tc.name.startswith("delegate_to_") and self._last_delegation_run_id:
-                        step_content["child_run_id"] = self._last_delegation_run_id
-
-                    step_number += 1
-                    await self._record_step(run_id, step_number, "tool_result", step_content, duration_ms=tool_duration)
-
-                    messages.append(LLMMessage(
-                        role="tool",
-                        content=str(result),
-                        tool_call_id=tc.id,
-                        tool_name=tc.name,
-                    ))
-                except Exception as e:
-                    tool_duration = int((time.time() - tool_start) * 1000)
+            # Execute tools concurrently; steps are recorded in request order
+            cancelled_during_tools = await self._check_cancelled(run_id)
+            if not cancelled_during_tools:
+                for tc in response.tool_calls:
                     step_number += 1
-                    await self._record_step(run_id, step_number, "tool_error", {
+                    await self._record_step(run_id, step_number, "tool_call", {
                         "tool_name": tc.name,
-                        "error": str(e),
-                        "is_error": True,
-                    }, duration_ms=tool_duration)
-
-                    messages.append(LLMMessage(
-                        role="tool",
-                        content=f"Error: {e}",
-                        tool_call_id=tc.id,
-                        tool_name=tc.name,
-                    ))
+                        "arguments": tc.arguments,
+                    })
+
+                outcomes = iter_tool_calls(
+                    response.tool_calls,
+                    lambda tc: self._execute_tool(tc, agent),
+                    max_concurrency=max_parallel_tool_calls(agent),
+                    should_cancel=(lambda: self._check_cancelled(run_id)) if self.redis_client else None,
+                )
+                async with aclosing(outcomes):
+                    async for tc, result, tool_duration in outcomes:
+                        if isinstance(result, asyncio.CancelledError):
+                            cancelled_during_tools = True
+                            result = ToolError("Agent run was cancelled")
+
+                        if isinstance(result, BaseException):
+                            step_number += 1
+                            await self._record_step(run_id, step_number, "tool_error", {
+                                "tool_name": tc.name,
+                                "error": str(result),
+                                "is_error": True,
+                            }, duration_ms=tool_duration)
+
+                            messages.append(LLMMessage(
+                                role="tool",
+                                content=f"Error: {result}",
+                                tool_call_id=tc.id,
+                                tool_name=tc.name,
+                            ))
+                            continue
+
+                        step_content: dict = {
+                            "tool_name": tc.name,
+                            "result": str(result)[:20000],
+                            "is_error": False,
+                        }
+                        # Include child_run_id for delegation steps
+                        child_run_id = self._delegation_run_ids.pop(tc.id, None)
+                        if child_run_id:
+                            step_content["child_run_id"] = child_run_id
+
+                        step_number += 1
+                        await self._record_step(run_id, step_number, "tool_result", step_content, duration_ms=tool_duration)
+
+                        messages.append(LLMMessage(
+                            role="tool",
+                            content=str(result),
+                            tool_call_id=tc.id,
+                            tool_name=tc.name,
+                        ))
 
             # Check if cancelled during tool execution
             if cancelled_during_tools:
@@ -548,6 +557,7 @@ class AutonomousAgentExecutor:
         try:
             from src.repositories.knowledge import KnowledgeRepository
             from src.services.embeddings import get_embedding_client
+            from src.services.embeddings.query_cache import embed_query
 
             query = tool_call.arguments.get("query", "")
             limit = tool_call.arguments.get("limit", 5)
@@ -562,7 +572,7 @@ class AutonomousAgentExecutor:
             # Brief DB session for embedding client config + knowledge search
             async with self._session_factory() as db:
                 embedding_client = await get_embedding_client(db)
-                query_embedding = await embedding_client.embed_single(query)
+                query_embedding = await embed_query(embedding_client, query)
 
                 repo = KnowledgeRepository(
                     db, org_id=agent.organization_id, is_superuser=True
@@ -572,6 +582,7 @@ class AutonomousAgentExecutor:
                     namespace=namespaces,
                     limit=limit,
                     fallback=True,
+                    query_text=query,
                 )
 
             if not results:
@@ -643,7 +654,7 @@ class AutonomousAgentExecutor:
             await db.commit()
 
         # Store for the caller to include in the tool_result step
-        self._last_delegation_run_id = sub_run_id
+        self._delegation_run_ids[tool_call.id] = sub_run_id
 
         # Recursive run with the delegated agent (child gets its own session factory)
         sub_executor = AutonomousAgentExecutor(
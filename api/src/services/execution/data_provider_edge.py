@@ -0,0 +1,174 @@
+"""
+API-side (edge) data provider cache.
+
+Serves transient data provider calls from the Redis cache before anything
+is enqueued, so a hit never pays for a RabbitMQ round trip and a worker
+dispatch. Misses are coalesced:
+
+1. In-process: concurrent misses for the same key await one computation.
+2. Across processes: the first caller takes the data provider compute lock
+   (``acquire_compute_lock``) and keeps extending it while the provider
+   runs; other callers wait for it to cache a result, and compute
+   themselves only if the lock is released (or expires) without one.
+
+Expired entries are kept for ``TTL_DATA_PROVIDER_STALE`` seconds and served
+as-is while a single background refresh (guarded by the same lock) runs.
+
+The worker still writes the cache after a successful run; this module only
+reads it and decides who runs the provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from src.core.cache import (
+    DATA_PROVIDER_LOCK_EXTEND_INTERVAL,
+    acquire_compute_lock,
+    compute_param_hash,
+    data_provider_cache_key,
+    extend_compute_lock,
+    get_cached_data_provider,
+    release_compute_lock,
+    wait_for_cached_data_provider,
+)
+from src.models import WorkflowExecutionResponse
+from src.models.enums import ExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+RunProvider = Callable[[], Awaitable[WorkflowExecutionResponse]]
+
+# Cache key -> computation shared by concurrent misses in this process
+_inflight: dict[str, asyncio.Task[WorkflowExecutionResponse]] = {}
+
+# Cache key -> background refresh of a stale entry
+_refreshes: dict[str, asyncio.Task[None]] = {}
+
+
+async def execute_data_provider(
+    *,
+    org_id: str | None,
+    workflow_id: str,
+    workflow_name: str,
+    parameters: dict[str, Any] | None,
+    execution_id: str,
+    run: RunProvider,
+) -> WorkflowExecutionResponse:
+    """
+    Return a data provider result from the cache, or run it once.
+
+    Args:
+        org_id: Organization scope of the cache entry (None for global)
+        workflow_id: Data provider workflow ID
+        workflow_name: Data provider name (cache key component)
+        parameters: Input parameters (cache key component)
+        execution_id: Execution ID reported for cache hits
+        run: Executes the provider through the worker queue; the worker
+            caches a successful result
+
+    Returns:
+        WorkflowExecutionResponse from the cache or from ``run``
+    """
+    key = data_provider_cache_key(org_id, workflow_name, compute_param_hash(parameters))
+
+    def hit(entry: dict[str, Any]) -> WorkflowExecutionResponse:
+        return WorkflowExecutionResponse(
+            execution_id=execution_id,
+            workflow_id=workflow_id,
+            workflow_name=workflow_name,
+            status=ExecutionStatus.SUCCESS,
+            result=entry.get("data"),
+            duration_ms=0,
+            is_transient=True,
+        )
+
+    entry = await get_cached_data_provider(org_id, workflow_name, parameters, allow_stale=True)
+    if entry is not None:
+        if entry.get("stale"):
+            _schedule_refresh(key, org_id, workflow_name, parameters, run)
+        return hit(entry)
+
+    # Run the computation as its own task so a caller going away (client
+    # disconnect) doesn't cancel it for everyone else waiting on it
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_compute(org_id, workflow_name, parameters, run, hit))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _compute(
+    org_id: str | None,
+    name: str,
+    parameters: dict[str, Any] | None,
+    run: RunProvider,
+    hit: Callable[[dict[str, Any]], WorkflowExecutionResponse],
+) -> WorkflowExecutionResponse:
+    """Run the provider under the compute lock, or wait for whoever holds it."""
+    while True:
+        if await acquire_compute_lock(org_id, name, parameters):
+            return await _run_locked(org_id, name, parameters, run)
+
+        entry = await wait_for_cached_data_provider(org_id, name, parameters)
+        if entry is not None:
+            logger.debug(f"Data provider {name} computed by another caller")
+            return hit(entry)
+        # The holder released the lock without a result (take it and run),
+        # or is still running past the wait (wait again)
+
+
+async def _run_locked(
+    org_id: str | None,
+    name: str,
+    parameters: dict[str, Any] | None,
+    run: RunProvider,
+) -> WorkflowExecutionResponse:
+    """Run the provider while holding the compute lock, then release it.
+
+    The lock is extended while ``run`` is in flight, so a provider slower
+    than the lock TTL doesn't let waiters start their own runs.
+    """
+
+    async def keep_locked() -> None:
+        while True:
+            await asyncio.sleep(DATA_PROVIDER_LOCK_EXTEND_INTERVAL)
+            await extend_compute_lock(org_id, name, parameters)
+
+    keeper = asyncio.create_task(keep_locked())
+    try:
+        return await run()
+    finally:
+        keeper.cancel()
+        await release_compute_lock(org_id, name, parameters)
+
+
+def _schedule_refresh(
+    key: str,
+    org_id: str | None,
+    name: str,
+    parameters: dict[str, Any] | None,
+    run: RunProvider,
+) -> None:
+    """Start a background refresh of a stale entry unless one is running."""
+    if key in _refreshes:
+        return
+
+    async def refresh() -> None:
+        if not await acquire_compute_lock(org_id, name, parameters):
+            return  # Another process is already refreshing this entry
+        try:
+            response = await _run_locked(org_id, name, parameters, run)
+            if response.status != ExecutionStatus.SUCCESS:
+                logger.warning(
+                    f"Background refresh of data provider {name} ended with {response.status}"
+                )
+        except Exception as e:
+            logger.warning(f"Background refresh of data provider {name} failed: {e}")
+
+    task = asyncio.create_task(refresh())
+    _refreshes[key] = task
+    task.add_done_callback(lambda _: _refreshes.pop(key, None))
@@ -13,7 +13,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from io import StringIO
 from pathlib import Path
-from typing import Any, get_type_hints, get_origin, get_args, Union
+from types import CodeType
+from typing import Any, Callable, get_type_hints, get_origin, get_args, Union
 
 from pydantic import BaseModel
 
@@ -38,11 +39,13 @@ def _human_size(num_bytes: int) -> str:
 
 # Import unified log streaming (Redis Stream + PubSub)
 try:
-    from bifrost._logging import log_and_broadcast
+    from bifrost._logging import log_and_broadcast, start_log_shipper, stop_log_shipper
     STREAM_LOGGING_AVAILABLE = True
 except ImportError:
     STREAM_LOGGING_AVAILABLE = False
     log_and_broadcast = None  # type: ignore
+    start_log_shipper = None  # type: ignore
+    stop_log_shipper = None  # type: ignore
 
 # Import bifrost context management for SDK support
 project_root = Path(__file__).parent.parent
@@ -668,7 +671,7 @@ def _script_to_callable(code: str, name: str):
     streaming.
 
     The script code is wrapped in an async main() function to enable:
-    - Proper variable capture via sys.settrace()
+    - Proper variable capture from main's frame on return
     - Function-level logging that can be filtered
     - Support for both sync and async code
 
@@ -686,7 +689,7 @@ def _script_to_callable(code: str, name: str):
     script_code = base64.b64decode(code).decode('utf-8')
 
     # Wrap script code in an async main() function
-    # This allows sys.settrace() to capture variables properly
+    # This gives variable capture a single frame to read locals from
     # Add return statement to capture 'result' variable if set
     wrapped_code = f"""async def main():
 {textwrap.indent(script_code, '    ')}
@@ -701,7 +704,7 @@ def _script_to_callable(code: str, name: str):
         Async wrapper that executes the script code.
 
         The script code runs inside an async main() function, allowing:
-        - sys.settrace() to capture variables from main's frame
+        - variable capture from main's frame
         - await to work in user scripts
         - Proper logging with script-specific logger
         """
@@ -769,10 +772,77 @@ def _script_to_callable(code: str, name: str):
     # Set function metadata for trace filtering
     script_wrapper.__name__ = name
     script_wrapper.__module__ = f'<script:{name}>'
+    # main() is the frame whose locals are captured, not the wrapper's
+    setattr(script_wrapper, '_capture_code', next(
+        const for const in compiled_code.co_consts
+        if isinstance(const, CodeType) and const.co_name == 'main'
+    ))
 
     return script_wrapper
 
 
+# sys.monitoring tool ids CPython leaves unassigned (0-2 and 5 are reserved
+# for debuggers, coverage, profilers and optimizers)
+_MONITORING_TOOL_IDS = (3, 4)
+_MONITORING_TOOL_NAME = "bifrost-variable-capture"
+
+
+def _start_return_capture(
+    code_objects: list[CodeType],
+    on_return: Callable[[Any], None],
+) -> Callable[[], None] | None:
+    """
+    Call on_return(frame) whenever one of code_objects returns.
+
+    Uses sys.monitoring (Python 3.12+) with PY_RETURN enabled only as a local
+    event on the given code objects, so nothing else the workflow calls
+    (httpx, pydantic, SDK internals) pays any tracing cost — unlike
+    sys.settrace, which invokes a Python callback on every call event.
+
+    RAISE cannot be enabled per code object; exception-path locals are read
+    from the traceback by the caller instead.
+
+    Args:
+        code_objects: Code objects whose returns should be observed
+        on_return: Callback receiving the returning frame
+
+    Returns:
+        A function that stops the capture, or None when sys.monitoring is
+        unavailable (Python < 3.12) or every candidate tool id is in use —
+        callers then fall back to sys.settrace.
+    """
+    monitoring = getattr(sys, "monitoring", None)
+    if monitoring is None:
+        return None
+
+    tool_id = next(
+        (t for t in _MONITORING_TOOL_IDS if monitoring.get_tool(t) is None), None
+    )
+    if tool_id is None:
+        return None
+
+    def _on_py_return(code: CodeType, instruction_offset: int, retval: Any) -> None:
+        try:
+            # Frame 1 is the returning frame of the monitored code object
+            on_return(sys._getframe(1))
+        except Exception as e:
+            # Variable capture is diagnostic only — never break the workflow
+            logger.debug(f"Variable capture failed for {code.co_name}: {e}")
+
+    monitoring.use_tool_id(tool_id, _MONITORING_TOOL_NAME)
+    monitoring.register_callback(tool_id, monitoring.events.PY_RETURN, _on_py_return)
+    for code in code_objects:
+        monitoring.set_local_events(tool_id, code, monitoring.events.PY_RETURN)
+
+    def stop() -> None:
+        for code in code_objects:
+            monitoring.set_local_events(tool_id, code, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(tool_id, monitoring.events.PY_RETURN, None)
+        monitoring.free_tool_id(tool_id)
+
+    return stop
+
+
 async def _execute_workflow_with_trace(
     func: Any,
     context: ExecutionContext,
@@ -781,10 +851,12 @@ async def _execute_workflow_with_trace(
     broadcaster: Any = None
 ) -> tuple[Any, dict[str, Any], list[str]]:
     """
-    Execute a workflow function with variable capture using sys.settrace().
+    Execute a workflow function with variable capture.
 
     This is the same approach used for scripts, ensuring consistency.
-    Captures all local variables from the function as it executes.
+    Captures the local variables of the workflow function (or a script's
+    main()) when it returns. On Python 3.12+ this uses sys.monitoring scoped
+    to that one code object; older interpreters fall back to sys.settrace.
     Streams logs in real-time via SignalR if broadcaster is provided.
 
     Args:
@@ -879,8 +951,9 @@ async def _execute_workflow_with_trace(
 
                 # Unified log streaming: Write to Redis Stream + publish to PubSub
                 # Redis Stream is the single source of truth for logs
-                # - PubSub delivers immediately to WebSocket clients
+                # - PubSub delivers to WebSocket clients
                 # - Background worker persists from Stream to Postgres
+                # The execution's log shipper batches both off this thread
                 try:
                     if STREAM_LOGGING_AVAILABLE and log_and_broadcast:
                         log_and_broadcast(
@@ -902,6 +975,11 @@ async def _execute_workflow_with_trace(
     handler = WorkflowLogHandler()
     handler.setLevel(logging.DEBUG)  # Capture all levels
 
+    # Ship streamed logs in batches from a background thread instead of two
+    # Redis round trips per record on the workflow's thread
+    if execution_id and STREAM_LOGGING_AVAILABLE and start_log_shipper:
+        start_log_shipper(execution_id)
+
     # Attach to root logger since workflows use logging.info() which goes to root
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Set logger level to capture DEBUG messages
@@ -1074,14 +1152,27 @@ async def _execute_workflow_with_trace(
             )
             set_write_buffer(buffer)
 
-        # Set up trace function for variable capture
-        sys.settrace(chained_trace_func if existing_trace else trace_func)
+        # Set up variable capture: sys.monitoring scoped to the workflow's
+        # own code object where available, sys.settrace otherwise. Decorated
+        # workflows are observed through the function they wrap.
+        capture_codes = [
+            getattr(func, '_capture_code', None) or inspect.unwrap(func).__code__
+        ]
+        stop_capture = _start_return_capture(
+            capture_codes,
+            lambda frame: capture_variables_from_locals(frame.f_locals),
+        )
+        if stop_capture is None:
+            sys.settrace(chained_trace_func if existing_trace else trace_func)
         try:
             # Run the workflow directly - isolation is provided by subprocess
             result = await _run_workflow_async()
         finally:
-            # Clear trace function
-            sys.settrace(None)
+            # Stop variable capture
+            if stop_capture is not None:
+                stop_capture()
+            else:
+                sys.settrace(None)
             # Clear context
             if BIFROST_CONTEXT_AVAILABLE:
                 clear_execution_context()
@@ -1151,6 +1242,10 @@ async def _execute_workflow_with_trace(
         # Note: trace function cleanup is handled in _run_workflow_in_thread
         # Clean up the logging handler
         root_logger.removeHandler(handler)
+        # Final synchronous flush so every log is in the stream before the
+        # result is reported (log persistence reads the stream after that)
+        if execution_id and STREAM_LOGGING_AVAILABLE and stop_log_shipper:
+            stop_log_shipper(execution_id)
         # Note: Extra params are now stored in context.parameters instead of being
         # injected into func.__globals__, so no cleanup needed here
 
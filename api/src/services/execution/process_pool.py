@@ -16,6 +16,8 @@ Key features:
 - Heartbeat publishing for UI visibility
 - Drain + template restart after pip install (so future forks pick up
   newly installed packages); also exposed as a manual "recycle" RPC
+- Optional hot-module preload: the most-used workspace modules are
+  imported into the template so forks inherit them initialised
 
 Architecture:
     ProcessPoolManager (runs in consumer process)
@@ -23,7 +25,8 @@ Architecture:
         +-- up to max_workers concurrent one-shot children
         +-- Each child: work_queue (in) + result_queue (out)
         +-- Monitor loop checks health and timeouts
-        +-- Result loop collects execution results
+        +-- Result pipes registered with the event loop; the result loop
+            handles each result (or child exit) as soon as it is readable
         +-- Heartbeat loop publishes status to Redis/WebSocket
 """
 
@@ -47,6 +50,12 @@ import psutil
 import redis.asyncio as redis
 
 from src.config import get_settings
+from src.core.module_cache import (
+    MODULE_CHANGED_CHANNEL,
+    MODULE_INDEX_KEY,
+    MODULE_KEY_PREFIX,
+    MODULE_USAGE_KEY,
+)
 from src.services.execution.memory_monitor import get_cgroup_memory, has_sufficient_memory_cgroup
 from src.models.contracts.notifications import NotificationCategory, NotificationCreate, NotificationStatus
 from src.services.execution.simple_worker import install_requirements, RequirementsInstallResult
@@ -55,6 +64,16 @@ from src.services.execution.template_process import TemplateProcess
 
 logger = logging.getLogger(__name__)
 
+# Coalesce bursts of module change notifications (e.g. a git sync rewriting
+# many files) into a single preload refresh.
+PRELOAD_REFRESH_DEBOUNCE_SECONDS = 1.0
+
+# Modules imported per preload exchange with the template, and how long one
+# exchange may take. The template lock is released between batches so forks
+# aren't held up for the whole preload.
+PRELOAD_BATCH_SIZE = 5
+PRELOAD_BATCH_TIMEOUT_SECONDS = 15.0
+
 
 async def _notify_requirements_failures(result: RequirementsInstallResult) -> None:
     """Publish a deduped admin notification when requirements failed to install.
@@ -310,6 +329,7 @@ class ProcessPoolManager:
         heartbeat_interval_seconds: int = 10,
         registration_ttl_seconds: int = 30,
         on_result: ResultCallback | None = None,
+        preload_modules: int = 0,
     ):
         """
         Initialize the process pool manager.
@@ -321,6 +341,8 @@ class ProcessPoolManager:
             heartbeat_interval_seconds: Interval for heartbeat publications
             registration_ttl_seconds: TTL for worker registration in Redis
             on_result: Async callback for handling execution results
+            preload_modules: Number of most-used workspace modules to
+                warm-import into the template (0 disables preloading)
         """
         self.max_workers = max_workers
         self.execution_timeout_seconds = execution_timeout_seconds
@@ -328,6 +350,7 @@ class ProcessPoolManager:
         self.heartbeat_interval_seconds = heartbeat_interval_seconds
         self.registration_ttl_seconds = registration_ttl_seconds
         self.on_result = on_result
+        self.preload_modules = preload_modules
 
         # Worker ID from HOSTNAME env var (Docker container name) or UUID
         self.worker_id = os.environ.get("HOSTNAME", str(uuid.uuid4()))
@@ -349,6 +372,8 @@ class ProcessPoolManager:
         self._heartbeat_task: asyncio.Task[None] | None = None
         self._cancel_task: asyncio.Task[None] | None = None
         self._command_task: asyncio.Task[None] | None = None
+        self._module_task: asyncio.Task[None] | None = None
+        self._preload_refresh_task: asyncio.Task[None] | None = None
 
         # Redis connection
         self._redis: redis.Redis | None = None  # type: ignore[type-arg]
@@ -366,6 +391,23 @@ class ProcessPoolManager:
         # finish rather than trying to fork while the template is down.
         self._restart_lock = asyncio.Lock()
 
+        # Handles whose result pipe became readable (a result arrived or the
+        # child exited). Filled by event-loop reader callbacks, drained by
+        # _result_loop.
+        self._ready_results: asyncio.Queue[ProcessHandle] = asyncio.Queue()
+
+        # Serializes request/response exchanges on the template's control
+        # pipe so a preload reply can never be read as a fork reply.
+        self._template_lock = asyncio.Lock()
+
+        # Hot-module preload state: path -> content hash of each workspace
+        # module imported into the current template, plus hit counters
+        # reported by children (a hit is an import served by the template).
+        self._preloaded_hashes: dict[str, str] = {}
+        self._preload_restart_pending = False
+        self._preload_hits = 0
+        self._preload_misses = 0
+
     async def _get_redis(self) -> redis.Redis:  # type: ignore[type-arg]
         """Get or create Redis connection."""
         if self._redis is None:
@@ -376,7 +418,7 @@ class ProcessPoolManager:
             )
         return self._redis
 
-    async def _start_template(self) -> None:
+    async def _start_template(self, preload: bool = True) -> None:
         """Start the template process for fork-based workers.
 
         The new TemplateProcess is only assigned to self._template AFTER
@@ -393,9 +435,13 @@ class ProcessPoolManager:
         new_template = TemplateProcess()
         await asyncio.to_thread(new_template.start)
         self._template = new_template
+        self._preloaded_hashes = {}
         logger.info(f"Template process started (PID={new_template.pid})")
 
-    async def restart_template(self) -> None:
+        if preload and self.preload_modules > 0:
+            await self._preload_template()
+
+    async def restart_template(self, preload: bool = True) -> None:
         """
         Restart the template process (e.g., after pip install).
 
@@ -405,9 +451,67 @@ class ProcessPoolManager:
             logger.info("Shutting down template process for restart")
             await asyncio.to_thread(self._template.shutdown)
 
-        await self._start_template()
+        await self._start_template(preload=preload)
         logger.info("Template process restarted")
 
+    async def _preload_template(self) -> None:
+        """
+        Warm-import the most-used workspace modules into the template.
+
+        Usage comes from the shared bifrost:module:usage counts. Only
+        modules not already in the template are sent, so this is cheap to
+        repeat. The sources are read here and handed over the control pipe
+        because the template itself must not talk to Redis. Modules are
+        imported ``PRELOAD_BATCH_SIZE`` at a time, releasing the template
+        lock between batches so forks interleave with a long preload.
+        """
+        if self._template is None:
+            return
+
+        try:
+            r = await self._get_redis()
+            hot = await r.zrevrange(MODULE_USAGE_KEY, 0, self.preload_modules - 1)
+            index = await r.smembers(MODULE_INDEX_KEY)  # type: ignore[misc]
+            wanted = [p for p in hot if p in index and p not in self._preloaded_hashes]
+            if not wanted:
+                return
+            raw = await r.mget([f"{MODULE_KEY_PREFIX}{p}" for p in wanted])
+            modules = [json.loads(data) for data in raw if data]
+        except Exception as e:
+            logger.warning(f"Could not read workspace modules for preload: {e}")
+            return
+
+        template = self._template
+        already = len(self._preloaded_hashes)
+        hashes = {m["path"]: m["hash"] for m in modules}
+        index_list = sorted(index)
+        targets = [m["path"] for m in modules]
+        for start in range(0, len(targets), PRELOAD_BATCH_SIZE):
+            if self._template is not template:
+                return  # Restarted meanwhile; the new template preloads itself
+            try:
+                async with self._template_lock:
+                    loaded = await asyncio.to_thread(
+                        template.preload,
+                        modules,
+                        index_list,
+                        targets[start:start + PRELOAD_BATCH_SIZE],
+                        PRELOAD_BATCH_TIMEOUT_SECONDS,
+                    )
+            except RuntimeError as e:
+                # The control pipe is in an unknown state after a failed
+                # exchange — replace the template rather than risk a fork
+                # reading a late preload reply.
+                logger.error(f"Template preload failed, restarting without preload: {e}")
+                await self.restart_template(preload=False)
+                return
+            for path in loaded:
+                self._preloaded_hashes[path] = hashes[path]
+        logger.info(
+            f"Template preloaded {len(self._preloaded_hashes) - already} new workspace module(s) "
+            f"({len(self._preloaded_hashes)} total)"
+        )
+
     async def drain_and_restart_template(self, drain_timeout: float = 60.0) -> None:
         """
         Drain in-flight executions and restart the template process so
@@ -488,9 +592,34 @@ class ProcessPoolManager:
         )
 
         self.processes[process_id] = handle
+        self._watch_result_pipe(handle)
         logger.info(f"Created worker {process_id} (PID={handle.pid})")
         return handle
 
+    def _watch_result_pipe(self, handle: ProcessHandle) -> None:
+        """
+        Register the handle's result pipe with the event loop.
+
+        The pipe becomes readable when the child sends its result, or at
+        EOF when the child exits without one — either way the result loop
+        hears about it immediately instead of on the next poll.
+        """
+        loop = asyncio.get_running_loop()
+        loop.add_reader(handle.result_queue.fileno(), self._on_result_readable, handle)
+
+    def _on_result_readable(self, handle: ProcessHandle) -> None:
+        """Event-loop reader callback: hand the handle to the result loop."""
+        self._unwatch_result_pipe(handle)
+        self._ready_results.put_nowait(handle)
+
+    def _unwatch_result_pipe(self, handle: ProcessHandle) -> None:
+        """Remove the handle's result pipe from the event loop (idempotent)."""
+        try:
+            asyncio.get_running_loop().remove_reader(handle.result_queue.fileno())
+        except (OSError, ValueError) as e:
+            # Pipe already closed — nothing registered any more
+            logger.debug(f"remove_reader for {handle.id} ignored: {e}")
+
     async def start(self) -> None:
         """
         Start the pool manager and spawn initial workers.
@@ -546,6 +675,11 @@ class ProcessPoolManager:
             self._command_listener_loop(),
             name="pool-command-listener"
         )
+        if self.preload_modules > 0:
+            self._module_task = asyncio.create_task(
+                self._module_listener_loop(),
+                name="pool-module-listener"
+            )
 
         logger.info("ProcessPoolManager started")
 
@@ -572,6 +706,8 @@ class ProcessPoolManager:
             self._heartbeat_task,
             self._cancel_task,
             self._command_task,
+            self._module_task,
+            self._preload_refresh_task,
         ]
         for task in tasks:
             if task and not task.done():
@@ -584,6 +720,7 @@ class ProcessPoolManager:
 
         # Terminate all processes
         for handle in list(self.processes.values()):
+            self._unwatch_result_pipe(handle)
             await self._terminate_process(handle)
 
         # Shutdown template process
@@ -663,6 +800,24 @@ class ProcessPoolManager:
             except asyncio.TimeoutError:
                 return False
 
+    async def wait_for_capacity(self, reserved: Callable[[], int]) -> None:
+        """
+        Wait until a slot is free beyond the `reserved()` executions the
+        caller has committed to routing but not yet routed.
+
+        Lets a consumer choose which execution takes the next free slot
+        instead of queueing every message in route_execution. Waiters are
+        woken by worker exits and by `release_capacity`.
+        """
+        async with self._slot_condition:
+            await self._slot_condition.wait_for(
+                lambda: len(self.processes) + reserved() < self.max_workers
+            )
+
+    async def release_capacity(self) -> None:
+        """Wake `wait_for_capacity` waiters after a reservation is dropped."""
+        await self._notify_slot_free()
+
     async def route_execution(
         self,
         execution_id: str,
@@ -706,7 +861,8 @@ class ProcessPoolManager:
                 raise RuntimeError("No worker slot available after timeout")
 
         # Fork the worker. _fork_process returns a handle already in BUSY.
-        handle = self._fork_process()
+        async with self._template_lock:
+            handle = self._fork_process()
 
         # Get timeout from context or use default
         timeout = context.get("timeout_seconds", self.execution_timeout_seconds)
@@ -786,6 +942,11 @@ class ProcessPoolManager:
                         await cleanup_stale_entries()
                     except Exception as e:
                         logger.warning(f"Queue cleanup error: {e}")
+
+                    # Same cadence: pick up modules that became hot and
+                    # catch any module change notification we missed.
+                    if self.preload_modules > 0:
+                        await self._verify_preloaded_modules()
             except Exception as e:
                 logger.exception(f"Monitor loop error: {e}")
 
@@ -839,6 +1000,7 @@ class ProcessPoolManager:
         # work to this process during the graceful_shutdown_seconds sleep.
         handle.state = ProcessState.KILLED
         handle.killed_at = datetime.now(timezone.utc)
+        self._unwatch_result_pipe(handle)
 
         pid = handle.pid
         if pid is None:
@@ -977,6 +1139,140 @@ class ProcessPoolManager:
 
         logger.info("Command listener loop stopped")
 
+    async def _module_listener_loop(self) -> None:
+        """
+        Listen for workspace module changes via Redis pub/sub.
+
+        Only runs when hot-module preload is enabled. Changes to a module
+        the template has preloaded trigger a drain + template restart;
+        any other change triggers a (debounced) preload refresh so newly
+        hot modules get picked up.
+        """
+        logger.info("Module listener loop started")
+
+        while not self._shutdown:
+            pubsub = None
+            try:
+                r = await self._get_redis()
+                pubsub = r.pubsub()
+                await pubsub.subscribe(MODULE_CHANGED_CHANNEL)
+
+                while not self._shutdown:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=1.0,
+                    )
+                    if message and message["type"] == "message":
+                        data = json.loads(message["data"])
+                        self._on_module_changed(data.get("path", ""), data.get("hash"))
+            except Exception as e:
+                logger.error(f"Module listener error: {e}; reconnecting in 1s")
+                await asyncio.sleep(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.unsubscribe(MODULE_CHANGED_CHANNEL)
+                        await pubsub.aclose()
+                    except Exception as e:
+                        # Already-closed pubsub or Redis disconnect — best-effort cleanup
+                        logger.debug(f"module listener pubsub cleanup failed: {e}")
+
+        logger.info("Module listener loop stopped")
+
+    def _on_module_changed(self, path: str, content_hash: str | None) -> None:
+        """
+        React to a workspace module change.
+
+        Args:
+            path: Module path that changed
+            content_hash: New content hash, or None if the module was deleted
+        """
+        preloaded_hash = self._preloaded_hashes.get(path)
+        restart = preloaded_hash is not None and preloaded_hash != content_hash
+        self._schedule_preload_refresh(restart=restart)
+
+    def _schedule_preload_refresh(self, restart: bool) -> None:
+        """Start the preload refresh task unless one is already running."""
+        if restart:
+            self._preload_restart_pending = True
+        if self._preload_refresh_task is None or self._preload_refresh_task.done():
+            self._preload_refresh_task = asyncio.create_task(
+                self._refresh_preload(),
+                name="pool-preload-refresh",
+            )
+
+    async def _refresh_preload(self) -> None:
+        """
+        Apply pending preload work.
+
+        A changed preloaded module restarts the template immediately (the
+        restart re-runs the preload with current sources) — until then new
+        forks would inherit stale code. Additive refreshes are debounced.
+        """
+        while not self._shutdown:
+            if self._preload_restart_pending:
+                self._preload_restart_pending = False
+                logger.info("Preloaded workspace module changed — restarting template")
+                await self.drain_and_restart_template()
+            else:
+                await asyncio.sleep(PRELOAD_REFRESH_DEBOUNCE_SECONDS)
+                if self._preload_restart_pending:
+                    continue
+                async with self._restart_lock:
+                    await self._preload_template()
+
+            if not self._preload_restart_pending:
+                return
+
+    async def _verify_preloaded_modules(self) -> None:
+        """
+        Re-check preloaded module hashes against Redis and refresh.
+
+        Safety net for lost pub/sub notifications; also gives modules that
+        became hot since the last refresh a chance to be preloaded.
+        """
+        restart = False
+        if self._preloaded_hashes:
+            try:
+                r = await self._get_redis()
+                paths = list(self._preloaded_hashes)
+                raw = await r.mget([f"{MODULE_KEY_PREFIX}{p}" for p in paths])
+                for path, data in zip(paths, raw):
+                    current = json.loads(data).get("hash") if data else None
+                    if current != self._preloaded_hashes[path]:
+                        restart = True
+                        break
+            except Exception as e:
+                logger.warning(f"Could not verify preloaded modules: {e}")
+                return
+        self._schedule_preload_refresh(restart=restart)
+
+    async def _record_module_usage(self, usage: dict[str, Any]) -> None:
+        """
+        Record which workspace modules an execution imported.
+
+        Feeds the shared usage counts that pick the preload set, and the
+        hit/miss counters reported in the heartbeat.
+
+        Args:
+            usage: Child-reported {"used": [paths], "hits": int}
+        """
+        used = usage.get("used") or []
+        hits = int(usage.get("hits", 0))
+        self._preload_hits += hits
+        self._preload_misses += max(len(used) - hits, 0)
+        if not used:
+            return
+
+        try:
+            r = await self._get_redis()
+            pipe = r.pipeline(transaction=False)
+            for path in used:
+                pipe.zincrby(MODULE_USAGE_KEY, 1, path)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Failed to record module usage: {e}")
+
     async def _handle_command(self, command: dict[str, Any]) -> None:
         """
         Dispatch a pool management command to the appropriate handler.
@@ -1236,32 +1532,67 @@ class ProcessPoolManager:
 
     async def _result_loop(self) -> None:
         """
-        Collect results from all process result queues.
+        Collect results as their pipes become readable.
 
-        Polls result queues from all processes (non-blocking) and
-        handles completed executions.
+        Reader callbacks registered by _watch_result_pipe enqueue handles the
+        moment a child writes its result or exits, so there is no polling
+        delay and no per-tick cost proportional to max_workers.
         """
         logger.info("Result loop started")
 
         while not self._shutdown:
+            handle = await self._ready_results.get()
             try:
-                for handle in list(self.processes.values()):
-                    try:
-                        result = handle.result_queue.get_nowait()
-                        await self._handle_result(handle, result)
-                    except Empty:
-                        # Hot polling loop — Empty is the common case (no work ready).
-                        # Logging here would flood at 10Hz × N processes; intentionally silent.
-                        pass
-                    except Exception as e:
-                        logger.exception(f"Result loop error for {handle.id}: {e}")
+                await self._collect_result(handle)
             except Exception as e:
-                logger.exception(f"Result loop error: {e}")
-
-            await asyncio.sleep(0.1)
+                logger.exception(f"Result loop error for {handle.id}: {e}")
 
         logger.info("Result loop stopped")
 
+    async def _collect_result(self, handle: ProcessHandle) -> None:
+        """
+        Read a readable result pipe and dispatch what it holds.
+
+        Args:
+            handle: ProcessHandle whose result pipe signalled readiness
+        """
+        try:
+            result = handle.result_queue.get_nowait()
+        except Empty:
+            # Spurious wakeup — keep listening while the child is tracked
+            if handle.id in self.processes:
+                self._watch_result_pipe(handle)
+            return
+        except (EOFError, OSError):
+            # Child exited without sending a result
+            handle.result_queue.close()
+            await self._handle_child_exit(handle)
+            return
+
+        handle.result_queue.close()
+        await self._handle_result(handle, result)
+
+    async def _handle_child_exit(self, handle: ProcessHandle) -> None:
+        """
+        Handle a child whose result pipe hit EOF before any result.
+
+        Kills (cancel/timeout) report through their own paths; anything
+        else still BUSY is a crash and is reported now rather than on the
+        next health check.
+
+        Args:
+            handle: ProcessHandle whose child has exited
+        """
+        if handle.id not in self.processes or handle.state == ProcessState.KILLED:
+            return
+
+        logger.warning(f"Process {handle.id} exited without a result (PID={handle.pid})")
+        if handle.current_execution and not handle.result_reported:
+            await self._report_crash(handle)
+
+        if self.processes.pop(handle.id, None) is not None:
+            await self._notify_slot_free()
+
     async def _handle_result(
         self,
         handle: ProcessHandle,
@@ -1277,6 +1608,15 @@ class ProcessPoolManager:
             handle: ProcessHandle that produced the result
             result: Result data from the worker
         """
+        # A timeout or cancel already reported this execution and killed
+        # the process; a result it queued before dying is stale.
+        if handle.result_reported or handle.state == ProcessState.KILLED:
+            return
+
+        # Child-side module usage report — internal to the pool, never
+        # forwarded to the result callback.
+        usage = result.pop("workspace_modules", None)
+
         # Mark result as reported before clearing current_execution so the invariant
         # ("result_reported=True once on_result has fired") holds for external observers.
         handle.result_reported = True
@@ -1298,6 +1638,9 @@ class ProcessPoolManager:
             except Exception as e:
                 logger.exception(f"Error in result callback: {e}")
 
+        if usage and self.preload_modules > 0:
+            await self._record_module_usage(usage)
+
     async def _notify_slot_free(self) -> None:
         """Wake any tasks blocked in `_wait_for_slot`."""
         async with self._slot_condition:
@@ -1487,6 +1830,8 @@ class ProcessPoolManager:
 
         memory_current, memory_max = get_cgroup_memory()
 
+        preload_total = self._preload_hits + self._preload_misses
+
         return {
             "type": "worker_heartbeat",
             "worker_id": self.worker_id,
@@ -1502,6 +1847,12 @@ class ProcessPoolManager:
             "requirements_total": self._requirements_total,
             "memory_current_bytes": memory_current,
             "memory_max_bytes": memory_max,
+            "preloaded_modules": len(self._preloaded_hashes),
+            "preload_hits": self._preload_hits,
+            "preload_misses": self._preload_misses,
+            "preload_hit_rate": (
+                self._preload_hits / preload_total if preload_total else None
+            ),
         }
 
     def _get_process_memory(self, pid: int | None) -> float:
@@ -1582,6 +1933,7 @@ def get_process_pool() -> ProcessPoolManager:
             graceful_shutdown_seconds=settings.graceful_shutdown_seconds,
             heartbeat_interval_seconds=settings.worker_heartbeat_interval_seconds,
             registration_ttl_seconds=settings.worker_registration_ttl_seconds,
+            preload_modules=settings.template_preload_modules,
         )
     return _pool
 
@@ -2,10 +2,13 @@
 Queue position tracking for workflow executions.
 
 Uses a Redis sorted set to track pending executions and provide
-queue position visibility. Updates are event-driven - positions
-are recalculated and published when the queue changes.
+queue position visibility. Updates are event-driven: queue mutations
+schedule a coalesced broadcast (at most one per
+``QUEUE_BROADCAST_INTERVAL``) that publishes positions to the
+executions whose position actually changed, in one pipelined round trip.
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -19,22 +22,137 @@ logger = logging.getLogger(__name__)
 # Redis key for the queue sorted set
 QUEUE_KEY = "bifrost:queue:pending"
 
+# Minimum delay between coalesced queue position broadcasts (seconds)
+QUEUE_BROADCAST_INTERVAL = 0.25
+
+_redis: aioredis.Redis | None = None
+_redis_loop: asyncio.AbstractEventLoop | None = None
+
 
 async def _get_redis() -> aioredis.Redis:
-    """Create a Redis client scoped to the caller's event loop."""
-    settings = get_settings()
-    return aioredis.from_url(
-        settings.redis_url,
-        decode_responses=True,
-        socket_timeout=5.0,
-        socket_connect_timeout=5.0,
-    )
+    """
+    Get the pooled Redis client for the caller's event loop.
+
+    Redis connections are bound to the loop that opened them, so the
+    client is recreated if the running loop changes, and the previous
+    one is closed rather than left holding its connections.
+    """
+    global _redis, _redis_loop
+    loop = asyncio.get_running_loop()
+    if _redis is None or _redis_loop is not loop:
+        previous, previous_loop = _redis, _redis_loop
+        settings = get_settings()
+        _redis = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=5.0,
+            socket_connect_timeout=5.0,
+        )
+        _redis_loop = loop
+        if previous is not None:
+            await _close_client(previous, previous_loop)
+    return _redis
+
+
+async def _close_client(
+    client: aioredis.Redis, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a client from another loop, on that loop if it is still running."""
+    try:
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Failed to close previous queue tracker Redis client: {e}")
 
 
-async def _close_redis(r: aioredis.Redis) -> None:
-    close = getattr(r, "aclose", None)
-    if close is not None:
-        await close()
+class QueuePositionBroadcaster:
+    """
+    Coalesces queue position broadcasts.
+
+    ``request()`` schedules a single flush ``interval`` seconds out; any
+    further requests before it runs are folded into it. A flush reads the
+    queue once and publishes only to executions whose position differs
+    from the one this process last published for them.
+    """
+
+    def __init__(self, interval: float = QUEUE_BROADCAST_INTERVAL) -> None:
+        self.interval = interval
+        self._pending = False
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+        self._published: dict[str, int] = {}
+
+    def request(self) -> None:
+        """Schedule a broadcast unless one is already pending."""
+        if self._pending:
+            return
+        self._pending = True
+        task = asyncio.create_task(self._run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self) -> None:
+        await asyncio.sleep(self.interval)
+        # Mutations from here on need a fresh read of the queue
+        self._pending = False
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Queue position broadcast failed: {e}")
+
+    async def flush(self) -> int:
+        """
+        Publish changed queue positions now.
+
+        Returns:
+            Number of executions an update was published to
+        """
+        from src.core.pubsub import publish_execution_updates
+
+        async with self._lock:
+            positions = await get_all_queue_positions()
+            changed = [
+                (exec_id, position)
+                for exec_id, position in positions
+                if self._published.get(exec_id) != position
+            ]
+            if changed:
+                await publish_execution_updates([
+                    (exec_id, "Pending", {"queuePosition": position, "waitReason": "queued"})
+                    for exec_id, position in changed
+                ])
+            # Queued executions only move towards the front, so a position
+            # equal to the one we last sent is still what the client shows,
+            # even if another process published in between.
+            self._published = dict(positions)
+            return len(changed)
+
+    async def wait(self) -> None:
+        """Wait for scheduled and in-flight broadcasts to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+
+_broadcasters: dict[asyncio.AbstractEventLoop, QueuePositionBroadcaster] = {}
+
+
+def get_queue_broadcaster() -> QueuePositionBroadcaster:
+    """Get the queue position broadcaster for the running event loop."""
+    loop = asyncio.get_running_loop()
+    broadcaster = _broadcasters.get(loop)
+    if broadcaster is None:
+        # Drop broadcasters left behind by closed loops
+        for stale in [lp for lp in _broadcasters if lp.is_closed()]:
+            del _broadcasters[stale]
+        broadcaster = _broadcasters[loop] = QueuePositionBroadcaster()
+    return broadcaster
+
+
+def schedule_queue_position_broadcast() -> None:
+    """Request a coalesced queue position broadcast."""
+    get_queue_broadcaster().request()
 
 
 async def add_to_queue(execution_id: str) -> int:
@@ -48,22 +166,19 @@ async def add_to_queue(execution_id: str) -> int:
         Position in queue (1-based)
     """
     r = await _get_redis()
-    try:
-        timestamp = time.time()
+    timestamp = time.time()
 
-        # Add to sorted set with timestamp as score
-        await r.zadd(QUEUE_KEY, {execution_id: timestamp})
+    # Add to sorted set with timestamp as score
+    await r.zadd(QUEUE_KEY, {execution_id: timestamp})
 
-        # Get position (0-based rank + 1 for 1-based position)
-        rank = await r.zrank(QUEUE_KEY, execution_id)
-        position = (rank + 1) if rank is not None else 1
-    finally:
-        await _close_redis(r)
+    # Get position (0-based rank + 1 for 1-based position)
+    rank = await r.zrank(QUEUE_KEY, execution_id)
+    position = (rank + 1) if rank is not None else 1
 
     logger.debug(f"Added execution {execution_id} to queue at position {position}")
 
-    # Publish updated positions to all queued executions
-    await publish_all_queue_positions()
+    # Publish updated positions to queued executions (coalesced)
+    schedule_queue_position_broadcast()
 
     return position
 
@@ -78,16 +193,12 @@ async def remove_from_queue(execution_id: str) -> None:
         execution_id: Execution ID to remove
     """
     r = await _get_redis()
-    try:
-        # Remove from sorted set
-        removed = await r.zrem(QUEUE_KEY, execution_id)
-    finally:
-        await _close_redis(r)
+    removed = await r.zrem(QUEUE_KEY, execution_id)
 
     if removed:
         logger.debug(f"Removed execution {execution_id} from queue")
-        # Publish updated positions to remaining queued executions
-        await publish_all_queue_positions()
+        # Publish updated positions to remaining queued executions (coalesced)
+        schedule_queue_position_broadcast()
 
 
 async def get_queue_position(execution_id: str) -> int | None:
@@ -101,10 +212,7 @@ async def get_queue_position(execution_id: str) -> int | None:
         Position (1-based) or None if not in queue
     """
     r = await _get_redis()
-    try:
-        rank = await r.zrank(QUEUE_KEY, execution_id)
-    finally:
-        await _close_redis(r)
+    rank = await r.zrank(QUEUE_KEY, execution_id)
 
     if rank is not None:
         return rank + 1  # Convert 0-based to 1-based
@@ -119,10 +227,7 @@ async def get_queue_depth() -> int:
         Queue depth (number of pending executions)
     """
     r = await _get_redis()
-    try:
-        return await r.zcard(QUEUE_KEY)
-    finally:
-        await _close_redis(r)
+    return await r.zcard(QUEUE_KEY)
 
 
 async def get_all_queue_positions() -> list[tuple[str, int]]:
@@ -133,11 +238,8 @@ async def get_all_queue_positions() -> list[tuple[str, int]]:
         List of (execution_id, position) tuples, ordered by position
     """
     r = await _get_redis()
-    try:
-        # Get all members in order (lowest score = earliest = position 1)
-        members = await r.zrange(QUEUE_KEY, 0, -1)
-    finally:
-        await _close_redis(r)
+    # Get all members in order (lowest score = earliest = position 1)
+    members = await r.zrange(QUEUE_KEY, 0, -1)
 
     # Return as list of (execution_id, 1-based position) tuples
     return [(member, idx + 1) for idx, member in enumerate(members)]
@@ -145,10 +247,10 @@ async def get_all_queue_positions() -> list[tuple[str, int]]:
 
 async def publish_all_queue_positions() -> None:
     """
-    Publish current queue position to all queued executions.
+    Publish current queue position to all queued executions immediately.
 
-    Called after any queue mutation (add/remove) to update
-    all waiting clients with their new positions.
+    Queue mutations use ``schedule_queue_position_broadcast`` instead;
+    this is the uncoalesced, publish-to-everyone variant.
     """
     from src.core.pubsub import publish_execution_update
 
@@ -183,17 +285,14 @@ async def cleanup_stale_entries(max_age_seconds: int = 600) -> int:
         Number of entries removed
     """
     r = await _get_redis()
-    try:
-        cutoff = time.time() - max_age_seconds
+    cutoff = time.time() - max_age_seconds
 
-        # Remove entries with score (timestamp) less than cutoff
-        removed = await r.zremrangebyscore(QUEUE_KEY, "-inf", cutoff)
-    finally:
-        await _close_redis(r)
+    # Remove entries with score (timestamp) less than cutoff
+    removed = await r.zremrangebyscore(QUEUE_KEY, "-inf", cutoff)
 
     if removed:
         logger.info(f"Cleaned up {removed} stale queue entries")
-        await publish_all_queue_positions()
+        schedule_queue_position_broadcast()
 
     return removed
 
@@ -207,37 +306,30 @@ async def get_all_pending_executions() -> list[dict]:
         organization_name, and queued_at for each pending execution.
     """
     r = await _get_redis()
-    try:
-        # Get execution IDs from sorted set
-        exec_ids = await r.zrange(QUEUE_KEY, 0, -1)
-
-        items = []
-        for exec_id in exec_ids:
-            # Get execution context from Redis (stored when queued)
-            context = await r.get(f"bifrost:exec:{exec_id}:context")
-            if context:
-                try:
-                    data = json.loads(context)
-                    items.append({
-                        "execution_id": exec_id,
-                        "workflow_id": data.get("workflow_id"),
-                        "workflow_name": data.get("name"),
-                        "organization_name": data.get("organization", {}).get("name")
-                        if isinstance(data.get("organization"), dict)
-                        else None,
-                        "queued_at": data.get("queued_at"),
-                    })
-                except json.JSONDecodeError:
-                    # Invalid context, include execution_id only
-                    items.append({
-                        "execution_id": exec_id,
-                        "workflow_id": None,
-                        "workflow_name": None,
-                        "organization_name": None,
-                        "queued_at": None,
-                    })
-            else:
-                # No context found, include execution_id only
+    # Get execution IDs from sorted set
+    exec_ids = await r.zrange(QUEUE_KEY, 0, -1)
+    if not exec_ids:
+        return []
+
+    # Get execution contexts from Redis (stored when queued) in one round trip
+    contexts = await r.mget([f"bifrost:exec:{exec_id}:context" for exec_id in exec_ids])
+
+    items = []
+    for exec_id, context in zip(exec_ids, contexts):
+        if context:
+            try:
+                data = json.loads(context)
+                items.append({
+                    "execution_id": exec_id,
+                    "workflow_id": data.get("workflow_id"),
+                    "workflow_name": data.get("name"),
+                    "organization_name": data.get("organization", {}).get("name")
+                    if isinstance(data.get("organization"), dict)
+                    else None,
+                    "queued_at": data.get("queued_at"),
+                })
+            except json.JSONDecodeError:
+                # Invalid context, include execution_id only
                 items.append({
                     "execution_id": exec_id,
                     "workflow_id": None,
@@ -245,7 +337,14 @@ async def get_all_pending_executions() -> list[dict]:
                     "organization_name": None,
                     "queued_at": None,
                 })
-    finally:
-        await _close_redis(r)
+        else:
+            # No context found, include execution_id only
+            items.append({
+                "execution_id": exec_id,
+                "workflow_id": None,
+                "workflow_name": None,
+                "organization_name": None,
+                "queued_at": None,
+            })
 
     return items
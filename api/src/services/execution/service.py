@@ -336,7 +336,7 @@ async def run_workflow(
         input_data: Input parameters for the workflow
         form_id: Optional form ID if triggered by form
         transient: If True, don't persist execution record
-        sync: If True, wait for result via Redis BLPOP. If False, return PENDING immediately.
+        sync: If True, wait for result via the Redis result dispatcher. If False, return PENDING immediately.
 
     Returns:
         WorkflowExecutionResponse with execution results (or PENDING status if sync=False)
@@ -416,7 +416,7 @@ async def _enqueue_workflow_async(
     """
     Enqueue workflow for execution via RabbitMQ.
 
-    If sync=True, waits for result via Redis BLPOP.
+    If sync=True, waits for result via the Redis result dispatcher.
     If sync=False, returns immediately with PENDING status.
     """
     from src.services.execution.async_executor import enqueue_workflow_execution
@@ -440,8 +440,8 @@ async def _enqueue_workflow_async(
             status=ExecutionStatus.PENDING,
         )
 
-    # Wait for result via Redis BLPOP — use actual workflow timeout (+ 60s buffer)
-    # 0 = no timeout: cap at 86400 (24h) to prevent infinite BLPOP hang
+    # Wait for result — use actual workflow timeout (+ 60s buffer)
+    # 0 = no timeout: cap at 86400 (24h) to prevent an unbounded wait
     redis_client = get_redis_client()
     workflow_meta = await get_workflow_metadata_only(workflow_id)
     if workflow_meta.timeout_seconds > 0:
@@ -519,7 +519,7 @@ async def execute_tool(
     """
     Execute a workflow as a tool (for AI agent tool calls).
 
-    Uses sync execution via RabbitMQ with Redis BLPOP for result.
+    Uses sync execution via RabbitMQ with the Redis result dispatcher for result.
 
     Args:
         workflow_id: Workflow UUID
@@ -12,6 +12,10 @@ The template process NEVER:
 - Initializes thread-based logging handlers
 
 This ensures clean fork behavior (no inherited locked mutexes).
+
+Optionally the consumer hands the template the sources of its hottest
+workspace modules (CMD_PRELOAD); the template imports them from those
+sources alone, so children inherit them already initialised.
 """
 
 from __future__ import annotations
@@ -78,6 +82,10 @@ class _RecvQueue:
         """Receive an item without blocking."""
         return self.get(block=False)
 
+    def fileno(self) -> int:
+        """File descriptor of the pipe, for event-loop readiness callbacks."""
+        return self._conn.fileno()
+
     def close(self) -> None:
         try:
             self._conn.close()
@@ -87,6 +95,7 @@ class _RecvQueue:
 
 # Commands sent from consumer to template via pipe
 CMD_FORK = "fork"
+CMD_PRELOAD = "preload"
 CMD_SHUTDOWN = "shutdown"
 
 
@@ -258,9 +267,53 @@ def _template_main(
             result_send: Connection = cmd["result_send"]
             _handle_fork_request(pipe, worker_id, persistent, work_recv, result_send)
 
+        if cmd.get("action") == CMD_PRELOAD:
+            _handle_preload_request(
+                pipe, cmd.get("modules", []), cmd.get("index", []), cmd.get("targets")
+            )
+
     logger.info("Template process exiting")
 
 
+def _handle_preload_request(
+    pipe: Connection,
+    modules: list[dict[str, Any]],
+    index: list[str],
+    targets: list[str] | None = None,
+) -> None:
+    """
+    Warm-import workspace modules so future forks inherit them initialised.
+
+    The consumer supplies the module sources; the template never fetches
+    them itself, so it still opens no Redis connections before forking.
+
+    Args:
+        pipe: Control pipe to send the response back to the consumer.
+        modules: CachedModule payloads ({path, content, hash}) to import.
+        index: Full workspace module index.
+        targets: Paths to import (default: all of ``modules``).
+    """
+    import threading
+
+    loaded: list[str] = []
+    threads_before = threading.active_count()
+    try:
+        from src.services.execution.virtual_import import preload_workspace_modules
+        loaded = preload_workspace_modules(modules, set(index), targets)  # type: ignore[arg-type]
+    except Exception as e:
+        logger.exception(f"Workspace module preload failed: {e}")
+
+    if threading.active_count() > threads_before:
+        # Forking with live threads risks inherited locked mutexes.
+        logger.warning(
+            "Workspace module preload started background threads; "
+            "forked children may deadlock. Exclude such modules from preload."
+        )
+
+    logger.info(f"Preloaded {len(loaded)}/{len(targets or modules)} workspace module(s)")
+    pipe.send({"status": "preloaded", "loaded": loaded})
+
+
 def _handle_fork_request(
     pipe: Connection,
     worker_id: str,
@@ -366,6 +419,14 @@ def _run_forked_child(
 
     logger.info(f"Forked worker {worker_id} started (PID={os.getpid()}, persistent={persistent})")
 
+    # Hand template-preloaded workspace modules to the finder so their use
+    # can be reported back to the pool.
+    try:
+        from src.services.execution.virtual_import import park_preloaded_modules
+        park_preloaded_modules()
+    except ImportError as e:
+        logger.debug(f"park_preloaded_modules unavailable: {e}")
+
     execution_id: str | None = None
 
     while not shutdown_requested:
@@ -404,6 +465,14 @@ def _run_forked_child(
                     "worker_id": worker_id,
                 }
 
+            # Report which workspace modules this execution imported, and how
+            # many came from the template's preload (pool strips this key).
+            try:
+                from src.services.execution.virtual_import import get_preload_usage
+                result["workspace_modules"] = get_preload_usage()
+            except ImportError as e:
+                logger.debug(f"get_preload_usage unavailable: {e}")
+
             # Clean up per-execution state
             try:
                 from bifrost._logging import clear_sequence_counter
@@ -585,6 +654,46 @@ class TemplateProcess:
             result_queue,
         )
 
+    def preload(
+        self,
+        modules: list[dict[str, Any]],
+        index: list[str],
+        targets: list[str] | None = None,
+        timeout: float = 60.0,
+    ) -> list[str]:
+        """
+        Ask the template to warm-import workspace modules.
+
+        Must not run concurrently with fork() — both use the control pipe.
+
+        Args:
+            modules: CachedModule payloads ({path, content, hash}) to import.
+            index: Full workspace module index (for namespace resolution).
+            targets: Paths to import (default: all of ``modules``); the other
+                sources only resolve their imports.
+            timeout: Seconds to wait for the template to finish importing.
+
+        Returns:
+            Paths the template successfully imported.
+
+        Raises:
+            RuntimeError: If template is not running or does not respond.
+        """
+        if self._pipe is None or not self.is_alive():
+            raise RuntimeError("Template process is not running")
+
+        self._pipe.send(
+            {"action": CMD_PRELOAD, "modules": modules, "index": index, "targets": targets}
+        )
+
+        if not self._pipe.poll(timeout=timeout):
+            raise RuntimeError(f"Template process did not finish preload within {timeout}s")
+
+        msg = self._pipe.recv()
+        if msg.get("status") != "preloaded":
+            raise RuntimeError(f"Unexpected preload response: {msg}")
+        return list(msg.get("loaded", []))
+
     def shutdown(self) -> None:
         """Send shutdown command to template and wait for it to exit."""
         if self._pipe is not None:
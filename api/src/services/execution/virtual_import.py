@@ -21,22 +21,44 @@ during find_spec() because the import system itself may trigger imports
 2. Early exit for known stdlib module prefixes
 """
 
+import importlib
 import logging
+import marshal
 import sys
 import threading
 from importlib.abc import Loader, MetaPathFinder
 from importlib.machinery import ModuleSpec
 from pathlib import Path
-from types import ModuleType
+from types import CodeType, ModuleType
 from typing import Any
 
-from src.core.module_cache_sync import get_module_index_sync, get_module_sync
+from src.core.module_cache import CachedModule
+from src.core.module_cache_sync import (
+    get_module_code_sync,
+    get_module_index_sync,
+    get_module_sync,
+    set_module_code_sync,
+)
 
 logger = logging.getLogger(__name__)
 
 # Thread-local storage for recursion guard
 _thread_local = threading.local()
 
+# Hot-module preload state (see preload_workspace_modules / park_preloaded_modules).
+# While _offline_sources is set, the finder resolves workspace modules only from
+# it and never touches Redis - the template process must not open connections
+# that forked children would inherit.
+_offline_sources: dict[str, CachedModule] | None = None
+_offline_index: frozenset[str] = frozenset()
+
+# Modules warm-imported by the template, moved out of sys.modules in the
+# forked child and handed back by the finder on first import so each use
+# can be counted as a preload hit.
+_parked_modules: dict[str, ModuleType] = {}
+_preload_hits: set[str] = set()
+_preload_misses: set[str] = set()
+
 # Standard library module prefixes that we should NEVER try to load from Redis.
 # These modules are needed by Python's import system itself or by Redis client.
 # Adding to this list prevents infinite recursion.
@@ -201,8 +223,10 @@ class VirtualModuleLoader(Loader):
     """
     Loads module content from cached source code.
 
-    Compiles and executes Python code in the module's namespace,
-    setting __file__ to the relative path for meaningful tracebacks.
+    Executes Python code in the module's namespace, setting __file__ to
+    the relative path for meaningful tracebacks. When a content hash is
+    known, the marshalled code object is read from the bytecode cache
+    instead of recompiling the source in every forked worker.
     """
 
     def __init__(self, path: str, content: str, is_package: bool = False, content_hash: str = ""):
@@ -237,9 +261,8 @@ class VirtualModuleLoader(Loader):
             # Use the directory portion of the relative path
             module.__path__ = [str(Path(self.path).parent)]
 
-        # Compile and execute
         try:
-            code = compile(self.content, filename=self.path, mode="exec")
+            code = self._load_code()
             exec(code, module.__dict__)
         except SyntaxError as e:
             logger.error(f"Syntax error in virtual module {self.path}: {e}")
@@ -248,6 +271,47 @@ class VirtualModuleLoader(Loader):
             logger.error(f"Error executing virtual module {self.path}: {e}")
             raise
 
+    def _load_code(self) -> CodeType:
+        """
+        Return the module's code object, preferring the bytecode cache.
+
+        Without a content hash there is no safe cache key, so the source
+        is always compiled. On a cache miss the freshly compiled code is
+        written back so the next worker can skip compilation.
+        """
+        if not self.content_hash or _offline_sources is not None:
+            return compile(self.content, filename=self.path, mode="exec", dont_inherit=True)
+
+        cached = get_module_code_sync(self.path, self.content_hash)
+        if cached is not None:
+            try:
+                return marshal.loads(cached)
+            except (EOFError, ValueError, TypeError) as e:
+                logger.warning(f"Discarding corrupt bytecode for {self.path}: {e}")
+
+        code = compile(self.content, filename=self.path, mode="exec", dont_inherit=True)
+        set_module_code_sync(self.path, self.content_hash, marshal.dumps(code))
+        return code
+
+
+class PreloadedModuleLoader(Loader):
+    """
+    Re-registers a module that was already executed in the template process.
+
+    The module object (and all the state its top-level code built) is
+    reused as-is, so nothing is fetched from Redis or re-executed.
+    """
+
+    def __init__(self, module: ModuleType):
+        self.module = module
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        """Return the preloaded module instead of creating a new one."""
+        return self.module
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Nothing to execute - the template already ran the module body."""
+
 
 class VirtualModuleFinder(MetaPathFinder):
     """
@@ -318,16 +382,29 @@ class VirtualModuleFinder(MetaPathFinder):
         This ensures newly-added modules are immediately available
         without needing to refresh a cached index.
         """
+        parked = _parked_modules.pop(fullname, None)
+        if parked is not None and self._parked_is_current(fullname, parked):
+            return self._preloaded_spec(fullname, parked)
+
         # Convert module name to potential file paths
         possible_paths = self._module_name_to_paths(fullname)
 
         for file_path, is_package in possible_paths:
-            # Fetch directly from Redis - no index check needed
-            # This ensures newly-added modules are immediately available
-            cached = get_module_sync(file_path)
+            if _offline_sources is not None:
+                cached = _offline_sources.get(file_path)
+                if cached is None and file_path in _offline_index:
+                    # Exists in the workspace but wasn't handed to us - abort
+                    # this preload rather than fetch from Redis.
+                    raise ImportError(f"{fullname} is not part of the preload set")
+            else:
+                # Fetch directly from Redis - no index check needed
+                # This ensures newly-added modules are immediately available
+                cached = get_module_sync(file_path)
             if not cached:
                 continue
 
+            _preload_misses.add(file_path)
+
             # Create loader and spec
             loader = VirtualModuleLoader(file_path, cached["content"], is_package, cached.get("hash", ""))
             spec = ModuleSpec(
@@ -347,7 +424,7 @@ class VirtualModuleFinder(MetaPathFinder):
         prefix = f"{base_path}/"
 
         # Get the module index and check if any modules exist under this prefix
-        module_index = get_module_index_sync()
+        module_index = _offline_index if _offline_sources is not None else get_module_index_sync()
         has_submodules = any(path.startswith(prefix) for path in module_index)
 
         if has_submodules:
@@ -366,6 +443,41 @@ class VirtualModuleFinder(MetaPathFinder):
         # Not in our cache - let filesystem finder handle it
         return None
 
+    def _parked_is_current(self, fullname: str, module: ModuleType) -> bool:
+        """
+        Whether a parked template module still matches the workspace source.
+
+        The template may have been forked before an edit's invalidation
+        reached the pool; a stale module is dropped so the caller loads the
+        current source from Redis instead.
+        """
+        content_hash = getattr(module, "__content_hash__", None)
+        file_path = getattr(module, "__file__", None)
+        if not content_hash or not file_path:
+            return True  # Namespace package: no source to go stale
+        cached = get_module_sync(file_path)
+        if cached is not None and cached.get("hash") == content_hash:
+            return True
+        logger.info(f"Preloaded {fullname} is out of date; loading current source")
+        return False
+
+    def _preloaded_spec(self, fullname: str, module: ModuleType) -> ModuleSpec:
+        """Build a spec that hands a parked template module back to the importer."""
+        is_package = hasattr(module, "__path__")
+        spec = ModuleSpec(
+            fullname,
+            PreloadedModuleLoader(module),
+            is_package=is_package,
+            origin=getattr(module, "__file__", None),
+        )
+        if is_package:
+            spec.submodule_search_locations = list(module.__path__)
+        file_path = getattr(module, "__file__", None)
+        if file_path:
+            _preload_hits.add(file_path)
+        logger.debug(f"Preloaded import: {fullname}")
+        return spec
+
     def _module_name_to_paths(self, fullname: str) -> list[tuple[str, bool]]:
         """
         Convert module name to potential file paths.
@@ -510,3 +622,104 @@ def get_virtual_finder() -> VirtualModuleFinder | None:
         The active VirtualModuleFinder or None if not installed
     """
     return _finder
+
+
+def _module_name_for_path(path: str) -> str:
+    """Convert a workspace path to its module name ("shared/x/__init__.py" -> "shared.x")."""
+    return path.replace("/", ".").removesuffix(".py").removesuffix(".__init__")
+
+
+def preload_workspace_modules(
+    modules: list[CachedModule],
+    index: set[str],
+    targets: list[str] | None = None,
+) -> list[str]:
+    """
+    Import workspace modules from supplied sources (template process only).
+
+    The sources are resolved entirely in-process: nothing is read from Redis,
+    so the template keeps its no-connections guarantee. A module whose
+    imports reach a workspace path outside ``modules`` is skipped, and any
+    partially imported modules from that attempt are discarded.
+
+    Args:
+        modules: Cached module payloads to import
+        index: Full workspace module index, used to tell namespace packages
+            apart from regular packages whose source wasn't supplied
+        targets: Paths to import (default: all of ``modules``); the other
+            sources are only used to resolve their imports
+
+    Returns:
+        Paths of the modules that are now loaded
+    """
+    global _offline_sources, _offline_index
+
+    _offline_sources = {m["path"]: m for m in modules}
+    _offline_index = frozenset(index)
+    try:
+        for module in modules:
+            if targets is not None and module["path"] not in targets:
+                continue
+            name = _module_name_for_path(module["path"])
+            if name in sys.modules:
+                continue
+            before = set(sys.modules)
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                for added in set(sys.modules) - before:
+                    del sys.modules[added]
+                logger.warning(f"Skipping preload of {module['path']}: {e}")
+    finally:
+        _offline_sources = None
+        _offline_index = frozenset()
+
+    return sorted(
+        m["path"] for m in modules
+        if isinstance(
+            getattr(sys.modules.get(_module_name_for_path(m["path"])), "__loader__", None),
+            VirtualModuleLoader,
+        )
+    )
+
+
+def park_preloaded_modules() -> int:
+    """
+    Move template-preloaded workspace modules out of sys.modules.
+
+    Called once in each forked child before it executes. Parked modules are
+    handed back by the finder on first import, after checking their content
+    hash against Redis, which lets the child report exactly which preloaded
+    modules an execution used.
+
+    Returns:
+        Number of modules parked
+    """
+    _preload_hits.clear()
+    _preload_misses.clear()
+    for name, module in list(sys.modules.items()):
+        if isinstance(getattr(module, "__loader__", None), (VirtualModuleLoader, NamespacePackageLoader)):
+            _parked_modules[name] = sys.modules.pop(name)
+
+    # Detach submodules from their parents so `from pkg import mod` goes
+    # through the import system (and the finder) instead of a plain getattr.
+    for name, module in _parked_modules.items():
+        parent_name, _, child = name.rpartition(".")
+        parent = _parked_modules.get(parent_name)
+        if parent is not None and parent.__dict__.get(child) is module:
+            delattr(parent, child)
+    return len(_parked_modules)
+
+
+def get_preload_usage() -> dict[str, Any]:
+    """
+    Report workspace module usage for the current execution.
+
+    Returns:
+        Dict with ``used`` (sorted paths imported from the preload or from
+        Redis) and ``hits`` (how many of those came from the preload)
+    """
+    return {
+        "used": sorted(_preload_hits | _preload_misses),
+        "hits": len(_preload_hits),
+    }
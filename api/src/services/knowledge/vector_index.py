@@ -0,0 +1,186 @@
+"""
+Approximate nearest neighbour (HNSW) indexes for the knowledge store.
+
+`knowledge_store.embedding` is an unconstrained-dimension `vector` column
+(migration 20260506_knowledge_dim) so the embedding model can change without
+a schema migration. pgvector can only build HNSW indexes over a fixed
+dimension, so instead of one index on the column we keep one *partial
+expression index per dimension*:
+
+    CREATE INDEX ix_knowledge_embedding_hnsw_1536 ON knowledge_store
+    USING hnsw ((embedding::vector(1536)) vector_cosine_ops)
+    WHERE vector_dims(embedding) = 1536
+
+Dimensions above pgvector's 2000-dim `vector` limit (e.g. 3072 for
+text-embedding-3-large) index a `halfvec` cast instead, which HNSW supports
+up to 4000 dims. Anything larger has no index and falls back to exact search.
+
+The planner only considers a partial expression index when the query
+repeats the predicate and the indexed expression exactly, so search must
+build its distance/filter expressions with `ann_distance` and
+`ann_dimension_filter` (the dimension is rendered as a literal, because a
+bound parameter would not prove the partial-index predicate under a
+generic plan).
+
+Indexes are created with CREATE INDEX CONCURRENTLY for the configured
+embedding dimension, by the scheduler at startup / hourly
+(jobs/schedulers/knowledge_vector_index.py) and at the end of an embedding
+reindex. Indexes for dimensions that no longer have rows are dropped.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+
+from sqlalchemy import ColumnElement, cast, exists, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.models.orm.knowledge import KnowledgeStore
+from src.models.orm.vector_type import HalfVector, Vector
+
+logger = logging.getLogger(__name__)
+
+ANN_INDEX_PREFIX = "ix_knowledge_embedding_hnsw_"
+
+# pgvector HNSW limits: `vector` up to 2000 dims, `halfvec` up to 4000
+HNSW_VECTOR_MAX_DIMENSIONS = 2000
+HNSW_HALFVEC_MAX_DIMENSIONS = 4000
+
+# Build parameters (pgvector defaults; recall is tuned at query time)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+
+# Candidate list size per search. pgvector's default of 40 is too small once
+# search over-fetches for key grouping; 1000 is pgvector's upper bound.
+DEFAULT_EF_SEARCH = 100
+MAX_EF_SEARCH = 1000
+
+_INDEX_NAME_RE = re.compile(rf"^{ANN_INDEX_PREFIX}(\d+)$")
+
+
+def ann_index_name(dim: int) -> str:
+    return f"{ANN_INDEX_PREFIX}{int(dim)}"
+
+
+def is_indexable(dim: int) -> bool:
+    """Whether pgvector can build an HNSW index at this dimension."""
+    return 0 < dim <= HNSW_HALFVEC_MAX_DIMENSIONS
+
+
+def _uses_halfvec(dim: int) -> bool:
+    return dim > HNSW_VECTOR_MAX_DIMENSIONS
+
+
+def ann_distance(query_embedding: list[float]) -> ColumnElement[float]:
+    """
+    Cosine distance between `embedding` and the query, written as the
+    expression the per-dimension HNSW index is built on.
+
+    Must be combined with `ann_dimension_filter(len(query_embedding))`.
+    """
+    dim = len(query_embedding)
+    if not is_indexable(dim):
+        return KnowledgeStore.embedding.cosine_distance(query_embedding)
+    if _uses_halfvec(dim):
+        return cast(KnowledgeStore.embedding, HalfVector(dim)).cosine_distance(query_embedding)
+    return cast(KnowledgeStore.embedding, Vector(dim)).cosine_distance(query_embedding)
+
+
+def ann_dimension_filter(dim: int) -> ColumnElement[bool]:
+    """Restrict to rows at `dim` — the predicate of that dimension's index."""
+    return text(f"vector_dims(knowledge_store.embedding) = {int(dim)}")
+
+
+def ef_search_for(raw_limit: int) -> int:
+    """HNSW candidate list size needed to return `raw_limit` rows."""
+    return min(max(DEFAULT_EF_SEARCH, raw_limit), MAX_EF_SEARCH)
+
+
+def _create_index_sql(dim: int) -> str:
+    dim = int(dim)
+    if _uses_halfvec(dim):
+        expression, opclass = f"embedding::halfvec({dim})", "halfvec_cosine_ops"
+    else:
+        expression, opclass = f"embedding::vector({dim})", "vector_cosine_ops"
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {ann_index_name(dim)} ON knowledge_store "
+        f"USING hnsw (({expression}) {opclass}) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION}) "
+        f"WHERE vector_dims(embedding) = {dim}"
+    )
+
+
+async def list_ann_indexes(conn: AsyncConnection) -> dict[int, bool]:
+    """Map of dimension -> is-valid for the existing per-dimension indexes."""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname, i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = 'knowledge_store'::regclass "
+            "AND c.relname LIKE :prefix"
+        ).bindparams(prefix=f"{ANN_INDEX_PREFIX}%")
+    )
+    indexes: dict[int, bool] = {}
+    for name, valid in result.all():
+        match = _INDEX_NAME_RE.match(name)
+        if match:
+            indexes[int(match.group(1))] = bool(valid)
+    return indexes
+
+
+async def sync_ann_indexes(engine: AsyncEngine, dim: int) -> dict[str, list[int]]:
+    """
+    Make sure the HNSW index for `dim` exists and drop indexes for
+    dimensions that no longer have any rows.
+
+    Runs on an autocommit connection because CREATE/DROP INDEX CONCURRENTLY
+    cannot run inside a transaction. Building on a large table takes a
+    while but does not block reads or writes.
+
+    Returns:
+        {"created": [...], "dropped": [...]} dimensions
+    """
+    created: list[int] = []
+    dropped: list[int] = []
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        existing = await list_ann_indexes(conn)
+
+        if is_indexable(dim) and not existing.get(dim, False):
+            if dim in existing:
+                # A failed CONCURRENTLY build leaves an INVALID index behind
+                logger.warning(f"Rebuilding invalid knowledge ANN index for dim {dim}")
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {ann_index_name(dim)}"))
+            logger.info(f"Creating knowledge ANN index for dim {dim}")
+            await conn.execute(text(_create_index_sql(dim)))
+            created.append(dim)
+        elif not is_indexable(dim):
+            logger.info(f"Embedding dim {dim} exceeds HNSW limits; knowledge search stays exact")
+
+        for other_dim in sorted(existing):
+            if other_dim == dim:
+                continue
+            in_use = await conn.execute(
+                select(exists().where(ann_dimension_filter(other_dim)).select_from(KnowledgeStore))
+            )
+            if not in_use.scalar_one():
+                logger.info(f"Dropping knowledge ANN index for unused dim {other_dim}")
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {ann_index_name(other_dim)}"))
+                dropped.append(other_dim)
+
+    return {"created": created, "dropped": dropped}
+
+
+__all__ = [
+    "ANN_INDEX_PREFIX",
+    "DEFAULT_EF_SEARCH",
+    "ann_dimension_filter",
+    "ann_distance",
+    "ann_index_name",
+    "ef_search_for",
+    "is_indexable",
+    "list_ann_indexes",
+    "sync_ann_indexes",
+]
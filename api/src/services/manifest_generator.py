@@ -190,6 +190,7 @@ def serialize_agent(
         llm_max_tokens=agent.llm_max_tokens,
         max_iterations=agent.max_iterations,
         max_token_budget=agent.max_token_budget,
+        max_parallel_tool_calls=agent.max_parallel_tool_calls,
     )
 
 
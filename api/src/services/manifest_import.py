@@ -317,6 +317,8 @@ def _agent_content_from_manifest(magent) -> bytes:
         data["max_iterations"] = magent.max_iterations
     if magent.max_token_budget is not None:
         data["max_token_budget"] = magent.max_token_budget
+    if magent.max_parallel_tool_calls is not None:
+        data["max_parallel_tool_calls"] = magent.max_parallel_tool_calls
     return (yaml.dump(data, default_flow_style=False, sort_keys=True).rstrip() + "\n").encode("utf-8")
 
 
@@ -1962,6 +1964,7 @@ class ManifestResolver:
 
         from sqlalchemy.dialects.postgresql import insert
 
+        from src.core.cache.integration_cache import mark_integration_state_changed
         from src.models.orm.integrations import Integration, IntegrationConfigSchema, IntegrationMapping
         from src.models.orm.oauth import OAuthProvider
         from src.services.sync_ops import SyncOp, Upsert  # noqa: F401
@@ -2006,6 +2009,9 @@ class ManifestResolver:
                 match_on="id",
             )
         await upsert_op.execute(self.db)
+        # The upsert and the schema/provider/mapping statements below are
+        # Core statements the cache's flush hooks don't see
+        mark_integration_state_changed(self.db)
 
         # If the upsert rewrote the integration's PK (cross-env id sync), the
         # FK ON UPDATE CASCADE on integration_config_schema, integration_mappings,
@@ -2924,6 +2930,7 @@ class ManifestResolver:
                 "organization_id": org_id,
                 "max_iterations": data.get("max_iterations"),
                 "max_token_budget": data.get("max_token_budget"),
+                "max_parallel_tool_calls": data.get("max_parallel_tool_calls"),
             }
             if magent.access_level is not None:
                 agent_values["access_level"] = magent.access_level
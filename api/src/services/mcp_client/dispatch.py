@@ -27,6 +27,8 @@ import logging
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+import anyio
+import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -34,7 +36,6 @@ if TYPE_CHECKING:
     from mcp.types import CallToolResult
 
 from src.models.orm.external_mcp import MCPConnection, MCPConnectionTool
-from src.services.mcp_client import client as mcp_client_session
 from src.services.mcp_client.auth_resolution import (
     ResolutionPath,
     resolve_token,
@@ -43,6 +44,7 @@ from src.services.mcp_client.errors import (
     NeedsReauthError,
     ToolDispatchError,
 )
+from src.services.mcp_client.session_pool import get_session_pool
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +72,39 @@ def _looks_like_auth_error(exc: BaseException) -> bool:
     return any(marker in blob for marker in _AUTH_ERROR_MARKERS)
 
 
+# Failures that mean the request never reached a live server session, so
+# the tool cannot have run: the transport was already closed, the server
+# could not be dialled, or it no longer knows the session id (HTTP 404,
+# surfaced by the SDK as "Session terminated").
+_STALE_SESSION_ERRORS: tuple[type[BaseException], ...] = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    ConnectionRefusedError,
+)
+_SESSION_TERMINATED = "session terminated"
+
+
+def _is_stale_session_error(exc: BaseException) -> bool:
+    """Did the call fail before the server could have executed the tool?
+
+    Only these failures are safe to retry: a read timeout or a dropped
+    connection after the request was sent may come after the tool already
+    ran, and MCP tools are not assumed to be idempotent.
+    """
+    from mcp.shared.exceptions import McpError
+
+    cur: BaseException | None = exc
+    while cur is not None:
+        if isinstance(cur, _STALE_SESSION_ERRORS):
+            return True
+        if isinstance(cur, McpError) and _SESSION_TERMINATED in str(cur).lower():
+            return True
+        cur = cur.__cause__ or cur.__context__
+    return False
+
+
 def _normalize_call_tool_result(result: CallToolResult) -> dict[str, Any]:
     """Translate an MCP CallToolResult to Bifrost's tool-result envelope.
 
@@ -115,8 +150,30 @@ async def _call_remote(
     tool_name: str,
     arguments: dict[str, Any],
 ) -> CallToolResult:
-    """Open a session, call the tool, return the raw result."""
-    async with mcp_client_session.open_session(connection, access_token) as session:
+    """Call the tool on a pooled session, return the raw result.
+
+    A failed call discards its session. If that session had been reused
+    from the pool it may simply have gone stale (server restart, expired
+    MCP session id); when the failure shows the request never reached the
+    server (see ``_is_stale_session_error``) the call is retried once on a
+    freshly opened session. Anything else propagates, since the tool may
+    already have run. Auth failures go straight back to ``invoke``, which
+    resolves a new token (and so a new pool key).
+    """
+    pool = get_session_pool()
+    reused = pool.has_session(connection, access_token)
+    try:
+        async with pool.session(connection, access_token) as session:
+            return await session.call_tool(tool_name, arguments)
+    except Exception as exc:
+        if not reused or not _is_stale_session_error(exc):
+            raise
+        logger.info(
+            "Pooled MCP session for connection %s failed (%s); re-opening",
+            connection.id,
+            exc,
+        )
+    async with pool.session(connection, access_token) as session:
         return await session.call_tool(tool_name, arguments)
 
 
@@ -0,0 +1,308 @@
+"""Per-process pool of initialized MCP client sessions.
+
+``client.open_session`` dials the server and runs the MCP ``initialize``
+handshake; doing that for every tool call makes an agent that calls the
+same external tool 30 times pay 30 handshakes. The pool keeps sessions
+open between calls, keyed by ``(connection_id, token fingerprint)`` so a
+session is only ever reused with the exact credentials (and server URL)
+it was opened with.
+
+Lifecycle:
+
+- Each pooled session is owned by a dedicated task. The SDK's transport
+  and ``ClientSession`` are anyio context managers that must be exited by
+  the task that entered them, so callers borrow the session and the owner
+  task tears it down when asked.
+- Sessions idle for longer than ``idle_timeout`` are closed on the next
+  pool access.
+- Sessions idle for longer than ``health_check_after`` are pinged before
+  reuse; a failed ping (or a dead transport) re-opens the session.
+- At most ``max_sessions`` are kept. When the pool is full the least
+  recently used idle session is evicted; if every session is busy the
+  caller gets a one-off session that is closed after use.
+- Callers ``discard`` a session after a transport or auth error so the
+  next call re-opens it.
+
+Pools are per event loop (a session is bound to the loop that opened it).
+Each pool logs its ``PoolStats`` counters at most every
+``STATS_LOG_INTERVAL_SECONDS`` while in use, and once more on close;
+process shutdown closes the pool with ``close_session_pool``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.models.orm.external_mcp import MCPConnection
+from src.services.mcp_client import client as mcp_client_session
+
+if TYPE_CHECKING:
+    from mcp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+MAX_SESSIONS = 32
+IDLE_TIMEOUT_SECONDS = 300.0
+HEALTH_CHECK_AFTER_SECONDS = 60.0
+PING_TIMEOUT_SECONDS = 5.0
+STATS_LOG_INTERVAL_SECONDS = 300.0
+
+PoolKey = tuple[UUID, str]
+
+
+def token_fingerprint(connection: MCPConnection, access_token: str) -> str:
+    """Fingerprint of the credentials and URL a session was opened with."""
+    server_url = mcp_client_session._resolve_server_url(connection)
+    digest = hashlib.sha256(f"{server_url}\x00{access_token}".encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class PoolStats:
+    """Counters for pool behaviour (per pool, since process start)."""
+
+    hits: int = 0
+    misses: int = 0
+    reopens: int = 0
+    evictions: int = 0
+    discards: int = 0
+    overflow: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class _PooledSession:
+    key: PoolKey
+    session: ClientSession | None = None
+    owner: asyncio.Task[None] | None = None
+    closing: asyncio.Event = field(default_factory=asyncio.Event)
+    in_use: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and self.owner is not None
+            and not self.owner.done()
+            and not self.closing.is_set()
+        )
+
+
+class MCPSessionPool:
+    """Pool of initialized MCP sessions for one event loop."""
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        idle_timeout: float = IDLE_TIMEOUT_SECONDS,
+        health_check_after: float = HEALTH_CHECK_AFTER_SECONDS,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.stats = PoolStats()
+        self._stats_logged_at = time.monotonic()
+        self._entries: dict[PoolKey, _PooledSession] = {}
+        self._opening: dict[PoolKey, asyncio.Task[_PooledSession]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def has_session(self, connection: MCPConnection, access_token: str) -> bool:
+        """Whether a live pooled session exists for these credentials."""
+        entry = self._entries.get((connection.id, token_fingerprint(connection, access_token)))
+        return entry is not None and entry.alive
+
+    @asynccontextmanager
+    async def session(
+        self,
+        connection: MCPConnection,
+        access_token: str,
+    ) -> AsyncIterator[ClientSession]:
+        """Borrow an initialized session for ``connection`` and ``access_token``.
+
+        If the block raises, the session is discarded (closed and removed
+        from the pool) so the next call re-opens it; MCP errors that leave
+        the session usable are rare and a re-open is cheap by comparison.
+        """
+        entry = await self._acquire(connection, access_token)
+        entry.in_use += 1
+        try:
+            assert entry.session is not None
+            yield entry.session
+        except BaseException:
+            await self._discard(entry)
+            raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            if entry.key not in self._entries or self._entries[entry.key] is not entry:
+                # One-off (overflow) or discarded session: close once idle
+                if entry.in_use == 0:
+                    await self._close(entry)
+
+    async def close(self) -> None:
+        """Close every pooled session."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        await asyncio.gather(*(self._close(e) for e in entries))
+        self._log_stats()
+
+    def _log_stats(self) -> None:
+        self._stats_logged_at = time.monotonic()
+        logger.info(
+            "MCP session pool: %d open, %s", len(self._entries), self.stats.as_dict()
+        )
+
+    # ------------------------------------------------------------------
+
+    async def _acquire(
+        self, connection: MCPConnection, access_token: str
+    ) -> _PooledSession:
+        key: PoolKey = (connection.id, token_fingerprint(connection, access_token))
+        await self._evict_idle()
+        if time.monotonic() - self._stats_logged_at >= STATS_LOG_INTERVAL_SECONDS:
+            self._log_stats()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if await self._healthy(entry):
+                self.stats.hits += 1
+                return entry
+            self.stats.reopens += 1
+            await self._discard(entry)
+
+        # Concurrent misses for the same key share one handshake
+        opening = self._opening.get(key)
+        if opening is None:
+            opening = asyncio.create_task(self._open_pooled(key, connection, access_token))
+            self._opening[key] = opening
+            opening.add_done_callback(lambda _: self._opening.pop(key, None))
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return await asyncio.shield(opening)
+
+    async def _open_pooled(
+        self, key: PoolKey, connection: MCPConnection, access_token: str
+    ) -> _PooledSession:
+        entry = await self._open(key, connection, access_token)
+        if len(self._entries) >= self.max_sessions and not self._evict_lru():
+            # Every pooled session is busy: serve this caller a one-off
+            self.stats.overflow += 1
+            return entry
+        self._entries[key] = entry
+        return entry
+
+    async def _open(
+        self, key: PoolKey, connection: MCPConnection, access_token: str
+    ) -> _PooledSession:
+        entry = _PooledSession(key=key)
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        async def own() -> None:
+            try:
+                async with mcp_client_session.open_session(connection, access_token) as session:
+                    entry.session = session
+                    ready.set_result(None)
+                    await entry.closing.wait()
+            except BaseException as exc:
+                if not ready.done():
+                    ready.set_exception(exc)
+                elif not isinstance(exc, asyncio.CancelledError):
+                    logger.debug("Pooled MCP session for %s ended: %s", key[0], exc)
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+
+        entry.owner = asyncio.create_task(own())
+        await ready
+        logger.debug("Opened pooled MCP session for connection %s", key[0])
+        return entry
+
+    async def _healthy(self, entry: _PooledSession) -> bool:
+        if not entry.alive:
+            return False
+        if time.monotonic() - entry.last_used < self.health_check_after:
+            return True
+        assert entry.session is not None
+        try:
+            await asyncio.wait_for(entry.session.send_ping(), PING_TIMEOUT_SECONDS)
+        except Exception as exc:
+            logger.info("Pooled MCP session for %s failed health check: %s", entry.key[0], exc)
+            return False
+        entry.last_used = time.monotonic()
+        return True
+
+    async def _evict_idle(self) -> None:
+        now = time.monotonic()
+        stale = [
+            e
+            for e in self._entries.values()
+            if e.in_use == 0 and (not e.alive or now - e.last_used >= self.idle_timeout)
+        ]
+        for entry in stale:
+            self.stats.evictions += 1
+            await self._discard(entry)
+
+    def _evict_lru(self) -> bool:
+        """Evict the least recently used idle session; False if all are busy."""
+        idle = [e for e in self._entries.values() if e.in_use == 0]
+        if not idle:
+            return False
+        victim = min(idle, key=lambda e: e.last_used)
+        self.stats.evictions += 1
+        del self._entries[victim.key]
+        victim.closing.set()
+        return True
+
+    async def _discard(self, entry: _PooledSession) -> None:
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+            self.stats.discards += 1
+        if entry.in_use == 0:
+            await self._close(entry)
+        else:
+            # Stop handing it out; the last borrower closes it
+            entry.closing.set()
+
+    async def _close(self, entry: _PooledSession) -> None:
+        entry.closing.set()
+        owner = entry.owner
+        if owner is None or owner.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(owner), PING_TIMEOUT_SECONDS)
+        except Exception:
+            owner.cancel()
+
+
+_pools: dict[asyncio.AbstractEventLoop, MCPSessionPool] = {}
+
+
+def get_session_pool() -> MCPSessionPool:
+    """Get the MCP session pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        for stale in [lp for lp in _pools if lp.is_closed()]:
+            del _pools[stale]
+        pool = _pools[loop] = MCPSessionPool()
+    return pool
+
+
+async def close_session_pool() -> None:
+    """Close the running event loop's pool, if one was created (shutdown)."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
@@ -33,6 +33,7 @@ async def search_knowledge(
     """
     from src.repositories.knowledge import KnowledgeRepository
     from src.services.embeddings import get_embedding_client
+    from src.services.embeddings.query_cache import embed_query
 
     logger.info(f"MCP search_knowledge called with query={query}, namespace={namespace}")
 
@@ -62,7 +63,7 @@ async def search_knowledge(
         async with get_tool_db(context) as db:
             # Generate query embedding
             embedding_client = await get_embedding_client(db)
-            query_embedding = await embedding_client.embed_single(query)
+            query_embedding = await embed_query(embedding_client, query)
 
             # Search knowledge store
             repo = KnowledgeRepository(
@@ -73,6 +74,7 @@ async def search_knowledge(
                 namespace=namespaces_to_search,
                 limit=limit,
                 fallback=True,
+                query_text=query,
             )
 
             if not results:
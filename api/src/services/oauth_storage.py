@@ -10,6 +10,7 @@ from uuid import UUID
 
 from cryptography.fernet import Fernet
 
+from src.core.cache.integration_cache import mark_integration_state_changed
 from src.models import CreateOAuthConnectionRequest, OAuthConnection, UpdateOAuthConnectionRequest
 
 logger = logging.getLogger(__name__)
@@ -292,6 +293,7 @@ class OAuthStorageService:
             await db.execute(
                 delete(OAuthToken).where(OAuthToken.provider_id == provider.id)
             )
+            mark_integration_state_changed(db)
 
             # Delete provider (session.delete() is NOT async)
             db.delete(provider)
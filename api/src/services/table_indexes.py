@@ -0,0 +1,286 @@
+"""
+Typed field expressions and per-table expression indexes for documents.
+
+Document data is schemaless JSONB, so range filters (``gt``/``gte``/``lt``/
+``lte``) need to know how to compare a field. The comparison kind comes from,
+in order:
+
+1. A declared index on the field (``tables.indexes``)
+2. The table's schema hints (``{"columns": [{"name": ..., "type": ...}]}``)
+3. The operand type (int/float -> numeric, bool -> boolean, ISO date
+   string -> timestamp, anything else -> text)
+
+Every kind maps to exactly one SQL expression (``typed_field_sql``). The
+document query builder and the index DDL both use that expression, so a
+range filter on an indexed field matches the index expression and Postgres
+can use an index scan instead of scanning every document in the table.
+
+Expressions are type-guarded: a numeric comparison only sees values stored
+as JSON numbers, a timestamp comparison only values that parse as
+timestamps. Anything else evaluates to NULL and never matches.
+
+Indexes are partial (``WHERE table_id = '<uuid>'``), so each table only pays
+for its own indexes on write.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, Numeric, Text, literal_column, text
+from sqlalchemy.sql import ColumnElement
+
+from src.core.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+FieldKind = Literal["numeric", "boolean", "timestamp", "text"]
+
+FIELD_KINDS: tuple[FieldKind, ...] = ("numeric", "boolean", "timestamp", "text")
+
+# Immutable SQL helper created by the 20260610_table_typed_indexes migration.
+TIMESTAMP_FUNCTION = "bifrost_jsonb_timestamptz"
+
+# Schema column types (as written by the UI / MCP tools) -> comparison kind
+_SCHEMA_TYPE_KINDS: dict[str, FieldKind] = {
+    "number": "numeric",
+    "numeric": "numeric",
+    "integer": "numeric",
+    "int": "numeric",
+    "float": "numeric",
+    "decimal": "numeric",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "date": "timestamp",
+    "datetime": "timestamp",
+    "timestamp": "timestamp",
+}
+
+_SQL_TYPES = {
+    "numeric": Numeric(),
+    "boolean": Boolean(),
+    "timestamp": DateTime(timezone=True),
+    "text": Text(),
+}
+
+_ISO_DATE_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}"
+    r"([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}(:?\d{2})?)?)?$"
+)
+
+
+def _sql_string_literal(value: str) -> str:
+    """Quote ``value`` as a SQL string literal (standard_conforming_strings)."""
+    if "\x00" in value:
+        raise ValueError("Field names cannot contain NUL characters")
+    return "'" + value.replace("'", "''") + "'"
+
+
+def typed_field_sql(field: str, kind: FieldKind, column: str = "data") -> str:
+    """Return the SQL expression for ``column -> field`` compared as ``kind``.
+
+    The field name is rendered as a literal (not a bind parameter) so the
+    expression in a query is identical to the one in the index definition.
+    """
+    element = f"{column} -> {_sql_string_literal(field)}"
+    as_text = f"{column} ->> {_sql_string_literal(field)}"
+    if kind == "numeric":
+        return (
+            f"(CASE WHEN jsonb_typeof({element}) = 'number' "
+            f"THEN ({as_text})::numeric END)"
+        )
+    if kind == "boolean":
+        return (
+            f"(CASE WHEN jsonb_typeof({element}) = 'boolean' "
+            f"THEN ({as_text})::boolean END)"
+        )
+    if kind == "timestamp":
+        return f"{TIMESTAMP_FUNCTION}({element})"
+    return f"({as_text})"
+
+
+def typed_field_expr(field: str, kind: FieldKind) -> ColumnElement[Any]:
+    """SQLAlchemy expression for a document field compared as ``kind``."""
+    return literal_column(
+        typed_field_sql(field, kind, column="documents.data"),
+        type_=_SQL_TYPES[kind],
+    )
+
+
+def schema_field_kinds(schema: Any) -> dict[str, FieldKind]:
+    """Map field names to comparison kinds from a table's schema hints."""
+    if not isinstance(schema, dict):
+        return {}
+    columns = schema.get("columns")
+    if not isinstance(columns, list):
+        return {}
+    kinds: dict[str, FieldKind] = {}
+    for column in columns:
+        if not isinstance(column, dict):
+            continue
+        name = column.get("name")
+        column_type = column.get("type")
+        if isinstance(name, str) and isinstance(column_type, str):
+            kind = _SCHEMA_TYPE_KINDS.get(column_type.lower())
+            if kind is not None:
+                kinds[name] = kind
+    return kinds
+
+
+def declared_indexes(indexes: Any) -> list[dict[str, str]]:
+    """Return the well-formed index declarations stored on a table."""
+    if not isinstance(indexes, list):
+        return []
+    return [
+        entry
+        for entry in indexes
+        if isinstance(entry, dict)
+        and isinstance(entry.get("field"), str)
+        and entry.get("kind") in FIELD_KINDS
+    ]
+
+
+def table_field_kinds(schema: Any, indexes: Any) -> dict[str, FieldKind]:
+    """Comparison kinds for a table: schema hints overlaid by declared indexes."""
+    kinds = schema_field_kinds(schema)
+    for entry in declared_indexes(indexes):
+        kinds[entry["field"]] = entry["kind"]
+    return kinds
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    if not _ISO_DATE_RE.match(value):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        # Matches the SQL helper, which parses naive values as UTC
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _coerce(value: Any, kind: FieldKind) -> Any:
+    """Coerce an operand to ``kind``; returns None if it can't be."""
+    if kind == "numeric":
+        if isinstance(value, bool):
+            return None
+        try:
+            if isinstance(value, (int, float)):
+                number = Decimal(str(value))
+            elif isinstance(value, str):
+                number = Decimal(value.strip())
+            else:
+                return None
+        except InvalidOperation:
+            return None
+        return number if number.is_finite() else None
+    if kind == "boolean":
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        return None
+    if kind == "timestamp":
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        if isinstance(value, str):
+            return _parse_timestamp(value)
+        return None
+    return str(value)
+
+
+def comparison_operand(
+    field: str,
+    value: Any,
+    field_kinds: dict[str, FieldKind],
+) -> tuple[FieldKind, Any]:
+    """Resolve the comparison kind for ``field`` and coerce ``value`` to it.
+
+    A hinted kind wins when the operand can be coerced to it; otherwise the
+    operand's own type decides. Strings that aren't ISO dates compare as
+    text, which keeps ``{"gt": "150"}`` on an unhinted field lexicographic.
+    """
+    hinted = field_kinds.get(field)
+    if hinted is not None:
+        coerced = _coerce(value, hinted)
+        if coerced is not None:
+            return hinted, coerced
+
+    if isinstance(value, bool):
+        return "boolean", value
+    if isinstance(value, (int, float)):
+        number = _coerce(value, "numeric")
+        if number is not None:
+            return "numeric", number
+    if isinstance(value, str):
+        parsed = _parse_timestamp(value)
+        if parsed is not None:
+            return "timestamp", parsed
+    return "text", str(value)
+
+
+# =============================================================================
+# Index DDL
+# =============================================================================
+
+
+def index_name(table_id: UUID, field: str, kind: FieldKind) -> str:
+    """Deterministic index name (<= 63 chars) for a table field."""
+    digest = hashlib.md5(f"{field}\x00{kind}".encode()).hexdigest()[:8]
+    return f"ix_doc_{table_id.hex}_{digest}"
+
+
+def index_ddl(table_id: UUID, field: str, kind: FieldKind) -> str:
+    """``CREATE INDEX CONCURRENTLY`` statement for a table field."""
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name(table_id, field, kind)} "
+        f"ON documents ({typed_field_sql(field, kind)}) "
+        f"WHERE table_id = '{table_id}'::uuid"
+    )
+
+
+async def create_table_index(table_id: UUID, field: str, kind: FieldKind) -> str:
+    """Build the expression index for a table field and return its name.
+
+    Runs ``CREATE INDEX CONCURRENTLY`` on its own autocommit connection, so
+    callers must not hold locks on ``documents`` (commit first). A failed
+    concurrent build leaves an INVALID index behind; it is dropped before
+    the error is re-raised.
+    """
+    name = index_name(table_id, field, kind)
+    engine = get_engine()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            await conn.execute(text(index_ddl(table_id, field, kind)))
+        except Exception:
+            logger.exception(f"Failed to build index {name}")
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            raise
+    logger.info(f"Built document index {name} ({kind}) for table {table_id}")
+    return name
+
+
+async def drop_table_indexes(table_id: UUID, indexes: Any) -> None:
+    """Drop the expression indexes declared for a table.
+
+    Same locking rules as ``create_table_index``: commit first.
+    """
+    entries = declared_indexes(indexes)
+    if not entries:
+        return
+    engine = get_engine()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for entry in entries:
+            name = index_name(table_id, entry["field"], entry["kind"])
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            logger.info(f"Dropped document index {name} for table {table_id}")
@@ -24,6 +24,7 @@ from src.jobs.rabbitmq import rabbitmq
 from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
 from src.jobs.consumers.package_install import PackageInstallConsumer
 from src.jobs.consumers.agent_run import AgentRunConsumer
+from src.services.mcp_client.session_pool import close_session_pool
 from src.jobs.summarize_worker import (
     SummarizeBackfillConsumer,
     SummarizeConsumer,
@@ -88,6 +89,10 @@ class Worker:
             await init_db()
             logger.info("Database connection established")
 
+            # OAuth writes here must invalidate API-side integration caches
+            from src.core.cache.integration_cache import register_integration_cache_hooks
+            register_integration_cache_hooks()
+
             # Initialize and start RabbitMQ consumers
             logger.info("Starting RabbitMQ consumers...")
             await self._start_consumers()
@@ -187,6 +192,9 @@ class Worker:
             else:
                 logger.info(f"Drained consumer: {consumer.queue_name}")
 
+        # Close pooled MCP client sessions held by agent runs.
+        await close_session_pool()
+
         # Close RabbitMQ pools (idempotent if already closed).
         await rabbitmq.close()
         logger.info("RabbitMQ connections closed")
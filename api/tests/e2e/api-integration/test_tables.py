@@ -375,6 +375,52 @@ class TestDocumentQueryOperators:
         documents, total = await doc_repo.query(query)
         assert total == 3  # 100, 150, 200
 
+    @pytest.mark.asyncio
+    async def test_numeric_operand_compares_numerically(self, db_session: AsyncSession, test_table_with_data):
+        """Numeric operands compare as numbers, not strings ("1000" < "200")."""
+        doc_repo = DocumentRepository(db_session, test_table_with_data)
+        await doc_repo.insert({"name": "Big Co", "amount": 1000}, created_by="test@example.com")
+
+        from src.models.contracts.tables import DocumentQuery
+
+        documents, total = await doc_repo.query(DocumentQuery(where={"amount": {"gt": 150}}))
+        assert total == 3  # 200, 300, 1000
+        assert sorted(d.data["amount"] for d in documents) == [200, 300, 1000]
+
+        documents, total = await doc_repo.query(DocumentQuery(where={"amount": {"lte": 150.0}}))
+        assert total == 2  # 100, 150
+
+    @pytest.mark.asyncio
+    async def test_schema_hints_drive_comparison_kind(
+        self, db_session: AsyncSession, test_org, test_user_email
+    ):
+        """String operands follow the table's schema hints."""
+        from src.models.contracts.tables import DocumentQuery, TableCreate
+
+        repo = TableRepository(db_session, test_org.id)
+        table = await repo.create_table(
+            TableCreate(
+                name=f"test_typed_{uuid4().hex[:8]}",
+                schema={"columns": [
+                    {"name": "amount", "type": "number"},
+                    {"name": "due", "type": "datetime"},
+                ]},
+            ),
+            created_by=test_user_email,
+        )
+        doc_repo = DocumentRepository(db_session, table)
+        await doc_repo.insert({"amount": 9, "due": "2024-01-15T10:00:00Z"}, created_by=test_user_email)
+        await doc_repo.insert({"amount": 10, "due": "2024-03-01T00:00:00+02:00"}, created_by=test_user_email)
+        await doc_repo.insert({"amount": "n/a", "due": "not a date"}, created_by=test_user_email)
+
+        _, total = await doc_repo.query(DocumentQuery(where={"amount": {"gte": "9.5"}}))
+        assert total == 1  # 10 (the string "n/a" is not a number)
+
+        _, total = await doc_repo.query(
+            DocumentQuery(where={"due": {"gte": "2024-02-01", "lt": "2024-12-31"}})
+        )
+        assert total == 1
+
     @pytest.mark.asyncio
     async def test_in_operator(self, db_session: AsyncSession, test_table_with_data):
         """Test in operator for matching values in a list."""
@@ -0,0 +1,86 @@
+"""
+Benchmark: batch upsert of 100 / 1k / 10k documents.
+
+"before" replays the previous per-row strategy of the batch endpoint
+(``repo.get`` per row in pre-flight, then ``repo.update``/``repo.insert``
+per row). "after" is the set-based path (``repo.get_many`` plus
+``repo.write_many``). Each size runs against a table that already holds
+half of the ids, so both the update and insert branches are exercised.
+"""
+
+import statistics
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.contracts.tables import TableCreate
+from src.repositories.tables import TableRepository
+from src.routers.tables import DocumentRepository
+
+pytestmark = pytest.mark.slow
+
+BATCH_SIZES = (100, 1_000, 10_000)
+RUNS = 3
+
+
+async def _seeded_repo(session: AsyncSession, ids: list[str]) -> DocumentRepository:
+    table = await TableRepository(session, None).create_table(
+        TableCreate(name=f"bench_batch_{uuid4().hex[:8]}"), created_by="bench"
+    )
+    repo = DocumentRepository(session, table)
+    await repo.write_many(
+        [
+            {"id": doc_id, "data": {"n": 0}, "created_by": "bench", "updated_by": "bench"}
+            for doc_id in ids[::2]
+        ],
+        update_ids=set(),
+    )
+    return repo
+
+
+async def _per_row(repo: DocumentRepository, rows: list[dict]) -> None:
+    existing = {}
+    for row in rows:
+        doc = await repo.get(row["id"])
+        if doc is not None:
+            existing[row["id"]] = doc
+    for row in rows:
+        if row["id"] in existing:
+            await repo.update(row["id"], row["data"], updated_by="bench")
+        else:
+            await repo.insert(row["data"], created_by="bench", doc_id=row["id"])
+
+
+async def _set_based(repo: DocumentRepository, rows: list[dict]) -> None:
+    existing = await repo.get_many([row["id"] for row in rows])
+    written = await repo.write_many(rows, update_ids=set(existing))
+    assert len(written) == len(rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", BATCH_SIZES)
+async def test_batch_upsert_latency(db_session: AsyncSession, size: int):
+    results: dict[str, float] = {}
+    for label, strategy in (("before", _per_row), ("after", _set_based)):
+        timings = []
+        for _ in range(RUNS):
+            ids = [f"bench-{uuid4().hex}" for _ in range(size)]
+            repo = await _seeded_repo(db_session, ids)
+            rows = [
+                {"id": doc_id, "data": {"n": i}, "created_by": "bench", "updated_by": "bench"}
+                for i, doc_id in enumerate(ids)
+            ]
+            started = time.perf_counter()
+            await strategy(repo, rows)
+            timings.append((time.perf_counter() - started) * 1000)
+            await db_session.rollback()
+        results[label] = statistics.median(timings)
+
+    print(
+        f"\n{size:>6} rows: per-row {results['before']:9.1f} ms  "
+        f"set-based {results['after']:8.1f} ms  "
+        f"({results['before'] / results['after']:.1f}x)"
+    )
+    assert results["after"] < results["before"]
@@ -0,0 +1,153 @@
+"""
+Benchmark: typed range queries over a 100k-document table.
+
+Seeds one table with 100k documents ({"amount": <number>, "due": <ISO ts>})
+and times numeric and timestamp range filters through
+``DocumentRepository.count``/``query`` before and after declaring
+expression indexes on both fields. After indexing, the plan must use the
+index instead of scanning the table's documents.
+
+Rows are committed (a concurrent index build can't see an open
+transaction's rows) and removed again at the end.
+"""
+
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.contracts.tables import DocumentQuery
+from src.models.orm.tables import Document, Table
+from src.routers.tables import DocumentRepository, _build_document_filters
+from src.services.table_indexes import index_ddl, index_name
+
+pytestmark = pytest.mark.slow
+
+DOCUMENT_COUNT = 100_000
+INSERT_CHUNK = 5_000
+RUNS = 5
+
+NUMERIC_FILTER = {"amount": {"gte": 50_000, "lt": 50_500}}
+TIMESTAMP_FILTER = {"due": {"gte": "2024-06-01T00:00:00Z", "lt": "2024-06-02T00:00:00Z"}}
+
+BASE_DUE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def seeded_table(async_engine, async_session_factory):
+    table_id = uuid4()
+    rng = random.Random(1234)
+
+    async with async_session_factory() as session:
+        session.add(Table(id=table_id, name=f"bench_range_{table_id.hex[:8]}"))
+        await session.flush()
+        for start in range(0, DOCUMENT_COUNT, INSERT_CHUNK):
+            rows = []
+            for i in range(start, min(start + INSERT_CHUNK, DOCUMENT_COUNT)):
+                due = BASE_DUE + timedelta(minutes=rng.randrange(0, 365 * 24 * 60))
+                rows.append({
+                    "id": str(i),
+                    "table_id": table_id,
+                    "data": {"amount": rng.randrange(0, 100_000), "due": due.isoformat()},
+                })
+            await session.execute(insert(Document).values(rows))
+        await session.commit()
+
+    async with async_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE documents"))
+
+    yield table_id
+
+    async with async_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for field, kind in (("amount", "numeric"), ("due", "timestamp")):
+            await conn.execute(
+                text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name(table_id, field, kind)}")
+            )
+    async with async_session_factory() as session:
+        await session.execute(delete(Document).where(Document.table_id == table_id))
+        await session.execute(delete(Table).where(Table.id == table_id))
+        await session.commit()
+
+
+async def _median_ms(session: AsyncSession, table: Table, where: dict) -> tuple[float, int]:
+    repo = DocumentRepository(session, table)
+    timings = []
+    total = 0
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        total = await repo.count(where)
+        await repo.query(DocumentQuery(where=where, limit=100, skip_count=True))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), total
+
+
+async def _plan(session: AsyncSession, table: Table, where: dict) -> str:
+    repo = DocumentRepository(session, table)
+    query = _build_document_filters(
+        repo._select_table_documents(), where, repo._field_kinds()
+    )
+    compiled = query.compile(
+        dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = (await session.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    return "\n".join(rows)
+
+
+@pytest.mark.asyncio
+async def test_range_queries_use_expression_indexes(
+    seeded_table, async_engine, async_session_factory
+):
+    table_id = seeded_table
+    results: dict[str, dict[str, float]] = {}
+
+    async with async_session_factory() as session:
+        table = await session.get(Table, table_id)
+        before_numeric, numeric_total = await _median_ms(session, table, NUMERIC_FILTER)
+        before_ts, ts_total = await _median_ms(session, table, TIMESTAMP_FILTER)
+    assert numeric_total > 0 and ts_total > 0
+
+    async with async_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(index_ddl(table_id, "amount", "numeric")))
+        await conn.execute(text(index_ddl(table_id, "due", "timestamp")))
+        await conn.execute(text("ANALYZE documents"))
+
+    async with async_session_factory() as session:
+        await session.execute(
+            update(Table)
+            .where(Table.id == table_id)
+            .values(indexes=[
+                {"field": "amount", "kind": "numeric"},
+                {"field": "due", "kind": "timestamp"},
+            ])
+        )
+        await session.commit()
+
+    async with async_session_factory() as session:
+        table = await session.get(Table, table_id)
+        after_numeric, numeric_total_after = await _median_ms(session, table, NUMERIC_FILTER)
+        after_ts, ts_total_after = await _median_ms(session, table, TIMESTAMP_FILTER)
+        numeric_plan = await _plan(session, table, NUMERIC_FILTER)
+        ts_plan = await _plan(session, table, TIMESTAMP_FILTER)
+
+    assert numeric_total_after == numeric_total
+    assert ts_total_after == ts_total
+    assert index_name(table_id, "amount", "numeric") in numeric_plan, numeric_plan
+    assert index_name(table_id, "due", "timestamp") in ts_plan, ts_plan
+
+    results["numeric"] = {"before_ms": before_numeric, "after_ms": after_numeric}
+    results["timestamp"] = {"before_ms": before_ts, "after_ms": after_ts}
+    print(f"\nRange queries over {DOCUMENT_COUNT} documents (median of {RUNS}):")
+    for kind, r in results.items():
+        print(
+            f"  {kind:9s} seq {r['before_ms']:8.1f} ms  "
+            f"indexed {r['after_ms']:8.1f} ms  ({r['before_ms'] / r['after_ms']:.1f}x)"
+        )
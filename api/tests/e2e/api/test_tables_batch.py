@@ -184,6 +184,56 @@ class TestUpsertBatch:
         )
         assert cnt.json()["count"] == 2
 
+    def test_insert_batch_reports_existing_and_duplicate_ids(self, e2e_client, platform_admin):
+        """Without upsert, existing ids and in-batch duplicates are per-row errors."""
+        table_id = _create_table(
+            e2e_client, platform_admin.headers, f"test_batch_{uuid4().hex[:8]}"
+        )
+        existing_id, new_id = _uid("existing-"), _uid("new-")
+        seed = e2e_client.post(
+            f"/api/tables/{table_id}/documents",
+            headers=platform_admin.headers,
+            json={"id": existing_id, "data": {"name": "Old"}},
+        )
+        assert seed.status_code == 201, seed.text
+
+        response = e2e_client.post(
+            f"/api/tables/{table_id}/documents/batch",
+            headers=platform_admin.headers,
+            json={
+                "documents": [
+                    {"id": existing_id, "data": {"name": "Clobber"}},
+                    {"id": new_id, "data": {"name": "New"}},
+                    {"id": new_id, "data": {"name": "Again"}},
+                ],
+            },
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["inserted"] == 1
+        assert [d["id"] for d in data["documents"]] == [new_id]
+        assert {e["id"] for e in data["errors"]} == {existing_id, new_id}
+
+        existing = e2e_client.get(
+            f"/api/tables/{table_id}/documents/{existing_id}",
+            headers=platform_admin.headers,
+        )
+        assert existing.json()["data"]["name"] == "Old"
+
+    def test_upsert_batch_preserves_request_order(self, e2e_client, platform_admin):
+        """Returned documents follow the request order across write chunks."""
+        table_id = _create_table(
+            e2e_client, platform_admin.headers, f"test_upsert_{uuid4().hex[:8]}"
+        )
+        ids = [_uid(f"row{i}-") for i in range(1500)]
+        response = e2e_client.post(
+            f"/api/tables/{table_id}/documents/batch",
+            headers=platform_admin.headers,
+            json={"upsert": True, "documents": [{"id": i, "data": {"n": 1}} for i in ids]},
+        )
+        assert response.status_code == 200, response.text
+        assert [d["id"] for d in response.json()["documents"]] == ids
+
 
 class TestDeleteBatch:
     """Batch delete via POST /api/tables/{id}/documents/batch-delete."""
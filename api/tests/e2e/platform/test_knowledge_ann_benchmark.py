@@ -0,0 +1,129 @@
+"""
+Benchmark: knowledge search through the HNSW index vs exact search.
+
+Loads 20k clustered vectors into a private namespace at a dimension no
+real embedding model uses, builds that dimension's index with
+sync_ann_indexes (the same path the scheduler takes), and runs the same
+KnowledgeRepository.search queries twice: once as-is and once with index
+scans disabled (the pre-index exact scan). Recall@10 of the indexed search
+must stay high while its latency drops below the exact scan's.
+"""
+
+import random
+import statistics
+import time
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.models.orm.knowledge import KnowledgeStore
+from src.repositories.knowledge import KnowledgeRepository
+from src.services.knowledge.vector_index import ann_index_name, sync_ann_indexes
+from tests.conftest import TEST_DATABASE_URL
+
+pytestmark = pytest.mark.slow
+
+DIM = 392
+ROWS = 20_000
+CLUSTERS = 50
+QUERIES = 50
+K = 10
+INSERT_BATCH = 1_000
+
+
+def _clustered_vectors(rng: random.Random, n: int) -> list[list[float]]:
+    centroids = [[rng.gauss(0, 1) for _ in range(DIM)] for _ in range(CLUSTERS)]
+    return [
+        [c + rng.gauss(0, 0.3) for c in rng.choice(centroids)]
+        for _ in range(n)
+    ]
+
+
+@pytest_asyncio.fixture
+async def loaded_namespace():
+    """Private namespace with ROWS vectors and the HNSW index for DIM."""
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    namespace = f"ann-bench-{uuid4().hex[:8]}"
+    rng = random.Random(1234)
+    vectors = _clustered_vectors(rng, ROWS + QUERIES)
+
+    async with session_factory() as db:
+        for start in range(0, ROWS, INSERT_BATCH):
+            await db.execute(
+                insert(KnowledgeStore),
+                [
+                    {"namespace": namespace, "content": f"doc {i}", "doc_metadata": {}, "embedding": vectors[i]}
+                    for i in range(start, min(start + INSERT_BATCH, ROWS))
+                ],
+            )
+        await db.commit()
+
+    synced = await sync_ann_indexes(engine, DIM)
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE knowledge_store"))
+
+    yield session_factory, namespace, vectors[ROWS:]
+
+    async with session_factory() as db:
+        await db.execute(delete(KnowledgeStore).where(KnowledgeStore.namespace == namespace))
+        await db.commit()
+    if DIM in synced["created"]:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {ann_index_name(DIM)}"))
+    await engine.dispose()
+
+
+async def _search(session_factory, namespace, query, *, exact: bool) -> tuple[list[str], float]:
+    async with session_factory() as db:
+        if exact:
+            await db.execute(text("SET LOCAL enable_indexscan = off"))
+        repo = KnowledgeRepository(db, org_id=None, is_superuser=True)
+        started = time.perf_counter()
+        docs = await repo.search(query, namespace=namespace, limit=K, group_by_key=False)
+        elapsed = time.perf_counter() - started
+        await db.rollback()
+    return [d.id for d in docs], elapsed
+
+
+@pytest.mark.asyncio
+async def test_hnsw_recall_and_latency_vs_exact(loaded_namespace):
+    session_factory, namespace, queries = loaded_namespace
+
+    async with session_factory() as db:
+        plan = await db.execute(
+            text(
+                f"EXPLAIN SELECT id FROM knowledge_store "
+                f"WHERE namespace = :ns AND vector_dims(knowledge_store.embedding) = {DIM} "
+                f"ORDER BY CAST(knowledge_store.embedding AS VECTOR({DIM})) <=> CAST(:q AS VECTOR({DIM})) "
+                f"LIMIT {K}"
+            ).bindparams(ns=namespace, q=str(queries[0]))
+        )
+        assert ann_index_name(DIM) in "\n".join(row[0] for row in plan.all())
+
+    recalls: list[float] = []
+    ann_times: list[float] = []
+    exact_times: list[float] = []
+    for query in queries:
+        expected, exact_s = await _search(session_factory, namespace, query, exact=True)
+        found, ann_s = await _search(session_factory, namespace, query, exact=False)
+        recalls.append(len(set(expected) & set(found)) / K)
+        exact_times.append(exact_s)
+        ann_times.append(ann_s)
+
+    recall = statistics.mean(recalls)
+    ann_p50 = statistics.median(ann_times) * 1000
+    exact_p50 = statistics.median(exact_times) * 1000
+    print(
+        f"\nrecall@{K}={recall:.3f} over {QUERIES} queries, {ROWS} rows x {DIM} dims; "
+        f"p50 hnsw={ann_p50:.1f}ms exact={exact_p50:.1f}ms"
+    )
+
+    assert recall >= 0.95
+    assert ann_p50 < exact_p50
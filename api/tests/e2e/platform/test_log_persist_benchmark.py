@@ -0,0 +1,122 @@
+"""
+Benchmark: persisting an execution's log stream to Postgres.
+
+Fills a Redis stream with 100, 1k and 10k log entries and copies it into
+execution_logs two ways:
+
+- legacy: what flush_logs_to_postgres used to do — one XRANGE for the
+  whole stream, an ExecutionLog ORM object per entry, add_all
+- paged: _persist_stream_pages — XRANGE COUNT pages, one multi-row
+  INSERT per page
+
+Both must persist every entry; from 1k logs up the paged path must win.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+from sqlalchemy import delete, func, select
+
+from bifrost._logging import _build_stream_entry, _persist_stream_pages
+from src.core.cache.keys import execution_logs_stream_key
+from src.models.enums import ExecutionStatus
+from src.models.orm import Execution, ExecutionLog
+from tests.conftest import TEST_REDIS_URL
+
+pytestmark = pytest.mark.slow
+
+
+async def _legacy_persist(r, stream_key, exec_uuid, db) -> int:
+    entries = await r.xrange(stream_key, min="-", max="+")
+    logs = []
+    for seq, (_entry_id, data) in enumerate(entries):
+        ts = datetime.fromisoformat(data["timestamp"]).replace(tzinfo=None)
+        logs.append(
+            ExecutionLog(
+                execution_id=exec_uuid,
+                level=data.get("level", "INFO"),
+                message=data.get("message", ""),
+                log_metadata=json.loads(data.get("metadata", "{}")),
+                timestamp=ts,
+                sequence=seq,
+            )
+        )
+    db.add_all(logs)
+    await db.flush()
+    return len(logs)
+
+
+@pytest_asyncio.fixture
+async def execution(db_session):
+    """An execution row to hang logs off, plus a Redis client for its stream."""
+    row = Execution(
+        id=uuid4(),
+        workflow_name="log_persist_benchmark",
+        status=ExecutionStatus.SUCCESS,
+        executed_by_name="benchmark",
+    )
+    db_session.add(row)
+    await db_session.commit()
+    r = aioredis.from_url(TEST_REDIS_URL, decode_responses=True)
+
+    yield row.id, r
+
+    await r.delete(execution_logs_stream_key(str(row.id)))
+    await r.aclose()
+    await db_session.rollback()
+    await db_session.execute(delete(ExecutionLog).where(ExecutionLog.execution_id == row.id))
+    await db_session.execute(delete(Execution).where(Execution.id == row.id))
+    await db_session.commit()
+
+
+async def _fill_stream(r, exec_id: str, count: int) -> str:
+    stream_key = execution_logs_stream_key(exec_id)
+    pipe = r.pipeline(transaction=False)
+    for n in range(count):
+        pipe.xadd(
+            stream_key,
+            _build_stream_entry(
+                exec_id, "info", f"log line {n}", {"n": n}, datetime.now(timezone.utc)
+            ),
+        )
+    await pipe.execute()
+    return stream_key
+
+
+async def _log_count(db, exec_uuid) -> int:
+    result = await db.execute(
+        select(func.count()).select_from(ExecutionLog).where(ExecutionLog.execution_id == exec_uuid)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lines", [100, 1_000, 10_000])
+async def test_paged_log_persistence_throughput(execution, db_session, lines):
+    exec_uuid, r = execution
+    stream_key = await _fill_stream(r, str(exec_uuid), lines)
+
+    started = time.perf_counter()
+    assert await _legacy_persist(r, stream_key, exec_uuid, db_session) == lines
+    legacy_s = time.perf_counter() - started
+    assert await _log_count(db_session, exec_uuid) == lines
+    await db_session.execute(delete(ExecutionLog).where(ExecutionLog.execution_id == exec_uuid))
+    db_session.expunge_all()
+
+    started = time.perf_counter()
+    assert await _persist_stream_pages(r, stream_key, exec_uuid, db_session) == lines
+    paged_s = time.perf_counter() - started
+    assert await _log_count(db_session, exec_uuid) == lines
+
+    print(
+        f"\n{lines} logs: legacy={lines / legacy_s:.0f}/s "
+        f"paged={lines / paged_s:.0f}/s"
+    )
+
+    if lines >= 1_000:
+        assert paged_s < legacy_s
@@ -0,0 +1,99 @@
+"""
+Load test: queue position broadcasts with 10k queued executions.
+
+Enqueues 10k executions in concurrent bursts, then drains half of them,
+against a real Redis. Publishing the full queue on every mutation (the
+previous behaviour) costs N(N+1)/2 messages for N enqueues; the coalesced
+broadcaster should stay within a small multiple of N, and the last
+position published to every execution must match its actual rank.
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+import src.services.execution.queue_tracker as queue_tracker
+from src.core.pubsub import manager
+from tests.conftest import TEST_REDIS_URL
+
+pytestmark = pytest.mark.slow
+
+QUEUED = 10_000
+BURST = 500
+
+
+@pytest_asyncio.fixture
+async def isolated_queue(monkeypatch):
+    """Point the tracker at a private sorted set and capture broadcasts."""
+    key = f"bifrost:queue:load-test:{uuid4().hex}"
+    monkeypatch.setattr(queue_tracker, "QUEUE_KEY", key)
+    monkeypatch.setattr(queue_tracker, "_redis", None)
+    monkeypatch.setattr(queue_tracker, "_broadcasters", {})
+
+    published: list[tuple[str, dict]] = []
+    original = manager.broadcast_many
+
+    async def capture(messages):
+        published.extend(messages)
+        await original(messages)
+
+    monkeypatch.setattr(manager, "broadcast_many", capture)
+
+    yield published
+
+    client = aioredis.from_url(TEST_REDIS_URL, decode_responses=True)
+    await client.delete(key)
+    await client.aclose()
+
+
+def _last_positions(published: list[tuple[str, dict]]) -> dict[str, int]:
+    last: dict[str, int] = {}
+    for channel, message in published:
+        last[channel.removeprefix("execution:")] = message["queuePosition"]
+    return last
+
+
+@pytest.mark.asyncio
+async def test_broadcasts_scale_linearly_at_10k(isolated_queue):
+    published = isolated_queue
+    exec_ids = [str(uuid4()) for _ in range(QUEUED)]
+
+    started = time.perf_counter()
+    for start in range(0, QUEUED, BURST):
+        await asyncio.gather(
+            *(queue_tracker.add_to_queue(exec_id) for exec_id in exec_ids[start:start + BURST])
+        )
+    await queue_tracker.get_queue_broadcaster().wait()
+    enqueue_s = time.perf_counter() - started
+    enqueue_messages = len(published)
+
+    assert await queue_tracker.get_queue_depth() == QUEUED
+    # Every execution heard about its position at least once...
+    assert _last_positions(published) == dict(await queue_tracker.get_all_queue_positions())
+    # ...without the quadratic fan-out
+    legacy_messages = QUEUED * (QUEUED + 1) // 2
+    assert enqueue_messages <= 2 * QUEUED
+
+    started = time.perf_counter()
+    drained = exec_ids[:QUEUED // 2]
+    for start in range(0, len(drained), BURST):
+        await asyncio.gather(
+            *(queue_tracker.remove_from_queue(exec_id) for exec_id in drained[start:start + BURST])
+        )
+    await queue_tracker.get_queue_broadcaster().wait()
+    drain_s = time.perf_counter() - started
+    drain_messages = len(published) - enqueue_messages
+
+    remaining = dict(await queue_tracker.get_all_queue_positions())
+    last = _last_positions(published)
+    assert {exec_id: last[exec_id] for exec_id in remaining} == remaining
+
+    print(
+        f"\nenqueue {QUEUED}: {enqueue_messages} messages in {enqueue_s:.2f}s "
+        f"(full broadcast per mutation: {legacy_messages})"
+        f"\ndrain {len(drained)}: {drain_messages} messages in {drain_s:.2f}s"
+    )
@@ -0,0 +1,111 @@
+"""
+Benchmark: publish throughput of the pooled publisher vs the old per-message path.
+
+Publishes the same messages to a private queue three ways:
+
+- legacy: what publish_message used to do per message — open a channel,
+  declare the DLX, poison queue, binding and main queue, publish, close
+- publish_message: pooled channel, topology declared once
+- publish_many: pooled channel, confirms awaited per batch
+
+Both new paths must beat the legacy one, and every message must arrive.
+"""
+
+import json
+import time
+from uuid import uuid4
+
+import aio_pika
+import pytest
+import pytest_asyncio
+
+from src.jobs.rabbitmq import publish_many, publish_message, rabbitmq
+
+pytestmark = pytest.mark.slow
+
+MESSAGES = 2_000
+
+
+async def _legacy_publish(queue_name: str, message: dict) -> None:
+    async with rabbitmq.get_connection() as connection:
+        channel = await connection.channel()
+        try:
+            dead_letter_exchange = f"{queue_name}-dlx"
+            await channel.declare_exchange(
+                dead_letter_exchange, aio_pika.ExchangeType.DIRECT, durable=True
+            )
+            dlq = await channel.declare_queue(f"{queue_name}-poison", durable=True)
+            await dlq.bind(dead_letter_exchange, routing_key=queue_name)
+            await channel.declare_queue(
+                queue_name,
+                durable=True,
+                arguments={
+                    "x-dead-letter-exchange": dead_letter_exchange,
+                    "x-dead-letter-routing-key": queue_name,
+                },
+            )
+            await channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=json.dumps(message).encode(),
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+                routing_key=queue_name,
+            )
+        finally:
+            await channel.close()
+
+
+@pytest_asyncio.fixture
+async def queue_name():
+    # Pools pin their connections to the loop that created them
+    rabbitmq.reset_pools()
+    await rabbitmq.init_pools()
+    name = f"publish-bench-{uuid4().hex[:8]}"
+
+    yield name
+
+    async with rabbitmq.get_connection() as connection:
+        channel = await connection.channel()
+        await channel.queue_delete(name)
+        await channel.queue_delete(f"{name}-poison")
+        await channel.exchange_delete(f"{name}-dlx")
+        await channel.close()
+    await rabbitmq.close()
+    rabbitmq.reset_pools()
+
+
+async def _depth(queue_name: str) -> int:
+    async with rabbitmq.get_connection() as connection:
+        channel = await connection.channel()
+        queue = await channel.declare_queue(queue_name, passive=True)
+        await channel.close()
+        return queue.declaration_result.message_count
+
+
+@pytest.mark.asyncio
+async def test_pooled_publisher_throughput(queue_name):
+    messages = [{"execution_id": str(uuid4()), "n": n} for n in range(MESSAGES)]
+
+    started = time.perf_counter()
+    for message in messages:
+        await _legacy_publish(queue_name, message)
+    legacy_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for message in messages:
+        await publish_message(queue_name, message)
+    single_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await publish_many(queue_name, messages)
+    many_s = time.perf_counter() - started
+
+    print(
+        f"\n{MESSAGES} messages: legacy={MESSAGES / legacy_s:.0f}/s "
+        f"publish_message={MESSAGES / single_s:.0f}/s "
+        f"publish_many={MESSAGES / many_s:.0f}/s"
+    )
+
+    assert await _depth(queue_name) == 3 * MESSAGES
+    assert single_s < legacy_s
+    assert many_s < single_s
@@ -0,0 +1,134 @@
+"""
+Benchmark: fork -> result -> on_result round-trip latency.
+
+Forks trivial children that immediately send a result over the same
+pipe-backed queue the template uses, and measures how long the pool takes
+to hand that result to on_result at 1/10/50 concurrent executions.
+
+"before" replays the previous collection strategy (scan every handle with
+get_nowait, then sleep 100ms); "after" is the event-driven path
+(_watch_result_pipe + _result_loop). Timestamps use time.monotonic, which
+is CLOCK_MONOTONIC on Linux and therefore comparable across the fork.
+"""
+
+import asyncio
+import multiprocessing
+import statistics
+import time
+from datetime import datetime, timezone
+from queue import Empty
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.execution.process_pool import (
+    ExecutionInfo,
+    ProcessHandle,
+    ProcessPoolManager,
+    ProcessState,
+)
+from src.services.execution.template_process import _RecvQueue
+
+pytestmark = pytest.mark.slow
+
+CONCURRENCY_LEVELS = (1, 10, 50)
+
+
+def _trivial_child(conn, execution_id: str) -> None:
+    """Forked child: report a trivial result immediately and exit."""
+    conn.send({"execution_id": execution_id, "success": True, "sent_at": time.monotonic()})
+    conn.close()
+
+
+async def _fork_children(
+    pool: ProcessPoolManager, count: int, event_driven: bool,
+) -> list:
+    """
+    Fork `count` trivial children and register their handles with the pool.
+
+    Yields to the loop after each fork, as route_execution does between
+    dispatches, so already-finished children can be collected meanwhile.
+    """
+    ctx = multiprocessing.get_context("fork")
+    children = []
+    for i in range(count):
+        reader, writer = ctx.Pipe(duplex=False)
+        execution_id = f"exec-{i}"
+        handle = ProcessHandle(
+            id=f"process-{i}",
+            process=MagicMock(),
+            pid=0,
+            state=ProcessState.BUSY,
+            work_queue=MagicMock(),
+            result_queue=_RecvQueue(reader),
+            started_at=datetime.now(timezone.utc),
+            current_execution=ExecutionInfo(
+                execution_id=execution_id,
+                started_at=datetime.now(timezone.utc),
+                timeout_seconds=30,
+            ),
+        )
+        pool.processes[handle.id] = handle
+        if event_driven:
+            pool._watch_result_pipe(handle)
+        child = ctx.Process(target=_trivial_child, args=(writer, execution_id))
+        child.start()
+        writer.close()
+        children.append(child)
+        await asyncio.sleep(0)
+    return children
+
+
+async def _polling_result_loop(pool: ProcessPoolManager) -> None:
+    """The pre-event-driven collector, kept here as the benchmark baseline."""
+    while True:
+        for handle in list(pool.processes.values()):
+            try:
+                result = handle.result_queue.get_nowait()
+            except (Empty, EOFError, OSError):
+                continue
+            await pool._handle_result(handle, result)
+        await asyncio.sleep(0.1)
+
+
+async def _measure(count: int, event_driven: bool) -> list[float]:
+    """Return send->on_result latency in ms for `count` executions."""
+    received: list[tuple[float, float]] = []
+    done = asyncio.Event()
+
+    async def on_result(result):
+        received.append((result["sent_at"], time.monotonic()))
+        if len(received) == count:
+            done.set()
+
+    pool = ProcessPoolManager(max_workers=count, on_result=on_result)
+    if event_driven:
+        loop_task = asyncio.create_task(pool._result_loop())
+    else:
+        loop_task = asyncio.create_task(_polling_result_loop(pool))
+
+    children = await _fork_children(pool, count, event_driven)
+    try:
+        await asyncio.wait_for(done.wait(), timeout=30)
+    finally:
+        loop_task.cancel()
+        for child in children:
+            child.join(timeout=5)
+
+    return [(got - sent) * 1000 for sent, got in received]
+
+
+class TestResultCollectionLatency:
+    """Event-driven collection vs 100ms polling."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", CONCURRENCY_LEVELS)
+    async def test_event_driven_beats_polling(self, count):
+        """Result dispatch should no longer pay the poll interval."""
+        before = await _measure(count, event_driven=False)
+        after = await _measure(count, event_driven=True)
+
+        assert statistics.mean(after) < statistics.mean(before), (
+            f"event-driven ({statistics.mean(after):.1f}ms) not faster than "
+            f"polling ({statistics.mean(before):.1f}ms)"
+        )
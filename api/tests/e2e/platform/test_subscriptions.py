@@ -144,6 +144,50 @@ async def test_receive_insert(platform_admin, alice_user):
             await ws.close()
 
 
+@pytest.mark.e2e
+@pytest.mark.asyncio
+async def test_receive_batch_insert_per_row(platform_admin, alice_user):
+    """A batch write is one coalesced publish but still one WS frame per row."""
+    async with httpx.AsyncClient(base_url=TEST_API_URL) as client:
+        r = await client.post(
+            "/api/tables",
+            headers=platform_admin.headers,
+            json={
+                "name": f"sub_batch_{uuid.uuid4().hex[:8]}",
+                "organization_id": None,
+                "policies": {"policies": [
+                    {
+                        "name": "admin_bypass",
+                        "actions": ["read", "create", "update", "delete"],
+                        "when": {"user": "is_platform_admin"},
+                    },
+                    {"name": "everyone_read", "actions": ["read"], "when": None},
+                ]},
+            },
+        )
+        assert r.status_code == 201, r.text
+        table_id = r.json()["id"]
+
+        ws, ack = await _ws_subscribe(alice_user.access_token, [f"table:{table_id}"])
+        try:
+            assert ack.get("type") == "subscribed", f"subscribe failed: {ack}"
+            r = await client.post(
+                f"/api/tables/{table_id}/documents/batch",
+                headers=platform_admin.headers,
+                json={"documents": [{"data": {"x": i}} for i in range(3)]},
+            )
+            assert r.status_code == 200, r.text
+            seen = []
+            for _ in range(3):
+                msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=3.0))
+                assert msg["type"] == "document_change", msg
+                assert msg["action"] == "insert", msg
+                seen.append(msg["row"]["x"])
+            assert sorted(seen) == [0, 1, 2]
+        finally:
+            await ws.close()
+
+
 @pytest.mark.e2e
 @pytest.mark.asyncio
 async def test_subscribe_by_name_resolves_to_canonical_channel(platform_admin, alice_user):
@@ -1146,6 +1146,100 @@ class TestDocumentQueryPaginationStable:
         assert len(set(walked)) == n
 
 
+@pytest.mark.e2e
+class TestDocumentCursorPagination:
+    """Keyset pagination via ``cursor``/``next_cursor`` and NDJSON export."""
+
+    def _walk_cursor(self, e2e_client, platform_admin, table_id, page_size, body_extra):
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = e2e_client.post(
+                f"/api/tables/{table_id}/documents/query",
+                headers=platform_admin.headers,
+                json={"limit": page_size, "cursor": cursor, **body_extra},
+            )
+            assert page.status_code == 200, page.text
+            body = page.json()
+            seen.extend(d["id"] for d in body["documents"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        return seen
+
+    def _seed(self, e2e_client, platform_admin, documents: list[dict]) -> str:
+        table_id = _create_table(e2e_client, platform_admin.headers, f"cur_{uuid4().hex[:8]}")
+        b = e2e_client.post(
+            f"/api/tables/{table_id}/documents/batch",
+            headers=platform_admin.headers,
+            json={"documents": [{"data": d} for d in documents]},
+        )
+        assert b.status_code == 200, b.text
+        return table_id
+
+    def _full(self, e2e_client, platform_admin, table_id, body_extra) -> list[str]:
+        full = e2e_client.post(
+            f"/api/tables/{table_id}/documents/query",
+            headers=platform_admin.headers,
+            json={"limit": 1000, **body_extra},
+        )
+        assert full.status_code == 200, full.text
+        return [d["id"] for d in full.json()["documents"]]
+
+    @pytest.mark.parametrize("order_dir", ["asc", "desc"])
+    def test_cursor_walk_default_order_matches_full_query(
+        self, e2e_client, platform_admin, order_dir
+    ):
+        table_id = self._seed(e2e_client, platform_admin, [{"i": i} for i in range(11)])
+        extra = {"order_dir": order_dir}
+        walked = self._walk_cursor(e2e_client, platform_admin, table_id, 4, extra)
+        assert walked == self._full(e2e_client, platform_admin, table_id, extra)
+
+    @pytest.mark.parametrize("order_dir", ["asc", "desc"])
+    def test_cursor_walk_order_by_with_ties_and_nulls(
+        self, e2e_client, platform_admin, order_dir
+    ):
+        """Ties on the sort key and rows missing it are each visited once."""
+        docs = [{"status": s} for s in ["b", "a", "b", "c", "a"]] + [{"other": 1}] * 4
+        table_id = self._seed(e2e_client, platform_admin, docs)
+        extra = {"order_by": "status", "order_dir": order_dir}
+        walked = self._walk_cursor(e2e_client, platform_admin, table_id, 3, extra)
+        assert walked == self._full(e2e_client, platform_admin, table_id, extra)
+        assert len(set(walked)) == len(docs)
+
+    def test_cursor_for_other_query_rejected(self, e2e_client, platform_admin):
+        table_id = self._seed(e2e_client, platform_admin, [{"i": i} for i in range(3)])
+        first = e2e_client.post(
+            f"/api/tables/{table_id}/documents/query",
+            headers=platform_admin.headers,
+            json={"limit": 2},
+        )
+        cursor = first.json()["next_cursor"]
+        assert cursor
+        r = e2e_client.post(
+            f"/api/tables/{table_id}/documents/query",
+            headers=platform_admin.headers,
+            json={"limit": 2, "cursor": cursor, "order_by": "i"},
+        )
+        assert r.status_code == 422, r.text
+
+    def test_export_streams_ndjson(self, e2e_client, platform_admin):
+        import json
+
+        table_id = self._seed(
+            e2e_client, platform_admin, [{"i": i, "even": i % 2 == 0} for i in range(5)]
+        )
+        r = e2e_client.post(
+            f"/api/tables/{table_id}/documents/export",
+            headers=platform_admin.headers,
+            json={"where": {"even": True}, "order_by": "i"},
+        )
+        assert r.status_code == 200, r.text
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in r.text.splitlines() if line]
+        assert [row["data"]["i"] for row in rows] == [0, 2, 4]
+
+
 @pytest.mark.e2e
 class TestDocumentIdUniquePerTable:
     """Document `id` must be unique *per table*, not platform-wide.
@@ -0,0 +1,67 @@
+"""
+Benchmark: one table change fanned out to 1k websocket subscribers.
+
+Compares the grouped fanout (one visibility decision per class of
+equivalent subscribers) against deciding per socket, for a dashboard's
+mix of orgs, roles and admins. Both must send the same messages; the
+grouped path must be faster.
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shared.policies.predicate import clear_compiled_policies
+from src.routers import websocket as ws_router
+from tests.unit.policies.test_evaluate import FakeUser
+from tests.unit.routers.test_websocket_table_fanout import (
+    CHANNEL,
+    ORG_A,
+    ORG_B,
+    POLICIES,
+    _change,
+    _per_socket,
+    _Socket,
+)
+
+pytestmark = pytest.mark.slow
+
+SUBSCRIBERS = 1_000
+
+
+@pytest.fixture(autouse=True)
+def policies():
+    clear_compiled_policies()
+    with patch.object(ws_router, "_load_policies_for_table", AsyncMock(return_value=POLICIES)):
+        yield
+    clear_compiled_policies()
+
+
+@pytest.mark.asyncio
+async def test_grouped_fanout_to_1k_subscribers_beats_per_socket_path():
+    users = []
+    for n in range(SUBSCRIBERS):
+        if n % 50 == 0:
+            users.append(FakeUser(is_platform_admin=True))
+        else:
+            users.append(FakeUser(
+                organization_id=(ORG_A, ORG_B)[n % 2],
+                role_names=["viewer"] if n % 3 else ["editor"],
+            ))
+    payloads = [_change(ORG_A, status) for status in ("draft", "published")] * 10
+
+    per_socket = [_Socket(u) for u in users]
+    started = time.perf_counter()
+    for payload in payloads:
+        await _per_socket(per_socket, payload)
+    per_socket_s = time.perf_counter() - started
+
+    grouped = [_Socket(u) for u in users]
+    started = time.perf_counter()
+    for payload in payloads:
+        await ws_router._fan_out_table_message(CHANNEL, payload, grouped)
+    grouped_s = time.perf_counter() - started
+
+    assert [s.sent for s in grouped] == [s.sent for s in per_socket]
+    assert grouped_s < per_socket_s
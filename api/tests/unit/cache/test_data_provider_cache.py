@@ -2,20 +2,24 @@
 
 import json
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.core.cache.data_provider_cache import (
     TTL_DATA_PROVIDER,
+    TTL_LOCK,
+    TTL_STALE,
     acquire_compute_lock,
     cache_result,
     compute_param_hash,
     data_provider_cache_key,
     data_provider_lock_key,
+    extend_compute_lock,
     get_cached_result,
     invalidate_data_provider,
     release_compute_lock,
+    wait_for_cached_result,
 )
 
 
@@ -119,7 +123,7 @@ class TestGetCachedResult:
 
     @pytest.mark.asyncio
     async def test_expired_cache_returns_none(self):
-        """Returns None and deletes expired entries."""
+        """Returns None for expired entries but keeps them for revalidation."""
         expires_at = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
         cached_data = {
             "data": {"users": [1, 2, 3]},
@@ -136,7 +140,30 @@ class TestGetCachedResult:
 
             result = await get_cached_result("org-123", "get_users", {"id": 1})
             assert result is None
-            mock_redis.delete.assert_called_once()
+            mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_served_stale_when_allowed(self):
+        """Returns expired entries marked stale when allow_stale is set."""
+        expires_at = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+        cached_data = {
+            "data": {"users": [1, 2, 3]},
+            "expires_at": expires_at
+        }
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=json.dumps(cached_data))
+
+        with patch("src.core.cache.data_provider_cache.get_redis") as mock_get_redis:
+            mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+            mock_get_redis.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await get_cached_result(
+                "org-123", "get_users", {"id": 1}, allow_stale=True
+            )
+            assert result is not None
+            assert result["stale"] is True
+            assert result["data"] == {"users": [1, 2, 3]}
 
 
 class TestCacheResult:
@@ -157,7 +184,7 @@ class TestCacheResult:
 
             mock_redis.setex.assert_called_once()
             call_args = mock_redis.setex.call_args
-            assert call_args[0][1] == 300  # TTL
+            assert call_args[0][1] == 300 + TTL_STALE  # TTL plus stale window
 
             # Verify expiration is in the future
             assert expires_at > datetime.now(timezone.utc)
@@ -175,7 +202,7 @@ class TestCacheResult:
             await cache_result("org-123", "get_users", None, {"data": 1})
 
             call_args = mock_redis.setex.call_args
-            assert call_args[0][1] == TTL_DATA_PROVIDER
+            assert call_args[0][1] == TTL_DATA_PROVIDER + TTL_STALE
 
 
 class TestInvalidateDataProvider:
@@ -258,3 +285,83 @@ class TestStampedeProtection:
 
             await release_compute_lock("org-123", "get_users", {"id": 1})
             mock_redis.delete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_extend_lock(self):
+        """Extends the lock by resetting its TTL."""
+        mock_redis = AsyncMock()
+
+        with patch("src.core.cache.data_provider_cache.get_redis") as mock_get_redis:
+            mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+            mock_get_redis.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            await extend_compute_lock("org-123", "get_users", {"id": 1})
+            mock_redis.expire.assert_awaited_once_with(
+                data_provider_lock_key("org-123", "get_users", compute_param_hash({"id": 1})),
+                TTL_LOCK,
+            )
+
+
+class TestWaitForCachedResult:
+    """Tests for waiting on another caller's computation."""
+
+    @staticmethod
+    def _redis_returning(*results):
+        pipe = MagicMock()
+        pipe.get.return_value = pipe
+        pipe.exists.return_value = pipe
+        pipe.execute = AsyncMock(side_effect=list(results))
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = pipe
+        return mock_redis, pipe
+
+    @pytest.mark.asyncio
+    async def test_returns_entry_once_cached(self):
+        """Polls until the lock holder caches a fresh entry."""
+        expires_at = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
+        entry = {"data": [1], "expires_at": expires_at}
+        mock_redis, pipe = self._redis_returning(
+            [None, 1],
+            [json.dumps(entry), 0],
+        )
+
+        with patch("src.core.cache.data_provider_cache.get_redis") as mock_get_redis, \
+                patch("src.core.cache.data_provider_cache.LOCK_POLL_INTERVAL", 0):
+            mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+            mock_get_redis.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await wait_for_cached_result("org-123", "get_users", {"id": 1})
+
+        assert result == entry
+        assert pipe.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_lock_released_without_result(self):
+        """A released lock with no fresh entry means the computation failed."""
+        expires_at = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+        stale = {"data": [1], "expires_at": expires_at}
+        mock_redis, _ = self._redis_returning([json.dumps(stale), 0])
+
+        with patch("src.core.cache.data_provider_cache.get_redis") as mock_get_redis:
+            mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+            mock_get_redis.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await wait_for_cached_result("org-123", "get_users", {"id": 1})
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_timeout(self):
+        """Returns None once the timeout elapses while the lock is held."""
+        mock_redis, _ = self._redis_returning(*([[None, 1]] * 100))
+
+        with patch("src.core.cache.data_provider_cache.get_redis") as mock_get_redis, \
+                patch("src.core.cache.data_provider_cache.LOCK_POLL_INTERVAL", 0):
+            mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+            mock_get_redis.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = await wait_for_cached_result(
+                "org-123", "get_users", {"id": 1}, timeout=0
+            )
+
+        assert result is None
@@ -0,0 +1,175 @@
+"""Unit tests for the per-process SDK integration resolution cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.cache import integration_cache
+from src.core.cache.integration_cache import (
+    MAX_CACHED_RESOLUTIONS,
+    TOKEN_EXPIRY_MARGIN_SECONDS,
+    _after_commit,
+    _after_flush,
+    _after_rollback,
+    cache_resolution,
+    current_version,
+    get_cached_resolution,
+    invalidate_integration_resolutions,
+    mark_integration_state_changed,
+)
+from src.core.cache.keys import INTEGRATIONS_VERSION_KEY
+
+KEY = ("HaloPSA", "org-1", None)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    integration_cache.clear_local_cache()
+    yield
+    integration_cache.clear_local_cache()
+
+
+class TestResolutionCache:
+    """Tests for cache_resolution / get_cached_resolution."""
+
+    def test_hit_with_same_version(self):
+        response = object()
+        cache_resolution(KEY, 3, response)
+        assert get_cached_resolution(KEY, 3) is response
+
+    def test_miss_after_version_bump(self):
+        cache_resolution(KEY, 3, object())
+        assert get_cached_resolution(KEY, 4) is None
+        # Stale entry is dropped
+        assert get_cached_resolution(KEY, 3) is None
+
+    def test_no_caching_without_version(self):
+        cache_resolution(KEY, None, object())
+        assert get_cached_resolution(KEY, 0) is None
+        assert get_cached_resolution(KEY, None) is None
+
+    def test_keys_are_distinct_per_org_and_oauth_scope(self):
+        cache_resolution(KEY, 0, "default")
+        assert get_cached_resolution(("HaloPSA", "org-2", None), 0) is None
+        assert get_cached_resolution(("HaloPSA", "org-1", "scope"), 0) is None
+
+    def test_token_near_expiry_is_not_cached(self):
+        expires_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=TOKEN_EXPIRY_MARGIN_SECONDS - 1)
+        ).isoformat()
+        cache_resolution(KEY, 0, object(), expires_at=expires_at)
+        assert get_cached_resolution(KEY, 0) is None
+
+    def test_ttl_capped_by_token_expiry(self):
+        expires_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=TOKEN_EXPIRY_MARGIN_SECONDS + 5)
+        ).isoformat()
+        cache_resolution(KEY, 0, object(), expires_at=expires_at)
+
+        _, deadline, _ = integration_cache._cache[KEY]
+        with patch.object(integration_cache.time, "monotonic", return_value=deadline):
+            assert get_cached_resolution(KEY, 0) is None
+
+    def test_size_is_bounded(self):
+        for i in range(MAX_CACHED_RESOLUTIONS + 10):
+            cache_resolution((f"int-{i}", None, None), 0, i)
+        assert len(integration_cache._cache) == MAX_CACHED_RESOLUTIONS
+        # Oldest insertions were evicted first
+        assert get_cached_resolution(("int-0", None, None), 0) is None
+
+
+class TestVersion:
+    """Tests for the Redis version counter."""
+
+    @pytest.mark.asyncio
+    async def test_current_version_defaults_to_zero(self):
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = None
+        with patch.object(integration_cache, "get_shared_redis", AsyncMock(return_value=mock_redis)):
+            assert await current_version() == 0
+        mock_redis.get.assert_awaited_once_with(INTEGRATIONS_VERSION_KEY)
+
+    @pytest.mark.asyncio
+    async def test_current_version_none_when_redis_fails(self):
+        with patch.object(
+            integration_cache, "get_shared_redis", AsyncMock(side_effect=ConnectionError())
+        ):
+            assert await current_version() is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_bumps_version_and_clears_local(self):
+        cache_resolution(KEY, 0, object())
+        mock_redis = AsyncMock()
+        with patch.object(integration_cache, "get_shared_redis", AsyncMock(return_value=mock_redis)):
+            await invalidate_integration_resolutions()
+        mock_redis.incr.assert_awaited_once_with(INTEGRATIONS_VERSION_KEY)
+        assert integration_cache._cache == {}
+
+
+class TestInvalidationHooks:
+    """Tests for the SQLAlchemy session hooks."""
+
+    def _session(self, new=(), dirty=(), deleted=()):
+        session = MagicMock()
+        session.new = list(new)
+        session.dirty = list(dirty)
+        session.deleted = list(deleted)
+        session._bifrost_integration_cache_dirty = False
+        return session
+
+    def test_oauth_token_write_flags_session(self):
+        from src.models.orm.oauth import OAuthToken
+
+        session = self._session(dirty=[OAuthToken()])
+        _after_flush(session, None)
+        assert session._bifrost_integration_cache_dirty is True
+
+    def test_plain_config_write_does_not_flag_session(self):
+        from src.models.orm.config import Config
+
+        session = self._session(new=[Config(key="k", integration_id=None)])
+        _after_flush(session, None)
+        assert session._bifrost_integration_cache_dirty is False
+
+    def test_integration_config_write_flags_session(self):
+        from src.models.orm.config import Config
+
+        session = self._session(new=[Config(key="k", integration_id=uuid4())])
+        _after_flush(session, None)
+        assert session._bifrost_integration_cache_dirty is True
+
+    @pytest.mark.asyncio
+    async def test_commit_schedules_invalidation(self):
+        session = self._session()
+        session._bifrost_integration_cache_dirty = True
+        with patch.object(
+            integration_cache, "invalidate_integration_resolutions", AsyncMock()
+        ) as invalidate:
+            _after_commit(session)
+            await integration_cache.asyncio.sleep(0)
+        invalidate.assert_awaited_once()
+        assert session._bifrost_integration_cache_dirty is False
+
+    def test_rollback_clears_flag(self):
+        session = self._session()
+        session._bifrost_integration_cache_dirty = True
+        _after_rollback(session)
+        assert session._bifrost_integration_cache_dirty is False
+
+    @pytest.mark.asyncio
+    async def test_bulk_statement_marker_invalidates_on_commit(self):
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        # Bulk deletes never reach after_flush; the marker stands in for it
+        session = AsyncSession()
+        mark_integration_state_changed(session)
+        assert session.sync_session._bifrost_integration_cache_dirty is True
+
+        with patch.object(
+            integration_cache, "invalidate_integration_resolutions", AsyncMock()
+        ) as invalidate:
+            _after_commit(session.sync_session)
+            await integration_cache.asyncio.sleep(0)
+        invalidate.assert_awaited_once()
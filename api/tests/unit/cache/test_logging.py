@@ -19,6 +19,10 @@ from bifrost._logging import (
     read_logs_from_stream,
     flush_logs_to_postgres,
     close_thread_redis,
+    LogShipper,
+    start_log_shipper,
+    stop_log_shipper,
+    _stream_entry_to_row,
 )
 
 
@@ -234,6 +238,101 @@ class TestLogAndBroadcast:
                 assert append_ts is not None
 
 
+class TestLogShipper:
+    """Tests for batched, pipelined log shipping."""
+
+    def test_batch_is_one_pipeline_with_single_publish(self):
+        """A flush issues one XADD per record and one PUBLISH for the batch."""
+        exec_id = str(uuid4())
+        mock_redis = MagicMock()
+        pipe = mock_redis.pipeline.return_value
+
+        with patch("bifrost._logging._get_sync_redis", return_value=mock_redis):
+            shipper = LogShipper(exec_id)
+            ts = datetime.now(timezone.utc)
+            for i in range(3):
+                shipper.submit("info", f"message {i}", None, ts)
+            assert shipper.flush() == 3
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.xadd.call_count == 3
+        assert [c[0][1]["message"] for c in pipe.xadd.call_args_list] == [
+            "message 0", "message 1", "message 2",
+        ]
+        pipe.publish.assert_called_once()
+        channel, payload = pipe.publish.call_args[0]
+        assert channel == f"bifrost:execution:{exec_id}"
+        batch = json.loads(payload)
+        assert batch["type"] == "execution_log_batch"
+        assert [log["sequence"] for log in batch["logs"]] == [0, 1, 2]
+        assert all(log["type"] == "execution_log" for log in batch["logs"])
+        pipe.execute.assert_called_once()
+
+    def test_flush_splits_into_max_batch_chunks_in_order(self):
+        """Backlogs larger than max_batch ship as several ordered batches."""
+        mock_redis = MagicMock()
+        pipe = mock_redis.pipeline.return_value
+
+        with patch("bifrost._logging._get_sync_redis", return_value=mock_redis):
+            shipper = LogShipper("exec-123", max_batch=2)
+            ts = datetime.now(timezone.utc)
+            for i in range(5):
+                shipper.submit("INFO", str(i), None, ts)
+            shipper.flush()
+
+        assert pipe.execute.call_count == 3
+        sequences = [
+            log["sequence"]
+            for c in pipe.publish.call_args_list
+            for log in json.loads(c[0][1])["logs"]
+        ]
+        assert sequences == [0, 1, 2, 3, 4]
+
+    def test_full_queue_ships_from_caller(self):
+        """Reaching max_pending ships a batch inline so memory stays bounded."""
+        mock_redis = MagicMock()
+
+        with patch("bifrost._logging._get_sync_redis", return_value=mock_redis):
+            shipper = LogShipper("exec-123", max_batch=10, max_pending=4)
+            ts = datetime.now(timezone.utc)
+            for i in range(4):
+                shipper.submit("INFO", str(i), None, ts)
+
+        assert shipper.shipped == 4
+        assert len(shipper._pending) == 0
+
+    def test_redis_error_drops_batch_without_raising(self):
+        """Shipping stays best-effort, like the unbatched path."""
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("down")
+
+        with patch("bifrost._logging._get_sync_redis", return_value=mock_redis):
+            shipper = LogShipper("exec-123")
+            shipper.submit("INFO", "lost", None, datetime.now(timezone.utc))
+            shipper.flush()
+
+        assert shipper.shipped == 0
+        assert len(shipper._pending) == 0
+
+    def test_log_and_broadcast_routes_to_active_shipper(self):
+        """While a shipper runs, records are queued and flushed on stop."""
+        exec_id = str(uuid4())
+        mock_redis = MagicMock()
+        pipe = mock_redis.pipeline.return_value
+
+        with patch("bifrost._logging._get_sync_redis", return_value=mock_redis), \
+                patch("bifrost._logging.append_log_to_stream") as mock_append:
+            start_log_shipper(exec_id)
+            try:
+                assert log_and_broadcast(exec_id, "INFO", "queued") is None
+            finally:
+                stop_log_shipper(exec_id)
+
+        mock_append.assert_not_called()
+        messages = [c[0][1]["message"] for c in pipe.xadd.call_args_list]
+        assert messages == ["queued"]
+
+
 class TestAsyncLogFunctions:
     """Tests for async log functions."""
 
@@ -361,16 +460,58 @@ class TestFlushLogsToPostgres:
             # Patch at the location where it's used, not where it's defined
             with patch("src.core.database.get_session_factory") as mock_session_factory:
                 mock_db = MagicMock()
+                mock_db.execute = AsyncMock()
                 mock_db.commit = AsyncMock()  # commit is async
                 mock_session_factory.return_value.return_value.__aenter__.return_value = mock_db
 
                 count = await flush_logs_to_postgres(exec_id)
 
                 assert count == 2
-                mock_db.add_all.assert_called_once()
+                # Both entries go out in one multi-row INSERT
+                mock_db.execute.assert_called_once()
                 mock_db.commit.assert_called_once()
                 mock_redis.delete.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_flush_logs_pages_through_stream(self):
+        """Reads the stream in XRANGE COUNT pages with continuous sequences."""
+        exec_id = str(uuid4())
+
+        def entry(n: int) -> tuple[str, dict[str, str]]:
+            return (f"1234-{n}", {
+                "level": "INFO",
+                "message": f"Log {n}",
+                "metadata": "{}",
+                "timestamp": "2025-01-01T00:00:00",
+            })
+
+        first_page = [entry(0), entry(1)]
+        second_page = [entry(2)]
+
+        with patch("bifrost._logging.LOG_PERSIST_PAGE_SIZE", 2), \
+                patch("bifrost._logging._stream_entry_to_row", wraps=_stream_entry_to_row) as to_row, \
+                patch("src.core.cache.get_redis") as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.xrange.side_effect = [first_page, second_page]
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            mock_db = MagicMock()
+            mock_db.execute = AsyncMock()
+
+            count = await flush_logs_to_postgres(exec_id, session=mock_db)
+
+            assert count == 3
+            assert mock_db.execute.call_count == 2
+
+            # Second page resumes exclusively after the last entry of the first
+            second_call = mock_redis.xrange.call_args_list[1]
+            assert second_call.kwargs["min"] == "(1234-1"
+            assert second_call.kwargs["count"] == 2
+
+            sequences = [call.args[2] for call in to_row.call_args_list]
+            assert sequences == [0, 1, 2]
+            mock_redis.delete.assert_called_once()
+
 
 class TestCloseThreadRedis:
     """Tests for close_thread_redis function."""
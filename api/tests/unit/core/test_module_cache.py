@@ -144,6 +144,48 @@ class TestModuleCacheAsync:
             # Verify path was added to index
             mock_redis.sadd.assert_called_once_with("bifrost:module:index", "shared/test.py")
 
+    async def test_set_module_caches_bytecode(self, mock_redis_client):
+        """set_module pre-compiles the source into the bytecode cache."""
+        import marshal
+
+        mock_client, mock_redis = mock_redis_client
+
+        with patch("src.core.module_cache.get_redis_client", return_value=mock_client):
+            from src.core.module_cache import module_code_key, set_module
+
+            await set_module("shared/test.py", "x = 1", "abc123")
+
+            key, ttl, data = mock_redis.setex.call_args[0]
+            assert key == module_code_key("shared/test.py", "abc123")
+            assert ttl == 86400
+            assert marshal.loads(data).co_filename == "shared/test.py"
+
+    async def test_set_module_compiles_off_the_event_loop(self, mock_redis_client):
+        """The compile runs in a worker thread so large modules don't block the loop."""
+        import asyncio
+
+        mock_client, _ = mock_redis_client
+
+        with patch("src.core.module_cache.get_redis_client", return_value=mock_client), \
+             patch("src.core.module_cache.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            from src.core.module_cache import compile_module_code, set_module
+
+            await set_module("shared/test.py", "x = 1", "abc123")
+
+            to_thread.assert_called_once_with(compile_module_code, "shared/test.py", "x = 1")
+
+    async def test_set_module_skips_bytecode_for_syntax_error(self, mock_redis_client):
+        """Broken source is still cached, just without bytecode."""
+        mock_client, mock_redis = mock_redis_client
+
+        with patch("src.core.module_cache.get_redis_client", return_value=mock_client):
+            from src.core.module_cache import set_module
+
+            await set_module("shared/test.py", "def broken(", "abc123")
+
+            mock_client.setex.assert_called_once()
+            mock_redis.setex.assert_not_called()
+
     async def test_invalidate_module(self, mock_redis_client):
         """Test removing a module from cache."""
         mock_client, mock_redis = mock_redis_client
@@ -298,6 +340,35 @@ class TestModuleCacheSync:
 
             assert result == set()
 
+    def test_get_module_code_sync_uses_versioned_key(self):
+        """Bytecode lookups are keyed by interpreter magic, hash and path."""
+        from src.core.module_cache import BYTECODE_MAGIC
+
+        mock_binary = MagicMock()
+        mock_binary.get.return_value = b"code"
+
+        with patch("src.core.module_cache_sync._get_sync_redis_binary", return_value=mock_binary):
+            from src.core.module_cache_sync import get_module_code_sync
+
+            result = get_module_code_sync("shared/test.py", "abc123")
+
+            assert result == b"code"
+            mock_binary.get.assert_called_once_with(
+                f"bifrost:modcode:{BYTECODE_MAGIC}:abc123:shared/test.py"
+            )
+
+    def test_get_module_code_sync_handles_redis_error(self):
+        """Redis errors are treated as a bytecode cache miss."""
+        import redis
+
+        mock_binary = MagicMock()
+        mock_binary.get.side_effect = redis.RedisError("Connection failed")
+
+        with patch("src.core.module_cache_sync._get_sync_redis_binary", return_value=mock_binary):
+            from src.core.module_cache_sync import get_module_code_sync
+
+            assert get_module_code_sync("shared/test.py", "abc123") is None
+
     def test_reset_sync_redis(self):
         """Test resetting the sync Redis client."""
         from src.core.module_cache_sync import reset_sync_redis
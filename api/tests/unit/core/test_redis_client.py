@@ -1,13 +1,14 @@
 """
 Unit tests for Redis client for sync execution results.
 
-Tests the BLPOP/RPUSH pattern for synchronous workflow execution.
+Tests the RPUSH + notify pattern for synchronous workflow execution.
 """
 
+import asyncio
 import pytest
 import json
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestRedisClient:
@@ -19,14 +20,30 @@ class TestRedisClient:
         redis = AsyncMock()
         redis.rpush = AsyncMock()
         redis.expire = AsyncMock()
-        redis.blpop = AsyncMock()
+        redis.lpop = AsyncMock(return_value=None)
+        redis.publish = AsyncMock()
         redis.setex = AsyncMock()
         redis.close = AsyncMock()
         return redis
 
+    @pytest.fixture(autouse=True)
+    def mock_listener(self):
+        """Keep the result dispatcher from opening a real pub/sub connection."""
+        with patch("src.core.redis_client.ResilientPubSubListener") as listener_cls:
+            listener = MagicMock()
+            listener.start = AsyncMock()
+            listener.stop = AsyncMock()
+            listener_cls.return_value = listener
+            yield listener_cls
+
     async def test_push_result_success(self, mock_redis):
         """Test pushing execution result to Redis."""
-        from src.core.redis_client import RedisClient, RESULT_KEY_PREFIX, RESULT_TTL_SECONDS
+        from src.core.redis_client import (
+            RedisClient,
+            RESULT_KEY_PREFIX,
+            RESULT_NOTIFY_CHANNEL,
+            RESULT_TTL_SECONDS,
+        )
 
         client = RedisClient()
         client._redis = mock_redis
@@ -52,6 +69,11 @@ class TestRedisClient:
         # Verify TTL was set
         mock_redis.expire.assert_called_once_with(expected_key, RESULT_TTL_SECONDS)
 
+        # Verify waiting API processes are notified
+        mock_redis.publish.assert_called_once_with(
+            RESULT_NOTIFY_CHANNEL, json.dumps({"execution_id": "exec-123"})
+        )
+
     async def test_push_result_with_error(self, mock_redis):
         """Test pushing error result to Redis."""
         from src.core.redis_client import RedisClient
@@ -74,14 +96,11 @@ class TestRedisClient:
         assert payload["error_type"] == "RuntimeError"
 
     async def test_wait_for_result_success(self, mock_redis):
-        """Test waiting for execution result from Redis."""
+        """Test waiting for a result that was already pushed."""
         from src.core.redis_client import RedisClient, RESULT_KEY_PREFIX
 
         expected_result = {"status": "Success", "result": {"data": "test"}}
-        mock_redis.blpop.return_value = (
-            f"{RESULT_KEY_PREFIX}exec-789",
-            json.dumps(expected_result),
-        )
+        mock_redis.lpop.return_value = json.dumps(expected_result)
 
         client = RedisClient()
         client._redis = mock_redis
@@ -92,23 +111,76 @@ class TestRedisClient:
         )
 
         assert result == expected_result
-        mock_redis.blpop.assert_called_once()
+        mock_redis.lpop.assert_called_once_with(f"{RESULT_KEY_PREFIX}exec-789")
+        assert client._dispatcher._waiters == {}
 
     async def test_wait_for_result_timeout(self, mock_redis):
         """Test timeout when waiting for result."""
         from src.core.redis_client import RedisClient
 
-        mock_redis.blpop.return_value = None  # Timeout
-
         client = RedisClient()
         client._redis = mock_redis
 
         result = await client.wait_for_result(
             execution_id="exec-timeout",
-            timeout_seconds=5,
+            timeout_seconds=0.05,
         )
 
         assert result is None
+        assert client._dispatcher._waiters == {}
+
+    async def test_wait_for_result_woken_by_notification(self, mock_redis):
+        """A notification wakes only the matching waiter, which then pops."""
+        from src.core.redis_client import RedisClient, RESULT_NOTIFY_CHANNEL
+
+        expected_result = {"status": "Success", "result": 1}
+        pushed: dict[str, str] = {}
+
+        async def lpop(key: str) -> str | None:
+            return pushed.pop(key, None)
+
+        mock_redis.lpop.side_effect = lpop
+
+        client = RedisClient()
+        client._redis = mock_redis
+
+        waiters = [
+            asyncio.create_task(client.wait_for_result(f"exec-{i}", timeout_seconds=30))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert mock_redis.lpop.call_count == 3
+
+        pushed["bifrost:result:exec-1"] = json.dumps(expected_result)
+        await client._dispatcher._on_message(
+            RESULT_NOTIFY_CHANNEL, {"execution_id": "exec-1"}
+        )
+
+        assert await asyncio.wait_for(waiters[1], timeout=1) == expected_result
+        assert not waiters[0].done()
+        assert not waiters[2].done()
+        # Only the woken waiter re-checked Redis
+        assert mock_redis.lpop.call_count == 4
+
+        for task in (waiters[0], waiters[2]):
+            task.cancel()
+        await asyncio.gather(waiters[0], waiters[2], return_exceptions=True)
+        assert client._dispatcher._waiters == {}
+
+    async def test_dispatcher_uses_one_subscription(self, mock_redis, mock_listener):
+        """Concurrent waits share a single pub/sub listener."""
+        from src.core.redis_client import RedisClient, RESULT_NOTIFY_CHANNEL
+
+        client = RedisClient()
+        client._redis = mock_redis
+
+        await asyncio.gather(*(
+            client.wait_for_result(f"exec-{i}", timeout_seconds=0.01)
+            for i in range(20)
+        ))
+
+        mock_listener.assert_called_once()
+        assert mock_listener.call_args.kwargs["channels"] == [RESULT_NOTIFY_CHANNEL]
 
     async def test_close(self, mock_redis):
         """Test closing Redis connection."""
@@ -332,3 +332,56 @@ class TestResilientPubSubListenerAsync:
                 await listener.start()
 
             await listener.stop()
+
+    async def test_subscribe_changes_are_batched(self, mock_redis, mock_pubsub):
+        """Changes made together go out as one SUBSCRIBE and one UNSUBSCRIBE."""
+        import asyncio
+        from unittest.mock import patch
+
+        mock_pubsub.unsubscribe = AsyncMock()
+        listener = ResilientPubSubListener(
+            redis_url="redis://localhost:6379",
+            on_message=AsyncMock(),
+        )
+
+        with patch(
+            "src.core.redis_reconnect.Redis.from_url", return_value=mock_redis
+        ):
+            await listener._connect()
+            await listener.subscribe(["a"])
+            mock_pubsub.subscribe.assert_awaited_once_with("a")
+            mock_pubsub.subscribe.reset_mock()
+
+            pending = asyncio.gather(
+                listener.subscribe(["b"]),
+                listener.subscribe(["c", "a"]),
+            )
+            await asyncio.sleep(0)
+            listener.unsubscribe(["a"])
+            # Unsubscribed before it was ever sent: cancels out
+            listener.unsubscribe(["b"])
+            await pending
+
+            mock_pubsub.subscribe.assert_awaited_once_with("c")
+            mock_pubsub.unsubscribe.assert_awaited_once_with("a")
+
+        await listener._cleanup()
+
+    async def test_reconnect_resubscribes_dynamic_channels(self, mock_redis, mock_pubsub):
+        """Channels added while disconnected are subscribed on connect."""
+        from unittest.mock import patch
+
+        listener = ResilientPubSubListener(
+            redis_url="redis://localhost:6379",
+            on_message=AsyncMock(),
+        )
+        await listener.subscribe(["a", "b"])
+        listener.unsubscribe(["b"])
+
+        with patch(
+            "src.core.redis_reconnect.Redis.from_url", return_value=mock_redis
+        ):
+            await listener._connect()
+
+        mock_pubsub.subscribe.assert_awaited_once_with("a")
+        await listener._cleanup()
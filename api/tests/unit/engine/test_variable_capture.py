@@ -0,0 +1,144 @@
+"""
+Unit tests for workflow variable capture.
+
+On Python 3.12+ variables are captured through sys.monitoring scoped to the
+workflow's own code object; older interpreters (and interpreters where every
+candidate tool id is taken) fall back to sys.settrace. Both paths must
+produce the same captured variables.
+"""
+
+import base64
+import functools
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.sdk.context import ExecutionContext, Organization
+from src.services.execution import engine
+from src.services.execution.engine import (
+    _execute_workflow_with_trace,
+    _script_to_callable,
+    _start_return_capture,
+)
+
+HAS_MONITORING = hasattr(sys, "monitoring")
+
+
+@pytest.fixture
+def mock_context():
+    return ExecutionContext(
+        user_id="test-user-123",
+        email="test@example.com",
+        name="Test User",
+        scope="test-org-456",
+        organization=Organization(id="test-org-456", name="Test Organization", is_active=True),
+        is_platform_admin=False,
+        is_function_key=False,
+        execution_id="test-exec-789",
+    )
+
+
+@pytest.fixture(params=["monitoring", "settrace"])
+def capture_mode(request):
+    """Run a test against both capture engines."""
+    if request.param == "monitoring":
+        if not HAS_MONITORING:
+            pytest.skip("sys.monitoring requires Python 3.12+")
+        yield request.param
+    else:
+        with patch.object(engine, "_start_return_capture", return_value=None):
+            yield request.param
+
+
+async def _helper_with_locals() -> int:
+    helper_secret = "should-not-be-captured"
+    return len(helper_secret)
+
+
+class TestVariableCapture:
+    """Both capture engines record the workflow's final locals."""
+
+    async def test_captures_workflow_locals_on_return(self, mock_context, capture_mode):
+        async def capture_workflow(context: ExecutionContext, count: int):
+            total = count * 2
+            labels = [f"item-{i}" for i in range(count)]
+            size = await _helper_with_locals()
+            return total + size + len(labels)
+
+        result, captured, _ = await _execute_workflow_with_trace(
+            capture_workflow, mock_context, {"count": 3}
+        )
+
+        assert result == 6 + len("should-not-be-captured") + 3
+        assert captured["total"] == 6
+        assert captured["labels"] == ["item-0", "item-1", "item-2"]
+        assert captured["count"] == 3
+        assert "helper_secret" not in captured
+
+    async def test_captures_decorated_workflow_locals(self, mock_context, capture_mode):
+        def logged(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                wrapper_secret = "should-not-be-captured"
+                return await fn(*args, **kwargs) + len(wrapper_secret) * 0
+
+            return wrapper
+
+        @logged
+        async def decorated_workflow(context: ExecutionContext, count: int):
+            doubled = count * 2
+            return doubled
+
+        result, captured, _ = await _execute_workflow_with_trace(
+            decorated_workflow, mock_context, {"count": 4}
+        )
+
+        assert result == 8
+        assert captured["doubled"] == 8
+        assert "wrapper_secret" not in captured
+
+    async def test_captures_script_main_locals(self, mock_context, capture_mode):
+        code = base64.b64encode(b"greeting = 'hi'\nresult = greeting.upper()").decode()
+        script = _script_to_callable(code, "capture_script")
+
+        result, captured, _ = await _execute_workflow_with_trace(script, mock_context, {})
+
+        assert result == "HI"
+        assert captured["greeting"] == "hi"
+        assert captured["result"] == "HI"
+
+    async def test_trace_is_cleared_after_fallback(self, mock_context):
+        async def quick_workflow(context: ExecutionContext):
+            value = 1
+            return value
+
+        with patch.object(engine, "_start_return_capture", return_value=None):
+            await _execute_workflow_with_trace(quick_workflow, mock_context, {})
+
+        assert sys.gettrace() is None
+
+
+@pytest.mark.skipif(not HAS_MONITORING, reason="sys.monitoring requires Python 3.12+")
+class TestStartReturnCapture:
+    """Tool-id bookkeeping for the sys.monitoring engine."""
+
+    def test_stop_releases_tool_id(self):
+        def sample():
+            return 1
+
+        stop = _start_return_capture([sample.__code__], lambda frame: None)
+        assert stop is not None
+        assert sys.monitoring.get_tool(3) == engine._MONITORING_TOOL_NAME
+        stop()
+        assert sys.monitoring.get_tool(3) is None
+
+    def test_falls_back_when_tool_ids_taken(self):
+        for tool_id in engine._MONITORING_TOOL_IDS:
+            sys.monitoring.use_tool_id(tool_id, "other-tool")
+        try:
+            assert _start_return_capture([], lambda frame: None) is None
+        finally:
+            for tool_id in engine._MONITORING_TOOL_IDS:
+                sys.monitoring.free_tool_id(tool_id)
+
@@ -0,0 +1,213 @@
+"""
+Unit tests for the API-side data provider cache (single-flight + SWR).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.models import WorkflowExecutionResponse
+from src.models.enums import ExecutionStatus
+from src.services.execution import data_provider_edge
+from src.services.execution.data_provider_edge import execute_data_provider
+
+MODULE = "src.services.execution.data_provider_edge"
+
+
+def _response(result) -> WorkflowExecutionResponse:
+    return WorkflowExecutionResponse(
+        execution_id="exec-run",
+        workflow_id="wf-1",
+        workflow_name="get_users",
+        status=ExecutionStatus.SUCCESS,
+        result=result,
+        is_transient=True,
+    )
+
+
+async def _execute(run, parameters=None):
+    return await execute_data_provider(
+        org_id="org-123",
+        workflow_id="wf-1",
+        workflow_name="get_users",
+        parameters=parameters or {"q": "a"},
+        execution_id="exec-req",
+        run=run,
+    )
+
+
+@pytest.fixture
+def cache():
+    """Patch the Redis-backed cache helpers used by the edge module."""
+    with (
+        patch(f"{MODULE}.get_cached_data_provider", new_callable=AsyncMock) as get,
+        patch(f"{MODULE}.acquire_compute_lock", new_callable=AsyncMock) as acquire,
+        patch(f"{MODULE}.release_compute_lock", new_callable=AsyncMock) as release,
+        patch(f"{MODULE}.wait_for_cached_data_provider", new_callable=AsyncMock) as wait,
+        patch(f"{MODULE}.extend_compute_lock", new_callable=AsyncMock) as extend,
+    ):
+        get.return_value = None
+        acquire.return_value = True
+        wait.return_value = None
+        yield {
+            "get": get, "acquire": acquire, "release": release, "wait": wait, "extend": extend,
+        }
+    assert not data_provider_edge._inflight
+
+
+class TestCacheHit:
+    @pytest.mark.asyncio
+    async def test_fresh_hit_skips_dispatch(self, cache):
+        """A fresh entry is returned without running the provider."""
+        cache["get"].return_value = {"data": [1, 2], "expires_at": "2999-01-01T00:00:00+00:00"}
+        run = AsyncMock()
+
+        response = await _execute(run)
+
+        run.assert_not_called()
+        assert response.result == [1, 2]
+        assert response.execution_id == "exec-req"
+        assert response.status == ExecutionStatus.SUCCESS
+        cache["get"].assert_awaited_once_with(
+            "org-123", "get_users", {"q": "a"}, allow_stale=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_served_while_one_refresh_runs(self, cache):
+        """Stale entries are returned immediately; one refresh runs behind them."""
+        cache["get"].return_value = {"data": ["old"], "stale": True}
+        release_run = asyncio.Event()
+
+        async def slow_run():
+            await release_run.wait()
+            return _response(["new"])
+
+        run = AsyncMock(side_effect=slow_run)
+
+        first = await _execute(run)
+        second = await _execute(run)
+        assert first.result == ["old"] and second.result == ["old"]
+
+        release_run.set()
+        await asyncio.gather(*data_provider_edge._refreshes.values())
+
+        run.assert_awaited_once()
+        cache["acquire"].assert_awaited_once()
+        cache["release"].assert_awaited_once()
+        assert not data_provider_edge._refreshes
+
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_when_another_process_holds_lock(self, cache):
+        """No refresh runs if another process already holds the compute lock."""
+        cache["get"].return_value = {"data": ["old"], "stale": True}
+        cache["acquire"].return_value = False
+        run = AsyncMock()
+
+        await _execute(run)
+        await asyncio.gather(*data_provider_edge._refreshes.values())
+
+        run.assert_not_called()
+        cache["release"].assert_not_called()
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_run(self, cache):
+        """Concurrent misses for the same key in one process run the provider once."""
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def slow_run():
+            started.set()
+            await finish.wait()
+            return _response(["fresh"])
+
+        run = AsyncMock(side_effect=slow_run)
+
+        callers = [asyncio.create_task(_execute(run)) for _ in range(20)]
+        await started.wait()
+        finish.set()
+        responses = await asyncio.gather(*callers)
+
+        run.assert_awaited_once()
+        cache["acquire"].assert_awaited_once()
+        cache["release"].assert_awaited_once()
+        assert all(r.result == ["fresh"] for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_run_separately(self, cache):
+        """Single-flight is per cache key."""
+        run = AsyncMock(return_value=_response([]))
+
+        await asyncio.gather(_execute(run, {"q": "a"}), _execute(run, {"q": "b"}))
+
+        assert run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_for_lock_holder_in_another_process(self, cache):
+        """Without the lock, the result cached by the holder is returned."""
+        cache["acquire"].return_value = False
+        cache["wait"].return_value = {"data": ["theirs"]}
+        run = AsyncMock()
+
+        response = await _execute(run)
+
+        run.assert_not_called()
+        assert response.result == ["theirs"]
+        assert response.execution_id == "exec-req"
+
+    @pytest.mark.asyncio
+    async def test_runs_itself_when_lock_holder_fails(self, cache):
+        """If the holder releases the lock without caching, take it and run."""
+        cache["acquire"].side_effect = [False, True]
+        run = AsyncMock(return_value=_response(["mine"]))
+
+        response = await _execute(run)
+
+        run.assert_awaited_once()
+        assert response.result == ["mine"]
+        cache["release"].assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_waits_again_while_lock_holder_is_still_running(self, cache):
+        """A wait that times out with the lock still held doesn't re-run."""
+        cache["acquire"].return_value = False
+        cache["wait"].side_effect = [None, None, {"data": ["theirs"]}]
+        run = AsyncMock()
+
+        response = await _execute(run)
+
+        run.assert_not_called()
+        assert cache["wait"].await_count == 3
+        assert response.result == ["theirs"]
+
+    @pytest.mark.asyncio
+    async def test_lock_is_extended_while_provider_runs(self, cache, monkeypatch):
+        """A provider slower than the lock TTL keeps the lock alive."""
+        monkeypatch.setattr(f"{MODULE}.DATA_PROVIDER_LOCK_EXTEND_INTERVAL", 0.01)
+
+        async def slow_run():
+            await asyncio.sleep(0.05)
+            return _response(["slow"])
+
+        response = await _execute(AsyncMock(side_effect=slow_run))
+
+        assert response.result == ["slow"]
+        assert cache["extend"].await_count >= 2
+        extends = cache["extend"].await_count
+        await asyncio.sleep(0.03)
+        # Stops once the run is over
+        assert cache["extend"].await_count == extends
+        cache["release"].assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_releases_lock(self, cache):
+        """Errors reach every waiter and the lock is released."""
+        run = AsyncMock(side_effect=RuntimeError("boom"))
+
+        results = await asyncio.gather(_execute(run), _execute(run), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        run.assert_awaited_once()
+        cache["release"].assert_awaited_once()
@@ -9,12 +9,14 @@ NOTE: These tests use mocks to avoid spawning real processes.
 """
 
 import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.services.execution.process_pool import (
+    PRELOAD_BATCH_SIZE,
     ExecutionInfo,
     ProcessHandle,
     ProcessPoolManager,
@@ -638,6 +640,296 @@ class TestProcessPoolManagerResultHandling:
         callback.assert_called_once_with(result_data)
 
 
+def _piped_handle(process_id: str, execution_id: str):
+    """Build a BUSY handle whose result_queue is a real pipe; returns (handle, writer)."""
+    import multiprocessing
+
+    from src.services.execution.template_process import _RecvQueue
+
+    reader, writer = multiprocessing.Pipe(duplex=False)
+    mock_process = MagicMock()
+    mock_process.is_alive.return_value = True
+    handle = ProcessHandle(
+        id=process_id,
+        process=mock_process,
+        pid=12345,
+        state=ProcessState.BUSY,
+        work_queue=MagicMock(),
+        result_queue=_RecvQueue(reader),
+        started_at=datetime.now(timezone.utc),
+        current_execution=ExecutionInfo(
+            execution_id=execution_id,
+            started_at=datetime.now(timezone.utc),
+            timeout_seconds=300,
+        ),
+    )
+    return handle, writer
+
+
+class TestEventDrivenResultCollection:
+    """Results and child exits are picked up from event-loop readiness, not polling."""
+
+    @pytest.mark.asyncio
+    async def test_result_dispatched_when_pipe_becomes_readable(self):
+        """A result written to the pipe reaches on_result without a poll tick."""
+        received = asyncio.Event()
+        results: list[dict] = []
+
+        async def on_result(result):
+            results.append(result)
+            received.set()
+
+        pool = ProcessPoolManager(on_result=on_result)
+        handle, writer = _piped_handle("process-1", "exec-1")
+        pool.processes["process-1"] = handle
+        pool._watch_result_pipe(handle)
+        task = asyncio.create_task(pool._result_loop())
+        try:
+            writer.send({"execution_id": "exec-1", "success": True})
+            await asyncio.wait_for(received.wait(), timeout=0.05)
+        finally:
+            task.cancel()
+            writer.close()
+
+        assert results == [{"execution_id": "exec-1", "success": True}]
+        assert "process-1" not in pool.processes
+
+    @pytest.mark.asyncio
+    async def test_child_exit_without_result_reports_crash(self):
+        """EOF on the result pipe of a BUSY worker is reported as a crash immediately."""
+        callback = AsyncMock()
+        pool = ProcessPoolManager(on_result=callback)
+        handle, writer = _piped_handle("process-1", "exec-crash")
+        pool.processes["process-1"] = handle
+        pool._watch_result_pipe(handle)
+        task = asyncio.create_task(pool._result_loop())
+        try:
+            writer.close()  # child died: last write end closed
+            for _ in range(50):
+                if callback.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+
+        callback.assert_awaited_once()
+        payload = callback.call_args[0][0]
+        assert payload["execution_id"] == "exec-crash"
+        assert payload["error_type"] == "ProcessCrashError"
+        assert "process-1" not in pool.processes
+        assert handle.result_reported is True
+
+    @pytest.mark.asyncio
+    async def test_killed_worker_exit_is_left_to_kill_path(self):
+        """EOF from a worker we killed ourselves must not produce a second report."""
+        callback = AsyncMock()
+        pool = ProcessPoolManager(on_result=callback)
+        handle, writer = _piped_handle("process-1", "exec-killed")
+        handle.state = ProcessState.KILLED
+        pool.processes["process-1"] = handle
+
+        writer.close()
+        await pool._collect_result(handle)
+
+        callback.assert_not_awaited()
+        assert "process-1" in pool.processes
+
+    @pytest.mark.asyncio
+    async def test_result_queued_before_timeout_kill_is_not_reported_again(self):
+        """A result already in the ready queue when the timeout path fires is dropped."""
+        callback = AsyncMock()
+        pool = ProcessPoolManager(on_result=callback)
+        handle, writer = _piped_handle("process-1", "exec-late")
+        pool.processes["process-1"] = handle
+        writer.send({"execution_id": "exec-late", "success": True})
+        pool._on_result_readable(handle)
+
+        # Timeout path: report, kill, drop the handle
+        await pool._report_timeout(handle)
+        handle.state = ProcessState.KILLED
+        pool.processes.pop("process-1")
+
+        await pool._collect_result(pool._ready_results.get_nowait())
+        writer.close()
+
+        callback.assert_awaited_once()
+        assert callback.call_args[0][0]["error_type"] == "TimeoutError"
+
+    @pytest.mark.asyncio
+    async def test_kill_stops_watching_the_result_pipe(self):
+        pool = ProcessPoolManager(on_result=AsyncMock())
+        handle, writer = _piped_handle("process-1", "exec-1")
+        pool.processes["process-1"] = handle
+        pool._watch_result_pipe(handle)
+
+        with patch(
+            "src.services.execution.process_pool.os.kill",
+            side_effect=ProcessLookupError,
+        ):
+            await pool._kill_process(handle)
+        writer.send({"execution_id": "exec-1", "success": True})
+        await asyncio.sleep(0.01)
+        writer.close()
+
+        assert pool._ready_results.empty()
+
+
+class TestHotModulePreload:
+    """Tests for template warm-import of workspace modules."""
+
+    def _busy_handle(self) -> ProcessHandle:
+        mock_process = MagicMock()
+        mock_process.is_alive.return_value = True
+        return ProcessHandle(
+            id="process-1",
+            process=mock_process,
+            pid=12345,
+            state=ProcessState.BUSY,
+            work_queue=MagicMock(),
+            result_queue=MagicMock(),
+            started_at=datetime.now(timezone.utc),
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_result_strips_usage_and_records_it(self):
+        """Module usage is recorded by the pool, never forwarded to the callback."""
+        callback = AsyncMock()
+        pool = ProcessPoolManager(on_result=callback, preload_modules=5)
+        handle = self._busy_handle()
+        pool.processes["process-1"] = handle
+
+        with patch.object(pool, "_record_module_usage", new=AsyncMock()) as mock_record:
+            await pool._handle_result(handle, {
+                "execution_id": "exec-1",
+                "success": True,
+                "workspace_modules": {"used": ["shared/a.py"], "hits": 1},
+            })
+
+        forwarded = callback.call_args[0][0]
+        assert "workspace_modules" not in forwarded
+        mock_record.assert_awaited_once_with({"used": ["shared/a.py"], "hits": 1})
+
+    @pytest.mark.asyncio
+    async def test_handle_result_skips_usage_when_preload_disabled(self):
+        """With preload off, usage is dropped without touching Redis."""
+        pool = ProcessPoolManager()
+        handle = self._busy_handle()
+        pool.processes["process-1"] = handle
+
+        with patch.object(pool, "_record_module_usage", new=AsyncMock()) as mock_record:
+            await pool._handle_result(handle, {
+                "success": True,
+                "workspace_modules": {"used": ["shared/a.py"], "hits": 0},
+            })
+
+        mock_record.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_record_module_usage_updates_hit_counters(self):
+        """Hits and misses feed the heartbeat hit rate."""
+        pool = ProcessPoolManager(preload_modules=5)
+        mock_redis = MagicMock()
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis.pipeline.return_value = mock_pipe
+
+        with patch.object(pool, "_get_redis", new=AsyncMock(return_value=mock_redis)):
+            await pool._record_module_usage({"used": ["shared/a.py", "shared/b.py"], "hits": 1})
+
+        assert mock_pipe.zincrby.call_count == 2
+        heartbeat = pool._build_heartbeat()
+        assert heartbeat["preload_hits"] == 1
+        assert heartbeat["preload_misses"] == 1
+        assert heartbeat["preload_hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_changed_preloaded_module_triggers_restart(self):
+        """A new hash for a preloaded module drains and restarts the template."""
+        pool = ProcessPoolManager(preload_modules=5)
+        pool._preloaded_hashes = {"shared/a.py": "old"}
+
+        with (
+            patch.object(pool, "drain_and_restart_template", new=AsyncMock()) as mock_restart,
+            patch.object(pool, "_preload_template", new=AsyncMock()) as mock_preload,
+        ):
+            pool._on_module_changed("shared/a.py", "new")
+            await pool._preload_refresh_task
+
+        mock_restart.assert_awaited_once()
+        mock_preload.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unrelated_module_change_only_refreshes_preload(self):
+        """Changes to modules outside the preload set never restart the template."""
+        pool = ProcessPoolManager(preload_modules=5)
+        pool._preloaded_hashes = {"shared/a.py": "same"}
+
+        with (
+            patch("src.services.execution.process_pool.PRELOAD_REFRESH_DEBOUNCE_SECONDS", 0),
+            patch.object(pool, "drain_and_restart_template", new=AsyncMock()) as mock_restart,
+            patch.object(pool, "_preload_template", new=AsyncMock()) as mock_preload,
+        ):
+            pool._on_module_changed("shared/b.py", "h")
+            pool._on_module_changed("shared/a.py", "same")
+            await pool._preload_refresh_task
+
+        mock_restart.assert_not_awaited()
+        mock_preload.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_preload_template_sends_only_new_hot_modules(self):
+        """Modules already in the template, or no longer indexed, are not resent."""
+        pool = ProcessPoolManager(preload_modules=3)
+        pool._template = MagicMock()
+        pool._template.preload.return_value = ["shared/b.py"]
+        pool._preloaded_hashes = {"shared/a.py": "ha"}
+
+        mock_redis = AsyncMock()
+        mock_redis.zrevrange.return_value = ["shared/a.py", "shared/b.py", "shared/gone.py"]
+        mock_redis.smembers.return_value = {"shared/a.py", "shared/b.py"}
+        mock_redis.mget.return_value = [
+            '{"path": "shared/b.py", "content": "X = 1", "hash": "hb"}'
+        ]
+
+        with patch.object(pool, "_get_redis", new=AsyncMock(return_value=mock_redis)):
+            await pool._preload_template()
+
+        mock_redis.mget.assert_awaited_once_with(["bifrost:module:shared/b.py"])
+        modules, index, targets, _ = pool._template.preload.call_args[0]
+        assert [m["path"] for m in modules] == ["shared/b.py"]
+        assert index == ["shared/a.py", "shared/b.py"]
+        assert targets == ["shared/b.py"]
+        assert pool._preloaded_hashes == {"shared/a.py": "ha", "shared/b.py": "hb"}
+
+    @pytest.mark.asyncio
+    async def test_preload_runs_in_batches_each_under_the_template_lock(self):
+        """The template lock is taken per batch, not for the whole preload."""
+        pool = ProcessPoolManager(preload_modules=20)
+        pool._template = MagicMock()
+        paths = [f"shared/m{n}.py" for n in range(PRELOAD_BATCH_SIZE + 1)]
+        held = []
+
+        def preload(modules, index, targets, timeout):
+            held.append(pool._template_lock.locked())
+            return targets
+
+        pool._template.preload.side_effect = preload
+        mock_redis = AsyncMock()
+        mock_redis.zrevrange.return_value = paths
+        mock_redis.smembers.return_value = set(paths)
+        mock_redis.mget.return_value = [
+            json.dumps({"path": p, "content": "", "hash": p}) for p in paths
+        ]
+
+        with patch.object(pool, "_get_redis", new=AsyncMock(return_value=mock_redis)):
+            await pool._preload_template()
+
+        batches = [c.args[2] for c in pool._template.preload.call_args_list]
+        assert batches == [paths[:PRELOAD_BATCH_SIZE], paths[PRELOAD_BATCH_SIZE:]]
+        assert held == [True, True]
+        assert not pool._template_lock.locked()
+        assert set(pool._preloaded_hashes) == set(paths)
+
 class TestProcessPoolManagerStatus:
     """Tests for status reporting."""
 
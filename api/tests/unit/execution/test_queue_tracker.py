@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import AsyncMock, patch
 
 from src.services.execution.queue_tracker import (
+    QueuePositionBroadcaster,
     add_to_queue,
     remove_from_queue,
     get_queue_position,
@@ -44,8 +45,7 @@ class TestAddToQueue:
         mock_redis.zrank = AsyncMock(return_value=0)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ):
             with patch("time.time", return_value=1000.0):
                 position = await add_to_queue("exec-123")
@@ -63,8 +63,7 @@ class TestAddToQueue:
         mock_redis.zrank = AsyncMock(return_value=4)  # 5th position (0-indexed)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ):
             position = await add_to_queue("exec-456")
 
@@ -72,13 +71,12 @@ class TestAddToQueue:
 
     @pytest.mark.asyncio
     async def test_publishes_queue_positions_after_add(self, mock_get_redis, mock_redis):
-        """Should publish position updates to all queued executions."""
+        """Should schedule a position broadcast to queued executions."""
         mock_redis.zadd = AsyncMock()
         mock_redis.zrank = AsyncMock(return_value=0)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ) as mock_publish:
             await add_to_queue("exec-789")
 
@@ -94,8 +92,7 @@ class TestRemoveFromQueue:
         mock_redis.zrem = AsyncMock(return_value=1)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ):
             await remove_from_queue("exec-123")
 
@@ -103,12 +100,11 @@ class TestRemoveFromQueue:
 
     @pytest.mark.asyncio
     async def test_publishes_positions_when_entry_removed(self, mock_get_redis, mock_redis):
-        """Should publish position updates when entry is actually removed."""
+        """Should schedule a position broadcast when entry is actually removed."""
         mock_redis.zrem = AsyncMock(return_value=1)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ) as mock_publish:
             await remove_from_queue("exec-123")
 
@@ -120,8 +116,7 @@ class TestRemoveFromQueue:
         mock_redis.zrem = AsyncMock(return_value=0)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ) as mock_publish:
             await remove_from_queue("exec-nonexistent")
 
@@ -239,6 +234,77 @@ class TestPublishAllQueuePositions:
         assert publish_mock.call_count == 3
 
 
+class TestQueuePositionBroadcaster:
+    """Tests for the coalescing queue position broadcaster."""
+
+    @pytest.mark.asyncio
+    async def test_requests_coalesce_into_one_flush(self, mock_get_redis, mock_redis):
+        """Requests made before the pending flush runs share that flush."""
+        mock_redis.zrange = AsyncMock(return_value=["exec-1", "exec-2"])
+        broadcaster = QueuePositionBroadcaster(interval=0.01)
+
+        with patch(
+            "src.core.pubsub.publish_execution_updates",
+            new_callable=AsyncMock
+        ) as mock_publish:
+            for _ in range(50):
+                broadcaster.request()
+            await broadcaster.wait()
+
+        mock_redis.zrange.assert_called_once()
+        mock_publish.assert_called_once_with([
+            ("exec-1", "Pending", {"queuePosition": 1, "waitReason": "queued"}),
+            ("exec-2", "Pending", {"queuePosition": 2, "waitReason": "queued"}),
+        ])
+
+    @pytest.mark.asyncio
+    async def test_publishes_only_changed_positions(self, mock_get_redis, mock_redis):
+        """Executions whose position didn't change aren't re-published."""
+        broadcaster = QueuePositionBroadcaster()
+
+        with patch(
+            "src.core.pubsub.publish_execution_updates",
+            new_callable=AsyncMock
+        ) as mock_publish:
+            mock_redis.zrange = AsyncMock(return_value=["exec-1", "exec-2", "exec-3"])
+            assert await broadcaster.flush() == 3
+
+            # exec-1 left: exec-2 and exec-3 moved up
+            mock_redis.zrange = AsyncMock(return_value=["exec-2", "exec-3", "exec-4"])
+            assert await broadcaster.flush() == 3
+
+            # exec-4 added at the tail: only it is new
+            mock_redis.zrange = AsyncMock(
+                return_value=["exec-2", "exec-3", "exec-4", "exec-5"]
+            )
+            assert await broadcaster.flush() == 1
+
+            # Nothing changed
+            assert await broadcaster.flush() == 0
+
+        assert mock_publish.call_count == 3
+        assert mock_publish.call_args_list[2].args[0] == [
+            ("exec-5", "Pending", {"queuePosition": 4, "waitReason": "queued"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_does_not_raise(self, mock_get_redis, mock_redis):
+        """A failed background flush is logged, and later requests still run."""
+        mock_redis.zrange = AsyncMock(side_effect=[Exception("boom"), ["exec-1"]])
+        broadcaster = QueuePositionBroadcaster(interval=0)
+
+        with patch(
+            "src.core.pubsub.publish_execution_updates",
+            new_callable=AsyncMock
+        ) as mock_publish:
+            broadcaster.request()
+            await broadcaster.wait()
+            broadcaster.request()
+            await broadcaster.wait()
+
+        mock_publish.assert_called_once()
+
+
 class TestCleanupStaleEntries:
     """Tests for cleanup_stale_entries function."""
 
@@ -248,8 +314,7 @@ class TestCleanupStaleEntries:
         mock_redis.zremrangebyscore = AsyncMock(return_value=2)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ):
             with patch("time.time", return_value=1000.0):
                 removed = await cleanup_stale_entries(max_age_seconds=600)
@@ -264,12 +329,11 @@ class TestCleanupStaleEntries:
 
     @pytest.mark.asyncio
     async def test_publishes_positions_when_entries_removed(self, mock_get_redis, mock_redis):
-        """Should publish position updates when entries are cleaned."""
+        """Should schedule a position broadcast when entries are cleaned."""
         mock_redis.zremrangebyscore = AsyncMock(return_value=1)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ) as mock_publish:
             await cleanup_stale_entries()
 
@@ -281,9 +345,29 @@ class TestCleanupStaleEntries:
         mock_redis.zremrangebyscore = AsyncMock(return_value=0)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_position_broadcast"
         ) as mock_publish:
             await cleanup_stale_entries()
 
         mock_publish.assert_not_called()
+
+
+class TestGetRedis:
+    """Tests for the per-event-loop Redis client."""
+
+    def test_previous_loop_client_is_closed(self):
+        """A client left behind by a finished event loop is closed, not leaked."""
+        import asyncio
+
+        from src.services.execution import queue_tracker
+
+        clients = [AsyncMock(), AsyncMock()]
+        with patch.object(queue_tracker.aioredis, "from_url", side_effect=clients), \
+             patch.object(queue_tracker, "_redis", None), \
+             patch.object(queue_tracker, "_redis_loop", None):
+            first = asyncio.run(queue_tracker._get_redis())
+            second = asyncio.run(queue_tracker._get_redis())
+
+        assert (first, second) == (clients[0], clients[1])
+        clients[0].aclose.assert_awaited_once()
+        clients[1].aclose.assert_not_awaited()
@@ -0,0 +1,65 @@
+"""Tests for event-driven result collection (_watch_result_pipe + _result_loop)."""
+
+import asyncio
+import multiprocessing
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.execution.process_pool import (
+    ExecutionInfo,
+    ProcessHandle,
+    ProcessPoolManager,
+    ProcessState,
+)
+from src.services.execution.template_process import _RecvQueue
+
+
+def _handle(reader) -> ProcessHandle:
+    return ProcessHandle(
+        id="process-1",
+        process=MagicMock(),
+        pid=0,
+        state=ProcessState.BUSY,
+        work_queue=MagicMock(),
+        result_queue=_RecvQueue(reader),
+        started_at=datetime.now(timezone.utc),
+        current_execution=ExecutionInfo(
+            execution_id="exec-1",
+            started_at=datetime.now(timezone.utc),
+            timeout_seconds=30,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ready_pipe_is_dispatched_without_sleeping():
+    """A readable result pipe reaches on_result with no poll interval in between."""
+    received = asyncio.Event()
+    results = []
+
+    async def on_result(result):
+        results.append(result)
+        received.set()
+
+    pool = ProcessPoolManager(max_workers=1, on_result=on_result)
+    reader, writer = multiprocessing.Pipe(duplex=False)
+    handle = _handle(reader)
+    pool.processes[handle.id] = handle
+    pool._watch_result_pipe(handle)
+
+    with patch(
+        "src.services.execution.process_pool.asyncio.sleep",
+        side_effect=AssertionError("result loop slept"),
+    ):
+        loop_task = asyncio.create_task(pool._result_loop())
+        try:
+            writer.send({"execution_id": "exec-1", "success": True})
+            await asyncio.wait_for(received.wait(), timeout=5)
+        finally:
+            loop_task.cancel()
+            writer.close()
+
+    assert results[0]["execution_id"] == "exec-1"
+    assert pool._ready_results.empty()
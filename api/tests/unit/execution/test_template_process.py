@@ -158,6 +158,29 @@ class TestTemplateProcessFork:
             template.shutdown()
 
 
+class TestTemplateProcessPreload:
+    """Tests for warm-importing workspace modules into the template."""
+
+    def test_preload_reports_loaded_modules_and_still_forks(self):
+        """Preloaded modules are reported back and the pipe stays usable."""
+        template = TemplateProcess()
+        template.start()
+        try:
+            modules = [
+                {"path": "preload_mod.py", "content": "VALUE = 1", "hash": "h1"},
+                {"path": "broken_mod.py", "content": "def broken(", "hash": "h2"},
+            ]
+            loaded = template.preload(modules, ["preload_mod.py", "broken_mod.py"])
+            assert loaded == ["preload_mod.py"]
+
+            child_pid, _, _ = template.fork()
+            assert child_pid > 0
+            os.kill(child_pid, signal.SIGTERM)
+            _wait_for_pid_to_die(child_pid)
+        finally:
+            template.shutdown()
+
+
 class TestTemplateProcessCrashRecovery:
     """Tests for template crash detection."""
 
@@ -0,0 +1,142 @@
+"""Tests for WorkflowExecutionConsumer's fair-share dispatch of buffered messages."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
+from src.jobs.fair_queue import FairQueue
+from src.jobs.rabbitmq import work_queue_arguments
+
+
+class _Pool:
+    """Pool double with `slots` capacity; a slot frees when its gate is set."""
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self.running = 0
+        self._changed = asyncio.Condition()
+
+    async def wait_for_capacity(self, reserved):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.running + reserved() < self.slots)
+
+    async def release_capacity(self):
+        async with self._changed:
+            self._changed.notify_all()
+
+
+def _message(execution_id: str, org_id: str, priority: int) -> MagicMock:
+    message = MagicMock()
+    message.body = json.dumps({"execution_id": execution_id, "org_id": org_id}).encode()
+    message.priority = priority
+    message.message_id = execution_id
+    message.nack = AsyncMock()
+    return message
+
+
+@pytest.fixture
+def consumer():
+    with patch.object(WorkflowExecutionConsumer, "__init__", lambda self: None):
+        consumer = WorkflowExecutionConsumer()
+    consumer.queue_name = "workflow-executions-prioritized"
+    consumer._draining = False
+    consumer._inflight = set()
+    consumer._queue = None
+    consumer._consumer_tag = None
+    consumer._legacy_consumers = []
+    consumer._buffer = FairQueue()
+    consumer._buffer_max_age = 60.0
+    consumer._dispatching = 0
+    consumer._dispatcher = None
+    consumer._requeuer = None
+    consumer._dispatch_closed = False
+    consumer._pool = _Pool(slots=1)
+    yield consumer
+    for task in (consumer._dispatcher, consumer._requeuer):
+        if task is not None:
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_buffered_messages_dispatch_by_priority_then_org(consumer):
+    started: list[str] = []
+    gate = asyncio.Event()
+
+    async def process(message):
+        started.append(message.message_id)
+        consumer._pool.running += 1
+        await gate.wait()
+        consumer._pool.running -= 1
+
+    consumer._process_message_with_ack = process
+
+    # The first message takes the only slot; the rest buffer behind it
+    await consumer._on_message(_message("bulk-1", "org-a", 1))
+    await asyncio.sleep(0)
+    for message in (
+        _message("bulk-2", "org-a", 1),
+        _message("bulk-3", "org-a", 1),
+        _message("other-org", "org-b", 1),
+        _message("interactive", "org-c", 5),
+    ):
+        await consumer._on_message(message)
+
+    for _ in range(4):
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.sleep(0)
+        gate.clear()
+        await asyncio.sleep(0.01)
+
+    assert started == ["bulk-1", "interactive", "bulk-2", "other-org", "bulk-3"]
+
+
+@pytest.mark.asyncio
+async def test_drain_requeues_buffered_messages(consumer):
+    consumer._pool = _Pool(slots=0)
+    buffered = [_message(f"e{n}", "org", 5) for n in range(3)]
+    for message in buffered:
+        await consumer._on_message(message)
+
+    with patch.object(WorkflowExecutionConsumer, "stop", AsyncMock()):
+        await consumer.drain(deadline=1)
+
+    for message in buffered:
+        message.nack.assert_awaited_once_with(requeue=True)
+    assert len(consumer._buffer) == 0
+
+    late = _message("late", "org", 5)
+    await consumer._on_message(late)
+    late.nack.assert_awaited_once_with(requeue=True)
+
+
+@pytest.mark.asyncio
+async def test_messages_buffered_too_long_are_requeued(consumer):
+    consumer._pool = _Pool(slots=0)
+    old = _message("old", "org-a", 1)
+    fresh = _message("fresh", "org-b", 1)
+    await consumer._on_message(old)
+    await consumer._on_message(fresh)
+
+    now = time.monotonic()
+    with patch("src.jobs.consumers.workflow_execution.time.monotonic", return_value=now + 45):
+        await consumer._requeue_stale()
+    old.nack.assert_not_awaited()
+
+    # Re-stamp "old" as buffered well before the cutoff
+    consumer._buffer.remove_where(lambda entry: entry[0] is old)
+    consumer._buffer.put((old, now - 120), priority=1, tenant="org-a")
+    await consumer._requeue_stale()
+
+    old.nack.assert_awaited_once_with(requeue=True)
+    fresh.nack.assert_not_awaited()
+    assert len(consumer._buffer) == 1
+
+
+def test_execution_queue_is_priority_capable():
+    assert work_queue_arguments("workflow-executions-prioritized")["x-max-priority"] == 10
+    assert "x-max-priority" not in work_queue_arguments("package-installations")
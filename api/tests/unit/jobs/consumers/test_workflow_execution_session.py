@@ -39,6 +39,8 @@ class TestConsumerSessionLifecycle:
             consumer._pool = AsyncMock()
             consumer._pool.stop = AsyncMock()
             consumer._pool_started = True
+            consumer._dispatcher = None
+            consumer._requeuer = None
 
             with patch.object(
                 WorkflowExecutionConsumer.__bases__[0], "stop", AsyncMock()
@@ -0,0 +1,75 @@
+"""
+Unit tests for FairQueue.
+"""
+
+import asyncio
+
+import pytest
+
+from src.jobs.fair_queue import FairQueue
+
+
+def test_fifo_within_one_tenant():
+    queue: FairQueue[int] = FairQueue()
+    for n in range(3):
+        queue.put(n, tenant="a")
+
+    assert queue.take_all() == [0, 1, 2]
+    assert len(queue) == 0
+
+
+def test_tenants_take_turns():
+    queue: FairQueue[str] = FairQueue()
+    for n in range(3):
+        queue.put(f"a{n}", tenant="a")
+    queue.put("b0", tenant="b")
+    queue.put("c0", tenant="c")
+
+    assert queue.take_all() == ["a0", "b0", "c0", "a1", "a2"]
+
+
+def test_higher_priority_goes_first():
+    queue: FairQueue[str] = FairQueue()
+    queue.put("bulk", priority=1, tenant="a")
+    queue.put("sync", priority=9, tenant="a")
+    queue.put("interactive", priority=5, tenant="b")
+
+    assert queue.take_all() == ["sync", "interactive", "bulk"]
+
+
+def test_remove_where_keeps_order_of_the_rest():
+    queue: FairQueue[int] = FairQueue()
+    for n in range(4):
+        queue.put(n, tenant="a")
+    queue.put(10, priority=5, tenant="b")
+
+    assert sorted(queue.remove_where(lambda n: n % 2 == 0)) == [0, 2, 10]
+    assert len(queue) == 2
+    assert queue.take_all() == [1, 3]
+
+
+def test_remove_where_everything_empties_the_queue():
+    queue: FairQueue[int] = FairQueue()
+    queue.put(1, tenant="a")
+    queue.put(2, tenant="b")
+
+    assert queue.remove_where(lambda n: True) == [1, 2]
+    assert len(queue) == 0
+    with pytest.raises(IndexError):
+        queue.get_nowait()
+
+
+def test_get_nowait_on_empty_raises():
+    with pytest.raises(IndexError):
+        FairQueue().get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_put():
+    queue: FairQueue[str] = FairQueue()
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put("x")
+    assert await asyncio.wait_for(getter, 1) == "x"
@@ -0,0 +1,184 @@
+"""
+Unit tests for the pooled RabbitMQ publisher: declare-once queue topology,
+publish_many's batched confirms and partial retry, and deferred_publishes.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aio_pika.exceptions
+import pytest
+
+from src.jobs import rabbitmq as rabbitmq_module
+from src.jobs.rabbitmq import (
+    PublishError,
+    deferred_publishes,
+    publish_many,
+    publish_message,
+    rabbitmq,
+)
+
+
+class _Channel:
+    """Channel double recording declarations and published bodies."""
+
+    def __init__(self, fail_bodies: set[int] | None = None):
+        self.declarations = 0
+        self.published: list[dict] = []
+        self.fail_bodies = fail_bodies or set()
+        self.declare_exchange = AsyncMock(side_effect=self._declare)
+        self.declare_queue = AsyncMock(side_effect=self._declare_queue)
+        self.default_exchange = MagicMock()
+        self.default_exchange.publish = AsyncMock(side_effect=self._publish)
+
+    async def _declare(self, *args, **kwargs):
+        self.declarations += 1
+
+    async def _declare_queue(self, *args, **kwargs):
+        self.declarations += 1
+        return MagicMock(bind=AsyncMock())
+
+    async def _publish(self, message, routing_key):
+        body = json.loads(message.body)
+        if body["n"] in self.fail_bodies:
+            self.fail_bodies.discard(body["n"])
+            raise aio_pika.exceptions.ChannelClosed(0, "flap")
+        self.published.append(body)
+
+
+@pytest.fixture
+def channel():
+    channel = _Channel()
+
+    @asynccontextmanager
+    async def get_channel():
+        yield channel
+
+    rabbitmq.declared_queues.clear()
+    with (
+        patch.object(rabbitmq, "init_pools", AsyncMock(return_value=None)),
+        patch.object(rabbitmq, "get_channel", get_channel),
+        patch.object(rabbitmq_module, "_PUBLISH_RETRY_DELAYS_S", (0.0, 0.0, 0.0)),
+    ):
+        yield channel
+    rabbitmq.declared_queues.clear()
+
+
+@pytest.mark.asyncio
+async def test_topology_is_declared_once_per_queue(channel):
+    for n in range(3):
+        await publish_message("q", {"n": n})
+
+    # DLX exchange + poison queue + main queue, once
+    assert channel.declarations == 3
+    assert [m["n"] for m in channel.published] == [0, 1, 2]
+
+    await publish_message("other", {"n": 3})
+    assert channel.declarations == 6
+
+
+@pytest.mark.asyncio
+async def test_reconnect_forgets_declared_topology(channel):
+    await publish_message("q", {"n": 0})
+    rabbitmq._forget_topology(MagicMock())
+    await publish_message("q", {"n": 1})
+
+    assert channel.declarations == 6
+
+
+@pytest.mark.asyncio
+async def test_publish_many_batches_and_preserves_order(channel, monkeypatch):
+    monkeypatch.setattr(rabbitmq_module, "PUBLISH_CONFIRM_BATCH", 4)
+
+    await publish_many("q", [{"n": n} for n in range(10)])
+
+    assert [m["n"] for m in channel.published] == list(range(10))
+    assert channel.declarations == 3
+
+
+@pytest.mark.asyncio
+async def test_publish_many_resends_only_unconfirmed(channel, monkeypatch):
+    monkeypatch.setattr(rabbitmq_module, "PUBLISH_CONFIRM_BATCH", 4)
+    channel.fail_bodies = {5}
+
+    await publish_many("q", [{"n": n} for n in range(10)])
+
+    assert sorted(m["n"] for m in channel.published) == list(range(10))
+    # The retry re-declares topology in case the broker behind it changed
+    assert channel.declarations == 6
+
+
+@pytest.mark.asyncio
+async def test_publish_many_does_not_retry_fatal_errors(channel):
+    channel.default_exchange.publish = AsyncMock(
+        side_effect=aio_pika.exceptions.AuthenticationError("bad creds")
+    )
+
+    with pytest.raises(PublishError) as exc_info:
+        await publish_many("q", [{"n": 0}])
+    assert isinstance(exc_info.value.__cause__, aio_pika.exceptions.AuthenticationError)
+    assert exc_info.value.unconfirmed == [{"n": 0}]
+    assert channel.default_exchange.publish.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_publish_many_failure_lists_only_unconfirmed(channel, monkeypatch):
+    monkeypatch.setattr(rabbitmq_module, "PUBLISH_CONFIRM_BATCH", 4)
+    publish = channel.default_exchange.publish.side_effect
+
+    async def reject_from_six(message, routing_key):
+        if json.loads(message.body)["n"] >= 6:
+            raise aio_pika.exceptions.AuthenticationError("bad creds")
+        await publish(message, routing_key)
+
+    channel.default_exchange.publish.side_effect = reject_from_six
+
+    with pytest.raises(PublishError) as exc_info:
+        await publish_many("q", [{"n": n} for n in range(10)])
+
+    assert [m["n"] for m in channel.published] == [0, 1, 2, 3, 4, 5]
+    assert [m["n"] for m in exc_info.value.unconfirmed] == [6, 7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_deferred_publishes_send_on_exit_grouped_by_queue():
+    with patch.object(rabbitmq_module, "publish_many", AsyncMock()) as publish:
+        async with deferred_publishes():
+            await publish_message("a", {"n": 0})
+            async with deferred_publishes():
+                await publish_message("b", {"n": 1})
+            await publish_message("a", {"n": 2})
+            publish.assert_not_awaited()
+
+    assert publish.await_args_list[0].args == ("a", [{"n": 0}, {"n": 2}], 0)
+    assert publish.await_args_list[1].args == ("b", [{"n": 1}], 0)
+
+
+@pytest.mark.asyncio
+async def test_deferred_publishes_flush_when_block_raises():
+    with patch.object(rabbitmq_module, "publish_many", AsyncMock()) as publish:
+        with pytest.raises(RuntimeError):
+            async with deferred_publishes():
+                await publish_message("a", {"n": 0})
+                raise RuntimeError("boom")
+
+    publish.assert_awaited_once_with("a", [{"n": 0}], 0)
+
+
+@pytest.mark.asyncio
+async def test_deferred_publishes_report_unconfirmed_across_queues():
+    async def publish(queue_name, messages, priority):
+        if queue_name == "a":
+            raise PublishError("rejected", messages[1:])
+
+    with patch.object(rabbitmq_module, "publish_many", AsyncMock(side_effect=publish)) as mock:
+        with pytest.raises(PublishError) as exc_info:
+            async with deferred_publishes():
+                await publish_message("a", {"n": 0})
+                await publish_message("a", {"n": 1})
+                await publish_message("b", {"n": 2})
+
+    # Queue "b" is still sent after "a" fails
+    assert mock.await_count == 2
+    assert exc_info.value.unconfirmed == [{"n": 1}]
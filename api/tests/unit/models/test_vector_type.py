@@ -71,3 +71,11 @@ def test_cosine_distance_compiles_to_pgvector_operator():
 
 def test_column_spec_is_unconstrained_vector():
     assert Vector().get_col_spec() == "VECTOR"
+
+
+def test_column_spec_with_dimension_for_casts():
+    from src.models.orm.vector_type import HalfVector
+
+    assert Vector(1536).get_col_spec() == "VECTOR(1536)"
+    assert HalfVector(3072).get_col_spec() == "HALFVEC(3072)"
+    assert HalfVector().bind_processor(dialect=None)([0.5]) == "[0.5]"
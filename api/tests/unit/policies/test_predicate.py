@@ -0,0 +1,143 @@
+"""
+Closure compiler tests: compiled predicates agree with `evaluate`.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from shared.policies.evaluate import evaluate
+from shared.policies.predicate import (
+    clear_compiled_policies,
+    compile_policies,
+    compile_predicate,
+    compiled_policies,
+    user_inputs,
+)
+from shared.policies.probe import evaluate_action
+from src.models.contracts.policies import Expr, TablePolicies
+from tests.unit.policies.test_evaluate import FakeUser
+
+ROLE_ID = uuid4()
+ORG_ID = uuid4()
+
+USERS = [
+    FakeUser(),
+    FakeUser(is_platform_admin=True),
+    FakeUser(organization_id=ORG_ID, role_names=["manager"]),
+    FakeUser(role_ids=[ROLE_ID]),
+    SimpleNamespace(
+        user_id=uuid4(), email="c@x", organization_id=ORG_ID,
+        is_platform_admin=False, role_ids=[], role_names=[],
+        claims={"allowed_campus_ids": ["c1", "c2"]},
+    ),
+]
+
+ROWS = [
+    None,
+    {},
+    {"x": 5, "status": "draft", "campus_id": "c1", "organization_id": str(ORG_ID)},
+    {"x": "5", "status": "done", "campus_id": "c3", "a": {"b": {"c": 1}}},
+    {"x": None, "a": {"b": None}, "manager_user_id": "m"},
+]
+
+EXPRESSIONS = [
+    {"eq": [{"row": "x"}, 5]},
+    {"neq": [{"row": "x"}, 5]},
+    {"lt": [{"row": "x"}, 10]},
+    {"gte": [{"row": "x"}, 5]},
+    {"in": [{"row": "status"}, ["draft", "review"]]},
+    {"in": [{"row": "campus_id"}, {"claims": "allowed_campus_ids"}]},
+    {"is_null": {"row": "a.b.c"}},
+    {"not": {"is_null": {"row": "manager_user_id"}}},
+    {"eq": [{"row": "organization_id"}, {"user": "organization_id"}]},
+    {"user": "is_platform_admin"},
+    {"call": "has_role", "args": ["manager"]},
+    {"call": "has_role", "args": [str(ROLE_ID)]},
+    {"and": [{"eq": [{"row": "x"}, 5]}, {"call": "has_role", "args": ["manager"]}]},
+    {"or": [{"user": "is_platform_admin"}, {"eq": [{"row": "a.b.c"}, 1]}]},
+]
+
+
+@pytest.mark.parametrize("raw", EXPRESSIONS)
+def test_compiled_predicate_matches_evaluate(raw):
+    expr = Expr.model_validate(raw)
+    predicate = compile_predicate(expr)
+    for user in USERS:
+        bound = predicate.bind(user)
+        for row in ROWS:
+            expected = evaluate(expr, row, user)
+            assert predicate(row, user) is expected, (row, user)
+            assert bound(row) is expected, (row, user)
+
+
+POLICIES = TablePolicies.model_validate({
+    "policies": [
+        {"name": "admin", "actions": ["read", "update", "delete"],
+         "when": {"user": "is_platform_admin"}},
+        {"name": "own", "actions": ["read", "update"],
+         "when": {"eq": [{"row": "organization_id"}, {"user": "organization_id"}]}},
+        {"name": "drafts", "actions": ["read"],
+         "when": {"and": [
+             {"call": "has_role", "args": ["manager"]},
+             {"in": [{"row": "status"}, ["draft"]]},
+         ]}},
+        {"name": "open_create", "actions": ["create"], "when": None},
+    ]
+})
+
+
+def test_compiled_policies_match_evaluate_action():
+    compiled = compile_policies(POLICIES)
+    for action in ("read", "create", "update", "delete"):
+        for user in USERS:
+            bound = compiled.bind(action, user)
+            for row in ROWS[1:]:
+                expected = evaluate_action(action, POLICIES, row, user)
+                assert compiled.allows(action, row, user) is expected
+                assert bound(row) is expected
+
+
+def test_user_only_rules_bind_to_a_constant():
+    compiled = compile_policies(POLICIES)
+    admin, nobody = FakeUser(is_platform_admin=True), FakeUser()
+    # The admin rule decides without looking at the row
+    assert compiled.bind("delete", admin)(None) is True
+    assert compiled.bind("delete", nobody)({"organization_id": "x"}) is False
+    assert compiled.bind("create", nobody)(None) is True
+    assert compiled.bind("unknown", admin)({}) is False
+
+
+def test_compiled_policies_cached_per_table_and_version():
+    clear_compiled_policies()
+    table_id = str(uuid4())
+    first = compiled_policies(table_id, POLICIES)
+    assert compiled_policies(table_id, TablePolicies.model_validate(POLICIES.model_dump())) is first
+    assert compiled_policies(str(uuid4()), POLICIES) is not first
+
+    edited = TablePolicies.model_validate({"policies": POLICIES.model_dump()["policies"][:1]})
+    recompiled = compiled_policies(table_id, edited)
+    assert recompiled is not first
+    assert recompiled.version != first.version
+    clear_compiled_policies()
+
+
+def test_user_inputs_lists_user_fields_claims_and_function_reads():
+    expr = Expr.model_validate({
+        "and": [
+            {"eq": [{"row": "owner"}, {"user": "user_id"}]},
+            {"in": [{"row": "campus_id"}, {"claims": "allowed_campus_ids"}]},
+            {"call": "has_role", "args": ["manager"]},
+        ]
+    })
+    assert user_inputs(expr) == {
+        ("user", "user_id"),
+        ("claims", "allowed_campus_ids"),
+        ("user", "role_names"),
+        ("user", "role_ids"),
+    }
+    assert user_inputs(Expr.model_validate({"eq": [{"row": "x"}, 1]})) == frozenset()
+
+
+# --- benchmark ----------------------------------------------------------------
@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.core.pubsub import publish_document_change
+from src.core.pubsub import (
+    DOCUMENT_CHANGES_PER_MESSAGE,
+    publish_document_change,
+    publish_document_changes,
+)
 
 
 @pytest.mark.asyncio
@@ -50,3 +54,49 @@ async def test_publish_delete_carries_old_row_only():
         assert payload["action"] == "delete"
         assert payload["old_row"]["id"] == "r1"
         assert payload.get("new_row") is None
+
+
+@pytest.mark.asyncio
+async def test_publish_changes_coalesces_batch():
+    with patch("src.core.pubsub.publisher.publish", new=AsyncMock()) as mock_pub:
+        await publish_document_changes(
+            table_id="00000000-0000-0000-0000-000000000001",
+            changes=[
+                {"action": "insert", "old_row": None, "new_row": {"id": "r1"}},
+                {"action": "update", "old_row": {"id": "r2"}, "new_row": {"id": "r2"}},
+            ],
+        )
+        mock_pub.assert_awaited_once()
+        payload = mock_pub.await_args.kwargs.get("payload") or mock_pub.await_args.args[1]
+        assert payload["type"] == "document_changes"
+        assert [c["action"] for c in payload["changes"]] == ["insert", "update"]
+
+
+@pytest.mark.asyncio
+async def test_publish_changes_skips_empty_batch():
+    with patch("src.core.pubsub.publisher.publish", new=AsyncMock()) as mock_pub:
+        await publish_document_changes(
+            table_id="00000000-0000-0000-0000-000000000001",
+            changes=[],
+        )
+        mock_pub.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publish_changes_chunks_large_batch():
+    changes = [
+        {"action": "delete", "old_row": {"id": f"r{n}"}, "new_row": None}
+        for n in range(2 * DOCUMENT_CHANGES_PER_MESSAGE + 1)
+    ]
+    with patch("src.core.pubsub.publisher.publish", new=AsyncMock()) as mock_pub:
+        await publish_document_changes(
+            table_id="00000000-0000-0000-0000-000000000001",
+            changes=changes,
+        )
+    chunks = [call.kwargs["payload"]["changes"] for call in mock_pub.await_args_list]
+    assert [len(chunk) for chunk in chunks] == [
+        DOCUMENT_CHANGES_PER_MESSAGE,
+        DOCUMENT_CHANGES_PER_MESSAGE,
+        1,
+    ]
+    assert [c for chunk in chunks for c in chunk] == changes
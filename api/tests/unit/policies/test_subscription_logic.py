@@ -5,7 +5,15 @@ standing up a websocket connection. Each case asserts the right action
 would be emitted to the subscriber.
 """
 
-from shared.policies.subscription import decide_visibility_change
+from uuid import uuid4
+
+from shared.policies.predicate import compile_policies
+from shared.policies.subscription import (
+    compile_filter,
+    decide_compiled_visibility_change,
+    decide_visibility_change,
+    visibility_class,
+)
 from src.models.contracts.policies import Expr, TablePolicies
 from tests.unit.policies.test_evaluate import FakeUser
 
@@ -73,3 +81,50 @@ def test_user_filter_narrows_visibility():
     # Status flipped from open to done → user filter says no longer visible
     decision = decide_visibility_change(row_old, row_new, pol, user, user_filter=user_filter)
     assert decision == ("delete", "r1")
+
+
+def test_compiled_decision_matches_uncompiled():
+    user = FakeUser()
+    pol = _own_row_policies()
+    raw_filter = Expr.model_validate({"eq": [{"row": "status"}, "open"]})
+    mine = str(user.user_id)
+    rows = [
+        None,
+        {"id": "r1", "created_by": mine, "status": "open"},
+        {"id": "r1", "created_by": mine, "status": "done"},
+        {"id": "r1", "created_by": "someone-else", "status": "open"},
+    ]
+    can_read = compile_policies(pol).bind("read", user)
+    for user_filter in (None, raw_filter):
+        matches = compile_filter(user_filter).matches.bind(user) if user_filter else None
+        for old in rows:
+            for new in rows:
+                assert decide_compiled_visibility_change(
+                    old, new, can_read, matches
+                ) == decide_visibility_change(old, new, pol, user, user_filter)
+
+
+def test_visibility_class_is_as_coarse_as_the_policies():
+    org = uuid4()
+    by_org = compile_policies(TablePolicies.model_validate({
+        "policies": [{
+            "name": "same_org",
+            "actions": ["read"],
+            "when": {"eq": [{"row": "organization_id"}, {"user": "organization_id"}]},
+        }]
+    }))
+    a, b = FakeUser(organization_id=org), FakeUser(organization_id=org)
+    # Different users, same org: the policy can't tell them apart
+    assert visibility_class(by_org, a) == visibility_class(by_org, b)
+    assert visibility_class(by_org, a) != visibility_class(by_org, FakeUser(organization_id=uuid4()))
+
+    # Per-user policies put each user in their own class
+    own = compile_policies(_own_row_policies())
+    assert visibility_class(own, a) != visibility_class(own, b)
+
+    # Filters are part of the class, and may read the user too
+    status = compile_filter(Expr.model_validate({"eq": [{"row": "status"}, "open"]}))
+    assert visibility_class(by_org, a, status) != visibility_class(by_org, a)
+    assert visibility_class(by_org, a, status) == visibility_class(by_org, b, status)
+    mine = compile_filter(Expr.model_validate({"eq": [{"row": "owner"}, {"user": "user_id"}]}))
+    assert visibility_class(by_org, a, mine) != visibility_class(by_org, b, mine)
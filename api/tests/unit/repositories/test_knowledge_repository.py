@@ -1,10 +1,16 @@
 """Tests for KnowledgeRepository chunked storage and search."""
 
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
 import pytest
 from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
 
 from src.models.orm.knowledge import KnowledgeStore
-from src.repositories.knowledge import KnowledgeRepository
+from src.repositories.knowledge import KnowledgeRepository, reciprocal_rank_fusion
+from src.services.embeddings.base import EmbeddingConfig
+from src.services.embeddings.cache import EmbeddingCacheStats
 
 
 class _FakeEmbedder:
@@ -12,6 +18,7 @@ class _FakeEmbedder:
 
     def __init__(self, dim: int = 8):
         self.dim = dim
+        self.config = EmbeddingConfig(api_key="test", model="fake-embedder", dimensions=dim)
         self.calls: list[list[str]] = []
 
     async def embed(self, texts: list[str]) -> list[list[float]]:
@@ -71,7 +78,8 @@ async def test_store_long_content_produces_multiple_rows(db_session):
     assert all(row.chunk_count == len(rows) for row in rows)
     assert all(row.doc_metadata == {"client_id": "acme"} for row in rows)
     assert len(embedder.calls) == 1
-    assert len(embedder.calls[0]) == len(rows)
+    # Repeated chunks of the same text are embedded once
+    assert sorted(embedder.calls[0]) == sorted({row.content for row in rows})
 
 
 @pytest.mark.asyncio
@@ -193,3 +201,118 @@ async def test_search_metadata_filter_applies_to_chunks(db_session):
 
     assert all(result.metadata.get("client_id") == "acme" for result in results)
     assert any(result.key == "acme-doc" for result in results)
+
+
+@pytest.mark.asyncio
+async def test_restore_of_unchanged_content_uses_embedding_cache(db_session):
+    repo = KnowledgeRepository(db_session, org_id=None, is_superuser=True)
+    embedder = _FakeEmbedder()
+    content = " ".join(f"Paragraph {i} of the runbook." for i in range(400))
+
+    await repo.store_chunked(content=content, namespace="ns-cache", key="runbook", embedder=embedder)
+    stats = EmbeddingCacheStats()
+    await repo.store_chunked(
+        content=content + " One new closing line.",
+        namespace="ns-cache",
+        key="runbook",
+        embedder=embedder,
+        cache_stats=stats,
+    )
+
+    # Only the changed final chunk goes back to the provider
+    assert len(embedder.calls) == 2
+    assert len(embedder.calls[1]) == 1
+    assert stats.misses == 1
+    assert stats.hits >= 3
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_finds_exact_identifier(db_session):
+    repo = KnowledgeRepository(db_session, org_id=None, is_superuser=True)
+    embedder = _FakeEmbedder()
+    for index in range(5):
+        await repo.store_chunked(
+            content=f"Printer on floor {index} is jammed again.",
+            namespace="ns-hybrid",
+            key=f"ticket-{index}",
+            embedder=embedder,
+        )
+    await repo.store_chunked(
+        content="Escalated INC-48213 to the network team.",
+        namespace="ns-hybrid",
+        key="ticket-incident",
+        embedder=embedder,
+    )
+    await db_session.flush()
+
+    # Every fake embedding is identical, so only the text match separates them
+    query_embedding = await embedder.embed_single("anything")
+    hybrid = await repo.search(
+        query_embedding=query_embedding,
+        namespace="ns-hybrid",
+        limit=3,
+        query_text="INC-48213 escalation",
+    )
+    keyword = await repo.search(
+        query_embedding=None,
+        namespace="ns-hybrid",
+        limit=3,
+        query_text="INC-48213",
+    )
+
+    assert hybrid[0].key == "ticket-incident"
+    assert [doc.key for doc in keyword] == ["ticket-incident"]
+
+
+def _row():
+    return MagicMock(id=uuid4())
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    a, b, c = _row(), _row(), _row()
+
+    fused = reciprocal_rank_fusion([[(a, 0.9), (b, 0.8)], [(b, 2.0), (c, 1.0)]])
+
+    assert [row for row, _ in fused] == [b, a, c]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_matches_the_fts_index_without_embedding():
+    session = MagicMock()
+    rows = MagicMock()
+    rows.all.return_value = []
+    session.execute = AsyncMock(return_value=rows)
+    repo = KnowledgeRepository(session, org_id=None, is_superuser=True)
+
+    await repo.search(query_embedding=None, namespace="docs", query_text="INC-48213")
+
+    [stmt] = (call.args[0] for call in session.execute.await_args_list)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "to_tsvector('english'::regconfig, knowledge_store.content) @@" in sql
+    assert "websearch_to_tsquery('english'::regconfig" in sql
+    assert "ORDER BY rank DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_reports_similarity_not_fusion_score():
+    vector_only, both, text_only = _row(), _row(), _row()
+    for row in (vector_only, both, text_only):
+        row.key = None
+        row.organization_id = None
+    repo = KnowledgeRepository(MagicMock(), org_id=None, is_superuser=True)
+    repo._vector_candidates = AsyncMock(return_value=[(vector_only, 0.9), (both, 0.7)])
+    repo._lexical_candidates = AsyncMock(return_value=[(both, 3.0), (text_only, 1.0)])
+
+    docs = await repo.search(query_embedding=[0.1], namespace="docs", query_text="q")
+
+    assert [doc.id for doc in docs] == [str(both.id), str(vector_only.id), str(text_only.id)]
+    assert [doc.score for doc in docs] == [0.7, 0.9, None]
+
+
+@pytest.mark.asyncio
+async def test_search_requires_embedding_or_text():
+    repo = KnowledgeRepository(MagicMock(), org_id=None, is_superuser=True)
+
+    with pytest.raises(ValueError, match="query_embedding or query_text"):
+        await repo.search(query_embedding=None, namespace="docs")
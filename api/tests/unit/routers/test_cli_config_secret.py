@@ -1,4 +1,4 @@
-"""Tests for secret decryption in CLI config/get endpoint."""
+"""Tests for secret decryption in CLI config/get and config/get_many endpoints."""
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -19,7 +19,7 @@ class TestConfigGetDecryptsSecrets:
         encrypted = encrypt_secret(plaintext)
 
         mock_resolver = AsyncMock()
-        mock_resolver.merged_for_sdk = AsyncMock(return_value={
+        mock_resolver.values_for_sdk = AsyncMock(return_value={
             "test_secret": {"value": encrypted, "type": "secret"},
         })
 
@@ -46,7 +46,7 @@ class TestConfigGetDecryptsSecrets:
         from src.models.contracts.cli import CLIConfigGetRequest, CLIConfigValue
 
         mock_resolver = AsyncMock()
-        mock_resolver.merged_for_sdk = AsyncMock(return_value={
+        mock_resolver.values_for_sdk = AsyncMock(return_value={
             "bad_secret": {"value": "not-valid-encrypted-data", "type": "secret"},
         })
 
@@ -71,7 +71,7 @@ class TestConfigGetDecryptsSecrets:
         plain_value = "just_a_string"
 
         mock_resolver = AsyncMock()
-        mock_resolver.merged_for_sdk = AsyncMock(return_value={
+        mock_resolver.values_for_sdk = AsyncMock(return_value={
             "normal_key": {"value": plain_value, "type": "string"},
         })
 
@@ -88,6 +88,55 @@ class TestConfigGetDecryptsSecrets:
         assert result.value == plain_value
         assert result.config_type == "string"
 
+    @pytest.mark.asyncio
+    async def test_get_config_reads_only_requested_key(self):
+        """config/get should ask the repository for just the requested key."""
+        from src.routers.cli import cli_get_config
+        from src.models.contracts.cli import CLIConfigGetRequest
+
+        mock_resolver = AsyncMock()
+        mock_resolver.values_for_sdk = AsyncMock(return_value={})
+
+        request = CLIConfigGetRequest(key="missing_key")
+
+        with patch("src.routers.cli._resolve_sdk_org_id", new_callable=AsyncMock, return_value=None), \
+             patch("src.repositories.config.ConfigRepository", return_value=mock_resolver):
+            result = await cli_get_config(request=request, current_user=MagicMock(), db=AsyncMock())
+
+        assert result is None
+        mock_resolver.values_for_sdk.assert_awaited_once_with(["missing_key"])
+        mock_resolver.merged_for_sdk.assert_not_called()
+
+
+class TestConfigGetManyDecryptsSecrets:
+    """Verify that cli_get_many_config batches reads and decrypts secrets."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_found_keys_decoded(self):
+        """config/get_many returns decoded values and omits missing keys."""
+        from src.routers.cli import cli_get_many_config
+        from src.models.contracts.cli import CLIConfigGetManyRequest, CLIConfigValue
+
+        plaintext = "my_api_key_12345"
+
+        mock_resolver = AsyncMock()
+        mock_resolver.values_for_sdk = AsyncMock(return_value={
+            "api_key": {"value": encrypt_secret(plaintext), "type": "secret"},
+            "timeout": {"value": "30", "type": "int"},
+        })
+
+        request = CLIConfigGetManyRequest(keys=["api_key", "timeout", "api_key", "missing"])
+
+        with patch("src.routers.cli._resolve_sdk_org_id", new_callable=AsyncMock, return_value="11111111-1111-1111-1111-111111111111"), \
+             patch("src.repositories.config.ConfigRepository", return_value=mock_resolver):
+            result = await cli_get_many_config(request=request, current_user=MagicMock(), db=AsyncMock())
+
+        # Duplicate keys are requested once
+        mock_resolver.values_for_sdk.assert_awaited_once_with(["api_key", "timeout", "missing"])
+        assert set(result) == {"api_key", "timeout"}
+        assert result["api_key"] == CLIConfigValue(key="api_key", value=plaintext, config_type="secret")
+        assert result["timeout"].value == 30
+
 
 class TestConfigListMasksSecrets:
     """Verify that cli_list_config always masks secret values with [SECRET]."""
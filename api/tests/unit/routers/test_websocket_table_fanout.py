@@ -0,0 +1,149 @@
+"""
+Table-channel fanout: per-class visibility decisions, checked against the
+per-socket path each subscriber's dispatcher used to take.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from shared.policies.predicate import clear_compiled_policies
+from shared.policies.subscription import compile_filter, decide_visibility_change
+from src.models.contracts.policies import Expr, TablePolicies
+from src.routers import websocket as ws_router
+from tests.unit.policies.test_evaluate import FakeUser
+
+TABLE_ID = str(uuid4())
+CHANNEL = f"table:{TABLE_ID}"
+ORG_A, ORG_B = uuid4(), uuid4()
+
+POLICIES = TablePolicies.model_validate({
+    "policies": [
+        {"name": "admin", "actions": ["read"], "when": {"user": "is_platform_admin"}},
+        {
+            "name": "same_org",
+            "actions": ["read"],
+            "when": {
+                "and": [
+                    {"eq": [{"row": "organization_id"}, {"user": "organization_id"}]},
+                    {"or": [
+                        {"call": "has_role", "args": ["viewer"]},
+                        {"in": [{"row": "status"}, ["published", "archived"]]},
+                    ]},
+                ]
+            },
+        },
+    ]
+})
+
+
+class _Socket:
+    def __init__(self, user, user_filter: Expr | None = None):
+        self.sent: list[str] = []
+        self.state = SimpleNamespace(table_subscriptions={
+            TABLE_ID: {
+                "filter": compile_filter(user_filter) if user_filter else None,
+                "channel_name": CHANNEL,
+                "user": user,
+                "raw_filter": user_filter,
+            }
+        })
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+    async def send_json(self, data: dict) -> None:
+        # Serializes per call, like Starlette's send_json
+        self.sent.append(json.dumps(data))
+
+
+def _change(org, status="draft"):
+    row = {"id": "r1", "organization_id": str(org), "status": status}
+    return {"type": "document_change", "action": "insert", "old_row": None, "new_row": row}
+
+
+@pytest.fixture(autouse=True)
+def policies():
+    clear_compiled_policies()
+    with patch.object(ws_router, "_load_policies_for_table", AsyncMock(return_value=POLICIES)):
+        yield
+    clear_compiled_policies()
+
+
+async def _per_socket(sockets, payload):
+    """What each socket's dispatcher used to do: decide, then send."""
+    for websocket in sockets:
+        sub = websocket.state.table_subscriptions[TABLE_ID]
+        decision = decide_visibility_change(
+            payload.get("old_row"), payload.get("new_row"), POLICIES,
+            sub["user"], sub["raw_filter"],
+        )
+        if decision is not None:
+            await websocket.send_json({
+                "type": "document_change", "action": decision[0],
+                "table_id": TABLE_ID, "row": decision[1],
+            })
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_their_own_decision():
+    viewer = _Socket(FakeUser(organization_id=ORG_A, role_names=["viewer"]))
+    member = _Socket(FakeUser(organization_id=ORG_A))
+    other_org = _Socket(FakeUser(organization_id=ORG_B, role_names=["viewer"]))
+    admin = _Socket(FakeUser(is_platform_admin=True))
+    filtered = _Socket(
+        FakeUser(organization_id=ORG_A, role_names=["viewer"]),
+        Expr.model_validate({"eq": [{"row": "status"}, "published"]}),
+    )
+    unsubscribed = _Socket(FakeUser(is_platform_admin=True))
+    unsubscribed.state.table_subscriptions = {}
+    sockets = [viewer, member, other_org, admin, filtered, unsubscribed]
+
+    failed = await ws_router._fan_out_table_message(CHANNEL, _change(ORG_A), sockets)
+
+    assert failed == set()
+    assert [len(s.sent) for s in sockets] == [1, 0, 0, 1, 0, 0]
+    message = json.loads(viewer.sent[0])
+    assert message["action"] == "insert"
+    assert message["row"]["organization_id"] == str(ORG_A)
+
+
+@pytest.mark.asyncio
+async def test_batch_changes_and_failed_sends():
+    good = _Socket(FakeUser(is_platform_admin=True))
+    broken = _Socket(FakeUser(is_platform_admin=True))
+    broken.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+    payload = {
+        "type": "document_changes",
+        "changes": [_change(ORG_A), _change(ORG_B)],
+    }
+
+    failed = await ws_router._fan_out_table_message(CHANNEL, payload, [good, broken])
+
+    assert failed == {broken}
+    assert len(good.sent) == 2
+    broken.send_text.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_grouped_fanout_matches_per_socket_path():
+    users = [
+        FakeUser(is_platform_admin=True),
+        FakeUser(organization_id=ORG_A, role_names=["viewer"]),
+        FakeUser(organization_id=ORG_A, role_names=["viewer"]),
+        FakeUser(organization_id=ORG_A, role_names=["editor"]),
+        FakeUser(organization_id=ORG_B, role_names=["viewer"]),
+    ]
+    payloads = [_change(org, status) for org in (ORG_A, ORG_B) for status in ("draft", "published")]
+
+    per_socket = [_Socket(u) for u in users]
+    grouped = [_Socket(u) for u in users]
+    for payload in payloads:
+        await _per_socket(per_socket, payload)
+        await ws_router._fan_out_table_message(CHANNEL, payload, grouped)
+
+    assert [s.sent for s in grouped] == [s.sent for s in per_socket]
+    assert sum(len(s.sent) for s in grouped) > 0
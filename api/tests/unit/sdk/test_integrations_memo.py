@@ -0,0 +1,116 @@
+"""Tests for execution-scoped memoization in integrations.get."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.sdk.context import ExecutionContext
+
+
+def _response(expires_at: str | None = None, access_token: str = "access-tok-abc123") -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "integration_id": "integ-uuid-1",
+        "entity_id": "tenant-1",
+        "entity_name": "Test Entity",
+        "config": {"region": "us"},
+        "oauth": {
+            "connection_name": "TestConn",
+            "client_id": "client-id",
+            "client_secret": None,
+            "authorization_url": None,
+            "token_url": None,
+            "scopes": [],
+            "access_token": access_token,
+            "refresh_token": None,
+            "expires_at": expires_at,
+        },
+    }
+    return response
+
+
+@pytest.fixture
+def ctx():
+    from bifrost._context import set_execution_context, clear_execution_context
+
+    ctx = ExecutionContext(
+        user_id="u1", email="e@e.com", name="Test",
+        scope="GLOBAL", organization=None,
+        is_platform_admin=False, is_function_key=False,
+        execution_id="exec-1",
+    )
+    set_execution_context(ctx)
+    yield ctx
+    clear_execution_context()
+
+
+class TestIntegrationsMemo:
+    @pytest.mark.asyncio
+    async def test_repeat_get_hits_api_once(self, ctx):
+        from bifrost.integrations import integrations
+
+        later = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=_response(expires_at=later))
+
+        with patch("bifrost.integrations.get_client", return_value=mock_client):
+            first = await integrations.get("TestIntegration")
+            first.config["region"] = "mutated"
+            second = await integrations.get("TestIntegration")
+
+        mock_client.post.assert_awaited_once()
+        assert second.oauth.access_token == "access-tok-abc123"
+        # Callers get independent copies
+        assert second.config["region"] == "us"
+
+    @pytest.mark.asyncio
+    async def test_oauth_scope_is_part_of_key(self, ctx):
+        from bifrost.integrations import integrations
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=_response())
+
+        with patch("bifrost.integrations.get_client", return_value=mock_client):
+            await integrations.get("TestIntegration")
+            await integrations.get("TestIntegration", oauth_scope="https://x/.default")
+
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_token_near_expiry_is_refetched(self, ctx):
+        from bifrost.integrations import integrations
+
+        soon = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=_response(expires_at=soon))
+
+        with patch("bifrost.integrations.get_client", return_value=mock_client):
+            await integrations.get("TestIntegration")
+            await integrations.get("TestIntegration")
+
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_drops_memoized_connection(self, ctx):
+        from bifrost.integrations import integrations
+
+        mock_client = AsyncMock()
+        refresh_response = MagicMock()
+        refresh_response.status_code = 200
+        refresh_response.json.return_value = {"access_token": "fresh-token-456", "expires_at": None}
+        mock_client.post = AsyncMock(side_effect=[
+            _response(),
+            refresh_response,
+            _response(access_token="fresh-token-456"),
+        ])
+
+        with patch("bifrost.integrations.get_client", return_value=mock_client), \
+                patch("bifrost.client.get_client", return_value=mock_client):
+            data = await integrations.get("TestIntegration")
+            await data.oauth.refresh()
+            again = await integrations.get("TestIntegration")
+
+        assert again.oauth.access_token == "fresh-token-456"
+        assert mock_client.post.await_count == 3
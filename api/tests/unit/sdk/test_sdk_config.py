@@ -0,0 +1,128 @@
+"""Tests for execution-scoped config memoization and config.get_many."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.sdk.context import ExecutionContext
+
+
+def _make_ctx() -> ExecutionContext:
+    return ExecutionContext(
+        user_id="u1", email="e@e.com", name="Test",
+        scope="GLOBAL", organization=None,
+        is_platform_admin=False, is_function_key=False,
+        execution_id="exec-1",
+    )
+
+
+def _response(payload, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def ctx():
+    from bifrost._context import set_execution_context, clear_execution_context
+
+    ctx = _make_ctx()
+    set_execution_context(ctx)
+    yield ctx
+    clear_execution_context()
+
+
+class TestConfigMemo:
+    @pytest.mark.asyncio
+    async def test_repeat_get_hits_api_once(self, ctx):
+        from bifrost.config import config
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=_response(
+            {"key": "api_url", "value": "https://x", "config_type": "string"}
+        ))
+
+        with patch("bifrost.config.get_client", return_value=mock_client):
+            assert await config.get("api_url") == "https://x"
+            assert await config.get("api_url") == "https://x"
+
+        mock_client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_key_is_memoized_and_default_applied(self, ctx):
+        from bifrost.config import config
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=_response(None))
+
+        with patch("bifrost.config.get_client", return_value=mock_client):
+            assert await config.get("missing", default=1) == 1
+            assert await config.get("missing", default=2) == 2
+
+        mock_client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_invalidates_memo(self, ctx):
+        from bifrost.config import config
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=[
+            _response({"key": "k", "value": "old", "config_type": "string"}),
+            _response(None),  # config/set
+            _response({"key": "k", "value": "new", "config_type": "string"}),
+        ])
+
+        with patch("bifrost.config.get_client", return_value=mock_client), \
+                patch("bifrost.config.raise_for_status_with_detail"):
+            assert await config.get("k") == "old"
+            await config.set("k", "new")
+            assert await config.get("k") == "new"
+
+        assert mock_client.post.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_no_context_does_not_memoize(self):
+        from bifrost.config import config
+        from bifrost._context import clear_execution_context
+
+        clear_execution_context()
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=_response(
+            {"key": "k", "value": "v", "config_type": "string"}
+        ))
+
+        with patch("bifrost.config.get_client", return_value=mock_client):
+            await config.get("k")
+            await config.get("k")
+
+        assert mock_client.post.await_count == 2
+
+
+class TestConfigGetMany:
+    @pytest.mark.asyncio
+    async def test_fetches_only_unmemoized_keys(self, ctx):
+        from bifrost.config import config
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=[
+            _response({"key": "a", "value": "A", "config_type": "string"}),
+            _response({
+                "b": {"key": "b", "value": "super-secret-value", "config_type": "secret"},
+            }),
+        ])
+
+        with patch("bifrost.config.get_client", return_value=mock_client):
+            await config.get("a")
+            result = await config.get_many(["a", "b", "c"], default="dflt")
+
+        assert result == {"a": "A", "b": "super-secret-value", "c": "dflt"}
+        batch_call = mock_client.post.await_args_list[1]
+        assert batch_call.args[0] == "/api/sdk/config/get_many"
+        assert batch_call.kwargs["json"]["keys"] == ["b", "c"]
+        assert "super-secret-value" in ctx._collect_secret_values()
+
+        # Everything is memoized now, including the missing key
+        with patch("bifrost.config.get_client", return_value=mock_client):
+            assert await config.get("c", default=0) == 0
+            assert await config.get_many(["a", "b"]) == {"a": "A", "b": "super-secret-value"}
+        assert mock_client.post.await_count == 2
@@ -193,3 +193,67 @@ class TestTablesSDKWithoutContext:
 
         with pytest.raises(RuntimeError, match="Not logged in"):
             await tables.query("customers")
+
+
+class TestTablesIter:
+    """tables.iter pages through cursors transparently."""
+
+    @staticmethod
+    def _page(ids: list[str], next_cursor: str | None):
+        from unittest.mock import MagicMock
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "documents": [
+                {
+                    "id": doc_id,
+                    "table_id": "00000000-0000-0000-0000-000000000001",
+                    "data": {"n": doc_id},
+                    "created_at": "2026-01-01T00:00:00+00:00",
+                    "updated_at": "2026-01-01T00:00:00+00:00",
+                    "created_by": None,
+                    "updated_by": None,
+                }
+                for doc_id in ids
+            ],
+            "total": -1,
+            "limit": 2,
+            "offset": 0,
+            "next_cursor": next_cursor,
+        }
+        return response
+
+    @pytest.mark.asyncio
+    async def test_iter_follows_next_cursor(self):
+        from unittest.mock import AsyncMock, patch
+        from bifrost import tables
+
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(side_effect=[
+            self._page(["a", "b"], "c1"),
+            self._page(["c"], None),
+        ])
+
+        with patch("bifrost.tables.get_client", return_value=mock_client), \
+                patch("bifrost.tables.resolve_scope", return_value=None):
+            ids = [doc.id async for doc in tables.iter("customers", page_size=2)]
+
+        assert ids == ["a", "b", "c"]
+        first, second = (call.kwargs["json"] for call in mock_client.post.await_args_list)
+        assert first["cursor"] is None and first["skip_count"] is True
+        assert second["cursor"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_iter_missing_table_yields_nothing(self):
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from bifrost import tables
+
+        response = MagicMock()
+        response.status_code = 404
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=response)
+
+        with patch("bifrost.tables.get_client", return_value=mock_client), \
+                patch("bifrost.tables.resolve_scope", return_value=None):
+            assert [doc async for doc in tables.iter("missing")] == []
@@ -2,7 +2,11 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.services.execution.async_executor import _publish_pending
+from src.services.execution.async_executor import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SYNC,
+    _publish_pending,
+)
 
 
 @pytest.mark.asyncio
@@ -33,8 +37,9 @@ async def test_publish_pending_writes_redis_then_publishes():
     q.assert_awaited_once_with("e1")
     pub.assert_awaited_once()
     queue_name, message = pub.await_args.args
-    assert queue_name == "workflow-executions"
-    assert message == {"execution_id": "e1", "workflow_id": "wf", "sync": False}
+    assert queue_name == "workflow-executions-prioritized"
+    assert message == {"execution_id": "e1", "workflow_id": "wf", "sync": False, "org_id": "org"}
+    assert pub.await_args.kwargs == {"priority": PRIORITY_INTERACTIVE}
 
 
 @pytest.mark.asyncio
@@ -63,3 +68,5 @@ async def test_publish_pending_includes_file_path_when_present():
     _, message = pub.await_args.args
     assert message["file_path"] == "workflows/foo.py"
     assert message["sync"] is True
+    # A caller is blocked on a sync execution
+    assert pub.await_args.kwargs == {"priority": PRIORITY_SYNC}
@@ -0,0 +1,134 @@
+"""Tests for the knowledge store's per-dimension HNSW indexes."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.repositories.knowledge import KnowledgeRepository
+from src.services.knowledge import vector_index
+from src.services.knowledge.vector_index import (
+    ann_dimension_filter,
+    ann_distance,
+    ann_index_name,
+    ef_search_for,
+    is_indexable,
+    sync_ann_indexes,
+)
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_distance_casts_to_the_indexed_type():
+    assert "CAST(knowledge_store.embedding AS VECTOR(1536)) <=>" in _sql(ann_distance([0.0] * 1536))
+    # Above 2000 dims HNSW only supports halfvec
+    assert "CAST(knowledge_store.embedding AS HALFVEC(3072)) <=>" in _sql(ann_distance([0.0] * 3072))
+
+
+def test_unindexable_dimension_falls_back_to_plain_distance():
+    assert not is_indexable(4096)
+    assert "CAST" not in _sql(ann_distance([0.0] * 4096))
+
+
+def test_dimension_filter_renders_a_literal():
+    # A bound parameter can't prove the partial-index predicate under a
+    # generic plan, so the dimension must be inlined
+    assert _sql(ann_dimension_filter(1536)) == "vector_dims(knowledge_store.embedding) = 1536"
+
+
+def test_create_index_matches_the_query_expressions():
+    sql = vector_index._create_index_sql(1536)
+    assert ann_index_name(1536) in sql
+    assert "USING hnsw ((embedding::vector(1536)) vector_cosine_ops)" in sql
+    assert sql.endswith("WHERE vector_dims(embedding) = 1536")
+
+    halfvec_sql = vector_index._create_index_sql(3072)
+    assert "((embedding::halfvec(3072)) halfvec_cosine_ops)" in halfvec_sql
+
+
+def test_ef_search_covers_the_over_fetch():
+    assert ef_search_for(5) == vector_index.DEFAULT_EF_SEARCH
+    assert ef_search_for(400) == 400
+    assert ef_search_for(50_000) == vector_index.MAX_EF_SEARCH
+
+
+def _engine(existing: dict[int, bool], dims_in_use: set[int]):
+    """Engine whose connection answers the index listing and EXISTS checks."""
+    executed: list[str] = []
+
+    async def execute(stmt):
+        sql = str(stmt)
+        executed.append(sql)
+        result = MagicMock()
+        if "pg_index" in sql:
+            result.all.return_value = [
+                (ann_index_name(dim), valid) for dim, valid in existing.items()
+            ]
+        elif "EXISTS" in sql:
+            result.scalar_one.return_value = any(
+                f"= {dim})" in sql for dim in dims_in_use
+            )
+        return result
+
+    conn = MagicMock()
+    conn.execute = execute
+    conn.execution_options = AsyncMock(return_value=conn)
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    return engine, executed
+
+
+@pytest.mark.asyncio
+async def test_sync_creates_missing_index_and_drops_unused():
+    engine, executed = _engine({768: True}, dims_in_use={1536})
+
+    result = await sync_ann_indexes(engine, 1536)
+
+    assert result == {"created": [1536], "dropped": [768]}
+    assert any(sql.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS") for sql in executed)
+    assert f"DROP INDEX CONCURRENTLY IF EXISTS {ann_index_name(768)}" in executed
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_indexes_for_dimensions_still_in_use():
+    # Mid-reindex: old rows are still at 768, so searches need that index
+    engine, executed = _engine({768: True, 1536: True}, dims_in_use={768, 1536})
+
+    result = await sync_ann_indexes(engine, 1536)
+
+    assert result == {"created": [], "dropped": []}
+    assert not any(sql.startswith(("CREATE", "DROP")) for sql in executed)
+
+
+@pytest.mark.asyncio
+async def test_sync_rebuilds_invalid_index():
+    engine, executed = _engine({1536: False}, dims_in_use={1536})
+
+    result = await sync_ann_indexes(engine, 1536)
+
+    assert result["created"] == [1536]
+    drop = executed.index(f"DROP INDEX CONCURRENTLY IF EXISTS {ann_index_name(1536)}")
+    create = next(i for i, sql in enumerate(executed) if sql.startswith("CREATE"))
+    assert drop < create
+
+
+@pytest.mark.asyncio
+async def test_search_query_is_shaped_for_the_index():
+    session = MagicMock()
+    rows = MagicMock()
+    rows.all.return_value = []
+    session.execute = AsyncMock(side_effect=[MagicMock(), rows])
+    repo = KnowledgeRepository(session, org_id=None, is_superuser=True)
+
+    await repo.search(query_embedding=[0.1] * 1536, namespace="docs", limit=5)
+
+    settings, stmt = (call.args[0] for call in session.execute.await_args_list)
+    assert "hnsw.ef_search" in str(settings)
+    assert settings.compile().params["ef_search"] == "100"
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "vector_dims(knowledge_store.embedding) = 1536" in sql
+    # Ascending distance on the indexed expression, not descending score
+    assert "ORDER BY CAST(knowledge_store.embedding AS VECTOR(1536)) <=>" in sql
+    assert "DESC" not in sql
@@ -46,6 +46,7 @@ def _make_mock_agent():
     agent.system_prompt = "You are a test agent."
     agent.max_iterations = 5
     agent.max_token_budget = 10000
+    agent.max_parallel_tool_calls = None
     agent.max_run_timeout = 60
     agent.llm_model = "test-model"
     agent.llm_max_tokens = 4096
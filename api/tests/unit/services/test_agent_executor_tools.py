@@ -690,3 +690,70 @@ class TestChatDelegation:
 
         assert result.error is not None
         assert "timed out" in result.error
+
+
+class TestChatParallelToolCalls:
+    """Tool calls from one assistant turn run concurrently in chat."""
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently_with_ordered_events(self, executor):
+        import asyncio
+
+        from src.models.contracts.agents import ToolResult
+        from src.services.conversation_history import ConversationHistory
+        from src.services.llm.base import LLMMessage, LLMStreamChunk, ToolCallRequest
+
+        names = ["slow_tool", "medium_tool", "fast_tool"]
+        delays = {"slow_tool": 0.3, "medium_tool": 0.2, "fast_tool": 0.1}
+        turns = [
+            [LLMStreamChunk(type="tool_call", tool_call=ToolCallRequest(id=f"tc{i}", name=n, arguments={}))
+             for i, n in enumerate(names)] + [LLMStreamChunk(type="done", input_tokens=10, output_tokens=5)],
+            [LLMStreamChunk(type="delta", content="Done"), LLMStreamChunk(type="done")],
+        ]
+        sent_messages = []
+
+        def stream(messages, **kwargs):
+            sent_messages.append(list(messages))
+            chunks = turns[len(sent_messages) - 1]
+
+            async def gen():
+                for chunk in chunks:
+                    yield chunk
+            return gen()
+
+        llm_client = MagicMock(stream=stream, model_name="test-model", provider_name="test")
+
+        async def execute_tool(tool_call, agent, conversation, execution_id=None, *, caller_user_id=None):
+            await asyncio.sleep(delays[tool_call.name])
+            return ToolResult(tool_call_id=tool_call.id, tool_name=tool_call.name, result=tool_call.name)
+
+        conversation = MagicMock(id=uuid4(), user_id=uuid4())
+        with (
+            patch.object(executor, "_save_message", AsyncMock(side_effect=lambda **kw: MagicMock(id=uuid4()))),
+            patch.object(executor, "_update_tool_call_message", AsyncMock()),
+            patch.object(
+                executor,
+                "_build_message_history",
+                AsyncMock(return_value=([LLMMessage(role="system", content="sys")], ConversationHistory())),
+            ),
+            patch.object(executor, "_record_ai_usage", AsyncMock()),
+            patch.object(executor, "_execute_tool", side_effect=execute_tool),
+            patch("src.services.agent_executor.get_llm_client", AsyncMock(return_value=llm_client)),
+        ):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            chunks = [
+                c async for c in executor.chat(None, conversation, "hi", enable_routing=False)
+            ]
+            elapsed = loop.time() - start
+
+        assert elapsed < 0.5  # Sequential dispatch would take 0.6s
+        events = [
+            (c.type, c.tool_result.tool_name if c.tool_result else None)
+            for c in chunks
+            if c.type == "tool_result"
+        ]
+        assert events == [("tool_result", n) for n in names]
+        assert chunks[-1].type == "done" and chunks[-1].content == "Done"
+        tool_msgs = [m for m in sent_messages[1] if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_msgs] == ["tc0", "tc1", "tc2"]
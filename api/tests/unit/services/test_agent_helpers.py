@@ -1,14 +1,24 @@
+import asyncio
+import time
+from contextlib import aclosing
+
 import pytest
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+from src.services.execution import agent_helpers
 from src.services.execution.agent_helpers import (
     agent_delegation_slug,
     build_agent_system_prompt,
     find_delegated_agent,
+    iter_tool_calls,
+    max_parallel_tool_calls,
     resolve_agent_tools,
+    ToolCallTimeoutError,
     AUTONOMOUS_MODE_SUFFIX,
+    DEFAULT_MAX_PARALLEL_TOOL_CALLS,
 )
+from src.services.llm import ToolCallRequest
 
 
 class TestResolveAgentTools:
@@ -184,3 +194,139 @@ class TestFindDelegatedAgent:
 
         result = find_delegated_agent(parent, "delegate_to_data_analyst")
         assert result is a2
+
+
+def _calls(*names: str) -> list[ToolCallRequest]:
+    return [ToolCallRequest(id=f"tc_{name}", name=name, arguments={}) for name in names]
+
+
+async def _collect(outcomes) -> list:
+    return [item async for item in outcomes]
+
+
+class TestMaxParallelToolCalls:
+    def test_default_when_unset(self):
+        agent = MagicMock()
+        agent.max_parallel_tool_calls = None
+        assert max_parallel_tool_calls(agent) == DEFAULT_MAX_PARALLEL_TOOL_CALLS
+
+    def test_agent_override(self):
+        agent = MagicMock()
+        agent.max_parallel_tool_calls = 1
+        assert max_parallel_tool_calls(agent) == 1
+
+    def test_agentless_chat_uses_default(self):
+        assert max_parallel_tool_calls(None) == DEFAULT_MAX_PARALLEL_TOOL_CALLS
+
+
+class TestIterToolCalls:
+    @pytest.mark.asyncio
+    async def test_independent_calls_run_concurrently(self):
+        """Three 0.2s tools finish in about 0.2s, not 0.6s."""
+        async def slow(tc):
+            await asyncio.sleep(0.2)
+            return tc.name
+
+        start = time.monotonic()
+        outcomes = await _collect(iter_tool_calls(_calls("a", "b", "c"), slow, max_concurrency=4))
+        elapsed = time.monotonic() - start
+
+        assert [result for _, result, _ in outcomes] == ["a", "b", "c"]
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        running = 0
+        peak = 0
+
+        async def tracked(tc):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return tc.name
+
+        await _collect(iter_tool_calls(_calls(*"abcdef"), tracked, max_concurrency=2))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_outcomes_follow_request_order(self):
+        """Calls that finish in reverse order are still yielded in request order."""
+        finished: list[str] = []
+
+        async def reverse(tc):
+            await asyncio.sleep({"a": 0.06, "b": 0.03, "c": 0.0}[tc.name])
+            finished.append(tc.name)
+            return tc.name
+
+        outcomes = await _collect(iter_tool_calls(_calls("a", "b", "c"), reverse, max_concurrency=3))
+
+        assert finished == ["c", "b", "a"]
+        assert [tc.name for tc, _, _ in outcomes] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_siblings(self):
+        async def flaky(tc):
+            if tc.name == "bad":
+                raise ValueError("boom")
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        outcomes = await _collect(iter_tool_calls(_calls("bad", "good"), flaky, max_concurrency=2))
+
+        assert isinstance(outcomes[0][1], ValueError)
+        assert outcomes[1][1] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_per_call_timeout(self):
+        async def maybe_hang(tc):
+            if tc.name == "hang":
+                await asyncio.sleep(10)
+            return "ok"
+
+        outcomes = await _collect(
+            iter_tool_calls(_calls("hang", "quick"), maybe_hang, max_concurrency=2, timeout=0.05)
+        )
+
+        assert isinstance(outcomes[0][1], ToolCallTimeoutError)
+        assert outcomes[1][1] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_stops_running_calls(self, monkeypatch):
+        monkeypatch.setattr(agent_helpers, "CANCEL_POLL_INTERVAL_SECONDS", 0.01)
+        cancel = asyncio.Event()
+
+        async def hang(tc):
+            await asyncio.sleep(10)
+
+        async def should_cancel():
+            return cancel.is_set()
+
+        outcomes = iter_tool_calls(
+            _calls("a", "b"), hang, max_concurrency=2, should_cancel=should_cancel
+        )
+        asyncio.get_running_loop().call_later(0.02, cancel.set)
+        results = await asyncio.wait_for(_collect(outcomes), 1)
+
+        assert all(isinstance(result, asyncio.CancelledError) for _, result, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_outstanding_calls(self):
+        cancelled: list[str] = []
+
+        async def work(tc):
+            try:
+                await asyncio.sleep(0 if tc.name == "a" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(tc.name)
+                raise
+            return tc.name
+
+        async with aclosing(iter_tool_calls(_calls("a", "b", "c"), work, max_concurrency=3)) as outcomes:
+            async for tc, _, _ in outcomes:
+                assert tc.name == "a"
+                break
+
+        assert sorted(cancelled) == ["b", "c"]
@@ -49,6 +49,7 @@ def mock_agent():
     agent.delegated_agents = []
     agent.max_iterations = 10
     agent.max_token_budget = 50000
+    agent.max_parallel_tool_calls = None
     agent.llm_model = None
     agent.llm_max_tokens = None
     agent.organization_id = uuid4()
@@ -290,6 +291,103 @@ class TestAutonomousAgentExecutor:
         assert result["status"] == "completed"
         assert result["output"] == "Recovered from error"
 
+    @pytest.mark.asyncio
+    @patch("src.services.execution.autonomous_agent_executor.get_llm_client")
+    @patch("src.services.execution.autonomous_agent_executor.resolve_agent_tools")
+    async def test_tool_calls_in_one_turn_run_concurrently(
+        self, mock_resolve_tools, mock_get_llm, mock_session, mock_agent
+    ):
+        """Independent tool calls overlap; steps and history keep request order."""
+        names = ["slow_tool", "medium_tool", "fast_tool"]
+        mock_resolve_tools.return_value = (
+            [MagicMock(name=n) for n in names],
+            {n: uuid4() for n in names},
+        )
+
+        mock_llm = AsyncMock()
+        mock_llm.complete = AsyncMock(side_effect=[
+            LLMResponse(
+                content=None,
+                tool_calls=[
+                    ToolCallRequest(id=f"tc{i}", name=n, arguments={}) for i, n in enumerate(names)
+                ],
+                finish_reason="tool_use",
+                input_tokens=50,
+                output_tokens=25,
+            ),
+            LLMResponse(
+                content="Done",
+                tool_calls=None,
+                finish_reason="end_turn",
+                input_tokens=100,
+                output_tokens=50,
+            ),
+        ])
+        mock_get_llm.return_value = mock_llm
+
+        delays = {"slow_tool": 0.3, "medium_tool": 0.2, "fast_tool": 0.1}
+
+        async def fake_execute_tool(**kwargs):
+            await asyncio.sleep(delays[kwargs["workflow_name"]])
+            return MagicMock(result=kwargs["workflow_name"], status=MagicMock(value="Success"))
+
+        with patch("src.services.execution.service.execute_tool", side_effect=fake_execute_tool):
+            executor = AutonomousAgentExecutor(mock_session)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await executor.run(agent=mock_agent, run_id=str(uuid4()))
+            elapsed = loop.time() - start
+
+        assert result["status"] == "completed"
+        assert elapsed < 0.5  # Sequential dispatch would take 0.6s
+
+        steps = [(s["type"], (s["content"] or {}).get("tool_name")) for s in executor._pending_steps]
+        tool_steps = [step for step in steps if step[0] in ("tool_call", "tool_result")]
+        assert tool_steps == [("tool_call", n) for n in names] + [("tool_result", n) for n in names]
+
+        history = mock_llm.complete.call_args_list[1].kwargs["messages"]
+        assert [m.tool_call_id for m in history if m.role == "tool"] == ["tc0", "tc1", "tc2"]
+
+    @pytest.mark.asyncio
+    @patch("src.services.execution.autonomous_agent_executor.get_llm_client")
+    @patch("src.services.execution.autonomous_agent_executor.resolve_agent_tools")
+    async def test_parallel_tool_calls_respect_agent_cap(
+        self, mock_resolve_tools, mock_get_llm, mock_session, mock_agent
+    ):
+        """max_parallel_tool_calls=1 restores sequential dispatch."""
+        mock_agent.max_parallel_tool_calls = 1
+        mock_resolve_tools.return_value = ([MagicMock(name="t")], {"t": uuid4()})
+
+        mock_llm = AsyncMock()
+        mock_llm.complete = AsyncMock(side_effect=[
+            LLMResponse(
+                content=None,
+                tool_calls=[ToolCallRequest(id=f"tc{i}", name="t", arguments={}) for i in range(3)],
+                finish_reason="tool_use",
+                input_tokens=50,
+                output_tokens=25,
+            ),
+            LLMResponse(content="Done", tool_calls=None, finish_reason="end_turn"),
+        ])
+        mock_get_llm.return_value = mock_llm
+
+        running = 0
+        peak = 0
+
+        async def fake_execute_tool(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return MagicMock(result="ok", status=MagicMock(value="Success"))
+
+        with patch("src.services.execution.service.execute_tool", side_effect=fake_execute_tool):
+            executor = AutonomousAgentExecutor(mock_session)
+            await executor.run(agent=mock_agent, run_id=str(uuid4()))
+
+        assert peak == 1
+
     @pytest.mark.asyncio
     @patch("src.services.execution.autonomous_agent_executor.get_llm_client")
     @patch("src.services.execution.autonomous_agent_executor.resolve_agent_tools")
@@ -309,6 +407,7 @@ class TestAutonomousAgentExecutor:
         delegated.delegated_agents = []
         delegated.max_iterations = 5
         delegated.max_token_budget = 10000
+        delegated.max_parallel_tool_calls = None
         delegated.llm_model = None
         delegated.llm_max_tokens = None
         delegated.organization_id = mock_agent.organization_id
@@ -397,6 +496,7 @@ class TestAutonomousAgentExecutor:
         delegated.delegated_agents = []
         delegated.max_iterations = 5
         delegated.max_token_budget = 10000
+        delegated.max_parallel_tool_calls = None
         delegated.llm_model = None
         delegated.llm_max_tokens = None
         delegated.organization_id = mock_agent.organization_id
@@ -419,6 +519,7 @@ class TestAutonomousAgentExecutor:
         refetched_agent.delegated_agents = []
         refetched_agent.max_iterations = 5
         refetched_agent.max_token_budget = 10000
+        refetched_agent.max_parallel_tool_calls = None
         refetched_agent.llm_model = None
         refetched_agent.llm_max_tokens = None
         refetched_agent.organization_id = mock_agent.organization_id
@@ -488,6 +589,7 @@ class TestAutonomousAgentExecutor:
         delegated.delegated_agents = []
         delegated.max_iterations = 5
         delegated.max_token_budget = 10000
+        delegated.max_parallel_tool_calls = None
         delegated.llm_model = None
         delegated.llm_max_tokens = None
         delegated.organization_id = mock_agent.organization_id
@@ -626,6 +728,7 @@ class TestAutonomousAgentExecutor:
         delegated.delegated_agents = []
         delegated.max_iterations = 5
         delegated.max_token_budget = 10000
+        delegated.max_parallel_tool_calls = None
         delegated.llm_model = None
         delegated.llm_max_tokens = None
         delegated.organization_id = mock_agent.organization_id
@@ -747,6 +850,7 @@ class TestAutonomousAgentExecutor:
         delegated.delegated_agents = []
         delegated.max_iterations = 5
         delegated.max_token_budget = 10000
+        delegated.max_parallel_tool_calls = None
         delegated.llm_model = None
         delegated.llm_max_tokens = None
         delegated.organization_id = mock_agent.organization_id
@@ -70,6 +70,7 @@ def mock_agent():
     agent.delegated_agents = []
     agent.max_iterations = 5
     agent.max_token_budget = 50000
+    agent.max_parallel_tool_calls = None
     agent.max_run_timeout = 60
     agent.llm_model = None
     agent.llm_max_tokens = None
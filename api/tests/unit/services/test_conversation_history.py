@@ -0,0 +1,232 @@
+"""
+Unit tests for the incremental conversation history (conversation_history).
+
+Covers row -> LLMMessage conversion, tool_call ID remapping, running token
+estimates, the Redis round trip, and that a turn only loads rows added
+since the cached copy was built.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.enums import MessageRole
+from src.services import conversation_history
+from src.services.conversation_history import (
+    ConversationHistory,
+    estimate_message_tokens,
+    load_conversation_history,
+    save_conversation_history,
+)
+from src.services.llm import LLMMessage
+
+
+def _row(sequence: int, role: MessageRole, **fields) -> SimpleNamespace:
+    defaults = {
+        "content": None,
+        "tool_calls": None,
+        "tool_call_id": None,
+        "tool_name": None,
+        "tool_input": None,
+    }
+    return SimpleNamespace(sequence=sequence, role=role, **{**defaults, **fields})
+
+
+def _turn(start: int, tc_id: str = "tc1") -> list[SimpleNamespace]:
+    """user -> assistant text -> TOOL_CALL -> TOOL -> final assistant."""
+    return [
+        _row(start, MessageRole.USER, content="List the tickets"),
+        _row(start + 1, MessageRole.ASSISTANT, content="Checking."),
+        _row(start + 2, MessageRole.TOOL_CALL, tool_call_id=tc_id, tool_name="list_tickets", tool_input={"q": "open"}),
+        _row(start + 3, MessageRole.TOOL, tool_call_id=tc_id, tool_name="list_tickets", content='[{"id": 1}]'),
+        _row(start + 4, MessageRole.ASSISTANT, content="There is one open ticket."),
+    ]
+
+
+class TestConversion:
+    def test_tool_call_rows_attach_to_preceding_assistant(self):
+        history = ConversationHistory()
+        history.append_rows(_turn(1))
+
+        roles = [m.role for m in history.messages]
+        assert roles == ["user", "assistant", "tool", "assistant"]
+        assert history.messages[1].tool_calls[0].id == "tc1"
+        assert history.messages[1].tool_calls[0].arguments == {"q": "open"}
+        assert history.messages[2].tool_call_id == "tc1"
+        assert history.last_sequence == 5
+        assert history.row_count == 5
+
+    def test_tool_call_without_assistant_creates_one(self):
+        history = ConversationHistory()
+        history.append_rows([
+            _row(1, MessageRole.TOOL_CALL, tool_call_id="tc1", tool_name="t"),
+        ])
+
+        assert history.messages[0].role == "assistant"
+        assert history.messages[0].tool_calls[0].name == "t"
+
+    def test_reused_tool_call_ids_are_remapped(self):
+        """Providers that reuse IDs across turns get unique IDs per call."""
+        history = ConversationHistory()
+        history.append_rows(_turn(1) + _turn(6) + _turn(11))
+
+        call_ids = [tc.id for m in history.messages if m.tool_calls for tc in m.tool_calls]
+        result_ids = [m.tool_call_id for m in history.messages if m.role == "tool"]
+        assert call_ids == ["tc1", "tc1_t2", "tc1_t3"]
+        assert result_ids == ["tc1", "tc1_t2", "tc1_t3"]
+
+    def test_system_rows_are_skipped(self):
+        history = ConversationHistory()
+        history.append_rows([_row(1, MessageRole.SYSTEM, content="ignored")])
+
+        assert history.messages == []
+        assert history.last_sequence == 1
+
+    def test_incremental_append_matches_full_build(self):
+        rows = _turn(1) + _turn(6) + _turn(11, tc_id="tc2")
+
+        full = ConversationHistory()
+        full.append_rows(rows)
+
+        incremental = ConversationHistory()
+        for i in range(0, len(rows), 3):
+            incremental = ConversationHistory.from_json(incremental.to_json())
+            incremental.append_rows(rows[i:i + 3])
+
+        assert incremental.messages == full.messages
+        assert incremental.tokens == full.tokens
+
+
+class TestTokens:
+    def test_running_estimate_matches_full_count(self):
+        history = ConversationHistory()
+        history.append_rows(_turn(1) + _turn(6))
+
+        assert history.tokens == sum(estimate_message_tokens(m) for m in history.messages)
+
+    def test_attached_tool_call_updates_assistant_estimate(self):
+        history = ConversationHistory()
+        history.append_rows(_turn(1)[:2])
+        before = history.tokens
+        history.append_rows(_turn(1)[2:3])
+
+        assert history.tokens > before
+        assert history.tokens == sum(estimate_message_tokens(m) for m in history.messages)
+
+    def test_replace_messages_stores_pruned_context(self):
+        history = ConversationHistory()
+        history.append_rows(_turn(1) + _turn(6))
+        summary = LLMMessage(role="user", content="[Previous conversation summary]\nOne ticket.")
+
+        history.replace_messages([summary, *history.messages[-2:]])
+        history.append_rows([_row(11, MessageRole.USER, content="Thanks")])
+
+        assert history.pruned
+        assert [m.content for m in history.messages][0].startswith("[Previous conversation summary]")
+        assert history.messages[-1].content == "Thanks"
+        assert history.tokens == sum(estimate_message_tokens(m) for m in history.messages)
+
+
+class TestSerialization:
+    def test_round_trip(self):
+        history = ConversationHistory()
+        history.append_rows(_turn(1) + _turn(6))
+
+        restored = ConversationHistory.from_json(history.to_json())
+
+        assert restored == history
+
+    def test_other_format_version_is_ignored(self):
+        raw = ConversationHistory().to_json().replace('"version": 1', '"version": 0')
+
+        assert ConversationHistory.from_json(raw) is None
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+def _session_factory(*, covered: int | None, rows: list):
+    """Session factory whose execute() answers the count query then the row query."""
+    session = MagicMock()
+    results = []
+    if covered is not None:
+        results.append(MagicMock(scalar=MagicMock(return_value=covered)))
+    results.append(MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=rows)))))
+    session.execute = AsyncMock(side_effect=results)
+
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch.object(conversation_history, "get_shared_redis", AsyncMock(return_value=fake)):
+        yield fake
+
+
+class TestLoad:
+    @pytest.mark.asyncio
+    async def test_cold_load_builds_and_caches(self, redis):
+        conversation_id = uuid4()
+        factory, session = _session_factory(covered=None, rows=_turn(1))
+
+        history = await load_conversation_history(factory, conversation_id)
+
+        assert len(history.messages) == 4
+        assert session.execute.await_count == 1
+        assert ConversationHistory.from_json(next(iter(redis.store.values()))) == history
+
+    @pytest.mark.asyncio
+    async def test_warm_load_only_queries_new_rows(self, redis):
+        conversation_id = uuid4()
+        cached = ConversationHistory()
+        cached.append_rows(_turn(1))
+        await save_conversation_history(conversation_id, cached)
+
+        factory, session = _session_factory(covered=5, rows=_turn(6))
+        history = await load_conversation_history(factory, conversation_id)
+
+        row_query = session.execute.await_args_list[1].args[0]
+        compiled = str(row_query.compile(compile_kwargs={"literal_binds": True}))
+        assert "messages.sequence > 5" in compiled
+        assert history.last_sequence == 10
+        assert len(history.messages) == 8
+
+    @pytest.mark.asyncio
+    async def test_out_of_date_cache_is_rebuilt(self, redis):
+        conversation_id = uuid4()
+        cached = ConversationHistory()
+        cached.append_rows(_turn(1))
+        await save_conversation_history(conversation_id, cached)
+
+        # A covered row was deleted since the cache was built
+        factory, session = _session_factory(covered=4, rows=_turn(1)[:4])
+        history = await load_conversation_history(factory, conversation_id)
+
+        row_query = session.execute.await_args_list[1].args[0]
+        compiled = str(row_query.compile(compile_kwargs={"literal_binds": True}))
+        assert "messages.sequence > 0" in compiled
+        assert history.row_count == 4
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_full_build(self):
+        factory, _ = _session_factory(covered=None, rows=_turn(1))
+        with patch.object(
+            conversation_history, "get_shared_redis", AsyncMock(side_effect=ConnectionError("down"))
+        ):
+            history = await load_conversation_history(factory, uuid4())
+
+        assert len(history.messages) == 4
@@ -0,0 +1,121 @@
+"""Unit tests for the content-addressed embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.embeddings.base import EmbeddingConfig
+from src.services.embeddings.cache import (
+    EmbeddingCacheStats,
+    content_hash,
+    embed_with_cache,
+    prune_embedding_cache,
+)
+
+
+class _Embedder:
+    def __init__(self, dim: int = 3):
+        self.config = EmbeddingConfig(api_key="test", model="text-embedding-3-small", dimensions=dim)
+        self.dim = dim
+        self.embed = AsyncMock(side_effect=self._embed)
+
+    async def _embed(self, texts):
+        return [[float(len(t))] * self.dim for t in texts]
+
+
+def _session(cached: dict[str, list[float]]):
+    """Session whose cache lookup returns ``cached`` (hash -> embedding)."""
+    session = MagicMock()
+
+    async def execute(stmt):
+        result = MagicMock()
+        result.tuples.return_value.all.return_value = list(cached.items())
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+def _statements(session) -> list[str]:
+    return [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in session.execute.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_all_hits_skip_the_provider():
+    embedder = _Embedder()
+    session = _session({content_hash("a"): [1.0, 1.0, 1.0], content_hash("b"): [2.0, 2.0, 2.0]})
+    stats = EmbeddingCacheStats()
+
+    result = await embed_with_cache(session, embedder, ["a", "b", "a"], stats)
+
+    assert result == [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0], [1.0, 1.0, 1.0]]
+    embedder.embed.assert_not_awaited()
+    assert (stats.hits, stats.misses) == (3, 0)
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_only_unique_misses_are_embedded_and_written_back():
+    embedder = _Embedder()
+    session = _session({content_hash("cached"): [9.0, 9.0, 9.0]})
+    stats = EmbeddingCacheStats()
+
+    result = await embed_with_cache(session, embedder, ["new", "cached", "new", "newer"], stats)
+
+    embedder.embed.assert_awaited_once_with(["new", "newer"])
+    assert result == [[3.0] * 3, [9.0] * 3, [3.0] * 3, [5.0] * 3]
+    assert (stats.hits, stats.misses) == (2, 2)
+    lookup, write = _statements(session)
+    assert "embedding_cache.model = " in lookup
+    assert "embedding_cache.dimensions = " in lookup
+    assert write.startswith("INSERT INTO embedding_cache")
+    assert "ON CONFLICT DO NOTHING" in write
+
+
+@pytest.mark.asyncio
+async def test_wrong_dimension_embeddings_are_returned_but_not_cached():
+    embedder = _Embedder(dim=3)
+    embedder.embed = AsyncMock(return_value=[[1.0, 2.0]])
+    session = _session({})
+
+    result = await embed_with_cache(session, embedder, ["text"])
+
+    assert result == [[1.0, 2.0]]
+    assert len(_statements(session)) == 1  # lookup only, no insert
+
+
+@pytest.mark.asyncio
+async def test_provider_count_mismatch_raises():
+    embedder = _Embedder()
+    embedder.embed = AsyncMock(return_value=[])
+
+    with pytest.raises(ValueError, match="0 embeddings for 1 texts"):
+        await embed_with_cache(_session({}), embedder, ["text"])
+
+
+@pytest.mark.asyncio
+async def test_empty_input_makes_no_queries():
+    session = _session({})
+
+    assert await embed_with_cache(session, _Embedder(), []) == []
+    session.execute.assert_not_awaited()
+
+
+def test_hit_ratio():
+    assert EmbeddingCacheStats().hit_ratio == 0.0
+    assert EmbeddingCacheStats(hits=3, misses=1).hit_ratio == 0.75
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_only_the_current_model():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=7))
+
+    assert await prune_embedding_cache(session, "text-embedding-3-large", 3072) == 7
+    sql = _statements(session)[0]
+    assert sql.startswith("DELETE FROM embedding_cache")
+    assert "(embedding_cache.model, embedding_cache.dimensions) !=" in sql
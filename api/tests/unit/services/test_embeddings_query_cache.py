@@ -0,0 +1,98 @@
+"""Unit tests for the query embedding cache."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.embeddings import query_cache
+from src.services.embeddings.base import EmbeddingConfig
+from src.services.embeddings.query_cache import (
+    LOCAL_CACHE_SIZE,
+    clear_local_query_cache,
+    embed_query,
+    normalize_query,
+)
+
+
+class _Embedder:
+    def __init__(self, model: str = "text-embedding-3-small", dim: int = 3):
+        self.config = EmbeddingConfig(api_key="test", model=model, dimensions=dim)
+        self.embed_single = AsyncMock(side_effect=lambda text: [float(len(text))] * dim)
+
+
+@pytest.fixture(autouse=True)
+def redis():
+    """Dict-backed Redis with get/set."""
+    store: dict[str, str] = {}
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=store.get)
+    client.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value))
+    client.store = store
+    clear_local_query_cache()
+    with patch.object(query_cache, "get_shared_redis", AsyncMock(return_value=client)):
+        yield client
+    clear_local_query_cache()
+
+
+def test_normalize_collapses_whitespace():
+    assert normalize_query("  reset\n the   password ") == "reset the password"
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_embedded_once(redis):
+    embedder = _Embedder()
+
+    first = await embed_query(embedder, "INC-1234 status")
+    second = await embed_query(embedder, " INC-1234   status ")
+
+    assert first == second
+    embedder.embed_single.assert_awaited_once_with("INC-1234 status")
+    # Second call is served in-process
+    redis.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_skips_the_provider(redis):
+    embedder = _Embedder()
+    await embed_query(embedder, "shared query")
+    [(key, value)] = redis.store.items()
+    assert key.startswith("bifrost:query_embedding:text-embedding-3-small:3:")
+    assert json.loads(value) == [12.0, 12.0, 12.0]
+
+    # Another worker: empty local tier, same Redis
+    clear_local_query_cache()
+    other = _Embedder()
+    assert await embed_query(other, "shared query") == [12.0, 12.0, 12.0]
+    other.embed_single.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_model_and_dimensions_are_part_of_the_key():
+    small = _Embedder(dim=3)
+    large = _Embedder(model="text-embedding-3-large", dim=4)
+
+    assert len(await embed_query(small, "query")) == 3
+    assert len(await embed_query(large, "query")) == 4
+    large.embed_single.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_the_provider():
+    embedder = _Embedder()
+    with patch.object(query_cache, "get_shared_redis", AsyncMock(side_effect=ConnectionError("down"))):
+        assert await embed_query(embedder, "query") == [5.0, 5.0, 5.0]
+    embedder.embed_single.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_local_tier_evicts_least_recently_used(redis):
+    embedder = _Embedder()
+    for i in range(LOCAL_CACHE_SIZE + 1):
+        await embed_query(embedder, f"query {i}")
+
+    redis.get.reset_mock()
+    await embed_query(embedder, f"query {LOCAL_CACHE_SIZE}")
+    redis.get.assert_not_awaited()
+    await embed_query(embedder, "query 0")
+    redis.get.assert_awaited_once()
@@ -13,6 +13,7 @@ from sqlalchemy import select
 
 from src.models.orm.knowledge import KnowledgeStore
 from src.services.embeddings import reindex
+from src.services.embeddings.base import EmbeddingConfig
 
 
 @pytest.fixture
@@ -87,6 +88,8 @@ async def test_run_reindex_for_group_rechunks_legacy_giant_row(db_session):
     await db_session.flush()
 
     class _Embedder:
+        config = EmbeddingConfig(api_key="test", model="fake-embedder", dimensions=8)
+
         async def embed(self, texts):
             return [[0.2] * 8 for _ in texts]
 
@@ -293,6 +296,10 @@ async def test_run_reindex_partial_failure_completes_with_failed_batch_count():
             "run_reindex_for_group",
             AsyncMock(side_effect=[2, RuntimeError("provider blip"), 2]),
         ),
+        patch.object(reindex, "get_engine"),
+        patch.object(reindex, "sync_ann_indexes", AsyncMock(
+            return_value={"created": [1536], "dropped": []}
+        )) as sync_indexes,
     ):
         await reindex.run_reindex("nid")
 
@@ -304,6 +311,9 @@ async def test_run_reindex_partial_failure_completes_with_failed_batch_count():
     assert final_update.result["total_batches"] == 3
     assert final_update.result["total"] == 3
     assert "1/3 document(s) failed" in final_update.description
+    # The HNSW index for the new dimension is built once the job completes
+    sync_indexes.assert_awaited_once()
+    assert sync_indexes.await_args.args[1] == embedding_client.config.dimensions
 
 
 @pytest.mark.asyncio
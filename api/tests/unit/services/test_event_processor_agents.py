@@ -8,6 +8,7 @@ enqueue_agent_run with the expected parameters.
 """
 
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -158,6 +159,67 @@ async def test_queue_deliveries_skips_non_pending():
     assert delivery.status == EventDeliveryStatus.QUEUED
 
 
+@pytest.mark.asyncio
+async def test_partial_publish_failure_fails_only_unconfirmed_deliveries():
+    """Deliveries whose messages the broker confirmed stay QUEUED."""
+    from src.jobs.rabbitmq import PublishError
+
+    processor = _create_processor()
+
+    event_id = uuid.uuid4()
+    event = _make_event(event_id=event_id)
+    confirmed = _make_delivery(target_type="workflow")
+    unconfirmed = _make_delivery(target_type="agent")
+
+    processor._delivery_repo.get_by_event = AsyncMock(
+        return_value=[confirmed, unconfirmed]
+    )
+    processor._event_repo.get_by_id = AsyncMock(return_value=event)
+    processor._queue_workflow_execution = AsyncMock(return_value="exec-1")
+    processor._queue_agent_run = AsyncMock(return_value="run-1")
+    processor._broadcast_event_update = AsyncMock()
+
+    @asynccontextmanager
+    async def failing_publishes():
+        yield
+        raise PublishError("1 of 2 messages were not confirmed", [{"run_id": "run-1"}])
+
+    with patch("src.services.events.processor.deferred_publishes", failing_publishes):
+        count = await processor.queue_event_deliveries(event_id)
+
+    assert count == 1
+    assert confirmed.status == EventDeliveryStatus.QUEUED
+    assert confirmed.error_message is None
+    assert unconfirmed.status == EventDeliveryStatus.FAILED
+    assert "not confirmed" in unconfirmed.error_message
+
+
+@pytest.mark.asyncio
+async def test_publish_failure_without_detail_fails_every_delivery():
+    """Any other publish error fails every delivery queued in the call."""
+    processor = _create_processor()
+
+    event_id = uuid.uuid4()
+    event = _make_event(event_id=event_id)
+    deliveries = [_make_delivery(), _make_delivery()]
+
+    processor._delivery_repo.get_by_event = AsyncMock(return_value=deliveries)
+    processor._event_repo.get_by_id = AsyncMock(return_value=event)
+    processor._queue_workflow_execution = AsyncMock(side_effect=["exec-1", "exec-2"])
+    processor._broadcast_event_update = AsyncMock()
+
+    @asynccontextmanager
+    async def failing_publishes():
+        yield
+        raise ConnectionError("broker gone")
+
+    with patch("src.services.events.processor.deferred_publishes", failing_publishes):
+        count = await processor.queue_event_deliveries(event_id)
+
+    assert count == 0
+    assert all(d.status == EventDeliveryStatus.FAILED for d in deliveries)
+
+
 @pytest.mark.asyncio
 async def test_queue_agent_run_calls_enqueue():
     """_queue_agent_run should call enqueue_agent_run with correct parameters."""
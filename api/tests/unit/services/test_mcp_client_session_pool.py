@@ -0,0 +1,366 @@
+"""Unit tests for the pooled MCP client sessions (``mcp_client.session_pool``).
+
+Most tests swap ``client.open_session`` for an in-memory fake so pool
+mechanics (reuse, eviction, health checks, limits) are deterministic.
+``TestStandInServer`` runs a real Streamable HTTP MCP server on localhost
+and checks that repeated tool calls share one server-side session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import anyio
+import httpx
+import pytest
+import pytest_asyncio
+import uvicorn
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+from sse_starlette.sse import AppStatus
+
+from src.services.mcp_client import dispatch
+from src.services.mcp_client import session_pool
+from src.services.mcp_client.session_pool import (
+    MCPSessionPool,
+    close_session_pool,
+    get_session_pool,
+)
+
+
+def _connection(url: str = "https://mcp.example.test/mcp") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        server_url_override=None,
+        server=SimpleNamespace(server_url=url),
+    )
+
+
+class FakeOpener:
+    """Stands in for ``client.open_session``; records opens and closes."""
+
+    def __init__(self) -> None:
+        self.opened: list[SimpleNamespace] = []
+        self.closed = 0
+        self.fail_with: Exception | None = None
+
+    @asynccontextmanager
+    async def __call__(self, connection, access_token):
+        session = SimpleNamespace(
+            token=access_token,
+            call_tool=AsyncMock(return_value="ok", side_effect=self.fail_with),
+            send_ping=AsyncMock(),
+        )
+        self.opened.append(session)
+        try:
+            yield session
+        finally:
+            self.closed += 1
+
+
+@pytest.fixture
+def opener():
+    fake = FakeOpener()
+    with patch(
+        "src.services.mcp_client.session_pool.mcp_client_session.open_session",
+        new=fake,
+    ):
+        yield fake
+
+
+class TestReuse:
+    async def test_sessions_are_reused_per_connection_and_token(self, opener):
+        pool = MCPSessionPool()
+        conn = _connection()
+
+        for _ in range(30):
+            async with pool.session(conn, "token-a") as session:
+                await session.call_tool("echo", {})
+
+        assert len(opener.opened) == 1
+        assert pool.stats.misses == 1
+        assert pool.stats.hits == 29
+        await pool.close()
+        assert opener.closed == 1
+
+    async def test_different_tokens_get_different_sessions(self, opener):
+        pool = MCPSessionPool()
+        conn = _connection()
+
+        async with pool.session(conn, "token-a") as a:
+            pass
+        async with pool.session(conn, "token-b") as b:
+            pass
+
+        assert a is not b
+        assert a.token == "token-a" and b.token == "token-b"
+        await pool.close()
+
+    async def test_concurrent_misses_share_one_handshake(self, opener):
+        pool = MCPSessionPool()
+        conn = _connection()
+
+        async def call():
+            async with pool.session(conn, "token-a") as session:
+                return session
+
+        sessions = await asyncio.gather(*(call() for _ in range(10)))
+
+        assert len(opener.opened) == 1
+        assert all(s is sessions[0] for s in sessions)
+        await pool.close()
+
+
+class TestLifecycle:
+    async def test_idle_sessions_are_evicted(self, opener):
+        pool = MCPSessionPool(idle_timeout=0)
+        conn = _connection()
+
+        async with pool.session(conn, "token-a"):
+            pass
+        async with pool.session(conn, "token-a"):
+            pass
+
+        assert len(opener.opened) == 2
+        assert pool.stats.evictions == 1
+        assert opener.closed == 1
+        await pool.close()
+
+    async def test_failed_health_check_reopens(self, opener):
+        pool = MCPSessionPool(health_check_after=0)
+        conn = _connection()
+
+        async with pool.session(conn, "token-a") as first:
+            pass
+        first.send_ping.side_effect = ConnectionError("gone")
+        async with pool.session(conn, "token-a") as second:
+            pass
+
+        assert second is not first
+        assert pool.stats.reopens == 1
+        await pool.close()
+
+    async def test_healthy_session_passes_ping(self, opener):
+        pool = MCPSessionPool(health_check_after=0)
+        conn = _connection()
+
+        async with pool.session(conn, "token-a") as first:
+            pass
+        async with pool.session(conn, "token-a") as second:
+            pass
+
+        assert second is first
+        first.send_ping.assert_awaited_once()
+        await pool.close()
+
+    async def test_error_in_block_discards_session(self, opener):
+        pool = MCPSessionPool()
+        conn = _connection()
+
+        with pytest.raises(RuntimeError):
+            async with pool.session(conn, "token-a"):
+                raise RuntimeError("transport closed")
+
+        assert len(pool) == 0
+        assert opener.closed == 1
+        assert pool.stats.discards == 1
+
+    async def test_max_sessions_evicts_least_recently_used(self, opener):
+        pool = MCPSessionPool(max_sessions=2)
+        conns = [_connection() for _ in range(3)]
+
+        for conn in conns:
+            async with pool.session(conn, "token"):
+                pass
+
+        assert len(pool) == 2
+        assert pool.stats.evictions == 1
+        assert not pool.has_session(conns[0], "token")
+        assert pool.has_session(conns[2], "token")
+        await pool.close()
+
+    async def test_overflow_when_all_sessions_busy(self, opener):
+        pool = MCPSessionPool(max_sessions=1)
+        busy, other = _connection(), _connection()
+
+        async with pool.session(busy, "token"):
+            async with pool.session(other, "token"):
+                pass
+
+        assert pool.stats.overflow == 1
+        assert len(pool) == 1
+        assert not pool.has_session(other, "token")
+        assert opener.closed == 1
+        await pool.close()
+
+
+class TestShutdownAndStats:
+    async def test_close_session_pool_closes_the_loops_pool(self, opener):
+        conn = _connection()
+        pool = get_session_pool()
+        async with pool.session(conn, "token"):
+            pass
+
+        await close_session_pool()
+
+        assert opener.closed == 1
+        assert get_session_pool() is not pool
+        await close_session_pool()
+
+    async def test_stats_are_logged_periodically(self, opener, caplog):
+        pool = MCPSessionPool()
+        conn = _connection()
+        caplog.set_level("INFO", logger=session_pool.__name__)
+
+        async with pool.session(conn, "token"):
+            pass
+        assert "MCP session pool" not in caplog.text
+
+        pool._stats_logged_at -= session_pool.STATS_LOG_INTERVAL_SECONDS
+        async with pool.session(conn, "token"):
+            pass
+        assert "MCP session pool: 1 open" in caplog.text
+        assert "'misses': 1" in caplog.text
+        await pool.close()
+
+
+class TestDispatchRetry:
+    async def test_stale_pooled_session_is_retried_once(self, opener):
+        conn = _connection()
+        pool = get_session_pool()
+
+        async with pool.session(conn, "token") as stale:
+            pass
+        stale.call_tool.side_effect = anyio.ClosedResourceError()
+
+        result = await dispatch._call_remote(conn, "token", "echo", {})
+
+        assert result == "ok"
+        assert len(opener.opened) == 2
+        await pool.close()
+
+    async def test_unknown_server_session_is_retried(self, opener):
+        conn = _connection()
+        pool = get_session_pool()
+
+        async with pool.session(conn, "token") as stale:
+            pass
+        stale.call_tool.side_effect = McpError(
+            ErrorData(code=32600, message="Session terminated")
+        )
+
+        assert await dispatch._call_remote(conn, "token", "echo", {}) == "ok"
+        assert len(opener.opened) == 2
+        await pool.close()
+
+    @pytest.mark.parametrize(
+        "error",
+        [httpx.ReadTimeout("timed out"), ConnectionResetError("reset by peer")],
+    )
+    async def test_failure_after_send_is_not_retried(self, opener, error):
+        # The server may already have run the tool; a retry could run it twice
+        conn = _connection()
+        pool = get_session_pool()
+
+        async with pool.session(conn, "token") as session:
+            pass
+        session.call_tool.side_effect = error
+
+        with pytest.raises(type(error)):
+            await dispatch._call_remote(conn, "token", "echo", {})
+
+        assert len(opener.opened) == 1
+        assert session.call_tool.await_count == 1
+        assert not pool.has_session(conn, "token")
+
+    async def test_auth_error_is_not_retried_here(self, opener):
+        conn = _connection()
+        pool = get_session_pool()
+
+        async with pool.session(conn, "token") as session:
+            pass
+        session.call_tool.side_effect = RuntimeError("HTTP 401 Unauthorized")
+
+        with pytest.raises(RuntimeError):
+            await dispatch._call_remote(conn, "token", "echo", {})
+
+        assert len(opener.opened) == 1
+        assert not pool.has_session(conn, "token")
+
+    async def test_fresh_session_failure_is_not_retried(self, opener):
+        opener.fail_with = ConnectionError("refused")
+
+        with pytest.raises(ConnectionError):
+            await dispatch._call_remote(_connection(), "token", "echo", {})
+
+        assert len(opener.opened) == 1
+
+
+@pytest_asyncio.fixture
+async def stand_in_server():
+    """A local Streamable HTTP MCP server exposing two tools."""
+    server = FastMCP("stand-in")
+
+    @server.tool()
+    def echo(text: str) -> str:
+        return text
+
+    @server.tool()
+    def server_session(ctx: Context) -> str:
+        return str(id(ctx.session))
+
+    config = uvicorn.Config(
+        server.streamable_http_app(), host="127.0.0.1", port=0, log_level="warning"
+    )
+    uv = uvicorn.Server(config)
+    # sse_starlette latches a process-wide exit flag when any uvicorn server
+    # stops; left set, the previous test's shutdown ends this server's SSE
+    # responses before they're written
+    AppStatus.should_exit = False
+    task = asyncio.create_task(uv.serve())
+    while not uv.started:
+        await asyncio.sleep(0.01)
+    port = uv.servers[0].sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/mcp"
+
+    uv.should_exit = True
+    await task
+
+
+class TestStandInServer:
+    async def test_tool_calls_share_one_server_session(self, stand_in_server):
+        pool = MCPSessionPool()
+        conn = _connection(stand_in_server)
+
+        seen = set()
+        for i in range(30):
+            async with pool.session(conn, "token") as session:
+                echoed = await session.call_tool("echo", {"text": f"hi {i}"})
+                assert echoed.content[0].text == f"hi {i}"
+                result = await session.call_tool("server_session", {})
+                seen.add(result.content[0].text)
+
+        assert len(seen) == 1
+        assert pool.stats.misses == 1
+        assert pool.stats.hits == 29
+        await pool.close()
+
+    async def test_reopens_after_session_closed(self, stand_in_server):
+        pool = MCPSessionPool()
+        conn = _connection(stand_in_server)
+
+        async with pool.session(conn, "token") as session:
+            first = (await session.call_tool("server_session", {})).content[0].text
+        await pool.close()
+        async with pool.session(conn, "token") as session:
+            second = (await session.call_tool("server_session", {})).content[0].text
+
+        assert first != second
+        assert pool.stats.misses == 2
+        await pool.close()
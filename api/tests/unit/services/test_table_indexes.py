@@ -0,0 +1,123 @@
+"""Unit tests for typed document field expressions and index DDL."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.models.orm.tables import Document
+from src.routers.tables import _build_document_filters
+from src.services.table_indexes import (
+    comparison_operand,
+    index_ddl,
+    index_name,
+    schema_field_kinds,
+    table_field_kinds,
+    typed_field_sql,
+)
+
+TABLE_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestFieldKinds:
+    def test_schema_hints(self):
+        schema = {
+            "columns": [
+                {"name": "amount", "type": "number"},
+                {"name": "active", "type": "boolean"},
+                {"name": "due", "type": "datetime"},
+                {"name": "name", "type": "string"},
+                {"name": "bad"},
+            ]
+        }
+        assert schema_field_kinds(schema) == {
+            "amount": "numeric",
+            "active": "boolean",
+            "due": "timestamp",
+        }
+
+    def test_non_dict_schema(self):
+        assert schema_field_kinds(None) == {}
+        assert schema_field_kinds({"type": "object"}) == {}
+
+    def test_declared_index_overrides_schema(self):
+        schema = {"columns": [{"name": "code", "type": "number"}]}
+        indexes = [{"field": "code", "kind": "text"}, {"field": "x", "kind": "bogus"}]
+        assert table_field_kinds(schema, indexes) == {"code": "text"}
+
+
+class TestComparisonOperand:
+    def test_operand_types_without_hints(self):
+        assert comparison_operand("f", 100, {}) == ("numeric", Decimal("100"))
+        assert comparison_operand("f", 1.5, {}) == ("numeric", Decimal("1.5"))
+        assert comparison_operand("f", True, {}) == ("boolean", True)
+        assert comparison_operand("f", "150", {}) == ("text", "150")
+        assert comparison_operand("f", "2024-01-02", {}) == (
+            "timestamp",
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+        )
+
+    def test_hint_coerces_string_operand(self):
+        assert comparison_operand("f", "150", {"f": "numeric"}) == (
+            "numeric",
+            Decimal("150"),
+        )
+
+    def test_uncoercible_operand_falls_back_to_operand_type(self):
+        assert comparison_operand("f", "abc", {"f": "numeric"}) == ("text", "abc")
+
+    def test_timestamp_with_offset(self):
+        kind, value = comparison_operand("f", "2024-01-02T03:04:05Z", {})
+        assert kind == "timestamp"
+        assert value == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class TestTypedSql:
+    def test_field_name_is_quoted(self):
+        sql = typed_field_sql("it's", "text")
+        assert sql == "(data ->> 'it''s')"
+
+    def test_nul_rejected(self):
+        with pytest.raises(ValueError):
+            typed_field_sql("a\x00b", "text")
+
+    def test_index_ddl_uses_filter_expression(self):
+        ddl = index_ddl(TABLE_ID, "amount", "numeric")
+        assert ddl.startswith(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name(TABLE_ID, 'amount', 'numeric')} "
+        )
+        assert typed_field_sql("amount", "numeric") in ddl
+        assert ddl.endswith(f"WHERE table_id = '{TABLE_ID}'::uuid")
+
+    def test_index_name_fits_postgres_limit(self):
+        assert len(index_name(TABLE_ID, "x" * 255, "timestamp")) <= 63
+        assert index_name(TABLE_ID, "a", "numeric") != index_name(TABLE_ID, "a", "text")
+
+
+class TestBuildDocumentFilters:
+    def test_numeric_operand_compares_numerically(self):
+        query = _build_document_filters(select(Document), {"amount": {"gt": 100}})
+        sql = _sql(query)
+        assert typed_field_sql("amount", "numeric", column="documents.data") in sql
+        assert "CAST" not in sql
+
+    def test_string_operand_without_hint_compares_as_text(self):
+        query = _build_document_filters(select(Document), {"amount": {"gt": "150"}})
+        assert typed_field_sql("amount", "text", column="documents.data") in _sql(query)
+
+    def test_schema_hint_applies_to_string_operand(self):
+        query = _build_document_filters(
+            select(Document),
+            {"due": {"gte": "2024-01-01", "lt": "2025-01-01"}, "n": {"lte": "5"}},
+            {"n": "numeric"},
+        )
+        sql = _sql(query)
+        assert "bifrost_jsonb_timestamptz(documents.data -> 'due') >=" in sql
+        assert typed_field_sql("n", "numeric", column="documents.data") in sql
@@ -19,9 +19,12 @@ from src.services.execution.virtual_import import (
     NamespacePackageLoader,
     VirtualModuleFinder,
     VirtualModuleLoader,
+    get_preload_usage,
     get_virtual_finder,
     install_virtual_import_hook,
     invalidate_module_index,
+    park_preloaded_modules,
+    preload_workspace_modules,
     remove_virtual_import_hook,
 )
 
@@ -390,6 +393,87 @@ class TestVirtualModuleLoader:
             loader.exec_module(module)
 
 
+class TestVirtualModuleLoaderBytecodeCache:
+    """Tests for the marshalled code-object cache used by VirtualModuleLoader."""
+
+    def test_exec_module_uses_cached_bytecode(self):
+        """A cache hit is executed without compiling the source."""
+        import marshal
+
+        code = compile("x = 'from cache'", "shared/test.py", "exec")
+        loader = VirtualModuleLoader(
+            "shared/test.py", "x = 'from source'", content_hash="abc123"
+        )
+        module = ModuleType("shared.test")
+
+        with (
+            patch(
+                "src.services.execution.virtual_import.get_module_code_sync",
+                return_value=marshal.dumps(code),
+            ) as mock_get,
+            patch(
+                "src.services.execution.virtual_import.set_module_code_sync"
+            ) as mock_set,
+        ):
+            loader.exec_module(module)
+
+        assert module.x == "from cache"
+        mock_get.assert_called_once_with("shared/test.py", "abc123")
+        mock_set.assert_not_called()
+
+    def test_exec_module_populates_cache_on_miss(self):
+        """A cache miss compiles the source and stores the marshalled code."""
+        import marshal
+
+        loader = VirtualModuleLoader("shared/test.py", "x = 1", content_hash="abc123")
+        module = ModuleType("shared.test")
+
+        with (
+            patch(
+                "src.services.execution.virtual_import.get_module_code_sync",
+                return_value=None,
+            ),
+            patch(
+                "src.services.execution.virtual_import.set_module_code_sync"
+            ) as mock_set,
+        ):
+            loader.exec_module(module)
+
+        assert module.x == 1
+        path, content_hash, data = mock_set.call_args[0]
+        assert (path, content_hash) == ("shared/test.py", "abc123")
+        assert marshal.loads(data).co_filename == "shared/test.py"
+
+    def test_exec_module_recompiles_corrupt_bytecode(self):
+        """Unreadable cached bytecode falls back to compiling the source."""
+        loader = VirtualModuleLoader("shared/test.py", "x = 2", content_hash="abc123")
+        module = ModuleType("shared.test")
+
+        with (
+            patch(
+                "src.services.execution.virtual_import.get_module_code_sync",
+                return_value=b"not bytecode",
+            ),
+            patch("src.services.execution.virtual_import.set_module_code_sync"),
+        ):
+            loader.exec_module(module)
+
+        assert module.x == 2
+
+    def test_exec_module_skips_cache_without_hash(self):
+        """Without a content hash there is no safe key, so the cache is bypassed."""
+        loader = VirtualModuleLoader("shared/test.py", "x = 3")
+        module = ModuleType("shared.test")
+
+        with patch(
+            "src.services.execution.virtual_import.get_module_code_sync"
+        ) as mock_get:
+            loader.exec_module(module)
+
+        assert module.x == 3
+        mock_get.assert_not_called()
+
+
 class TestInstallRemoveHook:
     """Tests for hook installation and removal functions."""
 
@@ -638,3 +722,149 @@ class TestIntegration:
             assert virtual_test_ns.extensions.__file__ is None
             assert hasattr(virtual_test_ns, "__path__")
             assert hasattr(virtual_test_ns.extensions, "__path__")
+
+
+class TestHotModulePreload:
+    """Tests for template-side preload and child-side parking of workspace modules."""
+
+    @pytest.fixture(autouse=True)
+    def cleanup(self):
+        """Clean up after each test."""
+        yield
+        sys.meta_path = [
+            finder
+            for finder in sys.meta_path
+            if not finder.__class__.__name__ == "VirtualModuleFinder"
+        ]
+        import src.services.execution.virtual_import as module
+
+        for k in [k for k in sys.modules if k.startswith("preload_test_")]:
+            del sys.modules[k]
+        module._parked_modules.clear()
+        module._preload_hits.clear()
+        module._preload_misses.clear()
+        module._finder = None
+
+    def test_preload_imports_from_supplied_sources_only(self):
+        """Preload never falls back to Redis."""
+        install_virtual_import_hook()
+        modules = [
+            {"path": "preload_test_pkg/__init__.py", "content": "", "hash": "h1"},
+            {
+                "path": "preload_test_pkg/client.py",
+                "content": "from preload_test_pkg import base\nVALUE = base.BASE + 1",
+                "hash": "h2",
+            },
+            {"path": "preload_test_pkg/base.py", "content": "BASE = 41", "hash": "h3"},
+        ]
+
+        with patch("src.services.execution.virtual_import.get_module_sync") as mock_get:
+            loaded = preload_workspace_modules(modules, {m["path"] for m in modules})
+
+        mock_get.assert_not_called()
+        assert loaded == sorted(m["path"] for m in modules)
+        assert sys.modules["preload_test_pkg.client"].VALUE == 42
+
+    def test_preload_skips_module_with_unsupplied_dependency(self):
+        """A module importing a workspace path outside the preload set is dropped."""
+        install_virtual_import_hook()
+        modules = [
+            {"path": "preload_test_a.py", "content": "import preload_test_b", "hash": "h1"},
+        ]
+        index = {"preload_test_a.py", "preload_test_b.py"}
+
+        with patch("src.services.execution.virtual_import.get_module_sync") as mock_get:
+            loaded = preload_workspace_modules(modules, index)
+
+        mock_get.assert_not_called()
+        assert loaded == []
+        assert "preload_test_a" not in sys.modules
+
+    def test_parked_modules_are_restored_and_counted_as_hits(self):
+        """Imports in the child reuse the template's module object."""
+        install_virtual_import_hook()
+        modules = [
+            {"path": "preload_test_pkg/__init__.py", "content": "", "hash": "h1"},
+            {"path": "preload_test_pkg/client.py", "content": "STATE = object()", "hash": "h2"},
+        ]
+        preload_workspace_modules(modules, {m["path"] for m in modules})
+        original = sys.modules["preload_test_pkg.client"]
+
+        assert park_preloaded_modules() == 2
+        assert "preload_test_pkg.client" not in sys.modules
+
+        hashes = {m["path"]: m["hash"] for m in modules}
+        with patch(
+            "src.services.execution.virtual_import.get_module_sync",
+            side_effect=lambda path: {"path": path, "content": "", "hash": hashes[path]},
+        ):
+            from preload_test_pkg import client  # type: ignore[import-not-found]
+
+        assert client is original
+        assert get_preload_usage() == {
+            "used": ["preload_test_pkg/__init__.py", "preload_test_pkg/client.py"],
+            "hits": 2,
+        }
+
+    def test_stale_parked_module_is_reloaded_from_redis(self):
+        """A module edited after the template preloaded it runs the new source."""
+        install_virtual_import_hook()
+        modules = [{"path": "preload_test_edited.py", "content": "VERSION = 1", "hash": "old"}]
+        preload_workspace_modules(modules, {"preload_test_edited.py"})
+        park_preloaded_modules()
+
+        def mock_get_module(path: str):
+            if path == "preload_test_edited.py":
+                return {"content": "VERSION = 2", "path": path, "hash": "new"}
+            return None
+
+        with (
+            patch(
+                "src.services.execution.virtual_import.get_module_sync",
+                side_effect=mock_get_module,
+            ),
+            patch("src.services.execution.virtual_import.get_module_code_sync", return_value=None),
+            patch("src.services.execution.virtual_import.set_module_code_sync"),
+        ):
+            import preload_test_edited  # type: ignore[import-not-found]
+
+        assert preload_test_edited.VERSION == 2
+        assert get_preload_usage() == {"used": ["preload_test_edited.py"], "hits": 0}
+
+    def test_preload_imports_only_targets(self):
+        """Sources outside ``targets`` only resolve the targets' imports."""
+        install_virtual_import_hook()
+        modules = [
+            {"path": "preload_test_x.py", "content": "import preload_test_y", "hash": "h1"},
+            {"path": "preload_test_y.py", "content": "Y = 1", "hash": "h2"},
+            {"path": "preload_test_z.py", "content": "Z = 1", "hash": "h3"},
+        ]
+
+        loaded = preload_workspace_modules(
+            modules, {m["path"] for m in modules}, targets=["preload_test_x.py"]
+        )
+
+        assert loaded == ["preload_test_x.py", "preload_test_y.py"]
+        assert "preload_test_z" not in sys.modules
+
+    def test_redis_loaded_modules_are_counted_as_misses(self):
+        """Modules the child had to fetch show up as used but not hit."""
+        install_virtual_import_hook()
+        park_preloaded_modules()
+
+        def mock_get_module(path: str):
+            if path == "preload_test_cold.py":
+                return {"content": "X = 1", "path": path, "hash": "abc"}
+            return None
+
+        with (
+            patch(
+                "src.services.execution.virtual_import.get_module_sync",
+                side_effect=mock_get_module,
+            ),
+            patch("src.services.execution.virtual_import.get_module_code_sync", return_value=None),
+            patch("src.services.execution.virtual_import.set_module_code_sync"),
+        ):
+            import preload_test_cold  # type: ignore[import-not-found]  # noqa: F401
+
+        assert get_preload_usage() == {"used": ["preload_test_cold.py"], "hits": 0}
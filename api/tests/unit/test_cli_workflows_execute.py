@@ -203,6 +203,48 @@ class TestWorkflowsExecute:
         assert "[INFO] Starting work" in result.output
         assert "[INFO] Done" in result.output
 
+    def test_prints_each_log_in_a_batch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_client: _FakeClient,
+        stub_resolver: dict[str, str],
+    ) -> None:
+        fake_client.queue(
+            "POST",
+            "/api/workflows/execute",
+            200,
+            {"execution_id": "exec-4", "status": "Pending"},
+        )
+        fake_client.queue(
+            "GET",
+            "/api/executions/exec-4",
+            200,
+            {"execution_id": "exec-4", "status": "Success", "result": None},
+        )
+        ws_messages = [
+            {
+                "type": "execution_log_batch",
+                "executionId": "exec-4",
+                "logs": [
+                    {"type": "execution_log", "level": "INFO", "message": "first", "sequence": 0},
+                    {"type": "execution_log", "level": "WARNING", "message": "second", "sequence": 1},
+                ],
+            },
+            {
+                "type": "execution_update",
+                "executionId": "exec-4",
+                "status": "Success",
+            },
+        ]
+        connect, _ = _ws_connect_factory(ws_messages)
+        import websockets.asyncio.client as ws_client_module
+        monkeypatch.setattr(ws_client_module, "connect", connect)
+
+        result = _invoke(["--json", "execute", "my-workflow"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.index("[INFO] first") < result.output.index("[WARNING] second")
+
     def test_failure_status_returns_exit_1(
         self,
         monkeypatch: pytest.MonkeyPatch,
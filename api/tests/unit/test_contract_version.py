@@ -138,7 +138,7 @@ CLI_ROUTES: tuple[str, ...] = ("/api/version",)
 #: the live fingerprint, this test fails — update this value, and bump
 #: CONTRACT_VERSION (both sides) IF the change is breaking. See module docstring.
 EXPECTED_CONTRACT_FINGERPRINT = (
-    "e6460f50e29885a406c962823bf9490db0272221c76c7b5f5e12adf03ce0f9f4"
+    "f1fca7095b623ba3d4e6d29eb5a45dd9029dc1d3f636c1e762ff1b9e15e74b52"
 )
 
 
@@ -49,6 +49,7 @@ class TestToPublicDict:
         result = ctx.to_public_dict()
         assert "_db" not in result
         assert "_integration_cache" not in result
+        assert "_config_cache" not in result
         assert "_integration_calls" not in result
         assert "_dynamic_secrets" not in result
         assert "_scope_override" not in result
@@ -2011,6 +2011,7 @@ class TestInlineAgentContent:
             llm_max_tokens=8000,
             max_iterations=15,
             max_token_budget=120000,
+            max_parallel_tool_calls=2,
         )
         manifest = Manifest(agents={agent_id: agent})
         yaml_out = serialize_manifest(manifest)
@@ -2028,6 +2029,7 @@ class TestInlineAgentContent:
         assert rt.llm_max_tokens == 8000
         assert rt.max_iterations == 15
         assert rt.max_token_budget == 120000
+        assert rt.max_parallel_tool_calls == 2
 
         yaml_out2 = serialize_manifest(parsed)
         assert yaml_out == yaml_out2
@@ -65,6 +65,7 @@ def _mock_agent(name="test_agent", org_id=None, access_level=None):
     agent.llm_max_tokens = None
     agent.max_iterations = None
     agent.max_token_budget = None
+    agent.max_parallel_tool_calls = None
     return agent
 
 
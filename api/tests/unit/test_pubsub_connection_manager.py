@@ -1,8 +1,10 @@
+import logging
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.core import pubsub as pubsub_module
 from src.core.pubsub import ConnectionManager
 
 
@@ -29,3 +31,138 @@ async def test_publish_to_redis_uses_per_call_connections():
     assert clients[0] is not clients[1]
     clients[0].publish.assert_awaited_once()
     clients[1].publish.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_many_uses_one_pipeline():
+    manager = ConnectionManager()
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    pipe.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def fake_get_redis():
+        yield client
+
+    with patch("src.core.pubsub.get_redis", side_effect=fake_get_redis):
+        await manager.broadcast_many([
+            ("execution:one", {"type": "one"}),
+            ("execution:two", {"type": "two"}),
+        ])
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args[0] for c in pipe.publish.call_args_list] == [
+        "bifrost:execution:one",
+        "bifrost:execution:two",
+    ]
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_many_falls_back_to_local_delivery():
+    manager = ConnectionManager()
+
+    @asynccontextmanager
+    async def unavailable():
+        raise ConnectionError("redis down")
+        yield
+
+    with (
+        patch("src.core.pubsub.get_redis", side_effect=unavailable),
+        patch.object(manager, "_send_local", new=AsyncMock()) as send_local,
+    ):
+        await manager.broadcast_many([("execution:one", {"type": "one"})])
+
+    send_local.assert_awaited_once_with("execution:one", {"type": "one"})
+
+
+def _manager_with_listener() -> tuple[ConnectionManager, MagicMock]:
+    manager = ConnectionManager()
+    listener = MagicMock()
+    listener.subscribe = AsyncMock()
+    listener.is_healthy.return_value = True
+    manager._pubsub_listener = listener
+    return manager, listener
+
+
+def _socket() -> MagicMock:
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+def _redis_channels(call) -> list[str]:
+    return sorted(call.args[0])
+
+
+@pytest.mark.asyncio
+async def test_channels_are_subscribed_by_first_socket_and_released_by_last():
+    manager, listener = _manager_with_listener()
+    first, second = _socket(), _socket()
+
+    await manager.connect(first, ["user:1", "execution:e"])
+    assert _redis_channels(listener.subscribe.await_args) == [
+        "bifrost:execution:e",
+        "bifrost:user:1",
+    ]
+
+    # Already subscribed for the first socket
+    await manager.connect(second, ["execution:e"])
+    await manager.subscribe(second, "user:1")
+    assert listener.subscribe.await_count == 1
+
+    manager.disconnect(first)
+    listener.unsubscribe.assert_not_called()
+
+    manager.unsubscribe(second, "user:1")
+    assert _redis_channels(listener.unsubscribe.call_args) == ["bifrost:user:1"]
+    manager.disconnect(second)
+    assert _redis_channels(listener.unsubscribe.call_args) == ["bifrost:execution:e"]
+    assert manager.connections == {}
+
+
+@pytest.mark.asyncio
+async def test_received_messages_are_counted():
+    manager, listener = _manager_with_listener()
+    sockets = [_socket(), _socket()]
+    for websocket in sockets:
+        await manager.connect(websocket, ["execution:e"])
+
+    manager._pubsub_listener = None
+    listener.start = AsyncMock()
+    with patch("src.core.pubsub.ResilientPubSubListener", return_value=listener) as cls:
+        await manager._init_redis()
+    on_message = cls.call_args.kwargs["on_message"]
+    # Channels connected while there was no listener are subscribed now
+    assert _redis_channels(listener.subscribe.await_args) == ["bifrost:execution:e"]
+
+    await on_message("bifrost:execution:e", {"type": "log"})
+    await on_message("bifrost:execution:gone", {"type": "log"})
+
+    assert manager.stats.as_dict() == {"received": 2, "unrouted": 1, "delivered": 2}
+    for websocket in sockets:
+        websocket.send_text.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stats_are_logged_periodically_and_on_close(caplog, monkeypatch):
+    manager, listener = _manager_with_listener()
+    manager._pubsub_listener = None
+    listener.start = AsyncMock()
+    with patch("src.core.pubsub.ResilientPubSubListener", return_value=listener) as cls:
+        await manager._init_redis()
+    on_message = cls.call_args.kwargs["on_message"]
+
+    caplog.set_level(logging.DEBUG, logger="src.core.pubsub")
+    await on_message("bifrost:execution:gone", {"type": "log"})
+    assert "Pub/sub:" not in caplog.text
+
+    monkeypatch.setattr(pubsub_module, "STATS_LOG_INTERVAL_SECONDS", 0.0)
+    await on_message("bifrost:execution:gone", {"type": "log"})
+    assert "'received': 2" in caplog.text
+
+    caplog.clear()
+    listener.stop = AsyncMock()
+    await manager.close()
+    assert "Pub/sub: 0 local channels" in caplog.text
@@ -19,6 +19,9 @@ class TestHeartbeatCgroupData:
         pool._requirements_installed = 0
         pool._requirements_total = 0
         pool.heartbeat_interval_seconds = 10
+        pool._preloaded_hashes = {}
+        pool._preload_hits = 0
+        pool._preload_misses = 0
 
         with patch(
             "src.services.execution.process_pool.get_cgroup_memory",
@@ -41,6 +44,9 @@ class TestHeartbeatCgroupData:
         pool._requirements_installed = 0
         pool._requirements_total = 0
         pool.heartbeat_interval_seconds = 10
+        pool._preloaded_hashes = {}
+        pool._preload_hits = 0
+        pool._preload_misses = 0
 
         with patch(
             "src.services.execution.process_pool.get_cgroup_memory",
@@ -63,6 +69,9 @@ class TestHeartbeatCgroupData:
         pool._requirements_installed = 0
         pool._requirements_total = 0
         pool.heartbeat_interval_seconds = 10
+        pool._preloaded_hashes = {}
+        pool._preload_hits = 0
+        pool._preload_misses = 0
 
         with patch(
             "src.services.execution.process_pool.get_cgroup_memory",
@@ -83,6 +92,9 @@ class TestHeartbeatCgroupData:
         pool._requirements_installed = 0
         pool._requirements_total = 0
         pool.heartbeat_interval_seconds = 10
+        pool._preloaded_hashes = {}
+        pool._preload_hits = 0
+        pool._preload_misses = 0
 
         fake_proc = type(
             "P",
@@ -123,6 +135,9 @@ class TestHeartbeatCgroupData:
         pool._requirements_installed = 0
         pool._requirements_total = 0
         pool.heartbeat_interval_seconds = 10
+        pool._preloaded_hashes = {}
+        pool._preload_hits = 0
+        pool._preload_misses = 0
 
         fake_proc = type(
             "P",
@@ -8804,6 +8804,11 @@ export interface components {
              * @description Max token budget for autonomous runs
              */
             max_token_budget?: number | null;
+            /**
+             * Max Parallel Tool Calls
+             * @description Max tool calls run concurrently in one turn (null = default of 4, 1 = sequential)
+             */
+            max_parallel_tool_calls?: number | null;
         };
         /**
          * AgentPromoteRequest
@@ -8874,6 +8879,8 @@ export interface components {
             max_iterations?: number | null;
             /** Max Token Budget */
             max_token_budget?: number | null;
+            /** Max Parallel Tool Calls */
+            max_parallel_tool_calls?: number | null;
             /**
              * Logo
              * @description Inline logo as a data URL, or null when no logo is set.
@@ -9289,6 +9296,11 @@ export interface components {
              * @description Max token budget for autonomous runs
              */
             max_token_budget?: number | null;
+            /**
+             * Max Parallel Tool Calls
+             * @description Max tool calls run concurrently in one turn (null = default of 4, 1 = sequential)
+             */
+            max_parallel_tool_calls?: number | null;
         };
         /**
          * AgentUsage
@@ -17986,6 +17998,16 @@ export interface components {
              * @description Memory limit of the worker container in bytes (from cgroup, -1 if unlimited)
              */
             memory_max_bytes?: number | null;
+            /**
+             * Preloaded Modules
+             * @description Workspace modules warm-imported into the fork template
+             */
+            preloaded_modules?: number | null;
+            /**
+             * Preload Hit Rate
+             * @description Fraction of workspace module imports served by the template preload
+             */
+            preload_hit_rate?: number | null;
         };
         /**
          * PoolsListResponse
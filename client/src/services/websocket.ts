@@ -441,6 +441,14 @@ type WebSocketMessage =
 	| { type: "pong" }
 	| { type: "execution_update"; executionId: string; [key: string]: unknown }
 	| { type: "execution_log"; executionId: string; [key: string]: unknown }
+	| {
+			type: "execution_log_batch";
+			executionId: string;
+			logs: ({ type: "execution_log"; executionId: string } & Record<
+				string,
+				unknown
+			>)[];
+	  }
 	| { type: "history_update"; [key: string]: unknown }
 	| { type: "notification_created"; notification: NotificationPayload }
 	| { type: "notification_updated"; notification: NotificationPayload }
@@ -812,6 +820,10 @@ class WebSocketService {
 				this.dispatchExecutionLog(message);
 				break;
 
+			case "execution_log_batch":
+				message.logs.forEach((log) => this.dispatchExecutionLog(log));
+				break;
+
 			case "history_update":
 				this.dispatchHistoryUpdate(message);
 				break;